@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import atexit
+import tracemalloc
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+
+from opensearchpy import OpenSearch
+from opensearchpy.helpers import bulk, bulk_from_dataframe
+
+ROW_COUNT = 100000
+CHUNK_SIZE = 5000
+ALLOCATED: Dict[str, int] = {}
+
+DF = pd.DataFrame(
+    {
+        "_id": [str(i) for i in range(ROW_COUNT)],
+        "user": [f"user-{i % 100}" for i in range(ROW_COUNT)],
+        "quantity": np.arange(ROW_COUNT, dtype=np.int32),
+        "price": np.where(
+            np.arange(ROW_COUNT) % 10 == 0, np.nan, np.arange(ROW_COUNT) / 7
+        ),
+        "in_stock": np.arange(ROW_COUNT) % 2 == 0,
+        "created": pd.date_range("2024-01-01", periods=ROW_COUNT, freq="min"),
+    }
+)
+
+
+class BulkClient(OpenSearch):
+    """Answers bulk requests without a server, after they were serialized"""
+
+    def bulk(self, body: Any, *args: Any, **kwargs: Any) -> Any:
+        items = [{"index": {"status": 201}} for _ in range(body.count(b"\n") // 2)]
+        return {"took": 1, "errors": False, "items": items}
+
+
+def measure(name: str, index: Callable[[], None]) -> None:
+    """record the peak memory allocated by index, once per name"""
+    if name not in ALLOCATED:
+        tracemalloc.start()
+        index()
+        ALLOCATED[name] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+
+def report() -> None:
+    """print the memory measured for each benchmark"""
+    for name, allocated in ALLOCATED.items():
+        print(f"{name}: {allocated} bytes allocated at peak")
+
+
+def index_records() -> None:
+    """bulk index the rows of the frame as dicts"""
+    # NaN is not valid JSON, it has to be replaced first
+    records = DF.astype(object).where(DF.notna(), None).to_dict("records")
+    success, _ = bulk(BulkClient(), records, index="orders", chunk_size=CHUNK_SIZE)
+    assert success == ROW_COUNT
+
+
+def index_columnar() -> None:
+    """bulk index the frame with bulk_from_dataframe"""
+    success, _ = bulk_from_dataframe(
+        BulkClient(), DF, index="orders", chunk_size=CHUNK_SIZE
+    )
+    assert success == ROW_COUNT
+
+
+def test_records() -> None:
+    """100k rows, to_dict("records") serialized value by value"""
+    index_records()
+    measure("records", index_records)
+
+
+def test_columnar() -> None:
+    """100k rows, converted column by column"""
+    index_columnar()
+    measure("columnar", index_columnar)
+
+
+atexit.register(report)
+
+__benchmarks__ = [
+    (test_records, test_columnar, "row-wise vs. columnar bulk from a DataFrame")
+]
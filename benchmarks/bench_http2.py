@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import asyncio
+import atexit
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional
+
+import h2.config
+import h2.connection
+import h2.events
+
+from opensearchpy import (
+    AIOHttpConnection,
+    AsyncHttpxHttpConnection,
+    AsyncOpenSearch,
+    HttpxHttpConnection,
+    OpenSearch,
+    Urllib3HttpConnection,
+)
+
+CONCURRENCY = 64
+ROUNDS = 10
+LATENCY = 0.01
+RESPONSE = b'{"took":1,"timed_out":false,"hits":{"total":{"value":0},"hits":[]}}'
+PREFACE = b"PRI * HTTP/2.0"
+PORT: Optional[int] = None
+CONNECTIONS: Dict[str, Any] = {}
+RUNS: Dict[str, int] = {"http1": 0, "http2": 0}
+
+
+class SearchProtocol(asyncio.Protocol):
+    """
+    stands in for OpenSearch, answers every request after LATENCY seconds
+    over HTTP/1.1 or over HTTP/2 without TLS (prior knowledge)
+    """
+
+    def __init__(self, connections: Dict[str, Any]) -> None:
+        self.connections = connections
+        self.buffer = b""
+        self.protocol: Optional[str] = None
+        self.h2: Any = None
+        self.transport: Any = None
+
+    def connection_made(self, transport: Any) -> None:
+        self.transport = transport
+
+    def data_received(self, data: bytes) -> None:
+        if self.h2 is not None:
+            self.h2_received(data)
+            return
+        self.buffer += data
+        if self.protocol is None:
+            if len(self.buffer) < len(PREFACE):
+                return
+            self.protocol = "http2" if self.buffer.startswith(PREFACE) else "http1"
+            with self.connections[self.protocol].get_lock():
+                self.connections[self.protocol].value += 1
+            if self.protocol == "http2":
+                self.h2 = h2.connection.H2Connection(
+                    h2.config.H2Configuration(client_side=False)
+                )
+                self.h2.initiate_connection()
+                data, self.buffer = self.buffer, b""
+                self.h2_received(data)
+                return
+        self.http1_received()
+
+    def http1_received(self) -> None:
+        """answer each complete HTTP/1.1 request after LATENCY"""
+        while b"\r\n\r\n" in self.buffer:
+            head, rest = self.buffer.split(b"\r\n\r\n", 1)
+            length = 0
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"content-length":
+                    length = int(value)
+            if len(rest) < length:
+                return
+            self.buffer = rest[length:]
+            asyncio.get_running_loop().call_later(LATENCY, self.http1_respond)
+
+    def http1_respond(self) -> None:
+        """send the search response over HTTP/1.1"""
+        self.transport.write(
+            b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\n"
+            b"content-length: %d\r\n\r\n%s" % (len(RESPONSE), RESPONSE)
+        )
+
+    def h2_received(self, data: bytes) -> None:
+        """answer each complete HTTP/2 stream after LATENCY"""
+        for event in self.h2.receive_data(data):
+            if isinstance(event, h2.events.DataReceived):
+                self.h2.acknowledge_received_data(
+                    event.flow_controlled_length, event.stream_id
+                )
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.get_running_loop().call_later(
+                    LATENCY, self.h2_respond, event.stream_id
+                )
+        self.transport.write(self.h2.data_to_send())
+
+    def h2_respond(self, stream_id: int) -> None:
+        """send the search response on an HTTP/2 stream"""
+        self.h2.send_headers(
+            stream_id,
+            [
+                (":status", "200"),
+                ("content-type", "application/json"),
+                ("content-length", str(len(RESPONSE))),
+            ],
+        )
+        self.h2.send_data(stream_id, RESPONSE, end_stream=True)
+        self.transport.write(self.h2.data_to_send())
+
+
+def serve(port: Any, connections: Dict[str, Any]) -> None:
+    """serve requests on any free port until the process is terminated"""
+
+    async def main() -> None:
+        server = await asyncio.get_running_loop().create_server(
+            lambda: SearchProtocol(connections), "127.0.0.1", 0
+        )
+        port.send(server.sockets[0].getsockname()[1])
+        await server.serve_forever()
+
+    asyncio.run(main())
+
+
+def report() -> None:
+    """print the connections opened by each protocol"""
+    for protocol, runs in RUNS.items():
+        if runs:
+            print(
+                f"{protocol}: {CONNECTIONS[protocol].value / runs:.0f} connections "
+                f"for {CONCURRENCY} concurrent searches"
+            )
+
+
+def server_port() -> int:
+    """start the stand-in server in its own process so it doesn't share our GIL"""
+    global PORT
+    if PORT is None:
+        CONNECTIONS.update(
+            http1=multiprocessing.Value("i", 0), http2=multiprocessing.Value("i", 0)
+        )
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(
+            target=serve, args=(sender, CONNECTIONS), daemon=True
+        )
+        process.start()
+        atexit.register(process.terminate)
+        atexit.register(report)
+        PORT = receiver.recv()
+    return PORT
+
+
+def search_with_threads(connection_class: Any, **kwargs: Any) -> None:
+    """CONCURRENCY threads sending ROUNDS searches each"""
+    client = OpenSearch(
+        hosts=[{"host": "127.0.0.1", "port": server_port()}],
+        connection_class=connection_class,
+        **kwargs,
+    )
+
+    def search(_: int) -> None:
+        for _ in range(ROUNDS):
+            client.search(index="movies", body={"query": {"match_all": {}}})
+
+    with ThreadPoolExecutor(CONCURRENCY) as executor:
+        list(executor.map(search, range(CONCURRENCY)))
+    client.close()
+
+
+def search_with_tasks(connection_class: Any, **kwargs: Any) -> None:
+    """CONCURRENCY tasks sending ROUNDS searches each"""
+
+    async def main() -> None:
+        client = AsyncOpenSearch(
+            hosts=[{"host": "127.0.0.1", "port": server_port()}],
+            connection_class=connection_class,
+            **kwargs,
+        )
+
+        async def search() -> None:
+            for _ in range(ROUNDS):
+                await client.search(index="movies", body={"query": {"match_all": {}}})
+
+        await asyncio.gather(*(search() for _ in range(CONCURRENCY)))
+        await client.close()
+
+    asyncio.run(main())
+
+
+def test_urllib3() -> None:
+    """HTTP/1.1, one connection per thread"""
+    RUNS["http1"] += 1
+    search_with_threads(Urllib3HttpConnection, pool_maxsize=CONCURRENCY)
+
+
+def test_httpx() -> None:
+    """HTTP/2, all threads multiplexed over one connection"""
+    RUNS["http2"] += 1
+    search_with_threads(HttpxHttpConnection, http1=False)
+
+
+def test_aiohttp() -> None:
+    """HTTP/1.1, one connection per task"""
+    RUNS["http1"] += 1
+    search_with_tasks(AIOHttpConnection, maxsize=CONCURRENCY)
+
+
+def test_async_httpx() -> None:
+    """HTTP/2, all tasks multiplexed over one connection"""
+    RUNS["http2"] += 1
+    search_with_tasks(AsyncHttpxHttpConnection, http1=False)
+
+
+__benchmarks__ = [
+    (test_urllib3, test_httpx, f"HTTP/1.1 vs. HTTP/2 ({CONCURRENCY} threads)"),
+    (test_aiohttp, test_async_httpx, f"HTTP/1.1 vs. HTTP/2 ({CONCURRENCY} tasks)"),
+]
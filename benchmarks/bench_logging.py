@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from typing import Any
+
+from urllib3._collections import HTTPHeaderDict
+
+from opensearchpy import Urllib3HttpConnection
+
+REQUEST_COUNT = 100000
+RESPONSE_BODY = b'{"took":1,"timed_out":false,"hits":{"total":{"value":0},"hits":[]}}'
+
+
+class StubResponse:
+    """canned urllib3 response, no network involved"""
+
+    status = 200
+    data = RESPONSE_BODY
+    headers = HTTPHeaderDict({"content-type": "application/json"})
+
+
+class StubPool:
+    """stands in for urllib3.HTTPConnectionPool"""
+
+    def urlopen(self, *args: Any, **kwargs: Any) -> Any:
+        """answer every request with the canned response"""
+        return StubResponse()
+
+    def close(self) -> None:
+        """nothing to release"""
+
+
+class NoLoggingConnection(Urllib3HttpConnection):
+    """connection with the logging layer removed entirely"""
+
+    def log_request_success(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def perform_requests(connection_class: Any) -> None:
+    """perform REQUEST_COUNT requests against the stub pool"""
+    connection = connection_class()
+    connection.pool = StubPool()
+    for _ in range(REQUEST_COUNT):
+        connection.perform_request(
+            "POST", "/movies/_search", params={"size": 10}, body=b"{}"
+        )
+
+
+def test_no_logging() -> None:
+    """logging layer removed"""
+    perform_requests(NoLoggingConnection)
+
+
+def test_logging_disabled() -> None:
+    """logging layer present but no logger enabled"""
+    perform_requests(Urllib3HttpConnection)
+
+
+__benchmarks__ = [
+    (test_no_logging, test_logging_disabled, "no logging vs. disabled logging")
+]
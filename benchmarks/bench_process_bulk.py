@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import atexit
+import multiprocessing
+import os
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
+
+from opensearchpy import OpenSearch, helpers
+
+DOC_COUNT = 50000
+WORKER_COUNT = min(os.cpu_count() or 1, 8)
+CHUNK_SIZE = 500
+PORT: Optional[int] = None
+
+
+class BulkHandler(BaseHTTPRequestHandler):
+    """stands in for OpenSearch, acknowledges every document of a bulk request"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """acknowledge the documents of a bulk request"""
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        count = body.count(b"\n") // 2
+        response = (
+            b'{"took":1,"errors":false,"items":['
+            + b",".join([b'{"index":{"status":201}}'] * count)
+            + b"]}"
+        )
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def serve(port: Any) -> None:
+    """serve bulk requests on any free port until the process is terminated"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), BulkHandler)
+    port.send(server.server_address[1])
+    server.serve_forever()
+
+
+def server_port() -> int:
+    """
+    start the stand-in server in its own process so it doesn't share our GIL,
+    started lazily so that worker processes importing this module don't
+    """
+    global PORT
+    if PORT is None:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=serve, args=(sender,), daemon=True)
+        process.start()
+        atexit.register(process.terminate)
+        PORT = receiver.recv()
+    return PORT
+
+
+def generate_docs() -> Iterator[Any]:
+    """documents with enough fields that serializing them dominates"""
+    for i in range(DOC_COUNT):
+        yield {
+            "_index": "movies",
+            "_id": i,
+            "title": f"Moneyball {i}",
+            "director": "Bennett Miller",
+            "year": 2011 + i % 10,
+            "rating": 7.5 + i % 3 / 10,
+            "tags": ["drama", "sports", "biography"],
+            "cast": [
+                {"name": f"Actor {j}", "role": f"Role {j}", "order": j}
+                for j in range(10)
+            ],
+        }
+
+
+def index_with_threads() -> None:
+    """parallel_bulk, serialization in the calling process"""
+    client = OpenSearch(hosts=[{"host": "127.0.0.1", "port": server_port()}])
+    for ok, _ in helpers.parallel_bulk(
+        client, generate_docs(), thread_count=WORKER_COUNT, chunk_size=CHUNK_SIZE
+    ):
+        assert ok
+
+
+def index_with_processes() -> None:
+    """process_parallel_bulk, serialization in the worker processes"""
+    client_factory = partial(
+        OpenSearch, hosts=[{"host": "127.0.0.1", "port": server_port()}]
+    )
+    for ok, _ in helpers.process_parallel_bulk(
+        client_factory,
+        generate_docs(),
+        process_count=WORKER_COUNT,
+        chunk_size=CHUNK_SIZE,
+    ):
+        assert ok
+
+
+__benchmarks__ = [
+    (
+        index_with_threads,
+        index_with_processes,
+        f"parallel_bulk vs. process_parallel_bulk ({WORKER_COUNT})",
+    )
+]
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import atexit
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from opensearchpy import Search
+from opensearchpy.helpers.response import Response
+from opensearchpy.helpers.utils import AttrDict, AttrList, HitMeta, _wrap
+
+HIT_COUNT = 10000
+REPEAT = 10
+ALLOCATED: Dict[str, int] = {}
+
+RESPONSE = {
+    "took": 12,
+    "timed_out": False,
+    "_shards": {"total": 5, "successful": 5, "skipped": 0, "failed": 0},
+    "hits": {
+        "total": {"value": HIT_COUNT, "relation": "eq"},
+        "max_score": 1.0,
+        "hits": [
+            {
+                "_index": "movies",
+                "_id": str(i),
+                "_score": 1.0,
+                "_source": {"title": f"Moneyball {i}", "year": 2011},
+            }
+            for i in range(HIT_COUNT)
+        ],
+    },
+}
+
+
+class EagerHit(AttrDict):
+    """Hit with its meta, built for every hit, as before lazy hits"""
+
+    def __init__(self, document: Any) -> None:
+        super().__init__(document.get("_source", {}))
+        super(AttrDict, self).__setattr__("meta", HitMeta(document))
+
+
+class EagerResponse(Response):
+    """Response building an object for every hit on first access to them"""
+
+    @property
+    def hits(self) -> Any:
+        if not hasattr(self, "_hits"):
+            h = self._d_["hits"]
+            hits = AttrList(map(EagerHit, h["hits"]))
+            super(AttrDict, self).__setattr__("_hits", hits)
+            for k in h:
+                setattr(self._hits, k, _wrap(h[k]))
+        return self._hits
+
+
+def measure(name: str, read: Callable[[], None]) -> None:
+    """record the peak memory allocated by read, once per name"""
+    if name not in ALLOCATED:
+        tracemalloc.start()
+        read()
+        ALLOCATED[name] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+
+def report() -> None:
+    """print the memory measured for each benchmark"""
+    for name, allocated in ALLOCATED.items():
+        print(f"{name}: {allocated} bytes allocated at peak")
+
+
+def read_first(response_class: Any) -> None:
+    """read the total and the first hit of the response"""
+    r = response_class(Search(), RESPONSE)
+    assert r.hits.total.value == HIT_COUNT
+    assert r.hits[0].meta.id == "0"
+
+
+def read_all(response_class: Any) -> None:
+    """read a field of every hit of the response"""
+    for hit in response_class(Search(), RESPONSE):
+        _ = hit.title
+
+
+def test_eager_first() -> None:
+    """total and first of 10k hits, every hit is built"""
+    for _ in range(REPEAT):
+        read_first(EagerResponse)
+    measure("eager, first hit", lambda: read_first(EagerResponse))
+
+
+def test_lazy_first() -> None:
+    """total and first of 10k hits, only the first hit is built"""
+    for _ in range(REPEAT):
+        read_first(Response)
+    measure("lazy, first hit", lambda: read_first(Response))
+
+
+def test_eager_all() -> None:
+    """iterate over 10k hits with their meta built"""
+    for _ in range(REPEAT):
+        read_all(EagerResponse)
+    measure("eager, all hits", lambda: read_all(EagerResponse))
+
+
+def test_lazy_all() -> None:
+    """iterate over 10k hits, meta not accessed"""
+    for _ in range(REPEAT):
+        read_all(Response)
+    measure("lazy, all hits", lambda: read_all(Response))
+
+
+atexit.register(report)
+
+__benchmarks__ = [
+    (test_eager_first, test_lazy_first, "eager vs. lazy hits (first hit)"),
+    (test_eager_all, test_lazy_all, "eager vs. lazy hits (all hits)"),
+]
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import atexit
+import copy
+import tracemalloc
+from typing import Any, Dict
+
+from opensearchpy import Search
+from opensearchpy.helpers.search import AggsProxy, QueryProxy
+
+REPEAT = 10000
+ALLOCATED: Dict[str, int] = {}
+
+
+class EagerSearch(Search):
+    """Search copying all of its state on every clone, as before copy-on-write"""
+
+    def _clone(self) -> Any:
+        s = self.__class__(
+            using=self._using, index=self._index, doc_type=self._doc_type
+        )
+        s._doc_type_map = self._doc_type_map.copy()
+        s._extra = self._extra.copy()
+        s._params = self._params.copy()
+        s._response_class = self._response_class
+        s._sort = self._sort[:]
+        s._source = copy.copy(self._source) if self._source is not None else None
+        s._highlight = self._highlight.copy()
+        s._highlight_opts = self._highlight_opts.copy()
+        s._suggest = self._suggest.copy()
+        s._script_fields = self._script_fields.copy()
+        s._collapse = self._collapse.copy()
+        s._query_proxy = QueryProxy(s, "query")
+        s._query_proxy._proxied = self._query_proxy._proxied
+        s._post_filter_proxy = QueryProxy(s, "post_filter")
+        s._post_filter_proxy._proxied = self._post_filter_proxy._proxied
+        s.aggs = AggsProxy(s)
+        if self.aggs._params.get("aggs"):
+            s.aggs._params = {"aggs": self.aggs._params["aggs"].copy()}
+        return s
+
+
+def build(search_class: Any, user_id: str) -> None:
+    """the builder chain of a typical request handler"""
+    (
+        search_class(index="orders")
+        .params(routing=user_id, request_cache=True)
+        .filter("term", user_id=user_id)
+        .exclude("term", status="cancelled")
+        .query("multi_match", query="running shoes", fields=["title^2", "body"])
+        .sort("-created", "_score")
+        .source(["title", "price", "created"])
+        .highlight("title", fragment_size=50)
+        .highlight_options(order="score")
+        .extra(track_total_hits=False)[20:40]
+        .to_dict()
+    )
+
+
+def measure(search_class: Any) -> None:
+    """record the peak memory allocated by one builder chain"""
+    tracemalloc.start()
+    build(search_class, "user-0")
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    build(search_class, "user-1")
+    ALLOCATED[search_class.__name__] = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+
+
+def report() -> None:
+    """print the memory measured for each search class"""
+    for name, allocated in ALLOCATED.items():
+        print(f"{name}: {allocated} bytes allocated at peak per builder chain")
+
+
+def test_eager() -> None:
+    """copy every container of the search on each chained call"""
+    for i in range(REPEAT):
+        build(EagerSearch, f"user-{i}")
+    if EagerSearch.__name__ not in ALLOCATED:
+        measure(EagerSearch)
+
+
+def test_copy_on_write() -> None:
+    """share the containers with the clone until they are changed"""
+    for i in range(REPEAT):
+        build(Search, f"user-{i}")
+    if Search.__name__ not in ALLOCATED:
+        measure(Search)
+
+
+atexit.register(report)
+
+__benchmarks__ = [(test_eager, test_copy_on_write, "eager vs. copy-on-write clone")]
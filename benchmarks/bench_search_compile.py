@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from datetime import datetime
+
+from opensearchpy import A, Param, Search
+from opensearchpy.serializer import serializer
+
+REPEAT = 10000
+
+
+def build(user_id: object, since: object) -> Search:
+    """the search of an orders page, the same one for every user"""
+    s: Search = (
+        Search(index="orders")
+        .filter("term", user_id=user_id)
+        .filter("range", created={"gte": since})
+        .query("multi_match", query="running shoes", fields=["title^2", "body"])
+        .exclude("term", status="cancelled")
+        .sort("-created", "_score")
+        .source(["title", "price", "created"])
+        .extra(size=20)
+    )
+    s.aggs.bucket("brands", A("terms", field="brand", size=10))
+    return s
+
+
+def test_to_dict() -> None:
+    """rebuild the body from the DSL objects for every request"""
+    since = datetime(2024, 1, 1)
+    for i in range(REPEAT):
+        serializer.dumps(build(f"user-{i}", since).to_dict()).encode("utf-8")
+
+
+def test_compiled() -> None:
+    """render a body compiled once, only serializing the parameters"""
+    since = datetime(2024, 1, 1)
+    compiled = build(Param("user_id"), Param("since")).compile()
+    for i in range(REPEAT):
+        compiled.render(user_id=f"user-{i}", since=since)
+
+
+__benchmarks__ = [(test_to_dict, test_compiled, "Search.to_dict() vs. compile()")]
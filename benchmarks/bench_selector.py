@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from opensearchpy import (
+    Connection,
+    LeastLatencySelector,
+    RoundRobinSelector,
+    Transport,
+)
+
+REQUEST_COUNT = 2000
+THREAD_COUNT = 16
+FAST_LATENCY = 0.002
+SLOW_LATENCY = 0.05
+
+
+class FakeNode(Connection):
+    """answers every request after a fixed latency, no network involved"""
+
+    def __init__(self, latency: float = FAST_LATENCY, **kwargs: Any) -> None:
+        self.latency = latency
+        super().__init__(**kwargs)
+
+    def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+        time.sleep(self.latency)
+        return 200, {}, "{}"
+
+
+def perform_requests(selector_class: Any) -> None:
+    """REQUEST_COUNT searches against 3 fast nodes and one in a long GC pause"""
+    transport = Transport(
+        [{}, {}, {}, {"latency": SLOW_LATENCY}],
+        connection_class=FakeNode,
+        selector_class=selector_class,
+    )
+    with ThreadPoolExecutor(THREAD_COUNT) as executor:
+        for _ in executor.map(
+            lambda _: transport.perform_request("GET", "/_search"),
+            range(REQUEST_COUNT),
+        ):
+            pass
+
+
+def test_round_robin() -> None:
+    """the default selector, every node gets the same share of requests"""
+    perform_requests(RoundRobinSelector)
+
+
+def test_least_latency() -> None:
+    """requests are steered away from the slow node"""
+    perform_requests(LeastLatencySelector)
+
+
+__benchmarks__ = [
+    (test_round_robin, test_least_latency, "round robin vs. least latency selector")
+]
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import uuid
+from datetime import datetime
+from typing import Any, Callable, List, Tuple
+
+from opensearchpy.exceptions import ImproperlyConfigured
+from opensearchpy.serializer import JSON_BACKENDS, FastJSONSerializer, JSONSerializer
+
+ITEM_COUNT = 1000
+REPEAT = 20
+
+BULK_ACTIONS: List[Any] = []
+for i in range(ITEM_COUNT):
+    BULK_ACTIONS.append({"index": {"_index": "movies", "_id": str(uuid.uuid4())}})
+    BULK_ACTIONS.append(
+        {
+            "title": f"Moneyball {i}",
+            "director": "Bennett Miller",
+            "year": 2011 + i % 10,
+            "rating": 7.5 + i % 3 / 10,
+            "released": datetime(2011, 9, 23),
+            "tags": ["drama", "sports", "biography"],
+        }
+    )
+
+SEARCH_BODY = {
+    "took": 12,
+    "timed_out": False,
+    "_shards": {"total": 5, "successful": 5, "skipped": 0, "failed": 0},
+    "hits": {
+        "total": {"value": ITEM_COUNT, "relation": "eq"},
+        "max_score": 1.0,
+        "hits": [
+            {
+                "_index": "movies",
+                "_id": str(i),
+                "_score": 1.0,
+                "_source": {
+                    "title": f"Moneyball {i}",
+                    "director": "Bennett Miller",
+                    "year": 2011,
+                    "tags": ["drama", "sports", "biography"],
+                },
+            }
+            for i in range(ITEM_COUNT)
+        ],
+    },
+}
+SEARCH_RESPONSE = JSONSerializer().dumps(SEARCH_BODY).encode("utf-8")
+
+
+def serialize_bulk(serializer: Any) -> None:
+    """serialize bulk action and source lines the way the bulk helpers do"""
+    for _ in range(REPEAT):
+        for line in BULK_ACTIONS:
+            data = serializer.dumps(line)
+            if isinstance(data, str):
+                data = data.encode("utf-8", "surrogatepass")
+
+
+def deserialize_search(serializer: Any) -> None:
+    """deserialize a search response as received from the connection"""
+    for _ in range(REPEAT):
+        serializer.loads(SEARCH_RESPONSE.decode("utf-8", "surrogatepass"))
+
+
+def deserialize_search_bytes(serializer: Any) -> None:
+    """deserialize a search response straight from bytes"""
+    for _ in range(REPEAT):
+        serializer.loads(SEARCH_RESPONSE)
+
+
+def benchmarks() -> List[Tuple[Callable[[], None], Callable[[], None], str]]:
+    """compare the default serializer to every installed FastJSONSerializer backend"""
+    default = JSONSerializer()
+    result: List[Tuple[Callable[[], None], Callable[[], None], str]] = []
+    for backend in JSON_BACKENDS:
+        try:
+            fast = FastJSONSerializer(backend=backend)
+        except ImproperlyConfigured:
+            continue
+        result.append(
+            (
+                lambda: serialize_bulk(default),
+                lambda fast=fast: serialize_bulk(fast),  # type: ignore
+                f"JSONSerializer vs. {backend} (bulk dumps)",
+            )
+        )
+        result.append(
+            (
+                lambda: deserialize_search(default),
+                lambda fast=fast: deserialize_search_bytes(fast),  # type: ignore
+                f"JSONSerializer vs. {backend} (search loads)",
+            )
+        )
+    return result
+
+
+__benchmarks__ = benchmarks()
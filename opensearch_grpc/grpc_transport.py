@@ -84,14 +84,16 @@ class GrpcTransport(Transport):
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         """Route to gRPC or REST based on the URL pattern.
 
         If a gRPC handler exists for this request, attempts gRPC first with
         retries. If gRPC is unavailable after all retries, falls back to REST
-        silently so the operation still succeeds.
+        silently so the operation still succeeds. Streamed responses are
+        always read over REST.
         """
-        handler = self._get_grpc_handler(method, url)
+        handler = None if stream else self._get_grpc_handler(method, url)
         if handler:
             # Ensure channel is healthy before attempting gRPC
             self._ensure_channel_connected()
@@ -133,6 +135,7 @@ class GrpcTransport(Transport):
             timeout=timeout,
             ignore=ignore,
             headers=headers,
+            stream=stream,
         )
 
     # Matches: /_bulk or /<index>/_bulk
@@ -44,13 +44,22 @@ logger.addHandler(logging.NullHandler())
 
 from .client import OpenSearch
 from .client.grpc_client import OpenSearchGrpc
+from .client.utils import BulkStream
 from .connection import (
     Connection,
+    HttpxHttpConnection,
     RequestsHttpConnection,
     Urllib3HttpConnection,
     connections,
 )
-from .connection_pool import ConnectionPool, ConnectionSelector, RoundRobinSelector
+from .connection_pool import (
+    CircuitBreakerConnectionPool,
+    ConnectionPool,
+    ConnectionSelector,
+    LeastLatencySelector,
+    LeastOutstandingSelector,
+    RoundRobinSelector,
+)
 from .exceptions import (
     AuthenticationException,
     AuthorizationException,
@@ -129,13 +138,14 @@ from .helpers.function import SF
 from .helpers.index import Index, IndexTemplate
 from .helpers.mapping import Mapping
 from .helpers.query import Q
-from .helpers.search import MultiSearch, Search
+from .helpers.search import CompiledSearch, MultiSearch, Param, Search
 from .helpers.update_by_query import UpdateByQuery
 from .helpers.utils import AttrDict, AttrList, DslBase
 from .helpers.wrappers import Range
 from .metrics import Metrics, MetricsEvents, MetricsNone
-from .serializer import JSONSerializer
-from .transport import Transport
+from .routing import ShardRouter
+from .serializer import FastJSONSerializer, JSONSerializer
+from .transport import RetryBudget, Transport
 
 # Only raise one warning per deprecation message so as not
 # to spam up the user if the same action is done multiple times.
@@ -144,12 +154,20 @@ warnings.simplefilter("default", category=OpenSearchDeprecationWarning, append=T
 __all__ = [
     "OpenSearch",
     "OpenSearchGrpc",
+    "BulkStream",
     "Transport",
+    "RetryBudget",
+    "ShardRouter",
     "ConnectionPool",
+    "CircuitBreakerConnectionPool",
     "ConnectionSelector",
     "RoundRobinSelector",
+    "LeastOutstandingSelector",
+    "LeastLatencySelector",
     "JSONSerializer",
+    "FastJSONSerializer",
     "Connection",
+    "HttpxHttpConnection",
     "RequestsHttpConnection",
     "Urllib3HttpConnection",
     "ImproperlyConfigured",
@@ -175,6 +193,7 @@ __all__ = [
     "Binary",
     "Boolean",
     "Byte",
+    "CompiledSearch",
     "Completion",
     "CustomField",
     "Date",
@@ -215,6 +234,7 @@ __all__ = [
     "NestedFacet",
     "Object",
     "OpenSearchDslException",
+    "Param",
     "Percolator",
     "Q",
     "Range",
@@ -250,6 +270,7 @@ __all__ = [
 try:
     from ._async.client import AsyncOpenSearch
     from ._async.http_aiohttp import AIOHttpConnection, AsyncConnection
+    from ._async.http_httpx import AsyncHttpxHttpConnection
     from ._async.transport import AsyncTransport
     from .connection import AsyncHttpConnection
     from .helpers import AWSV4SignerAsyncAuth
@@ -260,6 +281,7 @@ try:
         "AsyncTransport",
         "AsyncOpenSearch",
         "AsyncHttpConnection",
+        "AsyncHttpxHttpConnection",
         "AWSV4SignerAsyncAuth",
     ]
 except (ImportError, SyntaxError):
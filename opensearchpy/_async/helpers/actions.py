@@ -31,11 +31,13 @@
 
 import asyncio
 import logging
+import time
 from typing import (
     Any,
     AsyncGenerator,
     AsyncIterable,
     Collection,
+    Dict,
     Iterable,
     List,
     Optional,
@@ -48,21 +50,35 @@ from ...compat import map
 from ...exceptions import TransportError
 from ...helpers.actions import (
     _ActionChunker,
+    _BulkBodyWriter,
+    _check_shards,
+    _join_bulk_lines,
+    _pit_query,
     _process_bulk_chunk_error,
     _process_bulk_chunk_success,
+    _scan_options,
+    _slice_query,
+    _total_hits,
     expand_action,
 )
+from ...helpers.adaptive import (
+    AdaptiveChunkSize,
+    _adaptive_chunk_size,
+    _count_rejected,
+)
 from ...helpers.errors import ScanError
+from .streaming import async_stream_scroll, async_stream_search
 
 logger: logging.Logger = logging.getLogger("opensearchpy.helpers")
 
 
 async def _chunk_actions(
-    actions: Any, chunk_size: int, max_chunk_bytes: int, serializer: Any
+    actions: Any, chunk_size: Any, max_chunk_bytes: int, serializer: Any
 ) -> AsyncGenerator[Any, None]:
     """
-    Split actions into chunks by number or size, serialize them into strings in
-    the process.
+    Split actions into chunks by number or size, serialize them into a
+    newline delimited ``bytes`` body in the process. ``chunk_size`` may be an
+    :class:`AdaptiveChunkSize`, whose current size is read for every chunk.
     """
     chunker = _ActionChunker(
         chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes, serializer=serializer
@@ -84,18 +100,31 @@ async def _process_bulk_chunk(
     raise_on_error: bool = True,
     ignore_status: Any = (),
     *args: Any,
+    adaptive_chunk_size: Optional[AdaptiveChunkSize] = None,
     **kwargs: Any
 ) -> AsyncGenerator[Tuple[bool, Any], None]:
     """
     Send a bulk request to opensearch and process the output.
+
+    ``bulk_actions`` is either a ready to send ``bytes`` body, as produced by
+    :func:`_chunk_actions`, or a list of serialized lines. The outcome of the
+    request is recorded in ``adaptive_chunk_size`` when given.
     """
     if not isinstance(ignore_status, (list, tuple)):
         ignore_status = (ignore_status,)
 
+    if not isinstance(bulk_actions, bytes):
+        bulk_actions = _join_bulk_lines(bulk_actions)
+
+    start = time.perf_counter()
     try:
         # send the actual request
-        resp = await client.bulk(body="\n".join(bulk_actions) + "\n", *args, **kwargs)
+        resp = await client.bulk(body=bulk_actions, *args, **kwargs)
     except TransportError as e:
+        if adaptive_chunk_size is not None and e.status_code == 429:
+            adaptive_chunk_size.record(
+                len(bulk_data), time.perf_counter() - start, rejected=len(bulk_data)
+            )
         gen = _process_bulk_chunk_error(
             error=e,
             bulk_data=bulk_data,
@@ -104,6 +133,13 @@ async def _process_bulk_chunk(
             raise_on_error=raise_on_error,
         )
     else:
+        if adaptive_chunk_size is not None:
+            adaptive_chunk_size.record(
+                len(bulk_data),
+                time.perf_counter() - start,
+                took=resp.get("took"),
+                rejected=_count_rejected(resp),
+            )
         gen = _process_bulk_chunk_success(
             resp=resp,
             bulk_data=bulk_data,
@@ -145,10 +181,78 @@ async def azip(
         pass
 
 
+async def _process_bulk_chunk_with_retries(
+    client: Any,
+    bulk_actions: Any,
+    bulk_data: Any,
+    raise_on_exception: bool,
+    raise_on_error: bool,
+    ignore_status: Any,
+    max_retries: int,
+    initial_backoff: Union[float, int],
+    max_backoff: Union[float, int],
+    yield_ok: bool,
+    adaptive_chunk_size: Optional[AdaptiveChunkSize],
+    *args: Any,
+    **kwargs: Any
+) -> AsyncGenerator[Tuple[bool, Any], None]:
+    """
+    Send one chunk with :func:`_process_bulk_chunk`, retrying the documents
+    rejected with ``429`` up to ``max_retries`` times.
+    """
+    for attempt in range(max_retries + 1):
+        to_retry = _BulkBodyWriter(client.transport.serializer)
+        to_retry_data: Any = []
+        if attempt:
+            await asyncio.sleep(min(max_backoff, initial_backoff * 2 ** (attempt - 1)))
+
+        try:
+            async for data, (ok, info) in azip(
+                bulk_data,
+                _process_bulk_chunk(
+                    client,
+                    bulk_actions,
+                    bulk_data,
+                    raise_on_exception,
+                    raise_on_error,
+                    ignore_status,
+                    *args,
+                    adaptive_chunk_size=adaptive_chunk_size,
+                    **kwargs,
+                ),
+            ):
+                if not ok:
+                    action, info = info.popitem()
+                    # retry if retries enabled, we get 429, and we are not
+                    # in the last attempt
+                    if (
+                        max_retries
+                        and info["status"] == 429
+                        and (attempt + 1) <= max_retries
+                    ):
+                        # re-serialize the data into a new body
+                        to_retry.write(*map(to_retry.serialize, data))
+                        to_retry_data.append(data)
+                    else:
+                        yield ok, {action: info}
+                elif yield_ok:
+                    yield ok, info
+
+        except TransportError as e:
+            # suppress 429 errors since we will retry them
+            if attempt == max_retries or e.status_code != 429:
+                raise
+        else:
+            if not to_retry_data:
+                break
+            # retry only subset of documents that didn't succeed
+            bulk_actions, bulk_data = to_retry.getvalue(), to_retry_data
+
+
 async def async_streaming_bulk(
     client: Any,
     actions: Any,
-    chunk_size: int = 500,
+    chunk_size: Any = 500,
     max_chunk_bytes: int = 100 * 1024 * 1024,
     raise_on_error: bool = True,
     expand_action_callback: Any = expand_action,
@@ -176,7 +280,9 @@ async def async_streaming_bulk(
 
     :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
     :arg actions: iterable or async iterable containing the actions to be executed
-    :arg chunk_size: number of docs in one chunk sent to client (default: 500)
+    :arg chunk_size: number of docs in one chunk sent to client (default: 500),
+        ``"auto"`` or an :class:`~opensearchpy.helpers.AdaptiveChunkSize` to
+        adjust it from the latency and rejections of previous chunks
     :arg max_chunk_bytes: the maximum size of the request in bytes (default: 100MB)
     :arg raise_on_error: raise ``BulkIndexError`` containing errors (as `.errors`)
         from the execution of the last chunk when some occur. By default we raise.
@@ -199,60 +305,151 @@ async def async_streaming_bulk(
         async for item in aiter(actions):
             yield expand_action_callback(item)
 
+    chunk_size = _adaptive_chunk_size(chunk_size)
+    adaptive_chunk_size = (
+        chunk_size if isinstance(chunk_size, AdaptiveChunkSize) else None
+    )
+
     async for bulk_data, bulk_actions in _chunk_actions(
         map_actions(), chunk_size, max_chunk_bytes, client.transport.serializer
     ):
-        for attempt in range(max_retries + 1):
-            to_retry: Any = []
-            to_retry_data: Any = []
-            if attempt:
-                await asyncio.sleep(
-                    min(max_backoff, initial_backoff * 2 ** (attempt - 1))
+        async for item in _process_bulk_chunk_with_retries(
+            client,
+            bulk_actions,
+            bulk_data,
+            raise_on_exception,
+            raise_on_error,
+            ignore_status,
+            max_retries,
+            initial_backoff,
+            max_backoff,
+            yield_ok,
+            adaptive_chunk_size,
+            *args,
+            **kwargs,
+        ):
+            yield item
+
+
+async def async_parallel_bulk(
+    client: Any,
+    actions: Any,
+    max_inflight: int = 4,
+    chunk_size: Any = 500,
+    max_chunk_bytes: int = 100 * 1024 * 1024,
+    raise_on_error: bool = True,
+    expand_action_callback: Any = expand_action,
+    raise_on_exception: bool = True,
+    max_retries: int = 0,
+    initial_backoff: Union[float, int] = 2,
+    max_backoff: Union[float, int] = 600,
+    yield_ok: bool = True,
+    ignore_status: Any = (),
+    *args: Any,
+    **kwargs: Any
+) -> AsyncGenerator[Tuple[bool, Any], None]:
+    """
+    Parallel version of :func:`~opensearchpy.helpers.async_streaming_bulk`
+    that keeps up to ``max_inflight`` bulk requests in flight at once on the
+    same client. The next chunk is serialized while the previous ones are
+    being sent, and consuming ``actions`` pauses while ``max_inflight``
+    requests are pending.
+
+    Results are yielded per action as chunks complete, not necessarily in
+    the order the actions were passed in. Documents rejected with a ``429``
+    status code are retried per chunk as in
+    :func:`~opensearchpy.helpers.async_streaming_bulk`.
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg actions: iterable or async iterable containing the actions to be executed
+    :arg max_inflight: maximum number of concurrent bulk requests (default: 4)
+    :arg chunk_size: number of docs in one chunk sent to client (default: 500),
+        ``"auto"`` or an :class:`~opensearchpy.helpers.AdaptiveChunkSize` to
+        adjust it from the latency and rejections of previous chunks
+    :arg max_chunk_bytes: the maximum size of the request in bytes (default: 100MB)
+    :arg raise_on_error: raise ``BulkIndexError`` containing errors (as `.errors`)
+        from the execution of the last chunk when some occur. By default we raise.
+    :arg raise_on_exception: if ``False`` then don't propagate exceptions from
+        call to ``bulk`` and just report the items that failed as failed.
+    :arg expand_action_callback: callback executed on each action passed in,
+        should return a tuple containing the action line and the data line
+        (`None` if data line should be omitted).
+    :arg max_retries: maximum number of times a document will be retried when
+        ``429`` is received, set to 0 (default) for no retries on ``429``
+    :arg initial_backoff: number of seconds we should wait before the first
+        retry. Any subsequent retries will be powers of ``initial_backoff *
+        2**retry_number``
+    :arg max_backoff: maximum number of seconds a retry will wait
+    :arg yield_ok: if set to False will skip successful documents in the output
+    :arg ignore_status: list of HTTP status code that you want to ignore
+    """
+    if max_inflight < 1:
+        raise ValueError("max_inflight must be at least 1")
+
+    async def map_actions() -> Any:
+        async for item in aiter(actions):
+            yield expand_action_callback(item)
+
+    chunk_size = _adaptive_chunk_size(chunk_size)
+    adaptive_chunk_size = (
+        chunk_size if isinstance(chunk_size, AdaptiveChunkSize) else None
+    )
+
+    async def process_chunk(bulk_data: Any, bulk_actions: Any) -> Any:
+        return [
+            item
+            async for item in _process_bulk_chunk_with_retries(
+                client,
+                bulk_actions,
+                bulk_data,
+                raise_on_exception,
+                raise_on_error,
+                ignore_status,
+                max_retries,
+                initial_backoff,
+                max_backoff,
+                yield_ok,
+                adaptive_chunk_size,
+                *args,
+                **kwargs,
+            )
+        ]
+
+    pending: Any = set()
+    try:
+        async for bulk_data, bulk_actions in _chunk_actions(
+            map_actions(), chunk_size, max_chunk_bytes, client.transport.serializer
+        ):
+            # results and errors of the chunks that completed meanwhile are
+            # reported right away, not once max_inflight requests are pending
+            if pending:
+                done, pending = await asyncio.wait(pending, timeout=0)
+                for task in done:
+                    for item in task.result():
+                        yield item
+            if len(pending) >= max_inflight:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
+                for task in done:
+                    for item in task.result():
+                        yield item
+            pending.add(asyncio.ensure_future(process_chunk(bulk_data, bulk_actions)))
 
-            try:
-                async for data, (ok, info) in azip(
-                    bulk_data,
-                    _process_bulk_chunk(
-                        client,
-                        bulk_actions,
-                        bulk_data,
-                        raise_on_exception,
-                        raise_on_error,
-                        ignore_status,
-                        *args,
-                        **kwargs,
-                    ),
-                ):
-                    if not ok:
-                        action, info = info.popitem()
-                        # retry if retries enabled, we get 429, and we are not
-                        # in the last attempt
-                        if (
-                            max_retries
-                            and info["status"] == 429
-                            and (attempt + 1) <= max_retries
-                        ):
-                            # _process_bulk_chunk expects strings so we need to
-                            # re-serialize the data
-                            to_retry.extend(
-                                map(client.transport.serializer.dumps, data)
-                            )
-                            to_retry_data.append(data)
-                        else:
-                            yield ok, {action: info}
-                    elif yield_ok:
-                        yield ok, info
-
-            except TransportError as e:
-                # suppress 429 errors since we will retry them
-                if attempt == max_retries or e.status_code != 429:
-                    raise
-            else:
-                if not to_retry:
-                    break
-                # retry only subset of documents that didn't succeed
-                bulk_actions, bulk_data = to_retry, to_retry_data
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                for item in task.result():
+                    yield item
+
+    finally:
+        # an error or the caller stopping early leaves requests behind
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
 
 async def async_bulk(
@@ -312,6 +509,126 @@ async def async_bulk(
     return success, failed if stats_only else errors
 
 
+async def _scan_pages(
+    client: Any,
+    query: Any = None,
+    scroll: str = "5m",
+    raise_on_error: bool = True,
+    preserve_order: bool = False,
+    size: int = 1000,
+    request_timeout: Any = None,
+    clear_scroll: bool = True,
+    scroll_kwargs: Any = None,
+    **kwargs: Any
+) -> Any:
+    """
+    Yields the responses of a scroll that have hits, see :func:`async_scan`.
+    """
+    query, scroll_kwargs, transport_kwargs = _scan_options(
+        query, preserve_order, scroll_kwargs, kwargs
+    )
+
+    # initial search
+    resp = await client.search(
+        body=query, scroll=scroll, size=size, request_timeout=request_timeout, **kwargs
+    )
+    scroll_id = resp.get("_scroll_id")
+
+    try:
+        while scroll_id and resp.get("hits", {}).get("hits"):
+            yield resp
+
+            _shards = resp.get("_shards")
+
+            if _shards:
+                # Default to 0 if the value isn't included in the response
+                shards_successful = _shards.get("successful", 0)
+                shards_skipped = _shards.get("skipped", 0)
+                shards_total = _shards.get("total", 0)
+
+            # check if we have any errors
+            if (shards_successful + shards_skipped) < shards_total:
+                shards_message = "Scroll request has only succeeded on %d (+%d skipped) shards out of %d."
+                logger.warning(
+                    shards_message,
+                    shards_successful,
+                    shards_skipped,
+                    shards_total,
+                )
+                if raise_on_error:
+                    raise ScanError(
+                        scroll_id,
+                        shards_message
+                        % (
+                            shards_successful,
+                            shards_skipped,
+                            shards_total,
+                        ),
+                    )
+            resp = await client.scroll(
+                body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
+            )
+            scroll_id = resp.get("_scroll_id")
+
+    finally:
+        if scroll_id and clear_scroll:
+            await client.clear_scroll(
+                body={"scroll_id": [scroll_id]},
+                **transport_kwargs,
+                ignore=(404,),
+            )
+
+
+async def _stream_scan_pages(
+    client: Any,
+    query: Any = None,
+    scroll: str = "5m",
+    raise_on_error: bool = True,
+    preserve_order: bool = False,
+    size: int = 1000,
+    request_timeout: Any = None,
+    clear_scroll: bool = True,
+    scroll_kwargs: Any = None,
+    **kwargs: Any
+) -> Any:
+    """
+    Yields an :class:`~opensearchpy.helpers.AsyncHitsStream` per page of a
+    scroll, the next page is requested once the previous one was consumed,
+    see :func:`async_scan`.
+    """
+    query, scroll_kwargs, transport_kwargs = _scan_options(
+        query, preserve_order, scroll_kwargs, kwargs
+    )
+
+    page = await async_stream_search(
+        client,
+        body=query,
+        scroll=scroll,
+        size=size,
+        request_timeout=request_timeout,
+        **kwargs,
+    )
+    try:
+        while True:
+            yield page
+            scroll_id = page.response.get("_scroll_id")
+            if not scroll_id or not page.count:
+                break
+            _check_shards(page.response, scroll_id, raise_on_error)
+            page = await async_stream_scroll(
+                client, body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
+            )
+
+    finally:
+        await page.aclose()
+        # the scroll id comes first, it is known even if a page was abandoned
+        scroll_id = page.response.get("_scroll_id")
+        if scroll_id and clear_scroll:
+            await client.clear_scroll(
+                body={"scroll_id": [scroll_id]}, ignore=(404,), **transport_kwargs
+            )
+
+
 async def async_scan(
     client: Any,
     query: Any = None,
@@ -322,6 +639,8 @@ async def async_scan(
     request_timeout: Any = None,
     clear_scroll: bool = True,
     scroll_kwargs: Any = None,
+    prefetch: int = 0,
+    stream: bool = False,
     **kwargs: Any
 ) -> Any:
     """
@@ -335,6 +654,10 @@ async def async_scan(
     may be an expensive operation and will negate the performance benefits of
     using ``scan``.
 
+    With ``prefetch`` set, the next scroll requests are sent from a
+    background task while the caller processes the current page, keeping
+    up to ``prefetch`` pages buffered.
+
     :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
     :arg query: body for the :meth:`~opensearchpy.AsyncOpenSearch.search` api
     :arg scroll: Specify how long a consistent view of the index should be
@@ -352,6 +675,11 @@ async def async_scan(
         to true.
     :arg scroll_kwargs: additional kwargs to be passed to
         :meth:`~opensearchpy.AsyncOpenSearch.scroll`
+    :arg prefetch: number of pages fetched ahead of the caller, defaults to 0
+        which only requests a page once the previous one is consumed
+    :arg stream: parse the hits of every page as the response is received,
+        see :func:`~opensearchpy.helpers.async_stream_search`, instead of
+        loading the whole page first. Can't be combined with ``prefetch``.
 
     Any additional keyword arguments will be passed to the initial
     :meth:`~opensearchpy.AsyncOpenSearch.search` call::
@@ -363,75 +691,333 @@ async def async_scan(
         )
 
     """
-    scroll_kwargs = scroll_kwargs or {}
+    if stream and prefetch > 0:
+        raise ValueError("async_scan() can't prefetch pages while streaming them")
+    pages = (_stream_scan_pages if stream else _scan_pages)(
+        client,
+        query=query,
+        scroll=scroll,
+        raise_on_error=raise_on_error,
+        preserve_order=preserve_order,
+        size=size,
+        request_timeout=request_timeout,
+        clear_scroll=clear_scroll,
+        scroll_kwargs=scroll_kwargs,
+        **kwargs,
+    )
+    if prefetch > 0:
+        pages = _prefetch(pages, prefetch)
+    try:
+        async for resp in pages:
+            if stream:
+                async for hit in resp:
+                    yield hit
+            else:
+                for hit in resp["hits"]["hits"]:
+                    yield hit
+    finally:
+        await pages.aclose()
+
+
+async def _prefetch(pages: Any, prefetch: int) -> Any:
+    """
+    Iterate the ``pages`` async generator in a background task, keeping up
+    to ``prefetch`` pages ahead of the consumer. The task is cancelled, which
+    closes the generator, when the consumer stops early.
+    """
+    buffer: Any = asyncio.Queue(max(prefetch, 1))
+    done = object()
 
-    if not preserve_order:
-        query = query.copy() if query else {}
-        query["sort"] = "_doc"
+    async def produce() -> None:
+        error = None
+        try:
+            async for page in pages:
+                await buffer.put((page, None))
+        except Exception as e:
+            error = e
+        finally:
+            await pages.aclose()
+        await buffer.put((done, error))
 
+    task = asyncio.ensure_future(produce())
+    try:
+        while True:
+            page, error = await buffer.get()
+            if page is done:
+                if error is not None:
+                    raise error
+                return
+            yield page
+
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def _pit_pages(
+    client: Any,
+    query: Any = None,
+    index: Any = None,
+    keep_alive: str = "5m",
+    size: int = 1000,
+    raise_on_error: bool = True,
+    request_timeout: Any = None,
+    pit_id: Optional[str] = None,
+    pit_kwargs: Any = None,
+    **kwargs: Any
+) -> Any:
+    """
+    Yields the responses of a point in time search that have hits, see
+    :func:`async_pit_scan`.
+    """
     # Grab options that should be propagated to every
     # API call within this helper instead of just 'search()'
-    transport_kwargs = {}
+    transport_kwargs: Dict[str, Any] = {}
     for key in ("headers", "api_key", "http_auth"):
         if key in kwargs:
             transport_kwargs[key] = kwargs[key]
 
-    # If the user is using 'scroll_kwargs' we want
-    # to propagate there too, but to not break backwards
-    # compatibility we'll not override anything already given.
-    if scroll_kwargs is not None and transport_kwargs:
-        for key, val in transport_kwargs.items():
-            scroll_kwargs.setdefault(key, val)
+    created = pit_id is None
+    if created:
+        resp = await client.create_pit(
+            index=index,
+            keep_alive=keep_alive,
+            **dict(transport_kwargs, **(pit_kwargs or {})),
+        )
+        pit_id = resp["pit_id"]
 
-    # initial search
-    resp = await client.search(
-        body=query, scroll=scroll, size=size, request_timeout=request_timeout, **kwargs
-    )
-    scroll_id = resp.get("_scroll_id")
+    query = _pit_query(query)
+    try:
+        while True:
+            body = dict(query, pit={"id": pit_id, "keep_alive": keep_alive})
+            resp = await client.search(
+                body=body, size=size, request_timeout=request_timeout, **kwargs
+            )
+            # the id may change between requests, always send the latest one
+            pit_id = resp.get("pit_id", pit_id)
+
+            hits = resp.get("hits", {}).get("hits")
+            if not hits:
+                break
+            yield resp
+
+            _check_shards(resp, pit_id, raise_on_error)
+            if len(hits) < size:
+                break
+            query["search_after"] = hits[-1]["sort"]
+
+    finally:
+        if created and pit_id:
+            await client.delete_pit(
+                body={"pit_id": [pit_id]}, ignore=(404,), **transport_kwargs
+            )
 
+
+async def async_pit_scan(
+    client: Any,
+    query: Any = None,
+    index: Any = None,
+    keep_alive: str = "5m",
+    size: int = 1000,
+    prefetch: int = 1,
+    raise_on_error: bool = True,
+    request_timeout: Any = None,
+    pit_id: Optional[str] = None,
+    pit_kwargs: Any = None,
+    **kwargs: Any
+) -> Any:
+    """
+    Alternative to :func:`~opensearchpy.helpers.async_scan` that iterates
+    over all hits of a query using a point in time and ``search_after``
+    instead of a scroll. The query is sorted by its ``sort`` followed by
+    ``_shard_doc`` as tiebreaker, or by ``_shard_doc`` alone, which is the
+    most efficient order.
+
+    The point in time is created on ``index`` and deleted once the iterator
+    is exhausted, fails or is closed, unless an existing ``pit_id`` is given,
+    which is left for the caller to delete.
+
+    While the caller consumes a page, the next ``prefetch`` pages are
+    requested from a background task.
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.AsyncOpenSearch.search` api
+    :arg index: index (or list of indices) to create the point in time on
+    :arg keep_alive: Specify how long the point in time should be kept alive
+        between requests
+    :arg size: number of hits per page
+    :arg prefetch: number of pages fetched ahead of the caller, set to 0 to
+        only request a page once the previous one is consumed (default: 1)
+    :arg raise_on_error: raises an exception (``ScanError``) if an error is
+        encountered (some shards fail to execute). By default we raise.
+    :arg request_timeout: explicit timeout for each search request
+    :arg pit_id: id of an existing point in time to use instead of creating
+        one on ``index``
+    :arg pit_kwargs: additional kwargs to be passed to
+        :meth:`~opensearchpy.AsyncOpenSearch.create_pit`
+
+    Any additional keyword arguments will be passed to every
+    :meth:`~opensearchpy.AsyncOpenSearch.search` call.
+    """
+    pages = _pit_pages(
+        client,
+        query=query,
+        index=index,
+        keep_alive=keep_alive,
+        size=size,
+        raise_on_error=raise_on_error,
+        request_timeout=request_timeout,
+        pit_id=pit_id,
+        pit_kwargs=pit_kwargs,
+        **kwargs,
+    )
+    if prefetch > 0:
+        pages = _prefetch(pages, prefetch)
     try:
-        while scroll_id and resp.get("hits", {}).get("hits"):
-            for hit in resp.get("hits", {}).get("hits", []):
+        async for resp in pages:
+            for hit in resp["hits"]["hits"]:
                 yield hit
+    finally:
+        await pages.aclose()
 
-            _shards = resp.get("_shards")
 
-            if _shards:
-                # Default to 0 if the value isn't included in the response
-                shards_successful = _shards.get("successful", 0)
-                shards_skipped = _shards.get("skipped", 0)
-                shards_total = _shards.get("total", 0)
+async def async_parallel_scan(
+    client: Any,
+    query: Any = None,
+    slices: int = 4,
+    queue_size: int = 4,
+    progress: Any = None,
+    pit: bool = False,
+    scroll: str = "5m",
+    raise_on_error: bool = True,
+    preserve_order: bool = False,
+    size: int = 1000,
+    request_timeout: Any = None,
+    clear_scroll: bool = True,
+    scroll_kwargs: Any = None,
+    **kwargs: Any
+) -> Any:
+    """
+    Parallel version of :func:`~opensearchpy.helpers.async_scan` that splits
+    the scroll into ``slices`` independent sliced scrolls and runs each of
+    them in its own task. Hits of all slices are yielded from a single
+    iterator as their pages arrive, so they are interleaved between slices.
+    Every slice clears its own scroll when it's exhausted, fails or the
+    iterator is closed.
 
-            # check if we have any errors
-            if (shards_successful + shards_skipped) < shards_total:
-                shards_message = "Scroll request has only succeeded on %d (+%d skipped) shards out of %d."
-                logger.warning(
-                    shards_message,
-                    shards_successful,
-                    shards_skipped,
-                    shards_total,
-                )
-                if raise_on_error:
-                    raise ScanError(
-                        scroll_id,
-                        shards_message
-                        % (
-                            shards_successful,
-                            shards_skipped,
-                            shards_total,
-                        ),
-                    )
-            resp = await client.scroll(
-                body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
+    With ``pit=True`` the slices page through a single point in time with
+    ``search_after`` as in :func:`~opensearchpy.helpers.async_pit_scan`
+    instead, ``index`` must then be passed and the point in time is deleted
+    once all slices are done.
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.AsyncOpenSearch.search` api
+    :arg slices: number of slices to split the scroll into (default: 4)
+    :arg queue_size: number of pages fetched ahead of the consumer, slices
+        pause while the queue is full
+    :arg progress: optional callable invoked with the slice id, the number of
+        hits yielded from that slice so far and the total number of hits of the
+        slice every time a page is consumed
+    :arg pit: use a point in time and ``search_after`` instead of scrolls
+    :arg scroll: Specify how long a consistent view of the index should be
+        maintained for scrolled search, or the keep alive of the point in time
+    :arg raise_on_error: raises an exception (``ScanError``) if an error is
+        encountered (some shards fail to execute). By default we raise.
+    :arg preserve_order: sort each slice by the query sort instead of
+        ``_doc``, hits of different slices are still interleaved. Point in
+        time slices are always sorted by the query sort, if any
+    :arg size: size (per shard) of the batch send at each iteration.
+    :arg request_timeout: explicit timeout for each call to ``scan``
+    :arg clear_scroll: explicitly calls delete on the scroll ids via the clear
+        scroll API at the end of each slice, defaults to true.
+    :arg scroll_kwargs: additional kwargs to be passed to
+        :meth:`~opensearchpy.AsyncOpenSearch.scroll`
+
+    Any additional keyword arguments will be passed to the initial
+    :meth:`~opensearchpy.AsyncOpenSearch.search` call of every slice.
+    """
+    if slices < 1:
+        raise ValueError("slices must be at least 1")
+
+    pages_queue: Any = asyncio.Queue(max(queue_size, 1))
+    pit_id = None
+
+    def slice_pages(slice_id: int) -> Any:
+        if pit:
+            return _pit_pages(
+                client,
+                query=_slice_query(query, slice_id, slices),
+                keep_alive=scroll,
+                size=size,
+                raise_on_error=raise_on_error,
+                request_timeout=request_timeout,
+                pit_id=pit_id,
+                **kwargs,
             )
-            scroll_id = resp.get("_scroll_id")
+        return _scan_pages(
+            client,
+            query=_slice_query(query, slice_id, slices),
+            scroll=scroll,
+            raise_on_error=raise_on_error,
+            preserve_order=preserve_order,
+            size=size,
+            request_timeout=request_timeout,
+            clear_scroll=clear_scroll,
+            scroll_kwargs=dict(scroll_kwargs or {}),
+            **kwargs,
+        )
+
+    async def run_slice(slice_id: int) -> None:
+        pages = slice_pages(slice_id)
+        error = None
+        try:
+            async for resp in pages:
+                await pages_queue.put((slice_id, resp, None))
+        except Exception as e:
+            error = e
+        finally:
+            await pages.aclose()
+        # a page-less item marks the slice as done
+        await pages_queue.put((slice_id, None, error))
+
+    transport_kwargs = {}
+    for key in ("headers", "api_key", "http_auth"):
+        if key in kwargs:
+            transport_kwargs[key] = kwargs[key]
+    if pit:
+        resp = await client.create_pit(
+            index=kwargs.pop("index", None), keep_alive=scroll, **transport_kwargs
+        )
+        pit_id = resp["pit_id"]
+
+    tasks = [asyncio.ensure_future(run_slice(slice_id)) for slice_id in range(slices)]
+    hit_counts = [0] * slices
+    try:
+        remaining = slices
+        while remaining:
+            slice_id, resp, error = await pages_queue.get()
+            if error is not None:
+                raise error
+            if resp is None:
+                remaining -= 1
+                continue
+
+            hits = resp["hits"]["hits"]
+            hit_counts[slice_id] += len(hits)
+            if progress is not None:
+                progress(slice_id, hit_counts[slice_id], _total_hits(resp))
+            for hit in hits:
+                yield hit
 
     finally:
-        if scroll_id and clear_scroll:
-            await client.clear_scroll(
-                body={"scroll_id": [scroll_id]},
-                **transport_kwargs,
-                ignore=(404,),
+        # slices still running when the consumer stops or fails are
+        # cancelled, which clears their scrolls
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if pit_id:
+            await client.delete_pit(
+                body={"pit_id": [pit_id]}, ignore=(404,), **transport_kwargs
             )
 
 
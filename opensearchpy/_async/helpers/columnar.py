@@ -0,0 +1,116 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from typing import Any, AsyncIterator, Iterable, Optional
+
+from ...helpers.columnar import (
+    ColumnarBatches,
+    _arrow_actions,
+    _expanded,
+    _pyarrow,
+    _to_batches,
+)
+from .actions import aiter, async_bulk, async_scan
+
+
+async def _async_batches(columnar: ColumnarBatches, hits: Any) -> AsyncIterator[Any]:
+    async for hit in aiter(hits):
+        batch = columnar.add(hit)
+        if batch is not None:
+            yield batch
+    batch = columnar.flush()
+    if batch is not None:
+        yield batch
+
+
+def async_scan_to_arrow(
+    client: Any,
+    query: Any = None,
+    index: Any = None,
+    fields: Optional[Iterable[str]] = None,
+    meta: Iterable[str] = (),
+    mapping: Any = None,
+    schema: Any = None,
+    batch_size: int = 10000,
+    **kwargs: Any,
+) -> AsyncIterator[Any]:
+    """
+    Run :func:`async_scan` and return the matching documents as
+    ``pyarrow.RecordBatch`` objects of up to ``batch_size`` rows, see
+    :func:`~opensearchpy.helpers.scan_to_arrow`::
+
+        async for batch in async_scan_to_arrow(client, index="orders"):
+            writer.write_batch(batch)
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.AsyncOpenSearch.search` api
+    :arg index: the indices to scan
+    :arg fields: the (dotted) paths of the fields to return as columns
+    :arg meta: metadata of the hits to return as columns, e.g. ``["_id"]``
+    :arg mapping: :class:`~opensearchpy.Mapping` or
+        :class:`~opensearchpy.AsyncDocument` subclass used to type the columns
+    :arg schema: ``pyarrow.Schema`` of the batches, instead of ``mapping``
+    :arg batch_size: number of rows of a batch
+
+    Any additional keyword arguments will be passed to :func:`async_scan`.
+    """
+    columnar = ColumnarBatches(
+        fields=fields, meta=meta, mapping=mapping, schema=schema, batch_size=batch_size
+    )
+    return _async_batches(
+        columnar, async_scan(client, query=query, index=index, **kwargs)
+    )
+
+
+async def async_bulk_from_arrow(
+    client: Any,
+    table: Any,
+    op_type: str = "index",
+    batch_size: int = 10000,
+    **kwargs: Any,
+) -> Any:
+    """
+    Index the rows of a ``pyarrow.Table``, a ``pyarrow.RecordBatch`` or an
+    iterable of record batches with :func:`async_bulk`, one document per
+    row, see :func:`~opensearchpy.helpers.bulk_from_arrow`::
+
+        success, errors = await async_bulk_from_arrow(client, table, index="orders")
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg table: the rows to index
+    :arg op_type: the action of the rows without an ``_op_type`` column
+    :arg batch_size: number of rows converted at a time
+
+    Any additional keyword arguments will be passed to :func:`async_bulk`.
+    """
+    pyarrow = _pyarrow()
+    actions = _arrow_actions(pyarrow, _to_batches(pyarrow, table, batch_size), op_type)
+    return await async_bulk(client, actions, expand_action_callback=_expanded, **kwargs)
+
+
+async def async_bulk_from_dataframe(
+    client: Any,
+    df: Any,
+    op_type: str = "index",
+    batch_size: int = 10000,
+    **kwargs: Any,
+) -> Any:
+    """
+    Index the rows of a ``pandas.DataFrame`` with :func:`async_bulk`, one
+    document per row, see :func:`~opensearchpy.helpers.bulk_from_dataframe`.
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg df: the rows to index
+    :arg op_type: the action of the rows without an ``_op_type`` column
+    :arg batch_size: number of rows converted at a time
+
+    Any additional keyword arguments will be passed to :func:`async_bulk`.
+    """
+    table = _pyarrow().Table.from_pandas(df, preserve_index=False)
+    return await async_bulk_from_arrow(client, table, op_type, batch_size, **kwargs)
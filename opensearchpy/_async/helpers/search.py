@@ -7,22 +7,56 @@
 # Modifications Copyright OpenSearch Contributors. See
 # GitHub history for details.
 
-import copy
-from typing import Any, Dict, Sequence, cast
+from typing import Any
 
-from opensearchpy._async.helpers.actions import aiter, async_scan
+from opensearchpy._async.helpers.actions import aiter, async_pit_scan, async_scan
+from opensearchpy._async.helpers.columnar import _async_batches
 from opensearchpy.connection.async_connections import get_connection
 from opensearchpy.exceptions import IllegalOperation, TransportError
 from opensearchpy.helpers.aggs import A
 from opensearchpy.helpers.query import Bool, Q
 from opensearchpy.helpers.response import Response
-from opensearchpy.helpers.search import AggsProxy, ProxyDescriptor, QueryProxy, Request
-from opensearchpy.helpers.utils import AttrDict, recursive_to_dict
+from opensearchpy.helpers.search import (
+    AggsProxy,
+    CompiledSearch,
+    ProxyDescriptor,
+    QueryProxy,
+    Request,
+)
+from opensearchpy.helpers.utils import AttrDict, CopyOnWrite, recursive_to_dict
+
+
+class AsyncCompiledSearch(CompiledSearch):
+    """
+    :class:`~opensearchpy.helpers.search.CompiledSearch` of an
+    :class:`AsyncSearch`, returned by :meth:`AsyncSearch.compile`.
+    """
+
+    async def execute(self, **values: Any) -> Any:
+        """
+        Execute the search with the given values for the placeholders and
+        return an instance of ``Response`` wrapping all the data.
+        """
+        s = self._search
+        opensearch = await get_connection(s._using)
+        return s._response_class(
+            s,
+            await opensearch.search(
+                index=s._index, body=self.render(**values), **s._params
+            ),
+        )
 
 
 class AsyncSearch(Request):
     query = ProxyDescriptor("query")
     post_filter = ProxyDescriptor("post_filter")
+    _sort = CopyOnWrite()
+    _collapse = CopyOnWrite()
+    _source = CopyOnWrite()
+    _highlight = CopyOnWrite()
+    _highlight_opts = CopyOnWrite()
+    _suggest = CopyOnWrite()
+    _script_fields = CopyOnWrite()
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -38,13 +72,13 @@ class AsyncSearch(Request):
         super().__init__(**kwargs)
 
         self.aggs = AggsProxy(self)
-        self._sort: Sequence[Any] = []
-        self._collapse: Dict[str, Any] = {}
-        self._source: Any = None
-        self._highlight: Any = {}
-        self._highlight_opts: Any = {}
-        self._suggest: Any = {}
-        self._script_fields: Any = {}
+        self._sort = []
+        self._collapse = {}
+        self._source = None
+        self._highlight = {}
+        self._highlight_opts = {}
+        self._suggest = {}
+        self._script_fields = {}
         self._response_class: Any = Response
 
         self._query_proxy = QueryProxy(self, "query")
@@ -112,30 +146,6 @@ class AsyncSearch(Request):
         s.update_from_dict(d)
         return s
 
-    def _clone(self) -> "AsyncSearch":
-        """
-        Return a clone of the current search request. Performs a shallow copy
-        of all the underlying objects. Used internally by most state modifying
-        APIs.
-        """
-        s = cast(AsyncSearch, super()._clone())
-
-        s._response_class = self._response_class
-        s._sort = self._sort[:]
-        s._source = copy.copy(self._source) if self._source is not None else None
-        s._highlight = self._highlight.copy()
-        s._highlight_opts = self._highlight_opts.copy()
-        s._suggest = self._suggest.copy()
-        s._script_fields = self._script_fields.copy()
-        s._collapse = self._collapse.copy()
-        for x in ("query", "post_filter"):
-            getattr(s, x)._proxied = getattr(self, x)._proxied
-
-        # copy top-level bucket definitions
-        if self.aggs._params.get("aggs"):
-            s.aggs._params = {"aggs": self.aggs._params["aggs"].copy()}
-        return s
-
     def response_class(self, cls: Any) -> Any:
         """
         Override the default wrapper used for the response.
@@ -298,7 +308,7 @@ class AsyncSearch(Request):
 
         The API returns a copy of the AsyncSearch object and can thus be chained.
         """
-        s = self._clone()
+        s: AsyncSearch = self._clone()
         s._collapse = {}
 
         if field is None:
@@ -427,6 +437,14 @@ class AsyncSearch(Request):
         d.update(recursive_to_dict(kwargs))
         return d
 
+    def compile(self) -> AsyncCompiledSearch:
+        """
+        Serialize the search once into an :class:`AsyncCompiledSearch` that
+        renders and executes its body for the values of the
+        :class:`~opensearchpy.helpers.search.Param` placeholders used in it.
+        """
+        return AsyncCompiledSearch(self._clone())
+
     async def count(self) -> Any:
         """
         Return the number of hits matching the query and filters. Note that
@@ -443,13 +461,16 @@ class AsyncSearch(Request):
             "count"
         ]
 
-    async def execute(self, ignore_cache: bool = False) -> Any:
+    async def execute(self, ignore_cache: bool = False, raw: bool = False) -> Any:
         """
         Execute the search and return an instance of ``Response`` wrapping all
         the data.
 
         :arg ignore_cache: if set to ``True``, consecutive calls will hit
             AsyncOpenSearch, while cached result will be ignored. Defaults to `False`
+        :arg raw: if set to ``True``, return the response body as the plain
+            ``dict`` returned by the client, without any objects for its
+            hits. Defaults to `False`
         """
         if ignore_cache or not hasattr(self, "_response"):
             opensearch = await get_connection(self._using)
@@ -460,9 +481,9 @@ class AsyncSearch(Request):
                     index=self._index, body=self.to_dict(), **self._params
                 ),
             )
-        return self._response
+        return self._response.to_dict() if raw else self._response
 
-    async def scan(self) -> Any:
+    async def scan(self, pit: bool = False) -> Any:
         """
         Turn the search into a scan search and return a generator that will
         iterate over all the documents matching the query.
@@ -470,15 +491,65 @@ class AsyncSearch(Request):
         Use ``params`` method to specify any additional arguments you with to
         pass to the underlying ``async_scan`` helper from ``opensearchpy``
 
+        :arg pit: iterate using a point in time and ``search_after`` with the
+            ``async_pit_scan`` helper instead of a scroll
+
         """
+        async for hit in aiter(await self._scan_hits(pit)):
+            yield self._get_result(hit)
+
+    async def _scan_hits(self, pit: bool = False) -> Any:
         opensearch = await get_connection(self._using)
+        return (async_pit_scan if pit else async_scan)(
+            opensearch, query=self.to_dict(), index=self._index, **self._params
+        )
 
-        async for hit in aiter(
-            async_scan(
-                opensearch, query=self.to_dict(), index=self._index, **self._params
-            )
-        ):
-            yield self._get_result(hit)
+    async def to_arrow(
+        self,
+        fields: Any = None,
+        meta: Any = (),
+        scan: bool = False,
+        batch_size: int = 10000,
+    ) -> Any:
+        """
+        Return the hits of the search as a ``pyarrow.Table`` with a column
+        per field, typed after the fields of the ``AsyncDocument`` classes
+        searched, see :class:`~opensearchpy.helpers.ColumnarBatches`.
+        Requires ``pyarrow``.
+
+        :arg fields: the (dotted) paths of the fields to return as columns,
+            all the fields of the documents searched by default
+        :arg meta: metadata of the hits to return as columns, e.g. ``["_id"]``
+        :arg scan: return all the documents matching the query, using the
+            ``async_scan`` helper like :meth:`scan`, instead of the hits of
+            one response
+        :arg batch_size: number of hits converted at a time
+        """
+        columnar = self._columnar_batches(fields, meta, batch_size)
+        if scan:
+            batches = [
+                batch
+                async for batch in _async_batches(columnar, await self._scan_hits())
+            ]
+            return columnar.table(batches)
+        hits = (await self.execute(raw=True))["hits"]["hits"]
+        return columnar.table(columnar.batches(hits))
+
+    async def to_pandas(
+        self,
+        fields: Any = None,
+        meta: Any = (),
+        scan: bool = False,
+        batch_size: int = 10000,
+    ) -> Any:
+        """
+        Return the hits of the search as a ``pandas.DataFrame``, converted
+        from :meth:`to_arrow`. Requires ``pyarrow`` and ``pandas``.
+        """
+        table = await self.to_arrow(
+            fields=fields, meta=meta, scan=scan, batch_size=batch_size
+        )
+        return table.to_pandas()
 
     async def delete(self) -> Any:
         """
@@ -500,9 +571,11 @@ class AsyncMultiSearch(Request):
     request.
     """
 
+    _searches = CopyOnWrite()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self._searches: Any = []
+        self._searches = []
 
     def __getitem__(self, key: Any) -> Any:
         return self._searches[key]
@@ -510,11 +583,6 @@ class AsyncMultiSearch(Request):
     def __iter__(self) -> Any:
         return iter(self._searches)
 
-    def _clone(self) -> Any:
-        ms = super()._clone()
-        ms._searches = self._searches[:]
-        return ms
-
     def add(self, search: Any) -> Any:
         """
         Adds a new :class:`~opensearchpy.AsyncSearch` object to the request::
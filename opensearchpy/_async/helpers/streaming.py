@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from collections import deque
+from typing import Any, Dict
+
+from ...helpers.streaming import (
+    HitsParser,
+    _scroll_request,
+    _search_request,
+    _to_bytes,
+)
+
+
+class AsyncHitsStream:
+    """
+    Async iterator over the documents of a search or scroll response, parsed
+    from the response body as it is read from the connection, see
+    :class:`~opensearchpy.helpers.HitsStream`. Returned by
+    :func:`async_stream_search` and :func:`async_stream_scroll`.
+    """
+
+    def __init__(self, chunks: Any, serializer: Any = None) -> None:
+        if isinstance(chunks, (str, bytes)):
+            # an error status passed in ``ignore`` is read right away
+            chunks = _single_chunk(chunks)
+        self.count = 0
+        self._chunks = chunks
+        self._parser = HitsParser(serializer)
+        self._hits: Any = deque()
+
+    @property
+    def response(self) -> Dict[str, Any]:
+        """The response without the documents of ``hits.hits``."""
+        return self._parser.response
+
+    def __aiter__(self) -> "AsyncHitsStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        while not self._hits:
+            try:
+                chunk = await self._chunks.__anext__()
+            except StopAsyncIteration:
+                self._parser.close()
+                raise
+            self._hits.extend(self._parser.feed(_to_bytes(chunk)))
+        self.count += 1
+        return self._hits.popleft()
+
+    async def aclose(self) -> None:
+        """Release the connection, the remaining documents aren't read."""
+        aclose = getattr(self._chunks, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+    async def __aenter__(self) -> "AsyncHitsStream":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.aclose()
+
+
+async def _single_chunk(chunk: Any) -> Any:
+    yield chunk
+
+
+async def async_stream_search(
+    client: Any, body: Any = None, index: Any = None, **kwargs: Any
+) -> AsyncHitsStream:
+    """
+    Run a search like :meth:`~opensearchpy.AsyncOpenSearch.search`,
+    returning an :class:`AsyncHitsStream` that parses the documents from
+    the response as it is received::
+
+        async with await async_stream_search(client, body=query) as hits:
+            async for hit in hits:
+                export(hit["_source"])
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg body: the search definition
+    :arg index: comma-separated list of indices to search
+
+    Any additional keyword arguments are the query parameters of
+    :meth:`~opensearchpy.AsyncOpenSearch.search`.
+    """
+    url, params, headers, body = _search_request(body, index, kwargs)
+    chunks = await client.transport.perform_request(
+        "POST", url, params=params, headers=headers, body=body, stream=True
+    )
+    return AsyncHitsStream(chunks, client.transport.serializer)
+
+
+async def async_stream_scroll(
+    client: Any, scroll_id: Any = None, body: Any = None, **kwargs: Any
+) -> AsyncHitsStream:
+    """
+    Fetch the next page of a scroll like
+    :meth:`~opensearchpy.AsyncOpenSearch.scroll`, returning an
+    :class:`AsyncHitsStream`, see :func:`async_stream_search`.
+
+    :arg client: instance of :class:`~opensearchpy.AsyncOpenSearch` to use
+    :arg scroll_id: the scroll id of the previous page
+    :arg body: the scroll id and scroll period, instead of ``scroll_id``
+    :arg scroll: period to retain the search context for scrolling
+    """
+    params, headers, body = _scroll_request(scroll_id, body, kwargs)
+    chunks = await client.transport.perform_request(
+        "POST",
+        "/_search/scroll",
+        params=params,
+        headers=headers,
+        body=body,
+        stream=True,
+    )
+    return AsyncHitsStream(chunks, client.transport.serializer)
@@ -13,11 +13,12 @@ from opensearchpy.connection.async_connections import get_connection
 from opensearchpy.helpers.query import Bool, Q
 from opensearchpy.helpers.response import UpdateByQueryResponse
 from opensearchpy.helpers.search import ProxyDescriptor, QueryProxy, Request
-from opensearchpy.helpers.utils import recursive_to_dict
+from opensearchpy.helpers.utils import CopyOnWrite, recursive_to_dict
 
 
 class AsyncUpdateByQuery(Request):
     query = ProxyDescriptor("query")
+    _script = CopyOnWrite()
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -33,7 +34,7 @@ class AsyncUpdateByQuery(Request):
         """
         super().__init__(**kwargs)
         self._response_class = UpdateByQueryResponse
-        self._script: Any = {}
+        self._script = {}
         self._query_proxy = QueryProxy(self, "query")
 
     def filter(self, *args: Any, **kwargs: Any) -> Any:
@@ -64,19 +65,6 @@ class AsyncUpdateByQuery(Request):
         u.update_from_dict(d)
         return u
 
-    def _clone(self) -> Any:
-        """
-        Return a clone of the current search request. Performs a shallow copy
-        of all the underlying objects. Used internally by most state modifying
-        APIs.
-        """
-        ubq = super()._clone()
-
-        ubq._response_class = self._response_class
-        ubq._script = self._script.copy()
-        ubq.query._proxied = self.query._proxied
-        return ubq
-
     def response_class(self, cls: Any) -> Any:
         """
         Override the default wrapper used for the response.
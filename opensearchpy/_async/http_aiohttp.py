@@ -29,12 +29,12 @@ import asyncio
 import os
 import ssl
 import warnings
-from typing import Any, Collection, Mapping, Optional, Union
+from typing import Any, AsyncIterator, Collection, Dict, Mapping, Optional, Union
 
 import urllib3
 
-from ..compat import reraise_exceptions, urlencode
-from ..connection.base import Connection
+from ..compat import is_stream, reraise_exceptions, urlencode
+from ..connection.base import STREAM_CHUNK_SIZE, Connection, _body_chunks, _to_bytes
 from ..exceptions import (
     ConnectionError,
     ConnectionTimeout,
@@ -60,12 +60,45 @@ class AsyncConnection(Connection):
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         raise NotImplementedError()
 
     async def close(self) -> None:
         raise NotImplementedError()
 
+    def _stream_body(  # type: ignore
+        self, body: Any, headers: Dict[str, str]
+    ) -> AsyncIterator[bytes]:
+        """
+        The chunks to send of a streamed request body, async iterators are
+        accepted too. Compressed on the fly when ``http_compress`` is on.
+        """
+        compressor = None
+        if self.compression:
+            headers["content-encoding"] = self.compression
+            compressor = self._compressor()
+        return _async_body_chunks(body, compressor)
+
+
+async def _async_body_chunks(body: Any, compressor: Any) -> AsyncIterator[bytes]:
+    async def chunks() -> AsyncIterator[Any]:
+        if isinstance(body, AsyncIterator):
+            async for chunk in body:
+                yield chunk
+        else:
+            for chunk in _body_chunks(body):
+                yield chunk
+
+    async for chunk in chunks():
+        data = _to_bytes(chunk)
+        if compressor is not None:
+            data = compressor.compress(data)
+        if data:
+            yield data
+    if compressor is not None:
+        yield compressor.flush()
+
 
 class AIOHttpConnection(AsyncConnection):
     session: aiohttp.ClientSession
@@ -90,7 +123,7 @@ class AIOHttpConnection(AsyncConnection):
         maxsize: Optional[int] = 10,
         headers: Any = None,
         ssl_context: Any = None,
-        http_compress: Optional[bool] = None,
+        http_compress: Optional[Union[bool, str]] = None,
         opaque_id: Optional[str] = None,
         loop: Any = None,
         trust_env: Optional[bool] = False,
@@ -124,7 +157,8 @@ class AIOHttpConnection(AsyncConnection):
             host. See https://urllib3.readthedocs.io/en/1.4/pools.html#api for more
             information.
         :arg headers: any custom http headers to be add to requests
-        :arg http_compress: Use gzip compression
+        :arg http_compress: Use gzip compression, or the ``"deflate"`` or
+            ``"zstd"`` content encoding, see :class:`~opensearchpy.Connection`
         :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
             For tracing all requests made by this transport.
         :arg loop: asyncio Event Loop to use with aiohttp. This is set by default to the currently running loop.
@@ -240,6 +274,7 @@ class AIOHttpConnection(AsyncConnection):
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         if self.session is None:
             await self._create_aiohttp_session()
@@ -285,22 +320,33 @@ class AIOHttpConnection(AsyncConnection):
         if headers:
             req_headers.update(headers)
 
-        if self.http_compress and body:
-            body = self._gzip_compress(body)
-            req_headers["content-encoding"] = "gzip"
+        data: Union[bytes, AsyncIterator[bytes], None] = body
+        if is_stream(body):
+            data = self._stream_body(body, req_headers)
+        elif self.http_compress and body:
+            data = self._compress(body, req_headers)
 
         start = self.loop.time()
         try:
-            async with self.session.request(
+            request = self.session.request(
                 method,
                 url,
-                data=body,
+                data=data,
                 headers=req_headers,
                 timeout=timeout,
                 fingerprint=self.ssl_assert_fingerprint,
-            ) as response:
-                raw_data = await response.text()
+            )
+            if stream:
+                response = await request
+                raw_data = await self._read_stream(response)
                 duration = self.loop.time() - start
+            else:
+                async with request as response:
+                    if self.response_as_bytes:
+                        raw_data = await response.read()
+                    else:
+                        raw_data = await response.text()
+                    duration = self.loop.time() - start
 
         # We want to reraise a cancellation or recursion error.
         except reraise_exceptions:
@@ -357,6 +403,39 @@ class AIOHttpConnection(AsyncConnection):
             await self.session.close()
             self.session = None
 
+    async def _read_stream(self, response: Any) -> Any:
+        """
+        The body of a streamed response: the chunks of a successful one, read
+        as they are consumed, and the whole body of an error.
+        """
+        if 200 <= response.status < 300:
+            return self._stream_response(response)
+        async with response:
+            if self.response_as_bytes:
+                return await response.read()
+            return await response.text()
+
+    async def _stream_response(self, response: Any) -> AsyncIterator[bytes]:
+        """
+        The chunks of a successful streamed response. The connection goes
+        back to the pool once the body was read and is closed if the
+        iterator is closed before.
+        """
+        complete = False
+        try:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                yield chunk
+            complete = True
+        except asyncio.TimeoutError as e:
+            raise ConnectionTimeout("TIMEOUT", str(e), e)
+        except aiohttp_exceptions.ClientError as e:
+            raise ConnectionError("N/A", str(e), e)
+        finally:
+            if complete:
+                response.release()
+            else:
+                response.close()
+
     async def _create_aiohttp_session(self) -> Any:
         """Creates an aiohttp.ClientSession(). This is delayed until
         the first call to perform_request() so that AsyncTransport has
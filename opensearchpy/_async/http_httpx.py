@@ -0,0 +1,221 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import time
+from typing import Any, AsyncIterator, Collection, Mapping, Optional, Union
+
+from ..compat import is_stream, reraise_exceptions, urlencode
+from ..connection.base import STREAM_CHUNK_SIZE
+from ..connection.http_httpx import _httpx_client_options, _httpx_error
+from .http_aiohttp import AsyncConnection
+
+try:
+    import httpx
+except ImportError:
+    # reported by _httpx_client_options when a connection is created
+    pass
+
+
+class AsyncHttpxHttpConnection(AsyncConnection):
+    """
+    Async connection using the `httpx` library, with HTTP/2 enabled by
+    default.
+
+    Over HTTP/2 the concurrent requests to a node are multiplexed over a
+    single TLS connection instead of taking one connection each. HTTP/2 is
+    negotiated with the node during the TLS handshake, plain ``http``
+    connections use HTTP/1.1 unless ``http1=False`` asks to speak HTTP/2
+    right away.
+
+    Requires ``pip install opensearch-py[http2]``.
+
+    :arg http_auth: optional http auth information as either ':' separated
+        string or a tuple, or an ``httpx.Auth`` instance.
+    :arg use_ssl: use ssl for the connection if `True`
+    :arg verify_certs: whether to verify SSL certificates
+    :arg ssl_show_warn: show warning when verify certs is disabled
+    :arg ca_certs: optional path to CA bundle. Defaults to configured OpenSSL
+        bundles from environment variables and then certifi before falling
+        back to the system certificates
+    :arg client_cert: path to the file containing the private key and the
+        certificate, or cert only if using client_key
+    :arg client_key: path to the file containing the private key if using
+        separate cert and key files (client_cert will contain only the cert)
+    :arg ssl_context: ``ssl.SSLContext`` to use instead of the SSL related
+        arguments above
+    :arg headers: any custom http headers to be add to requests
+    :arg http_compress: Use gzip compression, or the ``"deflate"`` or
+        ``"zstd"`` content encoding, see :class:`~opensearchpy.Connection`
+    :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
+        For tracing all requests made by this transport.
+    :arg pool_maxsize: Maximum number of TCP connections to the node. Over
+        HTTP/2 a single connection serves many concurrent requests.
+    :arg http1: allow HTTP/1.1 (default: True)
+    :arg http2: allow HTTP/2 (default: True)
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: Optional[int] = None,
+        http_auth: Any = None,
+        use_ssl: bool = False,
+        verify_certs: bool = True,
+        ssl_show_warn: bool = True,
+        ca_certs: Any = None,
+        client_cert: Any = None,
+        client_key: Any = None,
+        ssl_context: Any = None,
+        headers: Any = None,
+        http_compress: Optional[Union[bool, str]] = None,
+        opaque_id: Optional[str] = None,
+        pool_maxsize: Optional[int] = None,
+        http1: bool = True,
+        http2: bool = True,
+        loop: Any = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(
+            host=host,
+            port=port,
+            use_ssl=use_ssl,
+            headers=headers,
+            http_compress=http_compress,
+            opaque_id=opaque_id,
+            **kwargs,
+        )
+
+        options = _httpx_client_options(
+            self,
+            http_auth,
+            verify_certs,
+            ssl_show_warn,
+            ca_certs,
+            client_cert,
+            client_key,
+            ssl_context,
+            pool_maxsize,
+            http1,
+            http2,
+        )
+        self.client = httpx.AsyncClient(**options)
+        if not self.http_compress:
+            # httpx asks for compressed responses by default
+            self.client.headers.pop("accept-encoding", None)
+
+    async def perform_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Union[int, float]] = None,
+        ignore: Collection[int] = (),
+        headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
+    ) -> Any:
+        url_path = self.url_prefix + url
+        if params:
+            url_path = f"{url_path}?{urlencode(params)}"
+        full_url = self.host + url_path
+
+        req_headers = self.headers.copy()
+        if headers:
+            req_headers.update(headers)
+
+        orig_body = body
+        data: Union[bytes, AsyncIterator[bytes], None] = body
+        if is_stream(body):
+            data = self._stream_body(body, req_headers)
+        elif self.http_compress and body:
+            data = self._compress(body, req_headers)
+
+        start = time.time()
+        try:
+            request = self.client.build_request(
+                method,
+                full_url,
+                content=data,
+                headers=req_headers,
+                timeout=timeout if timeout is not None else self.timeout,
+            )
+            response = await self.client.send(request, stream=stream)
+            duration = time.time() - start
+            if stream and 200 <= response.status_code < 300:
+                raw_data: Any = self._stream_response(response)
+            else:
+                raw_data = self._decode_response(await response.aread())
+        # We want to reraise a cancellation or recursion error.
+        except reraise_exceptions:
+            raise
+        except Exception as e:
+            self.log_request_fail(
+                method,
+                full_url,
+                url_path,
+                orig_body,
+                time.time() - start,
+                exception=e,
+            )
+            raise _httpx_error(e)
+
+        # raise warnings if any from the 'Warnings' header.
+        self._raise_warnings(response.headers.get_list("warning"))
+
+        # raise errors based on http status codes, let the client handle those if needed
+        if (
+            not (200 <= response.status_code < 300)
+            and response.status_code not in ignore
+        ):
+            self.log_request_fail(
+                method,
+                full_url,
+                url_path,
+                orig_body,
+                duration,
+                status_code=response.status_code,
+                response=raw_data,
+            )
+            self._raise_error(
+                response.status_code,
+                raw_data,
+                response.headers.get("content-type"),
+            )
+
+        self.log_request_success(
+            method,
+            full_url,
+            url_path,
+            orig_body,
+            response.status_code,
+            raw_data,
+            duration,
+        )
+
+        return response.status_code, response.headers, raw_data
+
+    async def _stream_response(self, response: Any) -> AsyncIterator[bytes]:
+        """
+        The chunks of a streamed response body, read as they are consumed.
+        The connection is released once the body was read or the iterator
+        is closed.
+        """
+        try:
+            async for chunk in response.aiter_bytes(STREAM_CHUNK_SIZE):
+                yield chunk
+        except httpx.HTTPError as e:
+            raise _httpx_error(e)
+        finally:
+            await response.aclose()
+
+    async def close(self) -> None:
+        """
+        Explicitly closes connections
+        """
+        await self.client.aclose()
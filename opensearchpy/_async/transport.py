@@ -27,21 +27,29 @@
 
 import asyncio
 import logging
+import time
 from itertools import chain
-from typing import Any, Collection, Mapping, Optional, Type, Union
+from typing import Any, Collection, Dict, Mapping, Optional, Type, Union
 
 from opensearchpy.connection.base import Connection
 from opensearchpy.serializer import Serializer
 
+from ..compat import is_stream
 from ..connection_pool import ConnectionPool
 from ..exceptions import (
     ConnectionError,
-    ConnectionTimeout,
+    ImproperlyConfigured,
     SerializationError,
     TransportError,
 )
-from ..serializer import JSONSerializer
-from ..transport import Transport, get_host_info
+from ..routing import ShardRouter
+from ..transport import (
+    RetryBudget,
+    Transport,
+    _is_hedgeable,
+    _stream_position,
+    get_host_info,
+)
 from .compat import get_running_loop
 from .http_aiohttp import AIOHttpConnection
 
@@ -70,7 +78,7 @@ class AsyncTransport(Transport):
         sniffer_timeout: Any = None,
         sniff_timeout: float = 0.1,
         sniff_on_connection_fail: bool = False,
-        serializer: Serializer = JSONSerializer(),
+        serializer: Optional[Serializer] = None,
         serializers: Any = None,
         default_mimetype: str = "application/json",
         max_retries: int = 3,
@@ -78,6 +86,10 @@ class AsyncTransport(Transport):
         retry_on_status: Any = (502, 503, 504),
         retry_on_timeout: bool = False,
         send_get_body_as: str = "GET",
+        json_backend: Optional[str] = None,
+        hedge_after: Optional[Union[float, str]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        routing_aware: bool = False,
         **kwargs: Any
     ) -> None:
         """
@@ -102,6 +114,10 @@ class AsyncTransport(Transport):
             used for deserializing data coming from the server. (key is the mimetype)
         :arg default_mimetype: when no mimetype is specified by the server
             response assume this mimetype, defaults to `'application/json'`
+        :arg json_backend: use a :class:`~opensearchpy.FastJSONSerializer`
+            backed by this JSON library (``'auto'``, ``'orjson'``,
+            ``'ujson'``, ``'msgspec'`` or ``'json'``) instead of the default
+            serializer. Can't be combined with ``serializer``.
         :arg max_retries: maximum number of retries before an exception is propagated
         :arg pool_maxsize: Maximum connection pool size used by pool-manager
             For custom connection-pooling on current session
@@ -114,12 +130,29 @@ class AsyncTransport(Transport):
             don't support passing bodies with GET requests. If you set this to
             'POST' a POST method will be used instead, if to 'source' then the body
             will be serialized and passed as a query parameter `source`.
+        :arg hedge_after: hedge reads (``GET``, ``HEAD``, search and msearch
+            requests) that haven't completed after this many seconds by
+            sending a duplicate to another node, using whichever answers
+            first and cancelling the other, ``'p95'`` to learn the delay as
+            the 95th percentile of recent read latencies. Duplicates count
+            against ``max_retries``. Disabled by default, see
+            :attr:`hedge_stats`.
+        :arg retry_budget: :class:`~opensearchpy.RetryBudget` limiting
+            retries (and hedged requests) to a share of the successful
+            requests, unlimited by default. Pass
+            ``connection_pool_class=CircuitBreakerConnectionPool`` to also
+            keep failing nodes out of rotation until a probe succeeds.
+        :arg routing_aware: send single document requests straight to a node
+            holding the document's shard, see :class:`~opensearchpy.ShardRouter`.
+            The shard allocation is refreshed in the background on every
+            sniff and at least every minute. Disabled by default.
 
         Any extra keyword arguments will be passed to the `connection_class`
         when creating and instance unless overridden by that connection's
         options provided as part of the hosts parameter.
         """
         self.sniffing_task = None
+        self.routing_task: Any = None
         self.loop: Any = None
         self._async_init_called = False
         self._sniff_on_start_event: Optional[asyncio.Event] = None
@@ -141,7 +174,11 @@ class AsyncTransport(Transport):
             retry_on_status=retry_on_status,
             retry_on_timeout=retry_on_timeout,
             send_get_body_as=send_get_body_as,
-            **kwargs
+            json_backend=json_backend,
+            hedge_after=hedge_after,
+            retry_budget=retry_budget,
+            routing_aware=routing_aware,
+            **kwargs,
         )
 
         # Since we defer connections / sniffing to not occur
@@ -213,6 +250,9 @@ class AsyncTransport(Transport):
             if self.loop.time() >= self.last_sniff + self.sniffer_timeout:
                 self.create_sniff_task()
 
+        if self.router is not None and self.router.stale:
+            self.create_routing_task()
+
     async def _get_node_info(self, conn: Any, initial: Any) -> Any:
         try:
             # use small timeout for the sniffing request, should be a fast api call
@@ -308,13 +348,12 @@ class AsyncTransport(Transport):
                 "N/A", "Unable to sniff hosts - no viable hosts found."
             )
 
-        # remember current live connections
-        orig_connections = self.connection_pool.connections[:]
         self.set_connections(hosts)
         # close those connections that are not in use any more
-        for c in orig_connections:
-            if c not in self.connection_pool.connections:
-                await c.close()
+        for connection in self._drained_connections():
+            await connection.close()
+        if self.router is not None:
+            self.create_routing_task()
 
     def create_sniff_task(self, initial: bool = False) -> None:
         """
@@ -332,6 +371,37 @@ class AsyncTransport(Transport):
         if self.sniffing_task is None:
             self.sniffing_task = self.loop.create_task(self.sniff_hosts(initial))
 
+    async def refresh_routing(self) -> None:  # type: ignore
+        """
+        Fetch the shard allocation of the cluster and the addresses of its
+        nodes for routing aware requests (``routing_aware=True``).
+        """
+        if self.router is None:
+            raise ImproperlyConfigured("refresh_routing requires routing_aware=True")
+        cluster_state = await self.perform_request(
+            "GET",
+            "/_cluster/state/metadata,routing_table",
+            params=dict(ShardRouter.CLUSTER_STATE_PARAMS),
+        )
+        node_info = await self.perform_request("GET", "/_nodes/_all/http")
+        self._update_routing(cluster_state, node_info)
+
+    async def _try_refresh_routing(self) -> None:  # type: ignore
+        try:
+            await self.refresh_routing()
+        except Exception:
+            self.router.updated = time.time()  # type: ignore
+            logger.warning("Refreshing the shard allocation failed", exc_info=True)
+
+    def create_routing_task(self) -> None:
+        """
+        Refresh the shard allocation in a task unless one is already
+        running. Requests use the regular connection selection until the
+        first refresh completes.
+        """
+        if self.routing_task is None or self.routing_task.done():
+            self.routing_task = self.loop.create_task(self._try_refresh_routing())
+
     def mark_dead(self, connection: Connection) -> None:
         """
         Mark a connection as dead (failed) in the connection pool. If sniffing
@@ -355,6 +425,7 @@ class AsyncTransport(Transport):
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         """
         Perform the actual request. Retrieve a connection from the connection
@@ -374,47 +445,63 @@ class AsyncTransport(Transport):
         :arg params: dictionary of query parameters, will be handed over to the
             underlying :class:`~opensearchpy.Connection` class for serialization
         :arg body: body of the request, will be serialized using serializer and
-            passed to the connection
+            passed to the connection. File-like objects and (async) iterators
+            of ``bytes`` or ``str`` chunks are streamed as they are, a stream
+            that can't be rewound isn't retried.
         :arg timeout: timeout of the request. If it is not presented as argument
             will be extracted from `params`
+        :arg stream: return the body of a successful response as an async
+            iterator of ``bytes`` chunks read from the connection as they are
+            consumed instead of deserializing it, the connection is released
+            once the iterator is exhausted or closed
         """
         await self._async_call()
 
+        routed = None
+        if self.router is not None:
+            routed = self._routed_connection(method, url, params, body)
+        streamed_body = is_stream(body)
+        hedge = (
+            self.hedger is not None
+            and not streamed_body
+            and not stream
+            and _is_hedgeable(method, url, params)
+        )
         method, params, body, ignore, timeout = self._resolve_request_args(
             method, params, body, ignore, timeout
         )
+        if hedge:
+            return await self._perform_hedged_request(
+                method, url, params, body, timeout, ignore, headers, routed
+            )
+        position = _stream_position(body) if streamed_body else None
 
         for attempt in range(self.max_retries + 1):
-            connection = self.get_connection()
+            if attempt and position is not None:
+                body.seek(position)  # type: ignore
+            # retries go through the regular selection, the routed node may be down
+            if attempt == 0 and routed is not None:
+                connection = routed
+            else:
+                connection = self.get_connection()
 
             try:
-                status, headers_response, data = await connection.perform_request(
+                status, headers_response, data = await self._perform_attempt(
+                    connection,
                     method,
                     url,
                     params,
                     body,
-                    headers=headers,
-                    ignore=ignore,
-                    timeout=timeout,
+                    timeout,
+                    ignore,
+                    headers,
+                    stream,
                 )
-
-                # Lowercase all the header names for consistency in accessing them.
-                headers_response = {
-                    header.lower(): value for header, value in headers_response.items()
-                }
             except TransportError as e:
                 if method == "HEAD" and e.status_code == 404:
                     return False
 
-                retry = False
-                if isinstance(e, ConnectionTimeout):
-                    retry = self.retry_on_timeout
-                elif isinstance(e, ConnectionError):
-                    retry = True
-                elif e.status_code in self.retry_on_status:
-                    retry = True
-
-                if retry:
+                if self._should_retry(e):
                     try:
                         # only mark as dead if we are retrying
                         self.mark_dead(connection)
@@ -422,24 +509,149 @@ class AsyncTransport(Transport):
                         # If sniffing on failure, it could fail too. Catch the
                         # exception not to interrupt the retries.
                         pass
-                    # raise exception on last retry
-                    if attempt == self.max_retries:
+                    # raise exception on last retry, for a stream that was
+                    # consumed or once the budget is spent
+                    if (
+                        attempt == self.max_retries
+                        or (streamed_body and position is None)
+                        or not self._retry_allowed()
+                    ):
                         raise e
                 else:
                     raise e
 
             else:
-                # connection didn't fail, confirm its live status
-                self.connection_pool.mark_live(connection)
+                return self._process_response(
+                    connection, method, status, headers_response, data, stream
+                )
 
-                if method == "HEAD":
-                    return 200 <= status < 300
+    async def _perform_hedged_request(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        timeout: Any,
+        ignore: Collection[int],
+        headers: Any,
+        routed: Optional[Connection] = None,
+    ) -> Any:
+        """
+        Send a read to one node and, if it hasn't answered within the hedging
+        delay, a duplicate to another one. The first successful answer wins
+        and the other request is cancelled, a failed attempt marks its node
+        as dead and is retried while the other is still waited for. At most
+        ``max_retries + 1`` requests are sent in total.
+        """
+        hedger: Any = self.hedger
+        args = (method, url, params, body, timeout, ignore, headers)
+        pending: Dict["asyncio.Task[Any]", Connection] = {}
+        hedge: Optional["asyncio.Task[Any]"] = None
+        hedged = False
+        sent = 0
+
+        def send(connection: Connection) -> "asyncio.Task[Any]":
+            nonlocal sent
+            sent += 1
+            task = asyncio.ensure_future(
+                self._perform_hedged_attempt(connection, *args)
+            )
+            pending[task] = connection
+            return task
 
-                if data:
-                    data = self.deserializer.loads(
-                        data, headers_response.get("content-type")
-                    )
-                return data
+        try:
+            send(routed or self.get_connection())
+            while True:
+                delay = None
+                if not hedged and sent <= self.max_retries:
+                    delay = hedger.delay
+                done, _ = await asyncio.wait(
+                    pending, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    hedged = True
+                    connection = self._get_hedge_connection(pending.values())
+                    if connection is not None and self._retry_allowed():
+                        hedger.hedge_fired()
+                        hedge = send(connection)
+                    continue
+
+                for task in done:
+                    connection = pending.pop(task)
+                    try:
+                        status, headers_response, data = task.result()
+                    except TransportError as e:
+                        if method == "HEAD" and e.status_code == 404:
+                            return False
+                        if not self._should_retry(e):
+                            raise
+                        try:
+                            self.mark_dead(connection)
+                        except TransportError:
+                            pass
+                        # keep waiting for the other attempt, if any
+                        if pending:
+                            continue
+                        if sent > self.max_retries or not self._retry_allowed():
+                            raise
+                        send(self.get_connection())
+                    else:
+                        if task is hedge:
+                            hedger.hedge_won()
+                        return self._process_response(
+                            connection, method, status, headers_response, data
+                        )
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _perform_hedged_attempt(self, connection: Connection, *args: Any) -> Any:
+        start = time.perf_counter()
+        response = await self._perform_attempt(connection, *args)
+        self.hedger.record(time.perf_counter() - start)  # type: ignore
+        return response
+
+    async def _perform_attempt(
+        self,
+        connection: Connection,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        timeout: Any,
+        ignore: Collection[int],
+        headers: Any,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Send the request over ``connection`` once, keeping the connection
+        pool informed of the request.
+        """
+        kwargs = {"stream": True} if stream else {}
+        self.connection_pool.request_started(connection)
+        start = time.perf_counter()
+        try:
+            status, headers_response, data = await connection.perform_request(
+                method,
+                url,
+                params,
+                body,
+                headers=headers,
+                ignore=ignore,
+                timeout=timeout,
+                **kwargs,
+            )
+        finally:
+            self.connection_pool.request_finished(
+                connection, time.perf_counter() - start
+            )
+
+        # Lowercase all the header names for consistency in accessing them.
+        headers_response = {
+            header.lower(): value for header, value in headers_response.items()
+        }
+        return status, headers_response, data
 
     async def close(self) -> None:
         """
@@ -453,6 +665,14 @@ class AsyncTransport(Transport):
                 pass
             self.sniffing_task = None
 
+        if self.routing_task:
+            self.routing_task.cancel()
+            try:
+                await self.routing_task
+            except asyncio.CancelledError:
+                pass
+            self.routing_task = None
+
         for connection in self.connection_pool.connections:
             await connection.close()
 
@@ -29,7 +29,7 @@ import base64
 import weakref
 from datetime import date, datetime
 from functools import wraps
-from typing import Any, Callable, Optional
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Iterator, Optional
 
 from opensearchpy.serializer import Serializer
 
@@ -180,10 +180,91 @@ def query_params(*opensearch_query_params: Any) -> Callable:  # type: ignore
     return _wrapper
 
 
+# size of the chunks the lines of a bulk body read from an iterator are sent in
+BULK_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _bulk_line(serializer: Optional[Serializer], line: Any) -> bytes:
+    line = serializer.dumps(line)  # type: ignore
+    if isinstance(line, str):
+        line = line.encode("utf-8", "surrogatepass")
+    if not line.endswith(b"\n"):
+        line += b"\n"
+    return line  # type: ignore
+
+
+def _bulk_stream(serializer: Optional[Serializer], lines: Any) -> Iterator[bytes]:
+    """
+    Serialize the lines of a bulk body as they are consumed, joined into
+    chunks of about ``BULK_STREAM_CHUNK_SIZE`` bytes.
+    """
+    chunk = []
+    size = 0
+    for line in lines:
+        data = _bulk_line(serializer, line)
+        chunk.append(data)
+        size += len(data)
+        if size >= BULK_STREAM_CHUNK_SIZE:
+            yield b"".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield b"".join(chunk)
+
+
+async def _async_bulk_stream(
+    serializer: Optional[Serializer], lines: Any
+) -> AsyncIterator[bytes]:
+    """The async counterpart of :func:`_bulk_stream`."""
+    chunk = []
+    size = 0
+    async for line in lines:
+        data = _bulk_line(serializer, line)
+        chunk.append(data)
+        size += len(data)
+        if size >= BULK_STREAM_CHUNK_SIZE:
+            yield b"".join(chunk)
+            chunk = []
+            size = 0
+    if chunk:
+        yield b"".join(chunk)
+
+
+class BulkStream:
+    """
+    Wraps the lines of a bulk body, an iterable or an async iterable (e.g. a
+    generator), to serialize and send them as they are consumed instead of
+    joining them into one body first. A streamed body can't be retried on
+    another node nor signed by ``AWSV4SignerAuth``.
+
+    :arg lines: the actions and documents of the bulk body
+    """
+
+    def __init__(self, lines: Any) -> None:
+        self.lines = lines
+
+
 def _bulk_body(serializer: Optional[Serializer], body: Any) -> Any:
+    # file-like objects (e.g. an NDJSON file) are streamed as they are
+    if hasattr(body, "read"):
+        return body
+    # lines are only serialized lazily when asked to, see BulkStream
+    if isinstance(body, BulkStream):
+        if isinstance(body.lines, AsyncIterable):
+            return _async_bulk_stream(serializer, body.lines)
+        return _bulk_stream(serializer, body.lines)
+
     # if not passed in a string, serialize items and join by newline
     if not isinstance(body, string_types):
-        body = "\n".join(map(serializer.dumps, body))  # type: ignore
+        lines = list(map(serializer.dumps, body))  # type: ignore
+        # bytes producing serializers (FastJSONSerializer) keep the body as bytes
+        if any(isinstance(line, bytes) for line in lines):
+            body = b"\n".join(
+                line.encode("utf-8", "surrogatepass") if isinstance(line, str) else line
+                for line in lines
+            )
+        else:
+            body = "\n".join(lines)
 
     # bulk body must end with a newline
     if isinstance(body, bytes):
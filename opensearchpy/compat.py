@@ -25,9 +25,9 @@
 #  under the License.
 
 
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Iterator, Mapping
 from queue import Queue
-from typing import Tuple, Type, Union
+from typing import Any, Tuple, Type, Union
 from urllib.parse import quote, quote_plus, unquote, urlencode, urlparse
 
 string_types = str, bytes
@@ -52,6 +52,16 @@ def to_bytes(x: Union[str, bytes], encoding: str = "ascii") -> bytes:
     return x
 
 
+def is_stream(body: Any) -> bool:
+    """
+    returns whether a request body is streamed rather than serialized at once
+    :param body: the request body
+    :return: True for file-like objects and iterators (e.g. generators) of
+        bytes or str chunks
+    """
+    return hasattr(body, "read") or isinstance(body, (Iterator, AsyncIterator))
+
+
 try:
     reraise_exceptions: Tuple[Type[BaseException], ...] = (RecursionError,)
 except NameError:
@@ -67,6 +77,7 @@ except (ImportError, AttributeError):
 
 __all__ = [
     "string_types",
+    "is_stream",
     "reraise_exceptions",
     "quote_plus",
     "quote",
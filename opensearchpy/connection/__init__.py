@@ -26,11 +26,13 @@
 
 
 from .base import Connection
+from .http_httpx import HttpxHttpConnection
 from .http_requests import RequestsHttpConnection
 from .http_urllib3 import Urllib3HttpConnection, create_ssl_context
 
 __all__ = [
     "Connection",
+    "HttpxHttpConnection",
     "RequestsHttpConnection",
     "Urllib3HttpConnection",
     "create_ssl_context",
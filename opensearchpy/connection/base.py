@@ -24,22 +24,32 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
-import gzip
-import io
 import logging
 import os
 import re
 import warnings
+import zlib
 from platform import python_version
-from typing import Any, Collection, Dict, Mapping, Optional, Union
+from typing import Any, Collection, Dict, Iterator, Mapping, Optional, Union
 
 try:
     import simplejson as json
 except ImportError:
     import json  # type: ignore
 
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from .._version import __versionstr__
-from ..exceptions import HTTP_EXCEPTIONS, OpenSearchWarning, TransportError
+from ..compat import is_stream
+from ..exceptions import (
+    HTTP_EXCEPTIONS,
+    ImproperlyConfigured,
+    OpenSearchWarning,
+    TransportError,
+)
 
 logger = logging.getLogger("opensearch")
 
@@ -52,6 +62,58 @@ if not TRACER_ALREADY_CONFIGURED:
 
 _WARNING_RE = re.compile(r"\"([^\"]*)\"")
 
+# size of the blocks a file-like request body is read and sent in
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# the content encodings request bodies can be compressed with
+COMPRESSION_ALGORITHMS = ("gzip", "deflate", "zstd")
+
+
+def _request_logging_enabled() -> bool:
+    """
+    Whether any per-request record (request summary, bodies or trace) would be
+    emitted. :mod:`logging` caches level checks and invalidates the cache on
+    every level change, so this is cheap enough to call for every request.
+    """
+    return logger.isEnabledFor(logging.INFO) or bool(
+        tracer.handlers and tracer.isEnabledFor(logging.INFO)
+    )
+
+
+def _compress_chunks(chunks: Any, compressor: Any) -> Iterator[bytes]:
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _to_bytes(chunk: Any) -> bytes:
+    """Encode a chunk of a streamed request body."""
+    if isinstance(chunk, str):
+        return chunk.encode("utf-8", "surrogatepass")
+    return bytes(chunk)
+
+
+def _body_chunks(body: Any) -> Iterator[bytes]:
+    """
+    The ``bytes`` chunks of a file-like object or an iterable of ``bytes``
+    or ``str`` chunks, read lazily.
+    """
+    chunks = body
+    if hasattr(body, "read"):
+        chunks = iter(lambda: body.read(STREAM_CHUNK_SIZE), body.read(0))
+    for chunk in chunks:
+        if chunk:
+            yield _to_bytes(chunk)
+
+
+def _to_text(data: Any) -> Any:
+    """Decode a raw response body for logging and error messages."""
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data).decode("utf-8", "surrogatepass")
+    return data
+
 
 class Connection:
     """
@@ -66,9 +128,20 @@ class Connection:
     :arg use_ssl: use ssl for the connection if `True`
     :arg url_prefix: optional url prefix for opensearch
     :arg timeout: default timeout in seconds (float, default: 10)
-    :arg http_compress: Use gzip compression
+    :arg http_compress: Compress request bodies and ask for compressed
+        responses. ``True`` or ``"gzip"`` use gzip, ``"deflate"`` and
+        ``"zstd"`` (requires the ``zstandard`` package) can be used with
+        nodes that accept these content encodings
+    :arg compression_level: level request bodies are compressed at, defaults
+        to 6 for gzip and deflate and 3 for zstd. Lower levels are faster
+        with a slightly larger body
+    :arg compression_threshold: only compress request bodies of at least
+        this many bytes, streamed bodies are always compressed (default: 0)
     :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
         For tracing all requests made by this transport.
+    :arg response_as_bytes: return the response body from `perform_request`
+        as the raw ``bytes`` received instead of decoding it to ``str`` first,
+        serializers parse it directly (default: `False`)
     """
 
     def __init__(
@@ -79,8 +152,11 @@ class Connection:
         url_prefix: str = "",
         timeout: int = 10,
         headers: Optional[Dict[str, str]] = None,
-        http_compress: Optional[bool] = None,
+        http_compress: Optional[Union[bool, str]] = None,
         opaque_id: Optional[str] = None,
+        response_as_bytes: bool = False,
+        compression_level: Optional[int] = None,
+        compression_threshold: int = 0,
         **kwargs: Any,
     ) -> None:
         if port is None:
@@ -114,6 +190,19 @@ class Connection:
             use_ssl = True
         self.use_ssl = use_ssl
         self.http_compress = http_compress or False
+        self.compression = "gzip" if http_compress is True else http_compress or None
+        if self.compression not in (None,) + COMPRESSION_ALGORITHMS:
+            raise ImproperlyConfigured(
+                f"Unsupported http_compress value {http_compress!r}, use one of "
+                f"True, {', '.join(map(repr, COMPRESSION_ALGORITHMS))}"
+            )
+        if self.compression == "zstd" and zstandard is None:
+            raise ImproperlyConfigured(
+                "Please install zstandard to use http_compress='zstd'."
+            )
+        self.compression_level = compression_level
+        self.compression_threshold = compression_threshold
+        self.response_as_bytes = response_as_bytes
 
         self.scheme = scheme
         self.hostname = host
@@ -145,11 +234,49 @@ class Connection:
     def __hash__(self) -> int:
         return id(self)
 
-    def _gzip_compress(self, body: Any) -> bytes:
-        buf = io.BytesIO()
-        with gzip.GzipFile(fileobj=buf, mode="wb") as f:
-            f.write(body)
-        return buf.getvalue()
+    def _compressor(self) -> Any:
+        """
+        A new compressor for the ``http_compress`` content encoding, with the
+        ``compress``/``flush`` interface of ``zlib.compressobj``.
+        """
+        if self.compression == "zstd":
+            level = 3 if self.compression_level is None else self.compression_level
+            return zstandard.ZstdCompressor(level=level).compressobj()
+        level = 6 if self.compression_level is None else self.compression_level
+        wbits = zlib.MAX_WBITS | 16 if self.compression == "gzip" else zlib.MAX_WBITS
+        return zlib.compressobj(level, zlib.DEFLATED, wbits)
+
+    def _compress(self, body: Any, headers: Dict[str, str]) -> Any:
+        """
+        ``body`` compressed with the ``http_compress`` content encoding, which
+        is set in ``headers``. Bodies smaller than ``compression_threshold``
+        are sent as they are.
+        """
+        if not self.compression or len(body) < self.compression_threshold:
+            return body
+        headers["content-encoding"] = self.compression
+        compressor = self._compressor()
+        return compressor.compress(body) + compressor.flush()
+
+    def _stream_body(self, body: Any, headers: Dict[str, str]) -> Iterator[bytes]:
+        """
+        The chunks to send of a streamed request body, compressed on the fly
+        when ``http_compress`` is on.
+        """
+        chunks = _body_chunks(body)
+        if not self.compression:
+            return chunks
+        headers["content-encoding"] = self.compression
+        return _compress_chunks(chunks, self._compressor())
+
+    def _decode_response(self, data: bytes) -> Union[str, bytes]:
+        """
+        Return the response body the way `perform_request` hands it to the
+        transport, only decoded when ``response_as_bytes`` is off.
+        """
+        if self.response_as_bytes:
+            return data
+        return data.decode("utf-8", "surrogatepass")
 
     def _raise_warnings(self, warning_headers: Any) -> None:
         """If 'headers' contains a 'Warning' header raise
@@ -186,17 +313,19 @@ class Connection:
             ).replace("'", r"\u0027")
         except (ValueError, TypeError):
             # non-json data or a bulk request
-            return data  # type: ignore
+            return _to_text(data)  # type: ignore
 
     def _log_request_response(
-        self, body: Optional[Union[str, bytes]], response: Optional[str]
+        self,
+        body: Optional[Union[str, bytes]],
+        response: Optional[Union[str, bytes]],
     ) -> None:
         if logger.isEnabledFor(logging.DEBUG):
             if body and isinstance(body, bytes):
                 body = body.decode("utf-8", "ignore")
             logger.debug("> %s", body)
             if response is not None:
-                logger.debug("< %s", response)
+                logger.debug("< %s", _to_text(response))
 
     def _log_trace(
         self,
@@ -204,10 +333,10 @@ class Connection:
         path: str,
         body: Optional[Union[str, bytes]],
         status_code: Optional[int],
-        response: Optional[str],
+        response: Optional[Union[str, bytes]],
         duration: Optional[float],
     ) -> None:
-        if not tracer.isEnabledFor(logging.INFO) or not tracer.handlers:
+        if not tracer.handlers or not tracer.isEnabledFor(logging.INFO):
             return
 
         # include pretty in trace curls
@@ -239,6 +368,7 @@ class Connection:
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         raise NotImplementedError()
 
@@ -249,16 +379,25 @@ class Connection:
         path: str,
         body: Any,
         status_code: int,
-        response: str,
+        response: Any,
         duration: float,
     ) -> None:
         """Log a successful API call."""
-        #  TODO: optionally pass in params instead of full_url and do urlencode only when needed
+        # skip formatting, decoding and pretty printing unless something is
+        # going to be emitted
+        if not _request_logging_enabled():
+            return
 
         logger.info(
             "%s %s [status:%s request:%.3fs]", method, full_url, status_code, duration
         )
 
+        # streamed bodies can only be read once, by the caller
+        if is_stream(body):
+            body = None
+        if is_stream(response):
+            response = None
+
         self._log_request_response(body, response)
         self._log_trace(method, path, body, status_code, response, duration)
 
@@ -270,7 +409,7 @@ class Connection:
         body: Any,
         duration: float,
         status_code: Optional[int] = None,
-        response: Optional[str] = None,
+        response: Optional[Union[str, bytes]] = None,
         exception: Optional[Exception] = None,
     ) -> None:
         """Log an unsuccessful API call."""
@@ -286,6 +425,8 @@ class Connection:
             exc_info=exception is not None,
         )
 
+        if is_stream(body):
+            body = None
         self._log_request_response(body, response)
         self._log_trace(method, path, body, status_code, response, duration)
 
@@ -296,6 +437,7 @@ class Connection:
         content_type: Optional[str] = None,
     ) -> None:
         """Locate appropriate exception and raise it."""
+        raw_data = _to_text(raw_data)
         error_message = raw_data
         additional_info = None
         try:
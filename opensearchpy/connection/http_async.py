@@ -15,6 +15,7 @@ import ssl
 import warnings
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Collection,
     Dict,
@@ -30,7 +31,7 @@ import yarl
 from .._async._extra_imports import aiohttp, aiohttp_exceptions  # type: ignore
 from .._async.compat import get_running_loop
 from .._async.http_aiohttp import AIOHttpConnection
-from ..compat import reraise_exceptions, string_types, urlencode
+from ..compat import is_stream, reraise_exceptions, string_types, urlencode
 from ..exceptions import (
     ConnectionError,
     ConnectionTimeout,
@@ -69,7 +70,7 @@ class AsyncHttpConnection(AIOHttpConnection):
         maxsize: Optional[int] = 10,
         headers: Optional[Mapping[str, str]] = None,
         ssl_context: Any = None,
-        http_compress: Optional[bool] = None,
+        http_compress: Optional[Union[bool, str]] = None,
         opaque_id: Optional[str] = None,
         loop: Any = None,
         **kwargs: Any,
@@ -180,6 +181,7 @@ class AsyncHttpConnection(AIOHttpConnection):
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         if self.session is None:
             await self._create_aiohttp_session()
@@ -213,9 +215,11 @@ class AsyncHttpConnection(AIOHttpConnection):
         if headers:
             req_headers.update(headers)
 
-        if self.http_compress and body:
-            body = self._gzip_compress(body)
-            req_headers["content-encoding"] = "gzip"
+        data: Union[bytes, AsyncIterator[bytes], None] = body
+        if is_stream(body):
+            data = self._stream_body(body, req_headers)
+        elif self.http_compress and body:
+            data = self._compress(body, req_headers)
 
         auth = (
             self._http_auth if isinstance(self._http_auth, aiohttp.BasicAuth) else None
@@ -224,23 +228,32 @@ class AsyncHttpConnection(AIOHttpConnection):
             req_headers = {
                 **req_headers,
                 **self._http_auth(
-                    method=method, url=url, body=body, headers=req_headers
+                    method=method, url=url, body=data, headers=req_headers
                 ),
             }
 
         start = self.loop.time()
         try:
-            async with self.session.request(
+            request = self.session.request(
                 method,
                 yarl.URL(url, encoded=True),
-                data=body,
+                data=data,
                 auth=auth,
                 headers=req_headers,
                 timeout=timeout,
                 fingerprint=self.ssl_assert_fingerprint,
-            ) as response:
-                raw_data = await response.text()
+            )
+            if stream:
+                response = await request
+                raw_data = await self._read_stream(response)
                 duration = self.loop.time() - start
+            else:
+                async with request as response:
+                    if self.response_as_bytes:
+                        raw_data = await response.read()
+                    else:
+                        raw_data = await response.text()
+                    duration = self.loop.time() - start
 
         # We want to reraise a cancellation or recursion error.
         except reraise_exceptions:
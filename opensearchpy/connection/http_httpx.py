@@ -0,0 +1,334 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import os
+import ssl
+import time
+import warnings
+from typing import Any, Collection, Dict, Iterator, Mapping, Optional, Union
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+from opensearchpy.metrics import Metrics, MetricsNone
+
+from ..compat import is_stream, reraise_exceptions, string_types, urlencode
+from ..exceptions import (
+    ConnectionError,
+    ConnectionTimeout,
+    ImproperlyConfigured,
+    SSLError,
+)
+from .base import STREAM_CHUNK_SIZE, Connection
+
+
+def _httpx_client_options(
+    connection: Connection,
+    http_auth: Any,
+    verify_certs: bool,
+    ssl_show_warn: bool,
+    ca_certs: Any,
+    client_cert: Any,
+    client_key: Any,
+    ssl_context: Any,
+    pool_maxsize: Optional[int],
+    http1: bool,
+    http2: bool,
+) -> Dict[str, Any]:
+    """
+    Keyword arguments of the ``httpx.Client`` or ``httpx.AsyncClient`` of
+    an httpx based connection.
+    """
+    if not HTTPX_AVAILABLE:
+        raise ImproperlyConfigured(
+            "Please install httpx to use %s." % type(connection).__name__
+        )
+    if http2:
+        try:
+            import h2  # noqa: F401  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            raise ImproperlyConfigured(
+                "Please install httpx[http2] to use HTTP/2 with %s, or pass http2=False."
+                % type(connection).__name__
+            )
+
+    if isinstance(http_auth, (tuple, list)):
+        http_auth = tuple(http_auth)
+    elif isinstance(http_auth, string_types):
+        http_auth = tuple(http_auth.split(":", 1))  # type: ignore
+
+    options: Dict[str, Any] = {
+        "auth": http_auth,
+        "http1": http1,
+        "http2": http2,
+        # the connection pool retries on other nodes, httpx must not follow
+        # redirects nor read the proxy and certificate environment variables
+        "follow_redirects": False,
+        "trust_env": False,
+    }
+    if pool_maxsize and isinstance(pool_maxsize, int):
+        options["limits"] = httpx.Limits(
+            max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+        )
+
+    if ssl_context is not None:
+        if verify_certs is not True or ca_certs or client_cert or client_key:
+            warnings.warn(
+                "When using `ssl_context`, all other SSL related kwargs are ignored"
+            )
+        options["verify"] = ssl_context
+    elif connection.use_ssl:
+        ssl_context = ssl.create_default_context()
+        if verify_certs:
+            ca_certs = connection.default_ca_certs() if ca_certs is None else ca_certs
+            if ca_certs:
+                if os.path.isdir(ca_certs):
+                    ssl_context.load_verify_locations(capath=ca_certs)
+                else:
+                    ssl_context.load_verify_locations(cafile=ca_certs)
+        else:
+            if ca_certs:
+                raise ImproperlyConfigured(
+                    "You cannot pass CA certificates when verify SSL is off."
+                )
+            ssl_context.check_hostname = False
+            ssl_context.verify_mode = ssl.CERT_NONE
+            if ssl_show_warn:
+                warnings.warn(
+                    "Connecting to %s using SSL with verify_certs=False is insecure."
+                    % connection.host
+                )
+        if client_cert:
+            ssl_context.load_cert_chain(client_cert, client_key)
+        options["verify"] = ssl_context
+    return options
+
+
+def _httpx_error(e: Exception) -> Exception:
+    """
+    Map an exception raised by httpx to the exception of the connection
+    layer.
+    """
+    if isinstance(e, httpx.TimeoutException):
+        return ConnectionTimeout("TIMEOUT", str(e), e)
+    cause: Optional[BaseException] = e
+    while cause is not None:
+        if isinstance(cause, ssl.SSLError):
+            return SSLError("N/A", str(e), e)
+        cause = cause.__cause__ or cause.__context__
+    return ConnectionError("N/A", str(e), e)
+
+
+class HttpxHttpConnection(Connection):
+    """
+    Connection using the `httpx` library, with HTTP/2 enabled by default.
+
+    Over HTTP/2 the concurrent requests to a node are multiplexed over a
+    single TLS connection instead of taking one connection each, share the
+    connection between the threads of your application rather than
+    creating more connections. HTTP/2 is negotiated with the node during
+    the TLS handshake, plain ``http`` connections use HTTP/1.1 unless
+    ``http1=False`` asks to speak HTTP/2 right away.
+
+    Requires ``pip install opensearch-py[http2]``.
+
+    :arg http_auth: optional http auth information as either ':' separated
+        string or a tuple, or an ``httpx.Auth`` instance.
+    :arg use_ssl: use ssl for the connection if `True`
+    :arg verify_certs: whether to verify SSL certificates
+    :arg ssl_show_warn: show warning when verify certs is disabled
+    :arg ca_certs: optional path to CA bundle. Defaults to configured OpenSSL
+        bundles from environment variables and then certifi before falling
+        back to the system certificates
+    :arg client_cert: path to the file containing the private key and the
+        certificate, or cert only if using client_key
+    :arg client_key: path to the file containing the private key if using
+        separate cert and key files (client_cert will contain only the cert)
+    :arg ssl_context: ``ssl.SSLContext`` to use instead of the SSL related
+        arguments above
+    :arg headers: any custom http headers to be add to requests
+    :arg http_compress: Use gzip compression, or the ``"deflate"`` or
+        ``"zstd"`` content encoding, see :class:`~opensearchpy.Connection`
+    :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
+        For tracing all requests made by this transport.
+    :arg pool_maxsize: Maximum number of TCP connections to the node. Over
+        HTTP/2 a single connection serves many concurrent requests.
+    :arg http1: allow HTTP/1.1 (default: True)
+    :arg http2: allow HTTP/2 (default: True)
+    :arg metrics: metrics is an instance of a subclass of the
+        :class:`~opensearchpy.Metrics` class, used for collecting
+        and reporting metrics related to the client's operations;
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: Optional[int] = None,
+        http_auth: Any = None,
+        use_ssl: bool = False,
+        verify_certs: bool = True,
+        ssl_show_warn: bool = True,
+        ca_certs: Any = None,
+        client_cert: Any = None,
+        client_key: Any = None,
+        ssl_context: Any = None,
+        headers: Any = None,
+        http_compress: Any = None,
+        opaque_id: Any = None,
+        pool_maxsize: Any = None,
+        http1: bool = True,
+        http2: bool = True,
+        metrics: Metrics = MetricsNone(),
+        **kwargs: Any,
+    ) -> None:
+        self.metrics = metrics
+        super().__init__(
+            host=host,
+            port=port,
+            use_ssl=use_ssl,
+            headers=headers,
+            http_compress=http_compress,
+            opaque_id=opaque_id,
+            **kwargs,
+        )
+
+        options = _httpx_client_options(
+            self,
+            http_auth,
+            verify_certs,
+            ssl_show_warn,
+            ca_certs,
+            client_cert,
+            client_key,
+            ssl_context,
+            pool_maxsize,
+            http1,
+            http2,
+        )
+        self.base_url = f"{self.host}{self.url_prefix}"
+        self.client = httpx.Client(**options)
+        if not self.http_compress:
+            # httpx asks for compressed responses by default
+            self.client.headers.pop("accept-encoding", None)
+
+    def perform_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        body: Optional[bytes] = None,
+        timeout: Optional[Union[int, float]] = None,
+        ignore: Collection[int] = (),
+        headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
+    ) -> Any:
+        url_path = self.url_prefix + url
+        if params:
+            url_path = f"{url_path}?{urlencode(params)}"
+        full_url = self.host + url_path
+
+        req_headers = self.headers.copy()
+        if headers:
+            req_headers.update(headers)
+
+        orig_body = body
+        data: Union[bytes, Iterator[bytes], None] = body
+        if is_stream(body):
+            data = self._stream_body(body, req_headers)
+        elif self.http_compress and body:
+            data = self._compress(body, req_headers)
+
+        start = time.time()
+        try:
+            self.metrics.request_start()
+            request = self.client.build_request(
+                method,
+                full_url,
+                content=data,
+                headers=req_headers,
+                timeout=timeout or self.timeout,
+            )
+            response = self.client.send(request, stream=stream)
+            duration = time.time() - start
+            if stream and 200 <= response.status_code < 300:
+                raw_data: Any = self._stream_response(response)
+            else:
+                raw_data = self._decode_response(response.read())
+        except reraise_exceptions:
+            raise
+        except Exception as e:
+            self.log_request_fail(
+                method,
+                full_url,
+                url_path,
+                orig_body,
+                time.time() - start,
+                exception=e,
+            )
+            raise _httpx_error(e)
+        finally:
+            self.metrics.request_end()
+
+        # raise warnings if any from the 'Warnings' header.
+        self._raise_warnings(response.headers.get_list("warning"))
+
+        # raise errors based on http status codes, let the client handle those if needed
+        if (
+            not (200 <= response.status_code < 300)
+            and response.status_code not in ignore
+        ):
+            self.log_request_fail(
+                method,
+                full_url,
+                url_path,
+                orig_body,
+                duration,
+                response.status_code,
+                raw_data,
+            )
+            self._raise_error(
+                response.status_code,
+                raw_data,
+                response.headers.get("content-type"),
+            )
+
+        self.log_request_success(
+            method,
+            full_url,
+            url_path,
+            orig_body,
+            response.status_code,
+            raw_data,
+            duration,
+        )
+
+        return response.status_code, response.headers, raw_data
+
+    def _stream_response(self, response: Any) -> Iterator[bytes]:
+        """
+        The chunks of a streamed response body, read as they are consumed.
+        The connection is released once the body was read or the iterator
+        is closed.
+        """
+        try:
+            yield from response.iter_bytes(STREAM_CHUNK_SIZE)
+        except httpx.HTTPError as e:
+            raise _httpx_error(e)
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        """
+        Explicitly closes connections
+        """
+        self.client.close()
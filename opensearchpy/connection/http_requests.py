@@ -27,7 +27,15 @@
 
 import time
 import warnings
-from typing import Any, Collection, Mapping, MutableMapping, Optional, Union
+from typing import (
+    Any,
+    Collection,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Optional,
+    Union,
+)
 
 try:
     import requests
@@ -38,14 +46,14 @@ except ImportError:
 
 from opensearchpy.metrics import Metrics, MetricsNone
 
-from ..compat import reraise_exceptions, string_types, urlencode
+from ..compat import is_stream, reraise_exceptions, string_types, urlencode
 from ..exceptions import (
     ConnectionError,
     ConnectionTimeout,
     ImproperlyConfigured,
     SSLError,
 )
-from .base import Connection
+from .base import STREAM_CHUNK_SIZE, Connection
 
 
 class RequestsHttpConnection(Connection):
@@ -66,7 +74,8 @@ class RequestsHttpConnection(Connection):
     :arg client_key: path to the file containing the private key if using
         separate cert and key files (client_cert will contain only the cert)
     :arg headers: any custom http headers to be add to requests
-    :arg http_compress: Use gzip compression
+    :arg http_compress: Use gzip compression, or the ``"deflate"`` or
+        ``"zstd"`` content encoding, see :class:`~opensearchpy.Connection`
     :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
         For tracing all requests made by this transport.
     :arg pool_maxsize: Maximum connection pool size used by pool-manager
@@ -173,6 +182,7 @@ class RequestsHttpConnection(Connection):
         allow_redirects: Optional[bool] = True,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         url = self.base_url + url
         headers = headers or {}
@@ -180,15 +190,18 @@ class RequestsHttpConnection(Connection):
             url = f"{url}?{urlencode(params or {})}"
 
         orig_body = body
-        if self.http_compress and body:
-            body = self._gzip_compress(body)
-            headers["content-encoding"] = "gzip"  # type: ignore
+        data: Union[bytes, Iterator[bytes], None] = body
+        if is_stream(body):
+            # requests sends generators with chunked transfer encoding
+            data = self._stream_body(body, headers)  # type: ignore
+        elif self.http_compress and body:
+            data = self._compress(body, headers)  # type: ignore
 
         start = time.time()
-        request = requests.Request(method=method, headers=headers, url=url, data=body)
+        request = requests.Request(method=method, headers=headers, url=url, data=data)
         prepared_request = self.session.prepare_request(request)
         settings = self.session.merge_environment_settings(
-            prepared_request.url, {}, None, None, None
+            prepared_request.url, {}, stream, None, None
         )
         send_kwargs: Any = {
             "timeout": timeout or self.timeout,
@@ -199,7 +212,10 @@ class RequestsHttpConnection(Connection):
             self.metrics.request_start()
             response = self.session.send(prepared_request, **send_kwargs)
             duration = time.time() - start
-            raw_data = response.content.decode("utf-8", "surrogatepass")
+            if stream and 200 <= response.status_code < 300:
+                raw_data: Any = self._stream_response(response)
+            else:
+                raw_data = self._decode_response(response.content)
         except reraise_exceptions:
             raise
         except Exception as e:
@@ -257,6 +273,19 @@ class RequestsHttpConnection(Connection):
 
         return response.status_code, response.headers, raw_data
 
+    def _stream_response(self, response: Any) -> Iterator[bytes]:
+        """
+        The chunks of a streamed response body, read as they are consumed.
+        The connection goes back to the pool once the body was read and is
+        closed if the iterator is closed before.
+        """
+        try:
+            yield from response.iter_content(STREAM_CHUNK_SIZE)
+        except requests.exceptions.RequestException as e:
+            raise ConnectionError("N/A", str(e), e)
+        finally:
+            response.close()
+
     @property
     def headers(self) -> Any:  # type: ignore
         return self.session.headers
@@ -27,7 +27,7 @@
 import ssl
 import time
 import warnings
-from typing import Any, Callable, Collection, Mapping, Optional, Union
+from typing import Any, Callable, Collection, Iterator, Mapping, Optional, Union
 
 import urllib3
 from urllib3.exceptions import ReadTimeoutError
@@ -36,14 +36,14 @@ from urllib3.util.retry import Retry
 
 from opensearchpy.metrics import Metrics, MetricsNone
 
-from ..compat import reraise_exceptions, urlencode
+from ..compat import is_stream, reraise_exceptions, urlencode
 from ..exceptions import (
     ConnectionError,
     ConnectionTimeout,
     ImproperlyConfigured,
     SSLError,
 )
-from .base import Connection
+from .base import STREAM_CHUNK_SIZE, Connection
 
 # sentinel value for `verify_certs` and `ssl_show_warn`.
 # This is used to detect if a user is passing in a value
@@ -93,7 +93,8 @@ class Urllib3HttpConnection(Connection):
         host. See https://urllib3.readthedocs.io/en/1.4/pools.html#api for more
         information.
     :arg headers: any custom http headers to be add to requests
-    :arg http_compress: Use gzip compression
+    :arg http_compress: Use gzip compression, or the ``"deflate"`` or
+        ``"zstd"`` content encoding, see :class:`~opensearchpy.Connection`
     :arg opaque_id: Send this value in the 'X-Opaque-Id' HTTP header
         For tracing all requests made by this transport.
     :arg metrics: metrics is an instance of a subclass of the
@@ -238,6 +239,7 @@ class Urllib3HttpConnection(Connection):
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         if self.pool is None:
             self._create_urllib3_pool()
@@ -249,12 +251,21 @@ class Urllib3HttpConnection(Connection):
 
         full_url = self.host + url
 
+        # signers hash the whole body, checked before the request as errors
+        # raised while signing it are wrapped in a ConnectionError
+        if is_stream(body) and callable(self.http_auth):
+            raise ValueError(
+                "Streamed request bodies can't be signed, pass the body as bytes or str"
+            )
+
         start = time.time()
         orig_body = body
         try:
             kw = {}
             if timeout:
                 kw["timeout"] = timeout
+            if stream:
+                kw["preload_content"] = False
 
             # in python2 we need to make sure the url and method are not
             # unicode. Otherwise the body will be decoded into unicode too and
@@ -267,21 +278,27 @@ class Urllib3HttpConnection(Connection):
             request_headers = self.headers.copy()
             request_headers.update(headers or ())
 
-            if self.http_compress and body:
-                body = self._gzip_compress(body)
-                request_headers["content-encoding"] = "gzip"
+            data: Union[bytes, Iterator[bytes], None] = body
+            if is_stream(body):
+                data = self._stream_body(body, request_headers)
+                kw["chunked"] = True
+            elif self.http_compress and body:
+                data = self._compress(body, request_headers)
 
             if self.http_auth is not None:
                 if isinstance(self.http_auth, Callable):  # type: ignore
-                    request_headers.update(self.http_auth(method, full_url, body))
+                    request_headers.update(self.http_auth(method, full_url, data))
 
             self.metrics.request_start()
 
             response = self.pool.urlopen(
-                method, url, body, retries=Retry(False), headers=request_headers, **kw
+                method, url, data, retries=Retry(False), headers=request_headers, **kw
             )
             duration = time.time() - start
-            raw_data = response.data.decode("utf-8", "surrogatepass")
+            if stream and 200 <= response.status < 300:
+                raw_data: Any = self._stream_response(response)
+            else:
+                raw_data = self._decode_response(response.data)
         except reraise_exceptions:
             raise
         except Exception as e:
@@ -317,6 +334,25 @@ class Urllib3HttpConnection(Connection):
 
         return response.status, response.headers, raw_data
 
+    def _stream_response(self, response: Any) -> Iterator[bytes]:
+        """
+        The chunks of a streamed response body, read as they are consumed.
+        The connection goes back to the pool once the body was read and is
+        closed if the iterator is closed before.
+        """
+        complete = False
+        try:
+            yield from response.stream(STREAM_CHUNK_SIZE)
+            complete = True
+        except ReadTimeoutError as e:
+            raise ConnectionTimeout("TIMEOUT", str(e), e)
+        except urllib3.exceptions.HTTPError as e:
+            raise ConnectionError("N/A", str(e), e)
+        finally:
+            if not complete:
+                response.close()
+            response.release_conn()
+
     def get_response_headers(self, response: Any) -> Any:
         return {header.lower(): value for header, value in response.headers.items()}
 
@@ -26,11 +26,12 @@
 
 
 import logging
+import math
 import random
 import threading
 import time
 from queue import Empty, PriorityQueue
-from typing import Any, Dict, Optional, Sequence, Tuple, Type
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
 
 from .connection import Connection
 from .exceptions import ImproperlyConfigured
@@ -55,8 +56,13 @@ class ConnectionSelector:
     Example of where this would be useful is a zone-aware selector that would
     only select connections from its own zones and only fall back to other
     connections where there would be none in its zones.
+
+    The :class:`~opensearchpy.ConnectionPool` owning the selector is set as
+    its `pool` attribute, e.g. to read its requests in flight.
     """
 
+    pool: "ConnectionPool"
+
     def __init__(self, opts: Sequence[Tuple[Connection, Any]]) -> None:
         """
         :arg opts: dictionary of connection instances and their options
@@ -71,6 +77,35 @@ class ConnectionSelector:
         """
         pass
 
+    def on_request_start(self, connection: Connection) -> None:
+        """
+        Called by the transport right before a request is sent over
+        ``connection``.
+
+        :arg connection: the connection the request is sent over
+        """
+        pass
+
+    def on_request_end(self, connection: Connection, duration: float) -> None:
+        """
+        Called by the transport once the request sent over ``connection`` has
+        completed, successfully or not.
+
+        :arg connection: the connection the request was sent over
+        :arg duration: round trip of the request in seconds
+        """
+        pass
+
+    def on_connection_removed(self, connection: Connection) -> None:
+        """
+        Called by the connection pool once ``connection`` was removed from
+        it, e.g. by sniffing, and no longer has requests in flight, to
+        forget what is known about it.
+
+        :arg connection: the removed connection
+        """
+        pass
+
 
 class RandomSelector(ConnectionSelector):
     """
@@ -96,6 +131,101 @@ class RoundRobinSelector(ConnectionSelector):
         return connections[self.data.rr]
 
 
+class LeastOutstandingSelector(ConnectionSelector):
+    """
+    Selector sending requests to the connection with the fewest requests in
+    flight. Two connections are picked at random and the less loaded one
+    wins (power of two choices), which spreads the load nearly as well as
+    comparing all connections without herding every client onto the same
+    node.
+
+    The requests in flight are the ones counted by the connection pool, fed
+    by the transport, so the selector works with both
+    :class:`~opensearchpy.Transport` and :class:`~opensearchpy.AsyncTransport`.
+    """
+
+    def cost(self, connection: Connection) -> float:
+        """
+        Cost of sending the next request over ``connection``, lower is better.
+
+        :arg connection: a live connection
+        """
+        return self.pool.inflight.get(connection, 0)
+
+    def select(self, connections: Sequence[Connection]) -> Any:
+        first, second = random.sample(connections, 2)
+        return second if self.cost(second) < self.cost(first) else first
+
+
+class LeastLatencySelector(LeastOutstandingSelector):
+    """
+    Selector steering requests away from connections that are slow without
+    being dead, e.g. a node in a long garbage collection or holding a hot
+    shard.
+
+    Every connection keeps an exponentially weighted moving average (EWMA)
+    of its request latency. Its cost is that average multiplied by the
+    number of requests in flight plus one, and two connections picked at
+    random are compared (power of two choices). Connections without any
+    recorded request cost nothing, so new and resurrected nodes are tried
+    right away. The average of a connection that isn't used decays by half
+    every ``half_life`` seconds so that a node which was slow gets probed
+    again once it had some time to recover.
+
+    Pass it to the client as ``selector_class``, binding the options with
+    :func:`functools.partial` to change the defaults::
+
+        client = OpenSearch(hosts, selector_class=LeastLatencySelector)
+        client = OpenSearch(
+            hosts, selector_class=partial(LeastLatencySelector, half_life=30)
+        )
+
+    :arg alpha: weight of the latest request in the moving average
+        (default: 0.3)
+    :arg half_life: seconds after which the average of an idle connection
+        has decayed by half (default: 10)
+    """
+
+    def __init__(
+        self,
+        opts: Sequence[Tuple[Connection, Any]],
+        alpha: float = 0.3,
+        half_life: float = 10.0,
+    ) -> None:
+        if not 0 < alpha <= 1:
+            raise ImproperlyConfigured("alpha must be between 0 and 1")
+        if half_life <= 0:
+            raise ImproperlyConfigured("half_life must be positive")
+        super().__init__(opts)
+        self.alpha = alpha
+        self.half_life = half_life
+        # connection -> (moving average of the latency, time of the last update)
+        self.latency: Dict[Connection, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def cost(self, connection: Connection) -> float:
+        try:
+            latency, updated = self.latency[connection]
+        except KeyError:
+            return 0.0
+        idle = time.monotonic() - updated
+        if idle > 0:
+            latency *= math.pow(0.5, idle / self.half_life)
+        return latency * (self.pool.inflight.get(connection, 0) + 1)
+
+    def on_request_end(self, connection: Connection, duration: float) -> None:
+        now = time.monotonic()
+        with self._lock:
+            if connection in self.latency:
+                latency, _ = self.latency[connection]
+                duration = self.alpha * duration + (1 - self.alpha) * latency
+            self.latency[connection] = (duration, now)
+
+    def on_connection_removed(self, connection: Connection) -> None:
+        with self._lock:
+            self.latency.pop(connection, None)
+
+
 class ConnectionPool:
     """
     Container holding the :class:`~opensearchpy.Connection` instances,
@@ -117,6 +247,10 @@ class ConnectionPool:
     the timeout is over the connection will be resurrected and returned to the
     live pool. A connection that has been previously marked as dead and
     succeeds will be marked as live (its fail count will be deleted).
+
+    When sniffing finds a different set of nodes the pool is updated in place
+    (via `update`): the state of the remaining connections is kept and the
+    connections that went away are drained.
     """
 
     connections_opts: Sequence[Tuple[Connection, Any]]
@@ -160,6 +294,12 @@ class ConnectionPool:
         # PriorityQueue for thread safety and ease of timeout management
         self.dead = PriorityQueue(len(self.connections))
         self.dead_count = {}
+        self.randomize_hosts = randomize_hosts
+        # requests in flight per connection and connections no longer in the
+        # pool waiting for theirs to complete
+        self.inflight: Dict[Connection, int] = {}
+        self.draining: List[Connection] = []
+        self._inflight_lock = threading.Lock()
 
         if randomize_hosts:
             # randomize the connection list to avoid all clients hitting same node
@@ -171,6 +311,7 @@ class ConnectionPool:
         self.timeout_cutoff = timeout_cutoff
 
         self.selector = selector_class(dict(connections))  # type: ignore
+        self.selector.pool = self
 
     def mark_dead(self, connection: Any, now: Optional[float] = None) -> None:
         """
@@ -282,6 +423,104 @@ class ConnectionPool:
         # only one connection, no need for a selector
         return connections[0]
 
+    def request_started(self, connection: Connection) -> None:
+        """
+        Count a request about to be sent over ``connection`` as in flight and
+        let the selector know, used by load aware selectors such as
+        :class:`~opensearchpy.LeastOutstandingSelector`.
+
+        :arg connection: the connection returned by `get_connection`
+        """
+        with self._inflight_lock:
+            self.inflight[connection] = self.inflight.get(connection, 0) + 1
+        self.selector.on_request_start(connection)
+
+    def request_finished(self, connection: Connection, duration: float) -> None:
+        """
+        Count the request sent over ``connection`` as completed and let the
+        selector know.
+
+        :arg connection: the connection the request was sent over
+        :arg duration: round trip of the request in seconds
+        """
+        with self._inflight_lock:
+            inflight = self.inflight.get(connection, 0) - 1
+            if inflight > 0:
+                self.inflight[connection] = inflight
+            else:
+                self.inflight.pop(connection, None)
+            removed = inflight <= 0 and connection in self.draining
+        self.selector.on_request_end(connection, duration)
+        if removed:
+            # the last request of a connection removed by update
+            self.selector.on_connection_removed(connection)
+
+    def update(self, connections: Any) -> None:
+        """
+        Replace the connections of the pool, e.g. after sniffing, keeping
+        the state of the connections that remain: whether they are live or
+        dead, their fail counts and the selector with its statistics. New
+        connections are added to the live pool. Connections that went away
+        aren't selected any more and are returned by `drained` once their
+        requests in flight have completed.
+
+        :arg connections: list of tuples containing the
+            :class:`~opensearchpy.Connection` instance and its options
+        """
+        if not connections:
+            raise ImproperlyConfigured(
+                "No defined connections, you need to " "specify at least one host."
+            )
+        new_connections = [c for (c, opts) in connections]
+        previous = set(self.orig_connections)
+        current = set(new_connections)
+        added = [c for c in new_connections if c not in previous]
+        removed = [c for c in self.orig_connections if c not in current]
+        if self.randomize_hosts:
+            random.shuffle(added)
+
+        self.connection_opts = connections
+        self.selector.connection_opts = dict(connections)
+        self.orig_connections = tuple(new_connections)
+        # swap the live list in one assignment, get_connection doesn't lock
+        self.connections = [c for c in self.connections if c in current] + added
+
+        # forget the removed connections that are on a timeout
+        dead = []
+        while True:
+            try:
+                dead.append(self.dead.get(block=False))
+            except Empty:
+                break
+        self.dead.maxsize = len(new_connections)
+        for timeout, connection in dead:
+            if connection in current:
+                self.dead.put((timeout, connection))
+        for connection in removed:
+            self.dead_count.pop(connection, None)
+            with self._inflight_lock:
+                self.draining.append(connection)
+                idle = connection not in self.inflight
+            if idle:
+                self.selector.on_connection_removed(connection)
+
+        if added or removed:
+            logger.info(
+                "Updated connection pool, %d connection(s) added, %d removed.",
+                len(added),
+                len(removed),
+            )
+
+    def drained(self) -> List[Connection]:
+        """
+        Return the connections removed by `update` that no longer have any
+        request in flight, so that they can be closed.
+        """
+        with self._inflight_lock:
+            drained = [c for c in self.draining if c not in self.inflight]
+            self.draining = [c for c in self.draining if c in self.inflight]
+        return drained
+
     def close(self) -> Any:
         """
         Explicitly closes connections
@@ -293,6 +532,125 @@ class ConnectionPool:
         return f"<{type(self).__name__}: {self.connections!r}>"
 
 
+class CircuitBreakerConnectionPool(ConnectionPool):
+    """
+    Connection pool keeping a circuit breaker per connection instead of
+    retiring a connection on its first failure and sending it the full share
+    of traffic again once its timeout is over.
+
+    A connection starts *closed* (live). After ``failure_threshold``
+    consecutive failures its circuit *opens* and it is put on a timeout,
+    exponentially longer on every consecutive opening just like in
+    :class:`~opensearchpy.ConnectionPool`. Once the timeout is over the
+    circuit is *half-open*: the connection is live again but only takes one
+    request at a time, the probe. A successful probe closes the circuit, a
+    failed one opens it again.
+
+    Enable it on the client with its options::
+
+        client = OpenSearch(
+            hosts,
+            connection_pool_class=CircuitBreakerConnectionPool,
+            failure_threshold=5,
+            dead_timeout=30,
+        )
+
+    :arg failure_threshold: number of consecutive failures that open the
+        circuit of a connection (default: 3)
+
+    Any other arguments are the ones of :class:`~opensearchpy.ConnectionPool`.
+    """
+
+    def __init__(
+        self, connections: Any, failure_threshold: int = 3, **kwargs: Any
+    ) -> None:
+        if failure_threshold < 1:
+            raise ImproperlyConfigured("failure_threshold must be at least 1")
+        super().__init__(connections, **kwargs)
+        self.failure_threshold = failure_threshold
+        self.failures: Dict[Connection, int] = {}
+        # half-open connection -> number of probes in flight
+        self.half_open: Dict[Connection, int] = {}
+        self._lock = threading.Lock()
+
+    def mark_dead(self, connection: Any, now: Optional[float] = None) -> None:
+        """
+        Record a failure of the connection, opening its circuit when it is
+        half-open or has failed ``failure_threshold`` times in a row.
+
+        :arg connection: the failed instance
+        """
+        with self._lock:
+            if connection not in self.half_open:
+                failures = self.failures.get(connection, 0) + 1
+                self.failures[connection] = failures
+                if failures < self.failure_threshold:
+                    return
+            self.half_open.pop(connection, None)
+            self.failures.pop(connection, None)
+        super().mark_dead(connection, now=now)
+
+    def mark_live(self, connection: Any) -> None:
+        """
+        Record a success of the connection, closing its circuit.
+
+        :arg connection: the connection to redeem
+        """
+        with self._lock:
+            self.failures.pop(connection, None)
+            self.half_open.pop(connection, None)
+        super().mark_live(connection)
+
+    def update(self, connections: Any) -> None:
+        super().update(connections)
+        current = set(self.orig_connections)
+        with self._lock:
+            for state in (self.failures, self.half_open):
+                for connection in [c for c in state if c not in current]:
+                    del state[connection]
+
+    def resurrect(self, force: bool = False) -> Any:
+        connection = super().resurrect(force)
+        if connection is not None and connection in self.dead_count:
+            with self._lock:
+                self.half_open.setdefault(connection, 0)
+        return connection
+
+    def get_connection(self) -> Any:
+        """
+        Return a connection like :meth:`ConnectionPool.get_connection`,
+        leaving out half-open connections with a probe in flight.
+        """
+        self.resurrect()
+        with self._lock:
+            probing = {c for c, inflight in self.half_open.items() if inflight}
+        connections = [c for c in self.connections if c not in probing]
+
+        # only connections with a probe in flight, no choice but to use them
+        if not connections:
+            connections = self.connections[:]
+
+        # no live nodes, resurrect one by force and return it
+        if not connections:
+            return self.resurrect(True)
+
+        if len(connections) > 1:
+            return self.selector.select(connections)
+        return connections[0]
+
+    def request_started(self, connection: Connection) -> None:
+        with self._lock:
+            if connection in self.half_open:
+                self.half_open[connection] += 1
+        super().request_started(connection)
+
+    def request_finished(self, connection: Connection, duration: float) -> None:
+        with self._lock:
+            if connection in self.half_open:
+                self.half_open[connection] = max(0, self.half_open[connection] - 1)
+        super().request_finished(connection, duration)
+
+
 class DummyConnectionPool(ConnectionPool):
     def __init__(self, connections: Any, **kwargs: Any) -> None:
         if len(connections) != 1:
@@ -303,6 +661,7 @@ class DummyConnectionPool(ConnectionPool):
         self.connection_opts = connections
         self.connection: Any = connections[0][0]
         self.connections = (self.connection,)
+        self.draining = []
 
     def get_connection(self) -> Any:
         return self.connection
@@ -313,10 +672,14 @@ class DummyConnectionPool(ConnectionPool):
         """
         self.connection.close()
 
+    def drained(self) -> List[Connection]:
+        drained, self.draining = self.draining, []
+        return drained
+
     def _noop(self, *args: Any, **kwargs: Any) -> Any:
         pass
 
-    mark_dead = mark_live = resurrect = _noop
+    mark_dead = mark_live = resurrect = request_started = request_finished = _noop
 
 
 class EmptyConnectionPool(ConnectionPool):
@@ -325,6 +688,7 @@ class EmptyConnectionPool(ConnectionPool):
     def __init__(self, *_: Any, **__: Any) -> None:
         self.connections = []
         self.connection_opts = []
+        self.draining = []
 
     def get_connection(self) -> Connection:
         raise ImproperlyConfigured("No connections were configured")
@@ -333,3 +697,7 @@ class EmptyConnectionPool(ConnectionPool):
         pass
 
     close = mark_dead = mark_live = resurrect = _noop
+    request_started = request_finished = _noop
+
+    def drained(self) -> List[Connection]:
+        return []
@@ -27,23 +27,47 @@
 
 from .._async.helpers.actions import (
     async_bulk,
+    async_parallel_bulk,
+    async_parallel_scan,
+    async_pit_scan,
     async_reindex,
     async_scan,
     async_streaming_bulk,
 )
+from .._async.helpers.columnar import (
+    async_bulk_from_arrow,
+    async_bulk_from_dataframe,
+    async_scan_to_arrow,
+)
+from .._async.helpers.streaming import (
+    AsyncHitsStream,
+    async_stream_scroll,
+    async_stream_search,
+)
 from .actions import (
     _chunk_actions,
     _process_bulk_chunk,
     bulk,
     expand_action,
     parallel_bulk,
+    parallel_scan,
+    pit_scan,
+    process_parallel_bulk,
     reindex,
     scan,
     streaming_bulk,
 )
+from .adaptive import AdaptiveChunkSize
 from .asyncsigner import AWSV4SignerAsyncAuth
+from .columnar import (
+    ColumnarBatches,
+    bulk_from_arrow,
+    bulk_from_dataframe,
+    scan_to_arrow,
+)
 from .errors import BulkIndexError, ScanError
 from .signer import AWSV4SignerAuth, RequestsAWSV4SignerAuth, Urllib3AWSV4SignerAuth
+from .streaming import HitsParser, HitsStream, stream_scroll, stream_search
 
 __all__ = [
     "BulkIndexError",
@@ -52,8 +76,20 @@ __all__ = [
     "streaming_bulk",
     "bulk",
     "parallel_bulk",
+    "process_parallel_bulk",
+    "AdaptiveChunkSize",
     "scan",
+    "parallel_scan",
+    "pit_scan",
     "reindex",
+    "ColumnarBatches",
+    "scan_to_arrow",
+    "bulk_from_arrow",
+    "bulk_from_dataframe",
+    "HitsParser",
+    "HitsStream",
+    "stream_search",
+    "stream_scroll",
     "_chunk_actions",
     "_process_bulk_chunk",
     "AWSV4SignerAuth",
@@ -62,6 +98,15 @@ __all__ = [
     "Urllib3AWSV4SignerAuth",
     "async_scan",
     "async_bulk",
+    "async_parallel_bulk",
+    "async_parallel_scan",
+    "async_pit_scan",
     "async_reindex",
+    "async_scan_to_arrow",
+    "async_bulk_from_arrow",
+    "async_bulk_from_dataframe",
     "async_streaming_bulk",
+    "AsyncHitsStream",
+    "async_stream_search",
+    "async_stream_scroll",
 ]
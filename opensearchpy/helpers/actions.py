@@ -25,14 +25,24 @@
 #  under the License.
 
 
+import io
 import logging
+import os
 import time
 from operator import methodcaller
-from typing import Any, Optional
+from queue import Full
+from typing import Any, Dict, Optional
 
 from ..compat import Mapping, Queue, map, string_types
 from ..exceptions import TransportError
+from .adaptive import (
+    AdaptiveChunkSize,
+    _adaptive_chunk_size,
+    _chunk_size_limit,
+    _count_rejected,
+)
 from .errors import BulkIndexError, ScanError
+from .streaming import stream_scroll, stream_search
 
 logger = logging.getLogger("opensearchpy.helpers")
 
@@ -104,63 +114,115 @@ def expand_action(data: Any) -> Any:
     return action, data.get("_source", data)
 
 
+def _join_bulk_lines(lines: Any) -> Any:
+    """
+    Join serialized lines into a newline delimited bulk body. The body stays a
+    ``str`` unless the serializer produced ``bytes``.
+    """
+    if any(isinstance(line, bytes) for line in lines):
+        return (
+            b"\n".join(
+                line.encode("utf-8", "surrogatepass") if isinstance(line, str) else line
+                for line in lines
+            )
+            + b"\n"
+        )
+    return "\n".join(lines) + "\n"
+
+
+class _BulkBodyWriter:
+    """
+    Serializes action and document lines straight into a newline delimited
+    UTF-8 buffer. The finished body is handed to the transport as ``bytes``
+    so it is neither joined nor encoded again, and its size is known exactly
+    while it is being built.
+    """
+
+    def __init__(self, serializer: Any) -> None:
+        self.serializer = serializer
+        self._buffer = io.BytesIO()
+
+    def serialize(self, line: Any) -> bytes:
+        line = self.serializer.dumps(line)
+        if isinstance(line, str):
+            # surrogatepass matches the rest of the client (transport.py, http_requests.py, etc.)
+            line = line.encode("utf-8", "surrogatepass")
+        return line  # type: ignore
+
+    def write(self, *lines: bytes) -> None:
+        for line in lines:
+            self._buffer.write(line)
+            self._buffer.write(b"\n")
+
+    def __len__(self) -> int:
+        return self._buffer.tell()
+
+    def getvalue(self) -> bytes:
+        """
+        Return the body written so far and start a new one. The buffer isn't
+        written to afterwards, which lets ``getvalue`` avoid copying it.
+        """
+        body = self._buffer.getvalue()
+        self._buffer = io.BytesIO()
+        return body
+
+
 class _ActionChunker:
-    def __init__(self, chunk_size: int, max_chunk_bytes: int, serializer: Any) -> None:
+    def __init__(self, chunk_size: Any, max_chunk_bytes: int, serializer: Any) -> None:
         self.chunk_size = chunk_size
         self.max_chunk_bytes = max_chunk_bytes
         self.serializer = serializer
 
-        self.size = 0
         self.action_count = 0
-        self.bulk_actions: Any = []
+        self.body = _BulkBodyWriter(serializer)
         self.bulk_data: Any = []
 
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
     def feed(self, action: Any, data: Any) -> Any:
         ret = None
-        raw_data, raw_action = data, action
-        action = self.serializer.dumps(action)
-        # +1 to account for the trailing new line character
-        # surrogatepass matches the rest of the client (transport.py, http_requests.py, etc.)
-        cur_size = len(action.encode("utf-8", "surrogatepass")) + 1
-
+        lines = [self.body.serialize(action)]
         if data is not None:
-            data = self.serializer.dumps(data)
-            cur_size += len(data.encode("utf-8", "surrogatepass")) + 1
+            lines.append(self.body.serialize(data))
+        # +1 to account for the trailing new line character
+        cur_size = sum(len(line) + 1 for line in lines)
 
         # full chunk, send it and start a new one
-        if self.bulk_actions and (
+        if self.bulk_data and (
             self.size + cur_size > self.max_chunk_bytes
-            or self.action_count == self.chunk_size
+            or self.action_count >= _chunk_size_limit(self.chunk_size)
         ):
-            ret = (self.bulk_data, self.bulk_actions)
-            self.bulk_actions, self.bulk_data = [], []
-            self.size, self.action_count = 0, 0
+            ret = (self.bulk_data, self.body.getvalue())
+            self.bulk_data = []
+            self.action_count = 0
 
-        self.bulk_actions.append(action)
+        self.body.write(*lines)
         if data is not None:
-            self.bulk_actions.append(data)
-            self.bulk_data.append((raw_action, raw_data))
+            self.bulk_data.append((action, data))
         else:
-            self.bulk_data.append((raw_action,))
+            self.bulk_data.append((action,))
 
-        self.size += cur_size
         self.action_count += 1
         return ret
 
     def flush(self) -> Any:
         ret = None
-        if self.bulk_actions:
-            ret = (self.bulk_data, self.bulk_actions)
-            self.bulk_actions, self.bulk_data = [], []
+        if self.bulk_data:
+            ret = (self.bulk_data, self.body.getvalue())
+            self.bulk_data = []
+            self.action_count = 0
         return ret
 
 
 def _chunk_actions(
-    actions: Any, chunk_size: int, max_chunk_bytes: int, serializer: Any
+    actions: Any, chunk_size: Any, max_chunk_bytes: int, serializer: Any
 ) -> Any:
     """
-    Split actions into chunks by number or size, serialize them into strings in
-    the process.
+    Split actions into chunks by number or size, serialize them into a
+    newline delimited ``bytes`` body in the process. ``chunk_size`` may be an
+    :class:`AdaptiveChunkSize`, whose current size is read for every chunk.
     """
     chunker = _ActionChunker(
         chunk_size=chunk_size, max_chunk_bytes=max_chunk_bytes, serializer=serializer
@@ -244,18 +306,31 @@ def _process_bulk_chunk(
     raise_on_error: bool = True,
     ignore_status: Any = (),
     *args: Any,
+    adaptive_chunk_size: Optional[AdaptiveChunkSize] = None,
     **kwargs: Any,
 ) -> Any:
     """
     Send a bulk request to opensearch and process the output.
+
+    ``bulk_actions`` is either a ready to send ``bytes`` body, as produced by
+    :func:`_chunk_actions`, or a list of serialized lines. The outcome of the
+    request is recorded in ``adaptive_chunk_size`` when given.
     """
     if not isinstance(ignore_status, (list, tuple)):
         ignore_status = (ignore_status,)
 
+    if not isinstance(bulk_actions, bytes):
+        bulk_actions = _join_bulk_lines(bulk_actions)
+
+    start = time.perf_counter()
     try:
         # send the actual request
-        resp = client.bulk(body="\n".join(bulk_actions) + "\n", *args, **kwargs)
+        resp = client.bulk(body=bulk_actions, *args, **kwargs)
     except TransportError as e:
+        if adaptive_chunk_size is not None and e.status_code == 429:
+            adaptive_chunk_size.record(
+                len(bulk_data), time.perf_counter() - start, rejected=len(bulk_data)
+            )
         gen = _process_bulk_chunk_error(
             error=e,
             bulk_data=bulk_data,
@@ -264,6 +339,13 @@ def _process_bulk_chunk(
             raise_on_error=raise_on_error,
         )
     else:
+        if adaptive_chunk_size is not None:
+            adaptive_chunk_size.record(
+                len(bulk_data),
+                time.perf_counter() - start,
+                took=resp.get("took"),
+                rejected=_count_rejected(resp),
+            )
         gen = _process_bulk_chunk_success(
             resp=resp,
             bulk_data=bulk_data,
@@ -276,7 +358,7 @@ def _process_bulk_chunk(
 def streaming_bulk(
     client: Any,
     actions: Any,
-    chunk_size: int = 500,
+    chunk_size: Any = 500,
     max_chunk_bytes: int = 100 * 1024 * 1024,
     raise_on_error: bool = True,
     expand_action_callback: Any = expand_action,
@@ -304,7 +386,9 @@ def streaming_bulk(
 
     :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
     :arg actions: iterable containing the actions to be executed
-    :arg chunk_size: number of docs in one chunk sent to client (default: 500)
+    :arg chunk_size: number of docs in one chunk sent to client (default: 500),
+        ``"auto"`` or an :class:`~opensearchpy.helpers.AdaptiveChunkSize` to
+        adjust it from the latency and rejections of previous chunks
     :arg max_chunk_bytes: the maximum size of the request in bytes (default: 100MB)
     :arg raise_on_error: raise ``BulkIndexError`` containing errors (as `.errors`)
         from the execution of the last chunk when some occur. By default we raise.
@@ -323,12 +407,16 @@ def streaming_bulk(
     :arg ignore_status: list of HTTP status code that you want to ignore
     """
     actions = map(expand_action_callback, actions)
+    chunk_size = _adaptive_chunk_size(chunk_size)
+    adaptive_chunk_size = (
+        chunk_size if isinstance(chunk_size, AdaptiveChunkSize) else None
+    )
 
     for bulk_data, bulk_actions in _chunk_actions(
         actions, chunk_size, max_chunk_bytes, client.transport.serializer
     ):
         for attempt in range(max_retries + 1):
-            to_retry: Any = []
+            to_retry = _BulkBodyWriter(client.transport.serializer)
             to_retry_data: Any = []
             if attempt:
                 time.sleep(min(max_backoff, initial_backoff * 2 ** (attempt - 1)))
@@ -344,6 +432,7 @@ def streaming_bulk(
                         raise_on_error,
                         ignore_status,
                         *args,
+                        adaptive_chunk_size=adaptive_chunk_size,
                         **kwargs,
                     ),
                 ):
@@ -356,11 +445,8 @@ def streaming_bulk(
                             and info["status"] == 429
                             and (attempt + 1) <= max_retries
                         ):
-                            # _process_bulk_chunk expects strings so we need to
-                            # re-serialize the data
-                            to_retry.extend(
-                                map(client.transport.serializer.dumps, data)
-                            )
+                            # re-serialize the data into a new body
+                            to_retry.write(*map(to_retry.serialize, data))
                             to_retry_data.append(data)
                         else:
                             yield ok, {action: info}
@@ -372,10 +458,10 @@ def streaming_bulk(
                 if attempt == max_retries or e.status_code != 429:
                     raise
             else:
-                if not to_retry:
+                if not to_retry_data:
                     break
                 # retry only subset of documents that didn't succeed
-                bulk_actions, bulk_data = to_retry, to_retry_data
+                bulk_actions, bulk_data = to_retry.getvalue(), to_retry_data
 
 
 def bulk(
@@ -437,7 +523,7 @@ def parallel_bulk(
     client: Any,
     actions: Any,
     thread_count: int = 4,
-    chunk_size: int = 500,
+    chunk_size: Any = 500,
     max_chunk_bytes: int = 100 * 1024 * 1024,
     queue_size: int = 4,
     expand_action_callback: Any = expand_action,
@@ -453,7 +539,9 @@ def parallel_bulk(
     :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
     :arg actions: iterator containing the actions
     :arg thread_count: size of the threadpool to use for the bulk requests
-    :arg chunk_size: number of docs in one chunk sent to client (default: 500)
+    :arg chunk_size: number of docs in one chunk sent to client (default: 500),
+        ``"auto"`` or an :class:`~opensearchpy.helpers.AdaptiveChunkSize` to
+        adjust it from the latency and rejections of previous chunks
     :arg max_chunk_bytes: the maximum size of the request in bytes (default: 100MB)
     :arg raise_on_error: raise ``BulkIndexError`` containing errors (as `.errors`)
         from the execution of the last chunk when some occur. By default we raise.
@@ -471,6 +559,10 @@ def parallel_bulk(
     from multiprocessing.pool import ThreadPool
 
     actions = map(expand_action_callback, actions)
+    chunk_size = _adaptive_chunk_size(chunk_size)
+    adaptive_chunk_size = (
+        chunk_size if isinstance(chunk_size, AdaptiveChunkSize) else None
+    )
 
     class BlockingPool(ThreadPool):
         def _setup_queues(self) -> None:
@@ -493,6 +585,7 @@ def parallel_bulk(
                     raise_on_error,
                     ignore_status,
                     *args,
+                    adaptive_chunk_size=adaptive_chunk_size,
                     **kwargs,
                 )
             ),
@@ -507,56 +600,174 @@ def parallel_bulk(
         pool.join()
 
 
-def scan(
-    client: Any,
-    query: Any = None,
-    scroll: Optional[str] = "5m",
-    raise_on_error: Optional[bool] = True,
-    preserve_order: Optional[bool] = False,
-    size: Optional[int] = 1000,
-    request_timeout: Optional[float] = None,
-    clear_scroll: Optional[bool] = True,
-    scroll_kwargs: Any = None,
+# per process state of the process_parallel_bulk workers, set by the pool
+# initializer so that the client is created once per worker process
+_PROCESS_BULK_STATE: Any = None
+
+
+def _process_bulk_init(
+    client_factory: Any,
+    expand_action_callback: Any,
+    max_chunk_bytes: int,
+    raise_on_exception: bool,
+    raise_on_error: bool,
+    ignore_status: Any,
+    args: Any,
+    kwargs: Any,
+) -> None:
+    global _PROCESS_BULK_STATE
+    _PROCESS_BULK_STATE = (
+        client_factory(),
+        expand_action_callback,
+        max_chunk_bytes,
+        raise_on_exception,
+        raise_on_error,
+        ignore_status,
+        args,
+        kwargs,
+    )
+
+
+def _process_bulk_batch(batch: Any) -> Any:
+    """
+    Expand, serialize and send one batch of actions from inside a
+    process_parallel_bulk worker, returning the ``(ok, item)`` results.
+    """
+    (
+        client,
+        expand_action_callback,
+        max_chunk_bytes,
+        raise_on_exception,
+        raise_on_error,
+        ignore_status,
+        args,
+        kwargs,
+    ) = _PROCESS_BULK_STATE
+
+    results = []
+    # the batch is already limited to chunk_size actions, it is only split
+    # further if it exceeds max_chunk_bytes
+    for bulk_data, bulk_actions in _chunk_actions(
+        map(expand_action_callback, batch),
+        len(batch),
+        max_chunk_bytes,
+        client.transport.serializer,
+    ):
+        results.extend(
+            _process_bulk_chunk(
+                client,
+                bulk_actions,
+                bulk_data,
+                raise_on_exception,
+                raise_on_error,
+                ignore_status,
+                *args,
+                **kwargs,
+            )
+        )
+    return results
+
+
+def process_parallel_bulk(
+    client_factory: Any,
+    actions: Any,
+    process_count: Optional[int] = None,
+    chunk_size: int = 500,
+    max_chunk_bytes: int = 100 * 1024 * 1024,
+    queue_size: int = 4,
+    expand_action_callback: Any = expand_action,
+    raise_on_exception: bool = True,
+    raise_on_error: bool = True,
+    ignore_status: Any = (),
+    mp_context: Any = None,
+    *args: Any,
     **kwargs: Any,
 ) -> Any:
     """
-    Simple abstraction on top of the
-    :meth:`~opensearchpy.OpenSearch.scroll` api - a simple iterator that
-    yields all hits as returned by underlining scroll requests.
+    Parallel version of the bulk helper run in multiple processes at once.
 
-    By default scan does not return results in any pre-determined order. To
-    have a standard order in the returned documents (either by score or
-    explicit sort definition) when scrolling, use ``preserve_order=True``. This
-    may be an expensive operation and will negate the performance benefits of
-    using ``scan``.
+    Unlike :func:`parallel_bulk`, the actions are expanded and serialized in
+    the worker processes, so serialization isn't limited by the GIL of the
+    calling process. Each worker creates its own client by calling
+    ``client_factory``. Results are yielded as chunks complete, not
+    necessarily in the order the actions were passed in.
 
-    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
-    :arg query: body for the :meth:`~opensearchpy.OpenSearch.search` api
-    :arg scroll: Specify how long a consistent view of the index should be
-        maintained for scrolled search
-    :arg raise_on_error: raises an exception (``ScanError``) if an error is
-        encountered (some shards fail to execute). By default we raise.
-    :arg preserve_order: don't set the ``search_type`` to ``scan`` - this will
-        cause the scroll to paginate with preserving the order. Note that this
-        can be an extremely expensive operation and can easily lead to
-        unpredictable results, use with caution.
-    :arg size: size (per shard) of the batch send at each iteration.
-    :arg request_timeout: explicit timeout for each call to ``scan``
-    :arg clear_scroll: explicitly calls delete on the scroll id via the clear
-        scroll API at the end of the method on completion or error, defaults
-        to true.
-    :arg scroll_kwargs: additional kwargs to be passed to
-        :meth:`~opensearchpy.OpenSearch.scroll`
+    ``client_factory``, ``expand_action_callback`` and the actions themselves
+    are sent to the worker processes, so they must be picklable, e.g.
+    ``functools.partial(OpenSearch, hosts=[...])`` rather than a lambda.
 
-    Any additional keyword arguments will be passed to the initial
-    :meth:`~opensearchpy.OpenSearch.search` call::
+    :arg client_factory: callable without arguments that returns the
+        :class:`~opensearchpy.OpenSearch` instance to use in a worker process
+    :arg actions: iterator containing the actions
+    :arg process_count: number of worker processes (default: ``os.cpu_count()``)
+    :arg chunk_size: number of docs in one chunk sent to client (default: 500)
+    :arg max_chunk_bytes: the maximum size of the request in bytes (default: 100MB)
+    :arg queue_size: number of chunks waiting for a free worker process, the
+        actions iterator isn't consumed further until one completes.
+    :arg expand_action_callback: callback executed on each action passed in,
+        should return a tuple containing the action line and the data line
+        (`None` if data line should be omitted).
+    :arg raise_on_error: raise ``BulkIndexError`` containing errors (as `.errors`)
+        from the execution of the last chunk when some occur. By default we raise.
+    :arg raise_on_exception: if ``False`` then don't propagate exceptions from
+        call to ``bulk`` and just report the items that failed as failed.
+    :arg ignore_status: list of HTTP status code that you want to ignore
+    :arg mp_context: :mod:`multiprocessing` context used to start the worker
+        processes, defaults to the platform default
+    """
+    # Avoid importing multiprocessing unless process_parallel_bulk is used
+    # to avoid exceptions on restricted environments like App Engine
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+    from itertools import islice
+
+    process_count = process_count or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(
+        process_count,
+        mp_context=mp_context,
+        initializer=_process_bulk_init,
+        initargs=(
+            client_factory,
+            expand_action_callback,
+            max_chunk_bytes,
+            raise_on_exception,
+            raise_on_error,
+            ignore_status,
+            args,
+            kwargs,
+        ),
+    )
+    # bounds the number of batches held in memory, one running in every
+    # worker plus queue_size waiting for one
+    max_pending = process_count + max(queue_size, 0)
+    pending: Any = set()
 
-        scan(client,
-            query={"query": {"match": {"title": "python"}}},
-            index="orders-*",
-            doc_type="books"
-        )
+    try:
+        actions = iter(actions)
+        while True:
+            batch = list(islice(actions, chunk_size))
+            if not batch:
+                break
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            pending.add(executor.submit(_process_bulk_batch, batch))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
 
+
+def _scan_options(
+    query: Any, preserve_order: Any, scroll_kwargs: Any, kwargs: Any
+) -> Any:
+    """
+    The query, the scroll kwargs and the kwargs passed to every request of a
+    scroll, see :func:`scan`.
     """
     scroll_kwargs = scroll_kwargs or {}
 
@@ -578,6 +789,28 @@ def scan(
         for key, val in transport_kwargs.items():
             scroll_kwargs.setdefault(key, val)
 
+    return query, scroll_kwargs, transport_kwargs
+
+
+def _scan_pages(
+    client: Any,
+    query: Any = None,
+    scroll: Optional[str] = "5m",
+    raise_on_error: Optional[bool] = True,
+    preserve_order: Optional[bool] = False,
+    size: Optional[int] = 1000,
+    request_timeout: Optional[float] = None,
+    clear_scroll: Optional[bool] = True,
+    scroll_kwargs: Any = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Yields the responses of a scroll that have hits, see :func:`scan`.
+    """
+    query, scroll_kwargs, transport_kwargs = _scan_options(
+        query, preserve_order, scroll_kwargs, kwargs
+    )
+
     # initial search
     resp = client.search(
         body=query, scroll=scroll, size=size, request_timeout=request_timeout, **kwargs
@@ -586,7 +819,7 @@ def scan(
 
     try:
         while scroll_id and resp.get("hits", {}).get("hits"):
-            yield from resp.get("hits", {}).get("hits", [])
+            yield resp
 
             _shards = resp.get("_shards")
 
@@ -628,6 +861,534 @@ def scan(
             )
 
 
+def _stream_scan_pages(
+    client: Any,
+    query: Any = None,
+    scroll: Optional[str] = "5m",
+    raise_on_error: Optional[bool] = True,
+    preserve_order: Optional[bool] = False,
+    size: Optional[int] = 1000,
+    request_timeout: Optional[float] = None,
+    clear_scroll: Optional[bool] = True,
+    scroll_kwargs: Any = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Yields a :class:`~opensearchpy.helpers.HitsStream` per page of a scroll,
+    the next page is requested once the previous one was consumed, see
+    :func:`scan`.
+    """
+    query, scroll_kwargs, transport_kwargs = _scan_options(
+        query, preserve_order, scroll_kwargs, kwargs
+    )
+
+    page = stream_search(
+        client,
+        body=query,
+        scroll=scroll,
+        size=size,
+        request_timeout=request_timeout,
+        **kwargs,
+    )
+    try:
+        while True:
+            yield page
+            scroll_id = page.response.get("_scroll_id")
+            if not scroll_id or not page.count:
+                break
+            _check_shards(page.response, scroll_id, raise_on_error)
+            page = stream_scroll(
+                client, body={"scroll_id": scroll_id, "scroll": scroll}, **scroll_kwargs
+            )
+
+    finally:
+        page.close()
+        # the scroll id comes first, it is known even if a page was abandoned
+        scroll_id = page.response.get("_scroll_id")
+        if scroll_id and clear_scroll:
+            client.clear_scroll(
+                body={"scroll_id": [scroll_id]}, ignore=(404,), **transport_kwargs
+            )
+
+
+def scan(
+    client: Any,
+    query: Any = None,
+    scroll: Optional[str] = "5m",
+    raise_on_error: Optional[bool] = True,
+    preserve_order: Optional[bool] = False,
+    size: Optional[int] = 1000,
+    request_timeout: Optional[float] = None,
+    clear_scroll: Optional[bool] = True,
+    scroll_kwargs: Any = None,
+    prefetch: int = 0,
+    stream: bool = False,
+    **kwargs: Any,
+) -> Any:
+    """
+    Simple abstraction on top of the
+    :meth:`~opensearchpy.OpenSearch.scroll` api - a simple iterator that
+    yields all hits as returned by underlining scroll requests.
+
+    By default scan does not return results in any pre-determined order. To
+    have a standard order in the returned documents (either by score or
+    explicit sort definition) when scrolling, use ``preserve_order=True``. This
+    may be an expensive operation and will negate the performance benefits of
+    using ``scan``.
+
+    With ``prefetch`` set, the next scroll requests are sent from a
+    background thread while the caller processes the current page, keeping
+    up to ``prefetch`` pages buffered.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.OpenSearch.search` api
+    :arg scroll: Specify how long a consistent view of the index should be
+        maintained for scrolled search
+    :arg raise_on_error: raises an exception (``ScanError``) if an error is
+        encountered (some shards fail to execute). By default we raise.
+    :arg preserve_order: don't set the ``search_type`` to ``scan`` - this will
+        cause the scroll to paginate with preserving the order. Note that this
+        can be an extremely expensive operation and can easily lead to
+        unpredictable results, use with caution.
+    :arg size: size (per shard) of the batch send at each iteration.
+    :arg request_timeout: explicit timeout for each call to ``scan``
+    :arg clear_scroll: explicitly calls delete on the scroll id via the clear
+        scroll API at the end of the method on completion or error, defaults
+        to true.
+    :arg scroll_kwargs: additional kwargs to be passed to
+        :meth:`~opensearchpy.OpenSearch.scroll`
+    :arg prefetch: number of pages fetched ahead of the caller, defaults to 0
+        which only requests a page once the previous one is consumed
+    :arg stream: parse the hits of every page as the response is received,
+        see :func:`~opensearchpy.helpers.stream_search`, instead of loading
+        the whole page first. Can't be combined with ``prefetch``.
+
+    Any additional keyword arguments will be passed to the initial
+    :meth:`~opensearchpy.OpenSearch.search` call::
+
+        scan(client,
+            query={"query": {"match": {"title": "python"}}},
+            index="orders-*",
+            doc_type="books"
+        )
+
+    """
+    if stream and prefetch > 0:
+        raise ValueError("scan() can't prefetch pages while streaming them")
+    pages = (_stream_scan_pages if stream else _scan_pages)(
+        client,
+        query=query,
+        scroll=scroll,
+        raise_on_error=raise_on_error,
+        preserve_order=preserve_order,
+        size=size,
+        request_timeout=request_timeout,
+        clear_scroll=clear_scroll,
+        scroll_kwargs=scroll_kwargs,
+        **kwargs,
+    )
+    if prefetch > 0:
+        pages = _prefetch(pages, prefetch)
+    try:
+        for resp in pages:
+            yield from resp if stream else resp["hits"]["hits"]
+    finally:
+        pages.close()
+
+
+def _put_until_stopped(queue: Any, item: Any, stop: Any) -> bool:
+    """
+    Put ``item`` on a bounded ``queue`` from a producer thread, giving up once
+    ``stop`` is set because the consumer is gone instead of blocking forever.
+    """
+    while not stop.is_set():
+        try:
+            queue.put(item, timeout=0.1)
+            return True
+        except Full:
+            pass
+    return False
+
+
+def _prefetch(pages: Any, prefetch: int) -> Any:
+    """
+    Iterate the ``pages`` generator in a background thread, keeping up to
+    ``prefetch`` pages ahead of the consumer. The generator is closed from
+    that thread when the consumer stops early.
+    """
+    import threading
+
+    buffer: Any = Queue(max(prefetch, 1))
+    stop = threading.Event()
+    done = object()
+
+    def produce() -> None:
+        error = None
+        try:
+            for page in pages:
+                if not _put_until_stopped(buffer, (page, None), stop):
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            pages.close()
+        _put_until_stopped(buffer, (done, error), stop)
+
+    thread = threading.Thread(target=produce, daemon=True)
+    thread.start()
+    try:
+        while True:
+            page, error = buffer.get()
+            if page is done:
+                if error is not None:
+                    raise error
+                return
+            yield page
+
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _check_shards(resp: Any, context_id: Any, raise_on_error: Any) -> None:
+    _shards = resp.get("_shards") or {}
+    # Default to 0 if the value isn't included in the response
+    shards_successful = _shards.get("successful", 0)
+    shards_skipped = _shards.get("skipped", 0)
+    shards_total = _shards.get("total", 0)
+
+    if (shards_successful + shards_skipped) < shards_total:
+        shards_message = (
+            "Search request has only succeeded on %d (+%d skipped) shards out of %d."
+        )
+        logger.warning(shards_message, shards_successful, shards_skipped, shards_total)
+        if raise_on_error:
+            raise ScanError(
+                context_id,
+                shards_message % (shards_successful, shards_skipped, shards_total),
+            )
+
+
+def _pit_query(query: Any) -> Any:
+    """
+    Copy of ``query`` sorted with a ``_shard_doc`` tiebreaker, which makes
+    ``search_after`` pagination of a point in time unambiguous.
+    """
+    query = query.copy() if query else {}
+    sort = query.get("sort", [])
+    if not isinstance(sort, list):
+        sort = [sort]
+    if not any(
+        s == "_shard_doc" or (isinstance(s, dict) and "_shard_doc" in s) for s in sort
+    ):
+        sort = sort + ["_shard_doc"]
+    query["sort"] = sort
+    return query
+
+
+def _pit_pages(
+    client: Any,
+    query: Any = None,
+    index: Any = None,
+    keep_alive: str = "5m",
+    size: int = 1000,
+    raise_on_error: bool = True,
+    request_timeout: Optional[float] = None,
+    pit_id: Optional[str] = None,
+    pit_kwargs: Any = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Yields the responses of a point in time search that have hits, see
+    :func:`pit_scan`.
+    """
+    # Grab options that should be propagated to every
+    # API call within this helper instead of just 'search()'
+    transport_kwargs: Dict[str, Any] = {}
+    for key in ("headers", "api_key", "http_auth"):
+        if key in kwargs:
+            transport_kwargs[key] = kwargs[key]
+
+    created = pit_id is None
+    if created:
+        resp = client.create_pit(
+            index=index,
+            keep_alive=keep_alive,
+            **dict(transport_kwargs, **(pit_kwargs or {})),
+        )
+        pit_id = resp["pit_id"]
+
+    query = _pit_query(query)
+    try:
+        while True:
+            body = dict(query, pit={"id": pit_id, "keep_alive": keep_alive})
+            resp = client.search(
+                body=body, size=size, request_timeout=request_timeout, **kwargs
+            )
+            # the id may change between requests, always send the latest one
+            pit_id = resp.get("pit_id", pit_id)
+
+            hits = resp.get("hits", {}).get("hits")
+            if not hits:
+                break
+            yield resp
+
+            _check_shards(resp, pit_id, raise_on_error)
+            if len(hits) < size:
+                break
+            query["search_after"] = hits[-1]["sort"]
+
+    finally:
+        if created and pit_id:
+            client.delete_pit(
+                body={"pit_id": [pit_id]}, ignore=(404,), **transport_kwargs
+            )
+
+
+def pit_scan(
+    client: Any,
+    query: Any = None,
+    index: Any = None,
+    keep_alive: str = "5m",
+    size: int = 1000,
+    prefetch: int = 1,
+    raise_on_error: bool = True,
+    request_timeout: Optional[float] = None,
+    pit_id: Optional[str] = None,
+    pit_kwargs: Any = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Alternative to :func:`scan` that iterates over all hits of a query using
+    a point in time and ``search_after`` instead of a scroll. The query is
+    sorted by its ``sort`` followed by ``_shard_doc`` as tiebreaker, or by
+    ``_shard_doc`` alone, which is the most efficient order.
+
+    The point in time is created on ``index`` and deleted once the iterator
+    is exhausted, fails or is closed, unless an existing ``pit_id`` is given,
+    which is left for the caller to delete.
+
+    While the caller consumes a page, the next ``prefetch`` pages are
+    requested from a background thread.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.OpenSearch.search` api
+    :arg index: index (or list of indices) to create the point in time on
+    :arg keep_alive: Specify how long the point in time should be kept alive
+        between requests
+    :arg size: number of hits per page
+    :arg prefetch: number of pages fetched ahead of the caller, set to 0 to
+        only request a page once the previous one is consumed (default: 1)
+    :arg raise_on_error: raises an exception (``ScanError``) if an error is
+        encountered (some shards fail to execute). By default we raise.
+    :arg request_timeout: explicit timeout for each search request
+    :arg pit_id: id of an existing point in time to use instead of creating
+        one on ``index``
+    :arg pit_kwargs: additional kwargs to be passed to
+        :meth:`~opensearchpy.OpenSearch.create_pit`
+
+    Any additional keyword arguments will be passed to every
+    :meth:`~opensearchpy.OpenSearch.search` call::
+
+        pit_scan(client,
+            query={"query": {"match": {"title": "python"}}},
+            index="orders-*",
+            keep_alive="1m",
+        )
+
+    """
+    pages = _pit_pages(
+        client,
+        query=query,
+        index=index,
+        keep_alive=keep_alive,
+        size=size,
+        raise_on_error=raise_on_error,
+        request_timeout=request_timeout,
+        pit_id=pit_id,
+        pit_kwargs=pit_kwargs,
+        **kwargs,
+    )
+    if prefetch > 0:
+        pages = _prefetch(pages, prefetch)
+    try:
+        for resp in pages:
+            yield from resp["hits"]["hits"]
+    finally:
+        pages.close()
+
+
+def _total_hits(resp: Any) -> Optional[int]:
+    total = resp.get("hits", {}).get("total")
+    if isinstance(total, dict):
+        total = total.get("value")
+    return total  # type: ignore
+
+
+def _slice_query(query: Any, slice_id: int, slices: int) -> Any:
+    query = query.copy() if query else {}
+    if slices > 1:
+        query["slice"] = {"id": slice_id, "max": slices}
+    return query
+
+
+def parallel_scan(
+    client: Any,
+    query: Any = None,
+    slices: int = 4,
+    thread_count: Optional[int] = None,
+    queue_size: int = 4,
+    progress: Any = None,
+    pit: bool = False,
+    scroll: Optional[str] = "5m",
+    raise_on_error: Optional[bool] = True,
+    preserve_order: Optional[bool] = False,
+    size: Optional[int] = 1000,
+    request_timeout: Optional[float] = None,
+    clear_scroll: Optional[bool] = True,
+    scroll_kwargs: Any = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Parallel version of :func:`scan` that splits the scroll into ``slices``
+    independent sliced scrolls and runs them in a pool of threads. Hits of
+    all slices are yielded from a single iterator as their pages arrive, so
+    they are interleaved between slices. Every slice clears its own scroll
+    when it's exhausted, fails or the iterator is closed.
+
+    With ``pit=True`` the slices page through a single point in time with
+    ``search_after`` as in :func:`pit_scan` instead, ``index`` must then be
+    passed and the point in time is deleted once all slices are done.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.OpenSearch.search` api
+    :arg slices: number of slices to split the scroll into (default: 4)
+    :arg thread_count: size of the threadpool running the slices, defaults
+        to ``slices``
+    :arg queue_size: number of pages fetched ahead of the consumer, slices
+        pause while the queue is full
+    :arg progress: optional callable invoked with the slice id, the number of
+        hits yielded from that slice so far and the total number of hits of the
+        slice every time a page is consumed
+    :arg pit: use a point in time and ``search_after`` instead of scrolls
+    :arg scroll: Specify how long a consistent view of the index should be
+        maintained for scrolled search, or the keep alive of the point in time
+    :arg raise_on_error: raises an exception (``ScanError``) if an error is
+        encountered (some shards fail to execute). By default we raise.
+    :arg preserve_order: sort each slice by the query sort instead of
+        ``_doc``, hits of different slices are still interleaved. Point in
+        time slices are always sorted by the query sort, if any
+    :arg size: size (per shard) of the batch send at each iteration.
+    :arg request_timeout: explicit timeout for each call to ``scan``
+    :arg clear_scroll: explicitly calls delete on the scroll ids via the clear
+        scroll API at the end of each slice, defaults to true.
+    :arg scroll_kwargs: additional kwargs to be passed to
+        :meth:`~opensearchpy.OpenSearch.scroll`
+
+    Any additional keyword arguments will be passed to the initial
+    :meth:`~opensearchpy.OpenSearch.search` call of every slice::
+
+        parallel_scan(client,
+            query={"query": {"match": {"title": "python"}}},
+            slices=8,
+            index="orders-*",
+        )
+
+    """
+    if slices < 1:
+        raise ValueError("slices must be at least 1")
+
+    # Avoid importing concurrent.futures unless parallel_scan is used
+    # to avoid exceptions on restricted environments like App Engine
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    pages_queue: Any = Queue(max(queue_size, 1))
+    stop = threading.Event()
+    pit_id = None
+
+    def slice_pages(slice_id: int) -> Any:
+        if pit:
+            return _pit_pages(
+                client,
+                query=_slice_query(query, slice_id, slices),
+                keep_alive=scroll or "5m",
+                size=size or 1000,
+                raise_on_error=bool(raise_on_error),
+                request_timeout=request_timeout,
+                pit_id=pit_id,
+                **kwargs,
+            )
+        return _scan_pages(
+            client,
+            query=_slice_query(query, slice_id, slices),
+            scroll=scroll,
+            raise_on_error=raise_on_error,
+            preserve_order=preserve_order,
+            size=size,
+            request_timeout=request_timeout,
+            clear_scroll=clear_scroll,
+            scroll_kwargs=dict(scroll_kwargs or {}),
+            **kwargs,
+        )
+
+    def run_slice(slice_id: int) -> None:
+        if stop.is_set():
+            return
+        pages = slice_pages(slice_id)
+        error = None
+        try:
+            for resp in pages:
+                if not _put_until_stopped(pages_queue, (slice_id, resp, None), stop):
+                    break
+        except Exception as e:
+            error = e
+        finally:
+            pages.close()
+        # a page-less item marks the slice as done
+        _put_until_stopped(pages_queue, (slice_id, None, error), stop)
+
+    transport_kwargs = {}
+    for key in ("headers", "api_key", "http_auth"):
+        if key in kwargs:
+            transport_kwargs[key] = kwargs[key]
+    if pit:
+        pit_id = client.create_pit(
+            index=kwargs.pop("index", None),
+            keep_alive=scroll or "5m",
+            **transport_kwargs,
+        )["pit_id"]
+
+    executor = ThreadPoolExecutor(thread_count or slices)
+    hit_counts = [0] * slices
+    try:
+        for slice_id in range(slices):
+            executor.submit(run_slice, slice_id)
+
+        remaining = slices
+        while remaining:
+            slice_id, resp, error = pages_queue.get()
+            if error is not None:
+                raise error
+            if resp is None:
+                remaining -= 1
+                continue
+
+            hits = resp["hits"]["hits"]
+            hit_counts[slice_id] += len(hits)
+            if progress is not None:
+                progress(slice_id, hit_counts[slice_id], _total_hits(resp))
+            yield from hits
+
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        if pit_id:
+            client.delete_pit(
+                body={"pit_id": [pit_id]}, ignore=(404,), **transport_kwargs
+            )
+
+
 def reindex(
     client: Any,
     source_index: Any,
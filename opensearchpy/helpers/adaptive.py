@@ -0,0 +1,175 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import logging
+import threading
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger("opensearchpy.helpers")
+
+
+class AdaptiveChunkSize:
+    """
+    Adjusts the number of actions sent in one bulk request from the feedback
+    of previous requests, AIMD style: the chunk size grows by
+    ``increase_by`` after every full chunk that completes within
+    ``target_latency`` without rejections, and is multiplied by
+    ``decrease_factor`` after a chunk that was slow or had documents
+    rejected with ``429``.
+
+    Latency is taken from the ``took`` of the bulk response when available,
+    so only the time spent by the cluster counts, and from the request round
+    trip otherwise. ``max_chunk_bytes`` still applies on top of the adaptive
+    chunk size.
+
+    Pass ``chunk_size="auto"`` to the bulk helpers to use the defaults, or
+    pass an instance to tune it and to read its :attr:`stats` afterwards::
+
+        chunk_size = AdaptiveChunkSize(target_latency=0.5)
+        helpers.bulk(client, actions, chunk_size=chunk_size)
+        print(chunk_size.stats)
+
+    :arg initial_size: number of actions in the first chunk (default: 500)
+    :arg min_size: lower bound of the chunk size (default: 50)
+    :arg max_size: upper bound of the chunk size (default: 10000)
+    :arg target_latency: bulk request latency in seconds above which the
+        chunk size is decreased (default: 1.0)
+    :arg increase_by: number of actions added to the chunk size after a fast
+        chunk, defaults to a tenth of ``initial_size``
+    :arg decrease_factor: factor the chunk size is multiplied by after a slow
+        or rejected chunk (default: 0.5)
+    """
+
+    def __init__(
+        self,
+        initial_size: int = 500,
+        min_size: int = 50,
+        max_size: int = 10000,
+        target_latency: float = 1.0,
+        increase_by: Optional[int] = None,
+        decrease_factor: float = 0.5,
+    ) -> None:
+        if not 1 <= min_size <= initial_size <= max_size:
+            raise ValueError(
+                "AdaptiveChunkSize requires 1 <= min_size <= initial_size <= max_size"
+            )
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        if target_latency <= 0:
+            raise ValueError("target_latency must be positive")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency = target_latency
+        self.increase_by = increase_by or max(1, initial_size // 10)
+        self.decrease_factor = decrease_factor
+
+        self.chunk_size = initial_size
+        self.chunks = 0
+        self.actions = 0
+        self.rejected = 0
+        self.increases = 0
+        self.decreases = 0
+        self.latency = 0.0
+        self.took = 0
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        actions: int,
+        latency: float,
+        took: Optional[int] = None,
+        rejected: int = 0,
+    ) -> None:
+        """
+        Adjust the chunk size from the outcome of one bulk request.
+
+        :arg actions: number of actions sent in the request
+        :arg latency: round trip of the request in seconds
+        :arg took: ``took`` of the bulk response in milliseconds, if any
+        :arg rejected: number of actions rejected with ``429``
+        """
+        server_latency = took / 1000.0 if took is not None else latency
+
+        with self._lock:
+            self.chunks += 1
+            self.actions += actions
+            self.rejected += rejected
+            self.latency += latency
+            self.took += took or 0
+
+            chunk_size = self.chunk_size
+            if rejected or server_latency > self.target_latency:
+                chunk_size = max(self.min_size, int(chunk_size * self.decrease_factor))
+                self.decreases += 1
+            elif actions >= chunk_size:
+                # only a full chunk tells us whether a larger one would be fine,
+                # chunks cut short by max_chunk_bytes or the end of the input don't
+                chunk_size = min(self.max_size, chunk_size + self.increase_by)
+                self.increases += 1
+
+            if chunk_size != self.chunk_size:
+                logger.debug(
+                    "bulk chunk size %d -> %d (latency %.3fs, rejected %d/%d)",
+                    self.chunk_size,
+                    chunk_size,
+                    server_latency,
+                    rejected,
+                    actions,
+                )
+                self.chunk_size = chunk_size
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Current chunk size and totals of the requests recorded so far.
+        """
+        with self._lock:
+            return {
+                "chunk_size": self.chunk_size,
+                "chunks": self.chunks,
+                "actions": self.actions,
+                "rejected": self.rejected,
+                "increases": self.increases,
+                "decreases": self.decreases,
+                "avg_latency": self.latency / self.chunks if self.chunks else 0.0,
+                "avg_took": self.took / self.chunks if self.chunks else 0.0,
+            }
+
+
+def _adaptive_chunk_size(chunk_size: Any) -> Any:
+    """
+    Resolve the ``chunk_size`` argument of the bulk helpers to either a fixed
+    number of actions or an :class:`AdaptiveChunkSize`.
+    """
+    if chunk_size == "auto":
+        return AdaptiveChunkSize()
+    if isinstance(chunk_size, str):
+        raise ValueError(
+            f"chunk_size must be a number, 'auto' or an AdaptiveChunkSize, got {chunk_size!r}"
+        )
+    return chunk_size
+
+
+def _chunk_size_limit(chunk_size: Any) -> Any:
+    if isinstance(chunk_size, AdaptiveChunkSize):
+        return chunk_size.chunk_size
+    return chunk_size
+
+
+def _count_rejected(resp: Any) -> int:
+    """
+    Number of items of a bulk response rejected with ``429``.
+    """
+    return sum(
+        1
+        for item in resp.get("items", ())
+        for result in item.values()
+        if result.get("status") == 429
+    )
@@ -0,0 +1,450 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from ..exceptions import ImproperlyConfigured
+from .actions import bulk, scan
+
+# the pyarrow type of the values of the mapping field types
+ARROW_TYPES = {
+    "boolean": "bool_",
+    "byte": "int8",
+    "short": "int16",
+    "integer": "int32",
+    "long": "int64",
+    "unsigned_long": "uint64",
+    "half_float": "float32",
+    "float": "float32",
+    "scaled_float": "float64",
+    "double": "float64",
+    "keyword": "string",
+    "constant_keyword": "string",
+    "text": "string",
+    "date": "timestamp",
+}
+# the pyarrow type of the metadata of hits
+META_ARROW_TYPES = {
+    "_index": "string",
+    "_id": "string",
+    "_routing": "string",
+    "_score": "float64",
+    "_version": "int64",
+    "_seq_no": "int64",
+    "_primary_term": "int64",
+}
+
+# the columns of a table going to the action line of a bulk request, and the
+# name of their parameter, like in ``expand_action``
+BULK_META_COLUMNS = {
+    "_index": "_index",
+    "_id": "_id",
+    "_routing": "routing",
+    "_if_seq_no": "if_seq_no",
+    "_if_primary_term": "if_primary_term",
+    "_version": "version",
+    "_version_type": "version_type",
+    "_retry_on_conflict": "retry_on_conflict",
+}
+
+_MISSING = object()
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        raise ImproperlyConfigured(
+            "pyarrow is required to build columnar results, "
+            "install opensearch-py[arrow]"
+        )
+    return pyarrow
+
+
+def _arrow_type(pyarrow: Any, name: str) -> Any:
+    if name == "timestamp":
+        # naive dates are UTC in OpenSearch
+        return pyarrow.timestamp("ms", tz="UTC")
+    return getattr(pyarrow, name)()
+
+
+class _Column:
+    def __init__(self, name: str, meta: bool, field: Any, arrow_type: Any) -> None:
+        self.name = name
+        self.meta = meta
+        self.path = name.split(".")
+        # only the mapped fields whose values are converted
+        self.field = field if arrow_type is not None and not meta else None
+        self.arrow_type = arrow_type
+        # the type pyarrow inferred from the first values, without arrow_type
+        self.inferred_type: Any = None
+        self.multi = bool(getattr(field, "_multi", False))
+
+    def value(self, hit: Dict[str, Any]) -> Any:
+        if self.meta:
+            return hit.get(self.name)
+        # fields and docvalue_fields are returned as lists under the full path
+        value = hit.get("fields", {}).get(self.name, _MISSING)
+        if value is not _MISSING:
+            if not self.multi and len(value) == 1:
+                value = value[0]
+        else:
+            value = hit.get("_source", {})
+            for step in self.path:
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(step)
+        if self.field is not None and value is not None:
+            value = self.field.deserialize(value)
+        return value
+
+
+class ColumnarBatches:
+    """
+    Accumulates the ``_source`` fields, ``fields`` and ``docvalue_fields``
+    of hits into columns, returned as ``pyarrow.RecordBatch`` objects of up
+    to ``batch_size`` rows, so only one batch of the hits is held in memory
+    at a time.
+
+    The columns are typed after the mapping of their field when it is
+    known, a ``Keyword`` field becomes a ``string`` column, an ``Integer``
+    an ``int32``, a ``Date`` a UTC ``timestamp`` etc. and a field with
+    ``multi=True`` a list. The type of the other columns is inferred by
+    pyarrow from the values of each batch, a batch without any value for
+    such a column gets the type of the previous batches. Pass a ``mapping``
+    or a ``schema`` for all the batches to have the same schema.
+
+    :arg fields: the (dotted) paths of the fields to return as columns, all
+        the fields of the mapping by default, or the ``_source`` fields of
+        the first batch of hits when there's no mapping
+    :arg meta: metadata of the hits to return as columns, e.g. ``["_id"]``
+    :arg mapping: :class:`~opensearchpy.Mapping` or
+        :class:`~opensearchpy.Document` subclass used to type the columns
+    :arg resolve_field: function returning the mapping field of a path,
+        instead of ``mapping``
+    :arg schema: ``pyarrow.Schema`` of the batches, instead of the types
+        of the mapping, its columns are the fields and metadata listed in
+        ``meta``
+    :arg batch_size: number of rows of a batch
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Iterable[str]] = None,
+        meta: Iterable[str] = (),
+        mapping: Any = None,
+        resolve_field: Optional[Callable[[str], Any]] = None,
+        schema: Any = None,
+        batch_size: int = 10000,
+    ) -> None:
+        self.pyarrow = _pyarrow()
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive number")
+        self.batch_size = batch_size
+        self.meta = list(meta)
+        if mapping is not None and hasattr(mapping, "_doc_type"):
+            mapping = mapping._doc_type.mapping
+        if resolve_field is None and mapping is not None:
+            resolve_field = mapping.resolve_field
+        self.resolve_field = resolve_field
+        self.schema = schema
+        if schema is not None and fields is None:
+            fields = [name for name in schema.names if name not in self.meta]
+        elif fields is None and mapping is not None:
+            fields = list(mapping)
+        self.columns: Optional[List[_Column]] = None
+        if fields is not None:
+            self.columns = self._columns(fields)
+        self.rows: List[Dict[str, Any]] = []
+
+    def _columns(self, fields: Iterable[str]) -> List[_Column]:
+        columns = []
+        for name in self.meta:
+            columns.append(
+                _Column(name, True, None, self._type(name, META_ARROW_TYPES.get(name)))
+            )
+        for name in fields:
+            field = self.resolve_field(name) if self.resolve_field else None
+            type_name = ARROW_TYPES.get(getattr(field, "name", None) or "")
+            arrow_type = self._type(name, type_name)
+            if arrow_type is not None and getattr(field, "_multi", False):
+                arrow_type = self.pyarrow.list_(arrow_type)
+            columns.append(_Column(name, False, field, arrow_type))
+        return columns
+
+    def _type(self, name: str, type_name: Optional[str]) -> Any:
+        if self.schema is not None:
+            return self.schema.field(name).type
+        if type_name is None:
+            return None
+        return _arrow_type(self.pyarrow, type_name)
+
+    def add(self, hit: Dict[str, Any]) -> Optional[Any]:
+        """
+        Add a hit, returns the batch it completed, if any.
+        """
+        self.rows.append(hit)
+        if len(self.rows) >= self.batch_size:
+            return self.flush()
+        return None
+
+    def flush(self) -> Optional[Any]:
+        """
+        Return the batch of the hits added since the last one, if any.
+        """
+        if not self.rows:
+            return None
+        hits, self.rows = self.rows, []
+        if self.columns is None:
+            # the _source fields of the first batch, in the order they are seen
+            names: Dict[str, None] = {}
+            for hit in hits:
+                names.update(dict.fromkeys(hit.get("_source", {})))
+                names.update(dict.fromkeys(hit.get("fields", {})))
+            self.columns = self._columns(names)
+        arrays = [
+            self._array(column, [column.value(hit) for hit in hits])
+            for column in self.columns
+        ]
+        return self.pyarrow.RecordBatch.from_arrays(
+            arrays, names=[column.name for column in self.columns]
+        )
+
+    def _array(self, column: _Column, values: List[Any]) -> Any:
+        if column.arrow_type is not None:
+            return self.pyarrow.array(values, type=column.arrow_type)
+        array = self.pyarrow.array(values)
+        if self.pyarrow.types.is_null(array.type):
+            if column.inferred_type is not None:
+                return self.pyarrow.nulls(len(values), type=column.inferred_type)
+        elif column.inferred_type is None:
+            column.inferred_type = array.type
+        return array
+
+    def batches(self, hits: Iterable[Dict[str, Any]]) -> Iterator[Any]:
+        """
+        Return the batches of all ``hits``.
+        """
+        for hit in hits:
+            batch = self.add(hit)
+            if batch is not None:
+                yield batch
+        batch = self.flush()
+        if batch is not None:
+            yield batch
+
+    def table(self, batches: Iterable[Any]) -> Any:
+        """
+        Return a ``pyarrow.Table`` of ``batches``, the types of the columns
+        inferred differently by different batches are unified, e.g. the
+        ``int64`` and ``double`` values of a column become ``double`` ones.
+        """
+        tables = [self.pyarrow.Table.from_batches([batch]) for batch in batches]
+        if not tables:
+            return self.pyarrow.table(
+                {
+                    column.name: self.pyarrow.array(
+                        [], type=column.arrow_type or self.pyarrow.null()
+                    )
+                    for column in self.columns or ()
+                }
+            )
+        return self.pyarrow.concat_tables(tables, promote_options="permissive")
+
+
+def scan_to_arrow(
+    client: Any,
+    query: Any = None,
+    index: Any = None,
+    fields: Optional[Iterable[str]] = None,
+    meta: Iterable[str] = (),
+    mapping: Any = None,
+    schema: Any = None,
+    batch_size: int = 10000,
+    **kwargs: Any,
+) -> Iterator[Any]:
+    """
+    Run :func:`scan` and return the matching documents as
+    ``pyarrow.RecordBatch`` objects of up to ``batch_size`` rows, holding
+    only one batch of documents in memory instead of building objects or
+    rows for all of them::
+
+        batches = scan_to_arrow(
+            client, index="orders", meta=["_id"], mapping=Order, stream=True
+        )
+        pyarrow.parquet.write_table(pyarrow.Table.from_batches(batches), path)
+
+    Requires ``pyarrow``, see :class:`ColumnarBatches` for the types of
+    the columns.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg query: body for the :meth:`~opensearchpy.OpenSearch.search` api
+    :arg index: the indices to scan
+    :arg fields: the (dotted) paths of the fields to return as columns
+    :arg meta: metadata of the hits to return as columns, e.g. ``["_id"]``
+    :arg mapping: :class:`~opensearchpy.Mapping` or
+        :class:`~opensearchpy.Document` subclass used to type the columns
+    :arg schema: ``pyarrow.Schema`` of the batches, instead of ``mapping``
+    :arg batch_size: number of rows of a batch
+
+    Any additional keyword arguments will be passed to :func:`scan`.
+    """
+    batches = ColumnarBatches(
+        fields=fields, meta=meta, mapping=mapping, schema=schema, batch_size=batch_size
+    )
+    return batches.batches(scan(client, query=query, index=index, **kwargs))
+
+
+def _json_column(pyarrow: Any, column: Any) -> Any:
+    """
+    Convert a column to values json can serialize without falling back to
+    :meth:`~opensearchpy.JSONSerializer.default` for each of them: dates and
+    timestamps become ISO 8601 strings, NaN and infinite floats ``null`` and
+    decimals floats.
+    """
+    import pyarrow.compute as pc  # pylint: disable=import-outside-toplevel
+
+    types = pyarrow.types
+    if types.is_dictionary(column.type):
+        column = column.dictionary_decode()
+    if types.is_timestamp(column.type):
+        if column.type.tz is None:
+            return pc.strftime(column, format="%Y-%m-%dT%H:%M:%S")
+        column = column.cast(pyarrow.timestamp(column.type.unit, tz="UTC"))
+        return pc.strftime(column, format="%Y-%m-%dT%H:%M:%SZ")
+    if types.is_date(column.type):
+        return pc.strftime(column, format="%Y-%m-%d")
+    if types.is_time(column.type):
+        return column.cast(pyarrow.string())
+    if types.is_decimal(column.type):
+        column = column.cast(pyarrow.float64())
+    if types.is_floating(column.type):
+        # null where the value isn't finite, NaN and Infinity aren't JSON
+        return pc.if_else(pc.is_finite(column), column, None)
+    return column
+
+
+def _arrow_actions(pyarrow: Any, batches: Iterable[Any], op_type: str) -> Iterator[Any]:
+    """
+    The action and document lines of the rows of ``batches``, each column
+    of a batch is converted at once before the rows are put together.
+    """
+    for batch in batches:
+        meta: List[Any] = []
+        op_types: Any = repeat(None)
+        names: List[str] = []
+        columns: List[List[Any]] = []
+        for name, column in zip(batch.schema.names, batch.columns):
+            values = _json_column(pyarrow, column).to_pylist()
+            if name in BULK_META_COLUMNS:
+                meta.append((BULK_META_COLUMNS[name], values))
+            elif name == "_op_type":
+                op_types = values
+            else:
+                names.append(name)
+                columns.append(values)
+
+        # the action is shared by the rows without metadata
+        action: Dict[str, Any] = {op_type: {}}
+        rows = zip(*columns) if columns else repeat((), batch.num_rows)
+        for row, (values, row_op_type) in enumerate(zip(rows, op_types)):
+            row_op_type = row_op_type or op_type
+            if meta or row_op_type != op_type:
+                row_action = {
+                    row_op_type: {
+                        key: column[row]
+                        for key, column in meta
+                        if column[row] is not None
+                    }
+                }
+            else:
+                row_action = action
+            doc: Any = dict(zip(names, values))
+            if row_op_type == "delete":
+                doc = None
+            elif row_op_type == "update":
+                doc = {"doc": doc}
+            yield row_action, doc
+
+
+def _expanded(action: Any) -> Any:
+    return action
+
+
+def _to_batches(pyarrow: Any, table: Any, batch_size: int) -> Iterable[Any]:
+    if isinstance(table, pyarrow.RecordBatch):
+        table = pyarrow.Table.from_batches([table])
+    if isinstance(table, pyarrow.Table):
+        return table.to_batches(max_chunksize=batch_size)  # type: ignore
+    return table  # type: ignore
+
+
+def bulk_from_arrow(
+    client: Any,
+    table: Any,
+    op_type: str = "index",
+    batch_size: int = 10000,
+    **kwargs: Any,
+) -> Any:
+    """
+    Index the rows of a ``pyarrow.Table``, a ``pyarrow.RecordBatch`` or an
+    iterable of record batches with :func:`bulk`, one document per row::
+
+        success, errors = bulk_from_arrow(client, table, index="orders")
+
+    The values are converted column by column, ``batch_size`` rows at a
+    time, instead of going through the serializer's fallback for each
+    value: timestamps and dates become ISO 8601 strings (timestamps with a
+    time zone in UTC), NaN and infinite floats ``null`` and decimals floats.
+
+    The ``_index``, ``_id``, ``_routing``, ``_if_seq_no``,
+    ``_if_primary_term``, ``_version``, ``_version_type``,
+    ``_retry_on_conflict`` and ``_op_type`` columns go to the
+    action line of their row, like the keys of the actions of :func:`bulk`,
+    the other columns are the document. A ``null`` ``_id`` leaves the id to
+    OpenSearch. The rows of an ``update`` are partial documents.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg table: the rows to index
+    :arg op_type: the action of the rows without an ``_op_type``
+    :arg batch_size: number of rows converted at a time
+
+    Any additional keyword arguments will be passed to :func:`bulk`, and
+    from there to :func:`streaming_bulk` which splits the rows into
+    requests of ``chunk_size`` documents.
+    """
+    pyarrow = _pyarrow()
+    actions = _arrow_actions(pyarrow, _to_batches(pyarrow, table, batch_size), op_type)
+    return bulk(client, actions, expand_action_callback=_expanded, **kwargs)
+
+
+def bulk_from_dataframe(
+    client: Any,
+    df: Any,
+    op_type: str = "index",
+    batch_size: int = 10000,
+    **kwargs: Any,
+) -> Any:
+    """
+    Index the rows of a ``pandas.DataFrame``, one document per row, see
+    :func:`bulk_from_arrow`. The frame is converted to Arrow without its
+    index, ``NaN``, ``None`` and ``NaT`` values are indexed as ``null``::
+
+        bulk_from_dataframe(client, df.reset_index(names="_id"), index="orders")
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg df: the rows to index
+    :arg op_type: the action of the rows without an ``_op_type`` column
+    :arg batch_size: number of rows converted at a time
+
+    Any additional keyword arguments will be passed to :func:`bulk`.
+    """
+    table = _pyarrow().Table.from_pandas(df, preserve_index=False)
+    return bulk_from_arrow(client, table, op_type, batch_size, **kwargs)
@@ -26,7 +26,7 @@
 
 from typing import Any
 
-from ..utils import AttrDict, AttrList, _wrap
+from ..utils import AttrDict, LazyAttrList, _wrap
 from .hit import Hit, HitMeta
 
 
@@ -73,7 +73,8 @@ class Response(AttrDict):
             h = self._d_["hits"]
 
             try:
-                hits = AttrList(map(self._search._get_result, h["hits"]))
+                # a hit is turned into an object once it's accessed
+                hits = LazyAttrList(h["hits"], obj_wrapper=self._search._get_result)
             except AttributeError as e:
                 # avoid raising AttributeError since it will be hidden by the property
                 raise TypeError("Could not parse hits.", e)
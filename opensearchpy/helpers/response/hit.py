@@ -30,6 +30,8 @@ from ..utils import AttrDict, HitMeta
 
 
 class Hit(AttrDict):
+    __slots__ = ("_hit", "_meta")
+
     def __init__(self, document: Any) -> None:
         data = {}
         if "_source" in document:
@@ -38,8 +40,20 @@ class Hit(AttrDict):
             data.update(document["fields"])
 
         super().__init__(data)
+        # meta is built from the document once it's accessed
+        super(AttrDict, self).__setattr__("_hit", document)
+        super(AttrDict, self).__setattr__("_meta", None)
+
+    @property
+    def meta(self) -> HitMeta:
+        if self._meta is None:
+            super(AttrDict, self).__setattr__("_meta", HitMeta(self._hit))
+        return self._meta  # type: ignore
+
+    @meta.setter
+    def meta(self, meta: HitMeta) -> None:
         # assign meta as attribute and not as key in self._d_
-        super(AttrDict, self).__setattr__("meta", HitMeta(document))
+        super(AttrDict, self).__setattr__("_meta", meta)
 
     def __getstate__(self) -> Any:
         # add self.meta since it is not in self.__dict__
@@ -26,17 +26,22 @@
 
 import collections.abc as collections_abc
 import copy
-from typing import Any
+import json
+import re
+import uuid
+from typing import Any, Dict, List
 
 from opensearchpy.connection.connections import get_connection
 from opensearchpy.exceptions import TransportError
-from opensearchpy.helpers import scan
+from opensearchpy.helpers import pit_scan, scan
 
 from ..exceptions import IllegalOperation
 from ..helpers.query import Bool, Q
+from ..serializer import serializer
 from .aggs import A, AggBase
+from .columnar import ColumnarBatches
 from .response import Hit, Response
-from .utils import AttrDict, DslBase, recursive_to_dict
+from .utils import AttrDict, CopyOnWrite, DslBase, recursive_to_dict, shallow_clone
 
 
 class QueryProxy:
@@ -85,6 +90,11 @@ class QueryProxy:
     def __setstate__(self, state: Any) -> None:
         self._search, self._proxied, self._attr_name = state
 
+    def _clone_for(self, search: Any) -> "QueryProxy":
+        proxy: QueryProxy = shallow_clone(self)
+        proxy._search = search
+        return proxy
+
 
 class ProxyDescriptor:
     """
@@ -108,6 +118,10 @@ class ProxyDescriptor:
 
 class AggsProxy(AggBase, DslBase):
     name = "aggs"
+    # copy the top-level bucket definitions
+    _params = CopyOnWrite(
+        lambda params: {name: copy.copy(value) for name, value in params.items()}
+    )
 
     def __init__(self, search: Any) -> None:
         self._base = self
@@ -117,10 +131,20 @@ class AggsProxy(AggBase, DslBase):
     def to_dict(self) -> Any:
         return super().to_dict().get("aggs", {})
 
+    def _clone_for(self, search: Any) -> "AggsProxy":
+        proxy: AggsProxy = shallow_clone(self)
+        proxy._base = proxy
+        proxy._search = search
+        return proxy
+
 
 class Request:
-    _doc_type: Any
-    _doc_type_map: Any
+    # containers shared with clones until either of them uses them
+    _index = CopyOnWrite()
+    _doc_type = CopyOnWrite()
+    _doc_type_map = CopyOnWrite()
+    _params = CopyOnWrite()
+    _extra = CopyOnWrite()
 
     def __init__(
         self,
@@ -147,8 +171,8 @@ class Request:
         elif doc_type:
             self._doc_type.append(doc_type)
 
-        self._params: Any = {}
-        self._extra: Any = extra or {}
+        self._params = {}
+        self._extra = extra or {}
 
     def __eq__(self: Any, other: Any) -> bool:
         return (
@@ -212,6 +236,23 @@ class Request:
             if field is not None:
                 return field
 
+    def _columnar_batches(
+        self, fields: Any, meta: Any, batch_size: int
+    ) -> ColumnarBatches:
+        if fields is None:
+            # the fields of the documents searched
+            names: Dict[str, None] = {}
+            for dt in self._doc_type:
+                if hasattr(dt, "_doc_type"):
+                    names.update(dict.fromkeys(dt._doc_type.mapping))
+            fields = list(names) or None
+        return ColumnarBatches(
+            fields=fields,
+            meta=meta,
+            resolve_field=self._resolve_field,
+            batch_size=batch_size,
+        )
+
     def _resolve_nested(self, hit: Any, parent_class: Any = None) -> Any:
         doc_class = Hit
 
@@ -307,18 +348,129 @@ class Request:
         return s
 
     def _clone(self) -> Any:
-        s = self.__class__(
-            using=self._using, index=self._index, doc_type=self._doc_type
-        )
-        s._doc_type_map = self._doc_type_map.copy()
-        s._extra = self._extra.copy()
-        s._params = self._params.copy()
+        """
+        Return a clone of the request sharing its state, the containers
+        holding it are only copied once they are used by the clone or the
+        request, see :class:`~opensearchpy.helpers.utils.CopyOnWrite`.
+        """
+        s = shallow_clone(self)
+        # the cached response belongs to this request only
+        s.__dict__.pop("_response", None)
+        for name, value in list(s.__dict__.items()):
+            if isinstance(value, (QueryProxy, AggsProxy)) and value._search is self:
+                s.__dict__[name] = value._clone_for(s)
         return s
 
 
+class Param:
+    """
+    Named placeholder for a value of a :class:`Search`, filled in when the
+    search compiled with :meth:`Search.compile` is rendered::
+
+        s = Search(index="orders").filter("term", user_id=Param("user_id"))
+        compiled = s.compile()
+        for user_id in user_ids:
+            response = compiled.execute(user_id=user_id)
+
+    Placeholders can be used wherever the search holds a value, not as
+    field names or other keys.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"Param({self.name!r})"
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Param) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash((Param, self.name))
+
+
+class CompiledSearch:
+    """
+    A :class:`Search` serialized once into the request body, with slots for
+    the values of its :class:`Param` placeholders. Rendering the body only
+    serializes these values instead of rebuilding it from the DSL objects
+    like :meth:`Search.to_dict` does. Returned by :meth:`Search.compile`.
+    """
+
+    def __init__(self, search: Any) -> None:
+        self._search = search
+        token = uuid.uuid4().hex
+        names: List[str] = []
+
+        def mark(data: Any) -> Any:
+            # replace the placeholders with strings that can't be in the body
+            if isinstance(data, Param):
+                names.append(data.name)
+                return f"{token}{len(names) - 1}"
+            if isinstance(data, (list, tuple)):
+                return [mark(value) for value in data]
+            if isinstance(data, collections_abc.Mapping):
+                return {key: mark(value) for key, value in data.items()}
+            return data
+
+        body = serializer.dumps(mark(recursive_to_dict(search.to_dict())))
+        parts = re.split(f'"{token}([0-9]+)"', body)
+        self._parts = [part.encode("utf-8", "surrogatepass") for part in parts[::2]]
+        self._slots = [names[int(i)] for i in parts[1::2]]
+        #: names of the placeholders that have to be given to :meth:`render`
+        self.params = frozenset(names)
+
+    def render(self, **values: Any) -> bytes:
+        """
+        Return the request body with the given values for the placeholders,
+        as the ``bytes`` sent to OpenSearch.
+        """
+        if values.keys() != self.params:
+            missing = sorted(self.params - values.keys())
+            unknown = sorted(values.keys() - self.params)
+            raise ValueError(
+                f"CompiledSearch.render() missing values for {missing}"
+                if missing
+                else f"CompiledSearch.render() got unknown placeholders {unknown}"
+            )
+        rendered: Dict[str, bytes] = {
+            name: json.dumps(
+                value,
+                default=serializer.default,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            ).encode("utf-8", "surrogatepass")
+            for name, value in values.items()
+        }
+        body = [self._parts[0]]
+        for name, part in zip(self._slots, self._parts[1:]):
+            body.append(rendered[name])
+            body.append(part)
+        return b"".join(body)
+
+    def execute(self, **values: Any) -> Any:
+        """
+        Execute the search with the given values for the placeholders and
+        return an instance of ``Response`` wrapping all the data.
+        """
+        s = self._search
+        opensearch = get_connection(s._using)
+        return s._response_class(
+            s,
+            opensearch.search(index=s._index, body=self.render(**values), **s._params),
+        )
+
+
 class Search(Request):
     query = ProxyDescriptor("query")
     post_filter = ProxyDescriptor("post_filter")
+    _sort = CopyOnWrite()
+    _collapse = CopyOnWrite()
+    _source = CopyOnWrite()
+    _highlight = CopyOnWrite()
+    _highlight_opts = CopyOnWrite()
+    _suggest = CopyOnWrite()
+    _script_fields = CopyOnWrite()
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -334,13 +486,13 @@ class Search(Request):
         super().__init__(**kwargs)
 
         self.aggs = AggsProxy(self)
-        self._sort: Any = []
-        self._collapse: Any = {}
-        self._source: Any = None
-        self._highlight: Any = {}
-        self._highlight_opts: Any = {}
-        self._suggest: Any = {}
-        self._script_fields: Any = {}
+        self._sort = []
+        self._collapse = {}
+        self._source = None
+        self._highlight = {}
+        self._highlight_opts = {}
+        self._suggest = {}
+        self._script_fields = {}
         self._response_class = Response
 
         self._query_proxy = QueryProxy(self, "query")
@@ -414,30 +566,6 @@ class Search(Request):
         s.update_from_dict(d)
         return s
 
-    def _clone(self) -> Any:
-        """
-        Return a clone of the current search request. Performs a shallow copy
-        of all the underlying objects. Used internally by most state modifying
-        APIs.
-        """
-        s = super()._clone()
-
-        s._response_class = self._response_class
-        s._sort = self._sort[:]
-        s._source = copy.copy(self._source) if self._source is not None else None
-        s._highlight = self._highlight.copy()
-        s._highlight_opts = self._highlight_opts.copy()
-        s._suggest = self._suggest.copy()
-        s._script_fields = self._script_fields.copy()
-        s._collapse = self._collapse.copy()
-        for x in ("query", "post_filter"):
-            getattr(s, x)._proxied = getattr(self, x)._proxied
-
-        # copy top-level bucket definitions
-        if self.aggs._params.get("aggs"):
-            s.aggs._params = {"aggs": self.aggs._params["aggs"].copy()}
-        return s
-
     def response_class(self, cls: Any) -> Any:
         """
         Override the default wrapper used for the response.
@@ -729,6 +857,15 @@ class Search(Request):
         d.update(recursive_to_dict(kwargs))
         return d
 
+    def compile(self) -> CompiledSearch:
+        """
+        Serialize the search once into a :class:`CompiledSearch` that renders
+        and executes its body for the values of the :class:`Param`
+        placeholders used in it, for searches sent many times with only a few
+        values changing.
+        """
+        return CompiledSearch(self._clone())
+
     def count(self) -> Any:
         """
         Return the number of hits matching the query and filters. Note that
@@ -743,13 +880,16 @@ class Search(Request):
         # TODO: failed shards detection
         return opensearch.count(index=self._index, body=d, **self._params)["count"]
 
-    def execute(self, ignore_cache: bool = False) -> Any:
+    def execute(self, ignore_cache: bool = False, raw: bool = False) -> Any:
         """
         Execute the search and return an instance of ``Response`` wrapping all
         the data.
 
         :arg ignore_cache: if set to ``True``, consecutive calls will hit
             OpenSearch, while cached result will be ignored. Defaults to `False`
+        :arg raw: if set to ``True``, return the response body as the plain
+            ``dict`` returned by the client, without any objects for its
+            hits. Defaults to `False`
         """
         if ignore_cache or not hasattr(self, "_response"):
             opensearch = get_connection(self._using)
@@ -760,9 +900,9 @@ class Search(Request):
                     index=self._index, body=self.to_dict(), **self._params
                 ),
             )
-        return self._response
+        return self._response.to_dict() if raw else self._response
 
-    def scan(self) -> Any:
+    def scan(self, pit: bool = False) -> Any:
         """
         Turn the search into a scan search and return a generator that will
         iterate over all the documents matching the query.
@@ -770,13 +910,61 @@ class Search(Request):
         Use ``params`` method to specify any additional arguments you with to
         pass to the underlying ``scan`` helper from ``opensearchpy``
 
+        :arg pit: iterate using a point in time and ``search_after`` with the
+            ``pit_scan`` helper instead of a scroll
+
         """
-        opensearch = get_connection(self._using)
+        for hit in self._scan_hits(pit):
+            yield self._get_result(hit)
 
-        for hit in scan(
+    def _scan_hits(self, pit: bool = False) -> Any:
+        opensearch = get_connection(self._using)
+        return (pit_scan if pit else scan)(
             opensearch, query=self.to_dict(), index=self._index, **self._params
-        ):
-            yield self._get_result(hit)
+        )
+
+    def to_arrow(
+        self,
+        fields: Any = None,
+        meta: Any = (),
+        scan: bool = False,
+        batch_size: int = 10000,
+    ) -> Any:
+        """
+        Return the hits of the search as a ``pyarrow.Table`` with a column
+        per field, typed after the fields of the ``Document`` classes
+        searched, see :class:`~opensearchpy.helpers.ColumnarBatches`.
+        Requires ``pyarrow``.
+
+        :arg fields: the (dotted) paths of the fields to return as columns,
+            all the fields of the documents searched by default
+        :arg meta: metadata of the hits to return as columns, e.g. ``["_id"]``
+        :arg scan: return all the documents matching the query, using the
+            ``scan`` helper like :meth:`scan`, instead of the hits of one
+            response
+        :arg batch_size: number of hits converted at a time
+        """
+        columnar = self._columnar_batches(fields, meta, batch_size)
+        if scan:
+            hits = self._scan_hits()
+        else:
+            hits = self.execute(raw=True)["hits"]["hits"]
+        return columnar.table(columnar.batches(hits))
+
+    def to_pandas(
+        self,
+        fields: Any = None,
+        meta: Any = (),
+        scan: bool = False,
+        batch_size: int = 10000,
+    ) -> Any:
+        """
+        Return the hits of the search as a ``pandas.DataFrame``, converted
+        from :meth:`to_arrow`. Requires ``pyarrow`` and ``pandas``.
+        """
+        return self.to_arrow(
+            fields=fields, meta=meta, scan=scan, batch_size=batch_size
+        ).to_pandas()
 
     def delete(self) -> Any:
         """
@@ -798,9 +986,11 @@ class MultiSearch(Request):
     request.
     """
 
+    _searches = CopyOnWrite()
+
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
-        self._searches: Any = []
+        self._searches = []
 
     def __getitem__(self, key: Any) -> Any:
         return self._searches[key]
@@ -808,11 +998,6 @@ class MultiSearch(Request):
     def __iter__(self) -> Any:
         return iter(self._searches)
 
-    def _clone(self) -> Any:
-        ms = super()._clone()
-        ms._searches = self._searches[:]
-        return ms
-
     def add(self, search: Any) -> Any:
         """
         Adds a new :class:`~opensearchpy.Search` object to the request::
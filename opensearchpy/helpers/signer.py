@@ -12,6 +12,8 @@ from urllib.parse import parse_qs, urlencode, urlparse
 
 import requests
 
+from ..compat import is_stream
+
 
 class AWSV4Signer:
     """
@@ -45,6 +47,12 @@ class AWSV4Signer:
         from botocore.auth import SigV4Auth
         from botocore.awsrequest import AWSRequest
 
+        # the signature covers a hash of the whole body
+        if is_stream(body):
+            raise ValueError(
+                "Streamed request bodies can't be signed, pass the body as bytes or str"
+            )
+
         signature_host = self._fetch_url(url, headers or dict())
 
         # create an AWS request object and sign it using SigV4Auth
@@ -0,0 +1,370 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import json
+import re
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+from ..exceptions import SerializationError
+
+# the next character that changes the nesting of a JSON value, or ends a string
+_STRUCTURE_RE = re.compile(rb'["{}\[\]]')
+_STRING_END_RE = re.compile(rb'["\\]')
+_SCALAR_END_RE = re.compile(rb"[,}\]\s]")
+_WHITESPACE = b" \t\r\n,"
+
+# parser states
+_START, _KEY, _COLON, _VALUE, _HITS, _DONE = range(6)
+
+
+class HitsParser:
+    """
+    Push parser picking the documents out of the ``hits.hits`` array of a
+    search or scroll response body as its chunks are fed, without holding
+    more than the chunk and the document being received in memory.
+
+    Every other value of the response is collected in :attr:`response`,
+    with ``hits.hits`` left empty, which is complete once the whole body was
+    fed and :meth:`close` was called.
+
+    :arg serializer: serializer the documents are loaded with, defaults to
+        the standard library ``json`` module
+    """
+
+    def __init__(self, serializer: Any = None) -> None:
+        self.loads = serializer.loads if serializer is not None else json.loads
+        self.response: Dict[str, Any] = {}
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _START
+        self._key: Any = None
+        # the object whose keys are being read, the response or its hits
+        self._object: Dict[str, Any] = self.response
+        # the value being scanned
+        self._value_start: Optional[int] = None
+        self._scan = 0
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Parse the next chunk of the response body, returns the documents it
+        completed.
+        """
+        self._buffer += chunk
+        hits: List[Any] = []
+        try:
+            while self._step(hits):
+                pass
+        finally:
+            # drop what was consumed, keeping the value being scanned
+            del self._buffer[: self._pos]
+            if self._value_start is not None:
+                self._value_start -= self._pos
+                self._scan -= self._pos
+            self._pos = 0
+        return hits
+
+    def close(self) -> None:
+        """
+        Check the whole response was fed, the rest of the response is in
+        :attr:`response` afterwards.
+        """
+        if self._state != _DONE:
+            raise SerializationError(
+                "Incomplete search response", bytes(self._buffer[:100])
+            )
+
+    def _step(self, hits: List[Any]) -> bool:
+        """Consume the next token or value, False if more data is needed."""
+        buffer = self._buffer
+        if self._value_start is None:
+            while self._pos < len(buffer) and buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos == len(buffer):
+                return False
+        char = buffer[self._pos : self._pos + 1]
+
+        if self._state == _START:
+            self._expect(char, b"{")
+            self._state = _KEY
+        elif self._state == _KEY:
+            if char == b"}" and self._value_start is None:
+                self._pos += 1
+                if self._object is self.response:
+                    self._state = _DONE
+                else:
+                    self._object = self.response
+                return True
+            key = self._value()
+            if key is None:
+                return False
+            self._key = self.loads(key)
+            self._state = _COLON
+        elif self._state == _COLON:
+            self._expect(char, b":")
+            self._state = _VALUE
+        elif self._state == _VALUE:
+            if self._key == "hits" and self._value_start is None:
+                if self._object is self.response and char == b"{":
+                    self._pos += 1
+                    self._object = self.response["hits"] = {}
+                    self._state = _KEY
+                    return True
+                if self._object is not self.response and char == b"[":
+                    self._pos += 1
+                    self._object["hits"] = []
+                    self._state = _HITS
+                    return True
+            value = self._value()
+            if value is None:
+                return False
+            self._object[self._key] = self.loads(value)
+            self._state = _KEY
+        elif self._state == _HITS:
+            if char == b"]" and self._value_start is None:
+                self._pos += 1
+                self._state = _KEY
+                return True
+            value = self._value()
+            if value is None:
+                return False
+            hits.append(self.loads(value))
+        else:
+            raise SerializationError("Unexpected data after the search response")
+        return True
+
+    def _expect(self, char: bytearray, expected: bytes) -> None:
+        if char != expected:
+            raise SerializationError(
+                f"Expected {expected!r} in search response, got {bytes(char)!r}"
+            )
+        self._pos += 1
+
+    def _value(self) -> Optional[bytes]:
+        """
+        Scan the JSON value starting at the current position, returns it once
+        complete and ``None`` while more data is needed.
+        """
+        buffer = self._buffer
+        if self._value_start is None:
+            self._value_start = self._scan = self._pos
+            self._depth = 0
+            self._in_string = buffer[self._pos] == ord('"')
+            if self._in_string:
+                self._scan += 1
+
+        if buffer[self._value_start] not in b'{["':
+            # a number, true, false or null
+            match = _SCALAR_END_RE.search(buffer, self._scan)
+            if match is None:
+                self._scan = len(buffer)
+                return None
+            self._scan = match.start()
+            return self._take()
+
+        while True:
+            if self._in_string:
+                match = _STRING_END_RE.search(buffer, self._scan)
+                if match is None:
+                    self._scan = len(buffer)
+                    return None
+                if match.group() == b"\\":
+                    if match.end() == len(buffer):
+                        # the escaped character is in the next chunk
+                        self._scan = match.start()
+                        return None
+                    self._scan = match.end() + 1
+                    continue
+                self._in_string = False
+                self._scan = match.end()
+                if self._depth == 0:
+                    return self._take()
+                continue
+
+            match = _STRUCTURE_RE.search(buffer, self._scan)
+            if match is None:
+                self._scan = len(buffer)
+                return None
+            self._scan = match.end()
+            char = match.group()
+            if char == b'"':
+                self._in_string = True
+            elif char in b"{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return self._take()
+
+    def _take(self) -> bytes:
+        value = bytes(self._buffer[self._value_start : self._scan])
+        self._pos = self._scan
+        self._value_start = None
+        return value
+
+
+class HitsStream:
+    """
+    Iterator over the documents of a search or scroll response, parsed from
+    the response body as it is read from the connection instead of loading
+    the whole response first. Returned by :func:`stream_search` and
+    :func:`stream_scroll`.
+
+    The rest of the response, ``_scroll_id``, ``hits.total``, aggregations
+    etc., is in :attr:`response` once all documents were consumed. Close the
+    stream, or use it as a context manager, to release the connection
+    without reading the remaining documents.
+    """
+
+    def __init__(self, chunks: Any, serializer: Any = None) -> None:
+        if isinstance(chunks, (str, bytes)):
+            # an error status passed in ``ignore`` is read right away
+            chunks = iter([chunks])
+        self.count = 0
+        self._chunks = chunks
+        self._parser = HitsParser(serializer)
+        self._hits: Any = deque()
+
+    @property
+    def response(self) -> Dict[str, Any]:
+        """The response without the documents of ``hits.hits``."""
+        return self._parser.response
+
+    def __iter__(self) -> "HitsStream":
+        return self
+
+    def __next__(self) -> Any:
+        while not self._hits:
+            try:
+                chunk = next(self._chunks)
+            except StopIteration:
+                self._parser.close()
+                raise
+            self._hits.extend(self._parser.feed(_to_bytes(chunk)))
+        self.count += 1
+        return self._hits.popleft()
+
+    def close(self) -> None:
+        """Release the connection, the remaining documents aren't read."""
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "HitsStream":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+
+def _to_bytes(chunk: Any) -> bytes:
+    if isinstance(chunk, str):
+        return chunk.encode("utf-8", "surrogatepass")
+    return chunk  # type: ignore
+
+
+class _RequestRecorder:
+    """
+    Stands in for the client in a method of the generated client, which then
+    returns the request it would send instead of sending it. The helpers
+    thereby take exactly the arguments of the API they stream.
+    """
+
+    def __init__(self) -> None:
+        self.transport = self
+
+    def perform_request(
+        self,
+        method: str,
+        url: str,
+        params: Any = None,
+        headers: Any = None,
+        body: Any = None,
+    ) -> Any:
+        return url, params, headers, body
+
+
+def _search_request(body: Any, index: Any, kwargs: Any) -> Any:
+    """
+    The url, params, headers and body of a search request, the keyword
+    arguments are handled like the ones of :meth:`OpenSearch.search`.
+    """
+    # the client imports the helpers (through the serializer), not the reverse
+    from ..client import OpenSearch  # pylint: disable=import-outside-toplevel
+
+    return OpenSearch.search(_RequestRecorder(), body=body, index=index, **kwargs)
+
+
+def _scroll_request(scroll_id: Any, body: Any, kwargs: Any) -> Any:
+    """
+    The params, headers and body of a scroll request, the keyword arguments
+    are handled like the ones of :meth:`OpenSearch.scroll`.
+    """
+    from ..client import OpenSearch  # pylint: disable=import-outside-toplevel
+
+    _, params, headers, body = OpenSearch.scroll(
+        _RequestRecorder(), scroll_id=scroll_id, body=body, **kwargs
+    )
+    return params, headers, body
+
+
+def stream_search(
+    client: Any, body: Any = None, index: Any = None, **kwargs: Any
+) -> HitsStream:
+    """
+    Run a search like :meth:`~opensearchpy.OpenSearch.search`, returning a
+    :class:`HitsStream` that parses the documents from the response as it
+    is received. Exporting large pages with big ``_source`` documents then
+    only holds a few of them in memory at a time::
+
+        with stream_search(client, index="movies", body=query, size=10000) as hits:
+            for hit in hits:
+                export(hit["_source"])
+        print(hits.response["hits"]["total"])
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg body: the search definition
+    :arg index: comma-separated list of indices to search
+
+    Any additional keyword arguments are the query parameters of
+    :meth:`~opensearchpy.OpenSearch.search`.
+    """
+    url, params, headers, body = _search_request(body, index, kwargs)
+    chunks = client.transport.perform_request(
+        "POST", url, params=params, headers=headers, body=body, stream=True
+    )
+    return HitsStream(chunks, client.transport.serializer)
+
+
+def stream_scroll(
+    client: Any, scroll_id: Any = None, body: Any = None, **kwargs: Any
+) -> HitsStream:
+    """
+    Fetch the next page of a scroll like
+    :meth:`~opensearchpy.OpenSearch.scroll`, returning a :class:`HitsStream`
+    that parses the documents from the response as it is received, see
+    :func:`stream_search`.
+
+    :arg client: instance of :class:`~opensearchpy.OpenSearch` to use
+    :arg scroll_id: the scroll id of the previous page
+    :arg body: the scroll id and scroll period, instead of ``scroll_id``
+    :arg scroll: period to retain the search context for scrolling
+    """
+    params, headers, body = _scroll_request(scroll_id, body, kwargs)
+    chunks = client.transport.perform_request(
+        "POST",
+        "/_search/scroll",
+        params=params,
+        headers=headers,
+        body=body,
+        stream=True,
+    )
+    return HitsStream(chunks, client.transport.serializer)
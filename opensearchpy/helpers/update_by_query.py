@@ -31,11 +31,12 @@ from opensearchpy.connection.connections import get_connection
 from ..helpers.query import Bool, Q
 from ..helpers.search import ProxyDescriptor, QueryProxy, Request
 from .response import UpdateByQueryResponse
-from .utils import recursive_to_dict
+from .utils import CopyOnWrite, recursive_to_dict
 
 
 class UpdateByQuery(Request):
     query = ProxyDescriptor("query")
+    _script = CopyOnWrite()
 
     def __init__(self, **kwargs: Any) -> None:
         """
@@ -51,7 +52,7 @@ class UpdateByQuery(Request):
         """
         super().__init__(**kwargs)
         self._response_class = UpdateByQueryResponse
-        self._script: Any = {}
+        self._script = {}
         self._query_proxy = QueryProxy(self, "query")
 
     def filter(self, *args: Any, **kwargs: Any) -> Any:
@@ -82,19 +83,6 @@ class UpdateByQuery(Request):
         u.update_from_dict(d)
         return u
 
-    def _clone(self) -> Any:
-        """
-        Return a clone of the current search request. Performs a shallow copy
-        of all the underlying objects. Used internally by most state modifying
-        APIs.
-        """
-        ubq = super()._clone()
-
-        ubq._response_class = self._response_class
-        ubq._script = self._script.copy()
-        ubq.query._proxied = self.query._proxied
-        return ubq
-
     def response_class(self, cls: Any) -> Any:
         """
         Override the default wrapper used for the response.
@@ -27,7 +27,9 @@
 
 import collections.abc as collections_abc
 from copy import copy
-from typing import Any, Callable, Dict, Optional, Tuple
+from functools import lru_cache
+from itertools import count
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
 
 from opensearchpy.exceptions import UnknownDslObject, ValidationException
 
@@ -114,6 +116,64 @@ class AttrList:
         self._l_, self._obj_wrapper = state
 
 
+_UNWRAPPED = object()
+
+
+class LazyAttrList(AttrList):
+    """
+    :class:`AttrList` whose items are passed to ``obj_wrapper`` the first
+    time they are accessed, instead of when the list is created or every
+    time they are accessed. Used for the hits of a search response so only
+    the hits that are read are turned into objects.
+    """
+
+    def __init__(self, p: Any, obj_wrapper: Callable[..., Any]) -> None:
+        if not isinstance(p, list):
+            p = list(p)
+        self._raw = p
+        self._items = [_UNWRAPPED] * len(p)
+        self._obj_wrapper = obj_wrapper
+
+    @property
+    def _l_(self) -> Any:
+        # wrap the remaining items when the whole list is needed
+        for i in range(len(self._items)):
+            self._item(i)
+        return self._items
+
+    @_l_.setter
+    def _l_(self, value: Any) -> None:
+        self._raw = self._items = value
+
+    def _item(self, i: Any) -> Any:
+        item = self._items[i]
+        if item is _UNWRAPPED:
+            item = self._items[i] = self._obj_wrapper(self._raw[i])  # type: ignore
+        return item
+
+    def __getitem__(self, k: Any) -> Any:
+        if isinstance(k, slice):
+            return AttrList([self._item(i) for i in range(*k.indices(len(self)))])
+        return self._item(k)
+
+    def __setitem__(self, k: Any, value: Any) -> None:
+        if isinstance(k, slice):
+            self._l_[k] = value
+        else:
+            self._items[k] = value
+
+    def __iter__(self) -> Any:
+        return (self._item(i) for i in range(len(self._items)))
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __nonzero__(self) -> bool:
+        return bool(self._items)
+
+    __bool__ = __nonzero__
+
+
 class AttrDict:
     """
     Helper class to provide attribute like access (read and write) to
@@ -121,6 +181,9 @@ class AttrDict:
     nested dsl dicts.
     """
 
+    # subclasses without __slots__ get a __dict__ for their own attributes
+    __slots__ = ("_d_",)
+
     def __init__(self, d: Any) -> None:
         # assign the inner dict manually to prevent __setattr__ from firing
         super().__setattr__("_d_", d)
@@ -409,6 +472,8 @@ class DslBase(metaclass=DslMeta):
 
 
 class HitMeta(AttrDict):
+    __slots__ = ()
+
     def __init__(
         self, document: Dict[str, Any], exclude: Any = ("_source", "_fields")
     ) -> None:
@@ -553,6 +618,85 @@ class ObjectBase(AttrDict):
         self.clean()
 
 
+class CopyOnWrite:
+    """
+    Descriptor for a container attribute (``dict``, ``list``...) that a
+    clone created with :func:`shallow_clone` shares with the object it was
+    cloned from. Each of them copies the container the first time it
+    accesses it afterwards, so cloning only costs as much as the attributes
+    that are then actually used, instead of copying all of them every time.
+
+    :arg copier: function copying the container, defaults to ``copy.copy``
+    """
+
+    # every descriptor flags its attribute as shared with its own bit of the
+    # ``_shared`` int of the instance, an int is much smaller than a set
+    _bits = count()
+
+    def __init__(self, copier: Callable[[Any], Any] = copy) -> None:
+        self.copier = copier
+        self.bit = 1 << next(self._bits)
+        self.name = ""
+
+    def __set_name__(self, owner: Any, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: Any = None) -> Any:
+        if instance is None:
+            return self
+        d = instance.__dict__
+        try:
+            value = d[self.name]
+        except KeyError:
+            raise AttributeError(
+                f"{instance.__class__.__name__!r} object has no attribute {self.name!r}"
+            ) from None
+        shared = d.get("_shared", 0)
+        if shared & self.bit:
+            d["_shared"] = shared & ~self.bit
+            value = d[self.name] = self.copier(value)
+        return value
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        d = instance.__dict__
+        d[self.name] = value
+        shared = d.get("_shared", 0)
+        if shared & self.bit:
+            d["_shared"] = shared & ~self.bit
+
+
+@lru_cache(maxsize=None)
+def _copy_on_write(cls: Any) -> Tuple[int, FrozenSet[str]]:
+    bits = 0
+    names = set()
+    for klass in cls.__mro__:
+        for name, value in vars(klass).items():
+            if isinstance(value, CopyOnWrite):
+                bits |= value.bit
+                names.add(name)
+    return bits, frozenset(names)
+
+
+def shallow_clone(obj: Any) -> Any:
+    """
+    Return a copy of ``obj`` sharing its attributes, created without calling
+    ``__init__``. Attributes declared as :class:`CopyOnWrite` are copied by
+    the clone or by ``obj`` once either of them accesses them, the other
+    ``list``, ``dict`` and ``set`` attributes are copied right away.
+    """
+    cls = obj.__class__
+    clone = cls.__new__(cls)
+    d = clone.__dict__
+    d.update(obj.__dict__)
+    bits, names = _copy_on_write(cls)
+    for name, value in d.items():
+        if isinstance(value, (list, dict, set)) and name not in names:
+            d[name] = copy(value)
+    if bits:
+        obj.__dict__["_shared"] = d["_shared"] = bits
+    return clone
+
+
 def merge(data: Any, new_data: Any, raise_on_conflict: bool = False) -> None:
     if not (
         isinstance(data, (AttrDict, collections_abc.Mapping))
@@ -0,0 +1,297 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+"""
+Shard aware routing: computes the shard a document lives on the same way
+OpenSearch does and maps it to a node holding a copy of the shard, so that
+single document requests can skip the hop from the coordinating node.
+"""
+
+import random
+import threading
+import time
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from urllib.parse import unquote
+
+_MASK = 0xFFFFFFFF
+
+# single document endpoints, /{index}/{endpoint}/{id}
+_DOCUMENT_ENDPOINTS = ("_doc", "_create", "_update", "_source")
+
+
+def murmur3_hash(routing: str) -> int:
+    """
+    32 bit murmur3 hash (x86 variant, seed 0) of the UTF-16 code units of
+    ``routing``, returned as a signed integer, as computed by OpenSearch's
+    ``Murmur3HashFunction``.
+
+    :arg routing: routing value or document id
+    """
+    data = routing.encode("utf-16-le", "surrogatepass")
+    h = 0
+    end = len(data) & ~3
+    for i in range(0, end, 4):
+        k = int.from_bytes(data[i : i + 4], "little")
+        k = (k * 0xCC9E2D51) & _MASK
+        k = ((k << 15) | (k >> 17)) & _MASK
+        h ^= (k * 0x1B873593) & _MASK
+        h = ((h << 13) | (h >> 19)) & _MASK
+        h = (h * 5 + 0xE6546B64) & _MASK
+    if end < len(data):
+        k = int.from_bytes(data[end:], "little")
+        k = (k * 0xCC9E2D51) & _MASK
+        k = ((k << 15) | (k >> 17)) & _MASK
+        h ^= (k * 0x1B873593) & _MASK
+    h ^= len(data)
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & _MASK
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & _MASK
+    h ^= h >> 16
+    return h - (1 << 32) if h & 0x80000000 else h
+
+
+def default_routing_num_shards(
+    number_of_shards: int, routing_partition_size: int = 1
+) -> int:
+    """
+    Number of routing shards OpenSearch picks for an index that doesn't set
+    ``index.number_of_routing_shards``: the largest ``number_of_shards *
+    2 ** n`` up to 1024, splitting at least once. Partitioned indices can't
+    be split and use ``number_of_shards``.
+
+    :arg number_of_shards: number of primary shards of the index
+    :arg routing_partition_size: ``index.routing_partition_size`` of the index
+    """
+    if routing_partition_size > 1:
+        return number_of_shards
+    splits = max(1, 10 - (number_of_shards - 1).bit_length())
+    return number_of_shards << splits
+
+
+def shard_id(
+    number_of_shards: int,
+    doc_id: Optional[str] = None,
+    routing: Optional[str] = None,
+    routing_num_shards: Optional[int] = None,
+    routing_partition_size: int = 1,
+) -> int:
+    """
+    Shard of an index a document is stored on.
+
+    :arg number_of_shards: number of primary shards of the index
+    :arg doc_id: id of the document, used when no ``routing`` is given
+    :arg routing: custom routing value of the document
+    :arg routing_num_shards: ``routing_num_shards`` of the index metadata,
+        defaults to the value OpenSearch picks when creating the index
+    :arg routing_partition_size: ``index.routing_partition_size`` of the index
+    """
+    if routing_num_shards is None:
+        routing_num_shards = default_routing_num_shards(
+            number_of_shards, routing_partition_size
+        )
+    effective_routing = routing if routing is not None else doc_id
+    if effective_routing is None:
+        raise ValueError("shard_id needs a document id or a routing value")
+
+    offset = 0
+    if routing_partition_size > 1:
+        if doc_id is None:
+            raise ValueError("A partitioned index needs the document id")
+        offset = murmur3_hash(doc_id) % routing_partition_size
+    # Java int addition, wraps around
+    value = (murmur3_hash(effective_routing) + offset) & _MASK
+    if value & 0x80000000:
+        value -= 1 << 32
+    return (value % routing_num_shards) // (routing_num_shards // number_of_shards)
+
+
+class _IndexRouting:
+    __slots__ = ("number_of_shards", "routing_num_shards", "partition_size", "copies")
+
+    def __init__(
+        self,
+        number_of_shards: int,
+        routing_num_shards: int,
+        partition_size: int,
+        copies: Dict[int, List[Tuple[str, bool]]],
+    ) -> None:
+        self.number_of_shards = number_of_shards
+        self.routing_num_shards = routing_num_shards
+        self.partition_size = partition_size
+        # shard number -> (node id, primary) of the started copies
+        self.copies = copies
+
+
+class ShardRouter:
+    """
+    Cache of the shard allocation of a cluster, used by
+    :class:`~opensearchpy.Transport` with ``routing_aware=True`` to send
+    single document requests (get, index, create, update, delete, source),
+    mget requests whose documents all live on one node and bulk requests
+    with a ``routing`` parameter straight to a node holding the shard: the
+    primary for writes, any started copy for reads.
+
+    The cache is built from ``GET /_cluster/state/metadata,routing_table``
+    and from the nodes' HTTP addresses, and is refreshed on every sniff and
+    whenever it is older than ``max_age`` seconds. Nodes are matched to the
+    connections of the pool by their host, so shard aware routing needs
+    sniffing or hosts configured as the nodes publish them. Requests that
+    can't be routed, e.g. to an alias or an index created since the last
+    refresh, use the regular connection selection.
+    """
+
+    #: seconds after which the cached shard allocation is refreshed
+    max_age: float = 60.0
+
+    #: query parameters of the cluster state request
+    CLUSTER_STATE_PARAMS: Dict[str, str] = {
+        "filter_path": ",".join(
+            (
+                "metadata.indices.*.settings.index.number_of_shards",
+                "metadata.indices.*.settings.index.routing_partition_size",
+                "metadata.indices.*.routing_num_shards",
+                "routing_table.indices.*.shards.*.node",
+                "routing_table.indices.*.shards.*.primary",
+                "routing_table.indices.*.shards.*.state",
+            )
+        )
+    }
+
+    def __init__(self) -> None:
+        self.indices: Dict[str, _IndexRouting] = {}
+        self.nodes: Dict[str, Any] = {}
+        self.updated: Optional[float] = None
+        self.lock = threading.Lock()
+
+    @property
+    def stale(self) -> bool:
+        return self.updated is None or time.time() - self.updated > self.max_age
+
+    def update(self, cluster_state: Mapping[str, Any], nodes: Dict[str, Any]) -> None:
+        """
+        Replace the cached shard allocation.
+
+        :arg cluster_state: response of ``GET /_cluster/state/metadata,routing_table``
+        :arg nodes: node id -> host dictionary of the node's connection, as
+            used in the ``hosts`` of the transport
+        """
+        metadata = cluster_state.get("metadata", {}).get("indices", {})
+        routing_table = cluster_state.get("routing_table", {}).get("indices", {})
+        indices = {}
+        for name, index in metadata.items():
+            settings = index.get("settings", {}).get("index", {})
+            try:
+                number_of_shards = int(settings["number_of_shards"])
+            except (KeyError, ValueError):
+                continue
+            copies: Dict[int, List[Tuple[str, bool]]] = {}
+            for shard, shard_copies in (
+                routing_table.get(name, {}).get("shards", {}).items()
+            ):
+                copies[int(shard)] = [
+                    (copy["node"], copy.get("primary", False))
+                    for copy in shard_copies
+                    if copy.get("state") == "STARTED" and copy.get("node")
+                ]
+            partition_size = int(settings.get("routing_partition_size", 1))
+            indices[name] = _IndexRouting(
+                number_of_shards,
+                int(
+                    index.get("routing_num_shards")
+                    or default_routing_num_shards(number_of_shards, partition_size)
+                ),
+                partition_size,
+                copies,
+            )
+        self.indices = indices
+        self.nodes = nodes
+        self.updated = time.time()
+
+    def hosts(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        body: Any,
+    ) -> List[Any]:
+        """
+        Hosts of the nodes the request can be sent to directly, best first,
+        empty if the request isn't routable.
+
+        :arg method: HTTP method of the request
+        :arg url: path of the request
+        :arg params: query parameters of the request
+        :arg body: body of the request, before serialization
+        """
+        if not self.indices:
+            return []
+        parts = url.strip("/").split("/")
+        routing = params.get("routing") if params else None
+
+        if len(parts) == 3 and parts[1] in _DOCUMENT_ENDPOINTS:
+            index, doc_id = unquote(parts[0]), unquote(parts[2])
+            return self._shard_hosts(
+                index, doc_id, routing, method not in ("GET", "HEAD")
+            )
+
+        if parts[-1] == "_bulk" and len(parts) == 2 and routing is not None:
+            return self._shard_hosts(unquote(parts[0]), None, routing, True)
+
+        if parts[-1] == "_mget" and len(parts) <= 2 and isinstance(body, Mapping):
+            default_index = unquote(parts[0]) if len(parts) == 2 else None
+            return self._mget_hosts(default_index, routing, body)
+
+        return []
+
+    def _mget_hosts(
+        self, default_index: Optional[str], routing: Any, body: Mapping[str, Any]
+    ) -> List[Any]:
+        if "ids" in body:
+            docs = [{"_id": doc_id} for doc_id in body["ids"]]
+        else:
+            docs = body.get("docs", [])
+        hosts: Optional[List[Any]] = None
+        for doc in docs:
+            if not isinstance(doc, Mapping):
+                return []
+            doc_hosts = self._shard_hosts(
+                doc.get("_index", default_index),
+                doc.get("_id"),
+                doc.get("routing", routing),
+                False,
+            )
+            # only route when every document lives on the same node
+            hosts = doc_hosts if hosts is None else [h for h in hosts if h in doc_hosts]
+            if not hosts:
+                return []
+        return hosts or []
+
+    def _shard_hosts(
+        self, index: Optional[str], doc_id: Any, routing: Any, write: bool
+    ) -> List[Any]:
+        index_routing = self.indices.get(index) if index else None
+        if index_routing is None or (doc_id is None and routing is None):
+            return []
+        if doc_id is None and index_routing.partition_size > 1:
+            return []
+        shard = shard_id(
+            index_routing.number_of_shards,
+            None if doc_id is None else str(doc_id),
+            None if routing is None else str(routing),
+            index_routing.routing_num_shards,
+            index_routing.partition_size,
+        )
+        copies = index_routing.copies.get(shard, [])
+        if write:
+            copies = [copy for copy in copies if copy[1]]
+        else:
+            # spread reads over the copies of the shard
+            copies = random.sample(copies, len(copies))
+        return [self.nodes[node] for node, _ in copies if node in self.nodes]
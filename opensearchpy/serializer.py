@@ -25,7 +25,9 @@
 #  under the License.
 
 
-from typing import Any, Dict, Optional
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
 
 try:
     import simplejson as json
@@ -45,6 +47,26 @@ FLOAT_TYPES = (Decimal,)
 TIME_TYPES = (date, datetime)
 
 
+@lru_cache(maxsize=None)
+def _numpy_types(np: Any) -> Tuple[Any, Any]:
+    """The numpy integer and float scalar types."""
+    return (
+        (
+            np.int_,
+            np.intc,
+            np.int8,
+            np.int16,
+            np.int32,
+            np.int64,
+            np.uint8,
+            np.uint16,
+            np.uint32,
+            np.uint64,
+        ),
+        (np.float16, np.float32, np.float64),
+    )
+
+
 class Serializer:
     mimetype: str = ""
 
@@ -58,7 +80,9 @@ class Serializer:
 class TextSerializer(Serializer):
     mimetype: str = "text/plain"
 
-    def loads(self, s: str) -> Any:
+    def loads(self, s: Any) -> Any:
+        if isinstance(s, (bytes, bytearray, memoryview)):
+            return bytes(s).decode("utf-8", "surrogatepass")
         return s
 
     def dumps(self, data: Any) -> Any:
@@ -87,35 +111,15 @@ class JSONSerializer(Serializer):
         elif INTEGER_TYPES and isinstance(data, INTEGER_TYPES):
             return int(data)
 
-        # Special cases for numpy and pandas types
-        # These are expensive to import so we try them last.
-        try:
-            import numpy as np
-
-            if isinstance(
-                data,
-                (
-                    np.int_,
-                    np.intc,
-                    np.int8,
-                    np.int16,
-                    np.int32,
-                    np.int64,
-                    np.uint8,
-                    np.uint16,
-                    np.uint32,
-                    np.uint64,
-                ),
-            ):
+        # Special cases for numpy and pandas types. A value can only be one of
+        # them once the module was imported, so it's looked up rather than
+        # imported, which is expensive, on every call.
+        np = sys.modules.get("numpy")
+        if np is not None:
+            integer_types, float_types = _numpy_types(np)
+            if isinstance(data, integer_types):
                 return int(data)
-            elif isinstance(
-                data,
-                (
-                    np.float16,
-                    np.float32,
-                    np.float64,
-                ),
-            ):
+            elif isinstance(data, float_types):
                 return float(data)
             elif isinstance(data, np.bool_):
                 return bool(data)
@@ -123,12 +127,9 @@ class JSONSerializer(Serializer):
                 return data.item().isoformat()
             elif isinstance(data, np.ndarray):
                 return data.tolist()
-        except ImportError:
-            pass
-
-        try:
-            import pandas as pd
 
+        pd = sys.modules.get("pandas")
+        if pd is not None:
             if isinstance(data, (pd.Series, pd.Categorical)):
                 return data.tolist()
             elif isinstance(data, pd.Timestamp) and data is not getattr(
@@ -137,12 +138,12 @@ class JSONSerializer(Serializer):
                 return data.isoformat()
             elif data is getattr(pd, "NA", None):
                 return None
-        except ImportError:
-            pass
 
         raise TypeError(f"Unable to serialize {data!r} (type: {type(data)})")
 
-    def loads(self, s: str) -> Any:
+    def loads(self, s: Any) -> Any:
+        if isinstance(s, (bytearray, memoryview)):
+            s = bytes(s)
         try:
             return json.loads(s)
         except (ValueError, TypeError) as e:
@@ -161,6 +162,147 @@ class JSONSerializer(Serializer):
             raise SerializationError(data, e)
 
 
+def _json_dumps_backend(default: Callable[[Any], Any]) -> Callable[[Any], bytes]:
+    def dumps(data: Any) -> bytes:
+        return json.dumps(
+            data, default=default, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8", "surrogatepass")
+
+    return dumps
+
+
+def _orjson_backend(
+    default: Callable[[Any], Any],
+) -> Tuple[Callable[[Any], bytes], Callable[[Any], Any]]:
+    import orjson
+
+    # datetimes are passed through to ``default`` so they are formatted exactly
+    # like the stdlib backend does (including the pandas ``NaT`` check).
+    option = (
+        orjson.OPT_SERIALIZE_NUMPY
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+    )
+
+    def dumps(data: Any) -> bytes:
+        return orjson.dumps(data, default=default, option=option)
+
+    return dumps, orjson.loads
+
+
+def _ujson_backend(
+    default: Callable[[Any], Any],
+) -> Tuple[Callable[[Any], bytes], Callable[[Any], Any]]:
+    import ujson
+
+    def dumps(data: Any) -> bytes:
+        text: str = ujson.dumps(
+            data, default=default, ensure_ascii=False, escape_forward_slashes=False
+        )
+        return text.encode("utf-8", "surrogatepass")
+
+    return dumps, ujson.loads
+
+
+def _msgspec_backend(
+    default: Callable[[Any], Any],
+) -> Tuple[Callable[[Any], bytes], Callable[[Any], Any]]:
+    import msgspec
+
+    try:
+        encoder = msgspec.json.Encoder(enc_hook=default, decimal_format="number")
+    except TypeError:
+        # msgspec < 0.16 has no ``decimal_format`` and always uses strings
+        encoder = msgspec.json.Encoder(enc_hook=default)
+
+    return encoder.encode, msgspec.json.decode
+
+
+def _stdlib_backend(
+    default: Callable[[Any], Any],
+) -> Tuple[Callable[[Any], bytes], Callable[[Any], Any]]:
+    return _json_dumps_backend(default), json.loads
+
+
+JSON_BACKENDS: Dict[str, Callable[..., Tuple[Callable[[Any], bytes], Any]]] = {
+    "orjson": _orjson_backend,
+    "ujson": _ujson_backend,
+    "msgspec": _msgspec_backend,
+    "json": _stdlib_backend,
+}
+
+
+class FastJSONSerializer(JSONSerializer):
+    """
+    JSON serializer that delegates to the fastest JSON library available and
+    returns UTF-8 encoded ``bytes`` from :meth:`dumps`, which the transport
+    sends as-is instead of encoding the body a second time. :meth:`loads`
+    accepts both ``str`` and ``bytes``.
+
+    Values the selected library can't handle natively go through
+    :meth:`JSONSerializer.default`, so ``datetime``, ``Decimal``, ``UUID``,
+    numpy and pandas values are supported just like with
+    :class:`JSONSerializer`. If the library rejects a document (for example
+    integers wider than 64 bits with ``orjson``) it is serialized again with
+    the standard library before giving up. Note that ``orjson`` and
+    ``msgspec`` write ``NaN`` and infinities as ``null``.
+
+    :arg backend: ``"orjson"``, ``"ujson"``, ``"msgspec"``, ``"json"`` (the
+        standard library, or ``simplejson`` if installed) or ``"auto"``
+        (default) to pick the first installed library in that order.
+    """
+
+    def __init__(self, backend: str = "auto") -> None:
+        if backend == "auto":
+            candidates = list(JSON_BACKENDS)
+        elif backend in JSON_BACKENDS:
+            candidates = [backend]
+        else:
+            raise ImproperlyConfigured(
+                f"Unknown JSON backend {backend!r}, expected one of: "
+                f"{', '.join(['auto'] + list(JSON_BACKENDS))}"
+            )
+
+        for name in candidates:
+            try:
+                self._dumps, self._loads = JSON_BACKENDS[name](self.default)
+            except ImportError:
+                continue
+            self.backend = name
+            break
+        else:
+            raise ImproperlyConfigured(
+                f"JSON backend {backend!r} requested but {backend} is not installed"
+            )
+        self._fallback_dumps = _json_dumps_backend(self.default)
+
+    def __reduce__(self) -> Any:
+        # the backend functions are closures, rebuild them on unpickling
+        return self.__class__, (self.backend,)
+
+    def loads(self, s: Any) -> Any:
+        try:
+            return self._loads(s)
+        except (ValueError, TypeError):
+            # e.g. lone surrogates that only the stdlib parser accepts
+            return super().loads(s)
+
+    def dumps(self, data: Any) -> Any:
+        # don't serialize strings
+        if isinstance(data, string_types):
+            return data
+
+        try:
+            return self._dumps(data)
+        except (ValueError, TypeError, OverflowError):
+            pass
+
+        try:
+            return self._fallback_dumps(data)
+        except (ValueError, TypeError) as e:
+            raise SerializationError(data, e)
+
+
 DEFAULT_SERIALIZERS: Dict[str, Serializer] = {
     JSONSerializer.mimetype: JSONSerializer(),
     TextSerializer.mimetype: TextSerializer(),
@@ -181,7 +323,11 @@ class Deserializer:
             )
         self.serializers = serializers
 
-    def loads(self, s: str, mimetype: Optional[str] = None) -> Any:
+    def loads(self, s: Any, mimetype: Optional[str] = None) -> Any:
+        """
+        Deserialize a response body, ``s`` can be ``str`` or the raw ``bytes``
+        returned by connections created with ``response_as_bytes=True``.
+        """
         if not mimetype:
             deserializer = self.default
         else:
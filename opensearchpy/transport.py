@@ -25,21 +25,53 @@
 #  under the License.
 
 
+import logging
+import threading
 import time
-from itertools import chain
-from typing import Any, Callable, Collection, Dict, List, Mapping, Optional, Type, Union
+import weakref
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Type,
+    Union,
+)
 
 from opensearchpy.metrics import Metrics, MetricsNone
 
+from .compat import is_stream
 from .connection import Connection, Urllib3HttpConnection
 from .connection_pool import ConnectionPool, DummyConnectionPool, EmptyConnectionPool
 from .exceptions import (
     ConnectionError,
     ConnectionTimeout,
+    ImproperlyConfigured,
     SerializationError,
     TransportError,
 )
-from .serializer import DEFAULT_SERIALIZERS, Deserializer, JSONSerializer, Serializer
+from .routing import ShardRouter
+from .serializer import (
+    DEFAULT_SERIALIZERS,
+    Deserializer,
+    FastJSONSerializer,
+    JSONSerializer,
+    Serializer,
+)
+
+logger: logging.Logger = logging.getLogger("opensearch")
 
 
 def get_host_info(
@@ -64,6 +96,201 @@ def get_host_info(
     return host
 
 
+# endpoints that only read and can safely be sent to two nodes at once
+HEDGED_ENDPOINTS = ("_search", "_msearch", "_search/template", "_msearch/template")
+
+
+def _is_hedgeable(method: str, url: str, params: Any) -> bool:
+    """
+    Whether the request is an idempotent read that may be hedged. Scrolls
+    are excluded, a duplicate would open or advance a second scroll context.
+    """
+    if params and "scroll" in params:
+        return False
+    if "/_search/scroll" in url:
+        return False
+    if method in ("GET", "HEAD"):
+        return True
+    return method == "POST" and url.rstrip("/").endswith(
+        tuple("/" + endpoint for endpoint in HEDGED_ENDPOINTS)
+    )
+
+
+def _stream_position(body: Any) -> Optional[int]:
+    """
+    The position a streamed request body is rewound to before it is sent
+    again, ``None`` if it can't be rewound (iterators, pipes, sockets).
+    """
+    try:
+        if body.seekable():
+            return body.tell()  # type: ignore
+    except (AttributeError, OSError, ValueError):
+        pass
+    return None
+
+
+class _Hedger:
+    """
+    Delay after which a duplicate of a slow read is sent to another node and
+    counters of the duplicates sent and of those that answered first.
+    ``hedge_after="p95"`` learns the delay as the 95th percentile of the
+    latency of recent reads.
+    """
+
+    # number of recent latencies the percentile is computed from
+    window = 1000
+    # latencies recorded before the learned delay is used
+    min_samples = 100
+
+    def __init__(self, hedge_after: Union[float, str]) -> None:
+        self.learn = hedge_after == "p95"
+        if self.learn:
+            self.delay: Optional[float] = None
+        elif isinstance(hedge_after, str):
+            raise ImproperlyConfigured(
+                f"hedge_after must be a number of seconds or 'p95', got {hedge_after!r}"
+            )
+        elif hedge_after < 0:
+            raise ImproperlyConfigured("hedge_after must not be negative")
+        else:
+            self.delay = float(hedge_after)
+        self.latencies: Deque[float] = deque(maxlen=self.window)
+        self.recorded = 0
+        self.fired = 0
+        self.won = 0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        if not self.learn:
+            return
+        with self._lock:
+            self.latencies.append(latency)
+            self.recorded += 1
+            # sorting the window is cheap but not free, refresh it periodically
+            if len(self.latencies) >= self.min_samples and self.recorded % 50 == 0:
+                latencies = sorted(self.latencies)
+                self.delay = latencies[int(len(latencies) * 0.95)]
+
+    def hedge_fired(self) -> None:
+        with self._lock:
+            self.fired += 1
+
+    def hedge_won(self) -> None:
+        with self._lock:
+            self.won += 1
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"fired": self.fired, "won": self.won, "delay": self.delay}
+
+
+class RetryBudget:
+    """
+    Token bucket limiting retries to a share of the successful traffic, so
+    that during a partial outage clients don't multiply the load on the
+    nodes that are still up by retrying every failed request.
+
+    Every successful request deposits ``ratio`` tokens and every retry
+    withdraws one. On top of that ``min_per_second`` tokens are added every
+    second so that clients with little traffic can still retry. At most
+    ``max_tokens`` retries can be saved up. A request that fails once the
+    bucket is empty raises its error instead of being retried::
+
+        client = OpenSearch(hosts, retry_budget=RetryBudget(ratio=0.2))
+
+    :arg ratio: retries allowed per successful request (default: 0.1)
+    :arg min_per_second: retries allowed per second regardless of the
+        traffic (default: 1)
+    :arg max_tokens: maximum number of retries that can be saved up, the
+        bucket starts full (default: 10)
+    """
+
+    def __init__(
+        self, ratio: float = 0.1, min_per_second: float = 1.0, max_tokens: int = 10
+    ) -> None:
+        if ratio < 0 or min_per_second < 0:
+            raise ImproperlyConfigured(
+                "ratio and min_per_second of a RetryBudget must not be negative"
+            )
+        if max_tokens < 1:
+            raise ImproperlyConfigured("max_tokens of a RetryBudget must be at least 1")
+        self.ratio = ratio
+        self.min_per_second = min_per_second
+        self.max_tokens = max_tokens
+        self.tokens = float(max_tokens)
+        self.retries = 0
+        self.rejected = 0
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """
+        Record a successful request.
+        """
+        with self._lock:
+            self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Take a token for a retry, returns ``False`` if the budget is spent.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.tokens = min(
+                self.max_tokens,
+                self.tokens + (now - self.updated) * self.min_per_second,
+            )
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                self.retries += 1
+                return True
+            self.rejected += 1
+            return False
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """
+        Tokens left and the number of retries allowed and rejected so far.
+        """
+        with self._lock:
+            return {
+                "tokens": self.tokens,
+                "retries": self.retries,
+                "rejected": self.rejected,
+            }
+
+
+def _sniff_in_background(
+    transport_ref: "weakref.ReferenceType[Transport]", requested: threading.Event
+) -> None:
+    """
+    Body of the background sniffer thread, sniffs every ``sniffer_timeout``
+    seconds or when asked to by :meth:`Transport.mark_dead`. The connection
+    pool is replaced in one assignment, request threads keep using the
+    previous one until then. Returns once the transport was closed or
+    garbage collected.
+    """
+    while True:
+        transport = transport_ref()
+        if transport is None or transport._sniffer_stopped:
+            return
+        timeout = transport.sniffer_timeout
+        # don't keep the transport alive while waiting
+        del transport
+        requested.wait(timeout)
+        requested.clear()
+        transport = transport_ref()
+        if transport is None or transport._sniffer_stopped:
+            return
+        try:
+            transport.sniff_hosts()
+        except Exception:
+            logger.warning("Sniffing in the background failed", exc_info=True)
+        del transport
+
+
 class Transport:
     """
     Encapsulation of transport-related to logic. Handles instantiation of the
@@ -73,6 +300,11 @@ class Transport:
     """
 
     DEFAULT_CONNECTION_CLASS: Type[Connection] = Urllib3HttpConnection
+    #: number of nodes asked for the cluster's nodes at the same time when sniffing
+    SNIFF_CONCURRENCY: int = 4
+    #: number of threads sending the attempts of hedged reads, shared by all
+    #: the threads using the transport
+    HEDGE_WORKERS: int = 64
 
     connection_pool: Any
     deserializer: Deserializer
@@ -107,7 +339,7 @@ class Transport:
         sniffer_timeout: Optional[float] = None,
         sniff_timeout: float = 0.1,
         sniff_on_connection_fail: bool = False,
-        serializer: Serializer = JSONSerializer(),
+        serializer: Optional[Serializer] = None,
         serializers: Optional[Mapping[str, Serializer]] = None,
         default_mimetype: str = "application/json",
         max_retries: int = 3,
@@ -116,7 +348,12 @@ class Transport:
         retry_on_timeout: bool = False,
         send_get_body_as: str = "GET",
         metrics: Metrics = MetricsNone(),
-        **kwargs: Any
+        json_backend: Optional[str] = None,
+        hedge_after: Optional[Union[float, str]] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        sniff_in_background: bool = False,
+        routing_aware: bool = False,
+        **kwargs: Any,
     ) -> None:
         """
         :arg hosts: list of dictionaries, each containing keyword arguments to
@@ -135,11 +372,19 @@ class Transport:
             to fail quickly. Not used during initial sniffing (if
             ``sniff_on_start`` is on) when the connection still isn't
             initialized.
+        :arg sniff_in_background: sniff every ``sniffer_timeout`` seconds and
+            on connection failures (with ``sniff_on_connection_fail``) in a
+            background thread instead of in the request thread that notices it
+            is time to sniff. Stopped by :meth:`close`.
         :arg serializer: serializer instance
         :arg serializers: optional dict of serializer instances that will be
             used for deserializing data coming from the server. (key is the mimetype)
         :arg default_mimetype: when no mimetype is specified by the server
             response assume this mimetype, defaults to `'application/json'`
+        :arg json_backend: use a :class:`~opensearchpy.FastJSONSerializer`
+            backed by this JSON library (``'auto'``, ``'orjson'``,
+            ``'ujson'``, ``'msgspec'`` or ``'json'``) instead of the default
+            serializer. Can't be combined with ``serializer``.
         :arg max_retries: maximum number of retries before an exception is propagated
         :arg retry_on_status: set of HTTP status codes on which we should retry
             on a different node. defaults to ``(502, 503, 504)``
@@ -155,6 +400,21 @@ class Transport:
         :arg metrics: metrics is an instance of a subclass of the
             :class:`~opensearchpy.Metrics` class, used for collecting
             and reporting metrics related to the client's operations;
+        :arg hedge_after: hedge reads (``GET``, ``HEAD``, search and msearch
+            requests) that haven't completed after this many seconds by
+            sending a duplicate to another node and using whichever answers
+            first, ``'p95'`` to learn the delay as the 95th percentile of
+            recent read latencies. Duplicates count against ``max_retries``.
+            Disabled by default, see :attr:`hedge_stats`.
+        :arg retry_budget: :class:`~opensearchpy.RetryBudget` limiting
+            retries (and hedged requests) to a share of the successful
+            requests, unlimited by default. Pass
+            ``connection_pool_class=CircuitBreakerConnectionPool`` to also
+            keep failing nodes out of rotation until a probe succeeds.
+        :arg routing_aware: send single document requests straight to a node
+            holding the document's shard, see :class:`~opensearchpy.ShardRouter`.
+            The shard allocation is refreshed on every sniff and at least
+            every minute. Disabled by default.
 
         Any extra keyword arguments will be passed to the `connection_class`
         when creating and instance unless overridden by that connection's
@@ -165,6 +425,15 @@ class Transport:
             connection_class = self.DEFAULT_CONNECTION_CLASS
 
         # serialization config
+        if json_backend is not None:
+            if serializer is not None:
+                raise ImproperlyConfigured(
+                    "'json_backend' and 'serializer' can't be used together"
+                )
+            serializer = FastJSONSerializer(backend=json_backend)
+        elif serializer is None:
+            serializer = JSONSerializer()
+
         _serializers = DEFAULT_SERIALIZERS.copy()
         # if a serializer has been specified, use it for deserialization as well
         _serializers[serializer.mimetype] = serializer
@@ -179,6 +448,13 @@ class Transport:
         self.retry_on_timeout = retry_on_timeout
         self.retry_on_status = retry_on_status
         self.send_get_body_as = send_get_body_as
+        self.hedger = _Hedger(hedge_after) if hedge_after is not None else None
+        self._hedge_executor: Optional[ThreadPoolExecutor] = None
+        self._hedge_running = 0
+        self._hedge_lock = threading.Lock()
+        self.retry_budget = retry_budget
+        self.router = ShardRouter() if routing_aware else None
+        self._routing_thread: Optional[threading.Thread] = None
 
         # data serializer
         self.serializer = serializer
@@ -214,9 +490,25 @@ class Transport:
         # callback to construct host dict from data in /_cluster/nodes
         self.host_info_callback = host_info_callback
 
+        self._sniffer: Optional[threading.Thread] = None
+        self._sniff_requested = threading.Event()
+        self._sniffer_stopped = False
+
         if sniff_on_start:
             self.sniff_hosts(True)
 
+        if sniff_in_background and (sniffer_timeout or sniff_on_connection_fail):
+            # the thread only holds a weak reference to the transport and is
+            # woken up to exit once the transport is garbage collected
+            self._sniffer = threading.Thread(
+                target=_sniff_in_background,
+                args=(weakref.ref(self), self._sniff_requested),
+                name="opensearch-sniffer",
+                daemon=True,
+            )
+            weakref.finalize(self, self._sniff_requested.set)
+            self._sniffer.start()
+
     def add_connection(self, host: Any) -> None:
         """
         Create a new :class:`~opensearchpy.Connection` instance and add it to the pool.
@@ -228,7 +520,8 @@ class Transport:
 
     def set_connections(self, hosts: Any) -> None:
         """
-        Instantiate all the connections and create new connection pool to hold them.
+        Instantiate all the connections and create new connection pool to hold them,
+        or update the current pool in place if it is of ``connection_pool_class``.
         Tries to identify unchanged hosts and re-use existing
         :class:`~opensearchpy.Connection` instances.
 
@@ -253,6 +546,12 @@ class Transport:
             return self.connection_class(metrics=self.metrics, **kwargs)
 
         connections = list(zip(map(_create_connection, hosts), hosts))
+        previous_pool = self.connection_pool
+        if len(connections) > 1 and type(previous_pool) is self.connection_pool_class:
+            # keep the state of the connections that remain
+            self.connection_pool.update(connections)
+            return
+
         if len(connections) == 1:
             self.connection_pool = DummyConnectionPool(connections)
         else:
@@ -260,13 +559,28 @@ class Transport:
             self.connection_pool = self.connection_pool_class(
                 connections, **self.kwargs
             )
+        # drain the connections that didn't make it into the new pool
+        current = {c for (c, _) in connections}
+        self.connection_pool.draining = getattr(previous_pool, "draining", []) + [
+            c for (c, _) in previous_pool.connection_opts if c not in current
+        ]
+
+    def _drained_connections(self) -> Any:
+        """
+        Connections removed from the pool by sniffing that are done with
+        their requests and can be closed. Seed connections are kept open as
+        they are used for sniffing.
+        """
+        return [
+            c for c in self.connection_pool.drained() if c not in self.seed_connections
+        ]
 
     def get_connection(self) -> Any:
         """
         Retrieve a :class:`~opensearchpy.Connection` instance from the
         :class:`~opensearchpy.ConnectionPool` instance.
         """
-        if self.sniffer_timeout:
+        if self.sniffer_timeout and self._sniffer is None:
             if time.time() >= self.last_sniff + self.sniffer_timeout:
                 self.sniff_hosts()
         return self.connection_pool.get_connection()
@@ -284,34 +598,48 @@ class Transport:
         configuration management.
         """
         previous_sniff = self.last_sniff
+        # use small timeout for the sniffing request, should be a fast api call
+        timeout = self.sniff_timeout if not initial else None
+
+        def _sniff_request(connection: Connection) -> Any:
+            _, headers, node_info = connection.perform_request(
+                "GET", "/_nodes/_all/http", timeout=timeout
+            )
+            # Lowercase all the header names for consistency in accessing them.
+            headers = {header.lower(): value for header, value in headers.items()}
+            return self.deserializer.loads(node_info, headers.get("content-type"))
+
+        # go through all current connections as well as the
+        # seed_connections for good measure
+        connections = list(self.connection_pool.connections)
+        connections.extend(c for c in self.seed_connections if c not in connections)
 
         try:
             # reset last_sniff timestamp
             self.last_sniff = time.time()
-            # go through all current connections as well as the
-            # seed_connections for good measure
-            for c in chain(self.connection_pool.connections, self.seed_connections):
-                try:
-                    # use small timeout for the sniffing request, should be a fast api call
-                    _, headers, node_info = c.perform_request(
-                        "GET",
-                        "/_nodes/_all/http",
-                        timeout=self.sniff_timeout if not initial else None,
-                    )
-
-                    # Lowercase all the header names for consistency in accessing them.
-                    headers = {
-                        header.lower(): value for header, value in headers.items()
-                    }
-
-                    node_info = self.deserializer.loads(
-                        node_info, headers.get("content-type")
-                    )
-                    break
-                except (ConnectionError, SerializationError):
-                    pass
-            else:
+            if not connections:
                 raise TransportError("N/A", "Unable to sniff hosts.")
+
+            # ask a few nodes at a time, the first valid answer wins
+            executor = ThreadPoolExecutor(
+                max_workers=min(len(connections), self.SNIFF_CONCURRENCY),
+                thread_name_prefix="opensearch-sniff",
+            )
+            futures = [executor.submit(_sniff_request, c) for c in connections]
+            try:
+                for future in as_completed(futures):
+                    try:
+                        node_info = future.result()
+                        break
+                    except (ConnectionError, SerializationError):
+                        pass
+                else:
+                    raise TransportError("N/A", "Unable to sniff hosts.")
+            finally:
+                # don't ask the nodes that haven't been asked yet
+                for future in futures:
+                    future.cancel()
+                executor.shutdown(wait=False)
         except Exception:
             # keep the previous value on error
             self.last_sniff = previous_sniff
@@ -362,6 +690,88 @@ class Transport:
             )
 
         self.set_connections(hosts)
+        for connection in self._drained_connections():
+            connection.close()
+        if self.router is not None:
+            self._refresh_routing_in_background()
+
+    def refresh_routing(self) -> None:
+        """
+        Fetch the shard allocation of the cluster and the addresses of its
+        nodes for routing aware requests (``routing_aware=True``).
+        """
+        if self.router is None:
+            raise ImproperlyConfigured("refresh_routing requires routing_aware=True")
+        cluster_state = self.perform_request(
+            "GET",
+            "/_cluster/state/metadata,routing_table",
+            params=dict(ShardRouter.CLUSTER_STATE_PARAMS),
+        )
+        node_info = self.perform_request("GET", "/_nodes/_all/http")
+        self._update_routing(cluster_state, node_info)
+
+    def _try_refresh_routing(self) -> None:
+        """
+        Refresh the shard allocation unless another thread is already at it.
+        Failures are logged and retried once the shard allocation is stale
+        again, requests fall back to the regular connection selection.
+        """
+        router: Any = self.router
+        if not router.lock.acquire(blocking=False):
+            return
+        try:
+            self.refresh_routing()
+        except Exception:
+            router.updated = time.time()
+            logger.warning("Refreshing the shard allocation failed", exc_info=True)
+        finally:
+            router.lock.release()
+
+    def _refresh_routing_in_background(self) -> None:
+        """
+        Refresh the shard allocation in a background thread, the cluster
+        state of a large cluster is too big to be fetched on the request
+        path. Requests are routed with the stale shard allocation, or go
+        through the regular connection selection before the first one, in
+        the meantime.
+        """
+        router: Any = self.router
+        thread = self._routing_thread
+        if router.lock.locked() or (thread is not None and thread.is_alive()):
+            return
+        self._routing_thread = threading.Thread(
+            target=self._try_refresh_routing, name="opensearch-routing", daemon=True
+        )
+        self._routing_thread.start()
+
+    def _update_routing(self, cluster_state: Any, node_info: Any) -> None:
+        nodes = {}
+        for node_id, info in node_info.get("nodes", {}).items():
+            host = self._get_host_info(info)
+            if host:
+                nodes[node_id] = host
+        self.router.update(cluster_state, nodes)  # type: ignore
+
+    def _routed_connection(
+        self, method: str, url: str, params: Any, body: Any
+    ) -> Optional[Connection]:
+        """
+        Live connection to a node holding the shard the request targets,
+        ``None`` if the request can't be routed.
+        """
+        hosts = self.router.hosts(method, url, params, body)  # type: ignore
+        if not hosts:
+            return None
+        pool = self.connection_pool
+        by_address: Dict[Any, Connection] = {
+            (opts.get("host"), opts.get("port")): connection
+            for connection, opts in pool.connection_opts
+        }
+        for host in hosts:
+            connection = by_address.get((host.get("host"), host.get("port")))
+            if connection is not None and connection in pool.connections:
+                return connection
+        return None
 
     def mark_dead(self, connection: Connection) -> None:
         """
@@ -373,7 +783,10 @@ class Transport:
         # mark as dead even when sniffing to avoid hitting this host during the sniff process
         self.connection_pool.mark_dead(connection)
         if self.sniff_on_connection_fail:
-            self.sniff_hosts()
+            if self._sniffer is not None:
+                self._sniff_requested.set()
+            else:
+                self.sniff_hosts()
 
     def perform_request(
         self,
@@ -384,6 +797,7 @@ class Transport:
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         """
         Perform the actual request. Retrieve a connection from the connection
@@ -403,46 +817,63 @@ class Transport:
         :arg params: dictionary of query parameters, will be handed over to the
             underlying :class:`~opensearchpy.Connection` class for serialization
         :arg body: body of the request, will be serialized using serializer and
-            passed to the connection
+            passed to the connection. File-like objects and iterators of
+            ``bytes`` or ``str`` chunks are streamed as they are, a stream
+            that can't be rewound isn't retried.
         :arg timeout: timeout of the request. If it is not presented as argument
             will be extracted from `params`
+        :arg stream: return the body of a successful response as an iterator
+            of ``bytes`` chunks read from the connection as they are consumed
+            instead of deserializing it, the connection is released once the
+            iterator is exhausted or closed
         """
+        routed = None
+        if self.router is not None:
+            if self.router.stale:
+                self._refresh_routing_in_background()
+            routed = self._routed_connection(method, url, params, body)
+        streamed_body = is_stream(body)
+        hedge = (
+            self.hedger is not None
+            and not streamed_body
+            and not stream
+            and _is_hedgeable(method, url, params)
+        )
         method, params, body, ignore, timeout = self._resolve_request_args(
             method, params, body, ignore, timeout
         )
+        if hedge:
+            return self._perform_hedged_request(
+                method, url, params, body, timeout, ignore, headers, routed
+            )
+        position = _stream_position(body) if streamed_body else None
 
         for attempt in range(self.max_retries + 1):
-            connection = self.get_connection()
+            if attempt and position is not None:
+                body.seek(position)
+            # retries go through the regular selection, the routed node may be down
+            if attempt == 0 and routed is not None:
+                connection = routed
+            else:
+                connection = self.get_connection()
 
             try:
-                status, headers_response, data = connection.perform_request(
+                status, headers_response, data = self._perform_attempt(
+                    connection,
                     method,
                     url,
                     params,
                     body,
-                    headers=headers,
-                    ignore=ignore,
-                    timeout=timeout,
+                    timeout,
+                    ignore,
+                    headers,
+                    stream,
                 )
-
-                # Lowercase all the header names for consistency in accessing them.
-                headers_response = {
-                    header.lower(): value for header, value in headers_response.items()
-                }
-
             except TransportError as e:
                 if method == "HEAD" and e.status_code == 404:
                     return False
 
-                retry = False
-                if isinstance(e, ConnectionTimeout):
-                    retry = self.retry_on_timeout
-                elif isinstance(e, ConnectionError):
-                    retry = True
-                elif e.status_code in self.retry_on_status:
-                    retry = True
-
-                if retry:
+                if self._should_retry(e):
                     try:
                         # only mark as dead if we are retrying
                         self.mark_dead(connection)
@@ -450,29 +881,249 @@ class Transport:
                         # If sniffing on failure, it could fail too. Catch the
                         # exception not to interrupt the retries.
                         pass
-                    # raise exception on last retry
-                    if attempt == self.max_retries:
+                    # raise exception on last retry, for a stream that was
+                    # consumed or once the budget is spent
+                    if (
+                        attempt == self.max_retries
+                        or (streamed_body and position is None)
+                        or not self._retry_allowed()
+                    ):
                         raise e
                 else:
                     raise e
 
             else:
-                # connection didn't fail, confirm its live status
-                self.connection_pool.mark_live(connection)
+                return self._process_response(
+                    connection, method, status, headers_response, data, stream
+                )
+
+    def _perform_hedged_request(
+        self,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        timeout: Any,
+        ignore: Collection[int],
+        headers: Any,
+        routed: Optional[Connection] = None,
+    ) -> Any:
+        """
+        Send a read to one node and, if it hasn't answered within the hedging
+        delay, a duplicate to another one. The first successful answer wins,
+        a failed attempt marks its node as dead and is retried while the
+        other is still waited for. At most ``max_retries + 1`` requests are
+        sent in total.
+
+        A thread can't be interrupted mid-request, the losing request runs
+        to completion in the background and its answer is discarded. The
+        attempts are sent by a pool of ``HEDGE_WORKERS`` threads, the delay
+        counts from when an attempt is sent rather than queued, and no hedge
+        is sent while all the threads are busy since it would only queue.
+        """
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=self.HEDGE_WORKERS, thread_name_prefix="opensearch-hedge"
+            )
+        hedger: Any = self.hedger
+        args = (method, url, params, body, timeout, ignore, headers)
+        pending: Dict["Future[Any]", Connection] = {}
+        hedge: Optional["Future[Any]"] = None
+        hedged = False
+        sent = 0
+        # when the latest attempt that isn't a hedge was sent
+        started = threading.Event()
+        started_at: Optional[float] = None
+
+        def send(connection: Connection) -> "Future[Any]":
+            nonlocal sent
+            sent += 1
+            future = self._hedge_executor.submit(  # type: ignore
+                self._perform_hedged_attempt, connection, started, *args
+            )
+            pending[future] = connection
+            return future
+
+        try:
+            send(routed or self.get_connection())
+            while True:
+                delay = None
+                if not hedged and sent <= self.max_retries and hedger.delay is not None:
+                    # an attempt is sent before it can complete
+                    started.wait()
+                    if started_at is None:
+                        started_at = time.perf_counter()
+                    delay = max(0.0, started_at + hedger.delay - time.perf_counter())
+                done, _ = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+
+                if not done:
+                    hedged = True
+                    connection = self._get_hedge_connection(pending.values())
+                    if (
+                        connection is not None
+                        and self._hedge_running < self.HEDGE_WORKERS
+                        and self._retry_allowed()
+                    ):
+                        hedger.hedge_fired()
+                        hedge = send(connection)
+                    continue
+
+                for future in done:
+                    connection = pending.pop(future)
+                    try:
+                        status, headers_response, data = future.result()
+                    except TransportError as e:
+                        if method == "HEAD" and e.status_code == 404:
+                            return False
+                        if not self._should_retry(e):
+                            raise
+                        try:
+                            self.mark_dead(connection)
+                        except TransportError:
+                            pass
+                        # keep waiting for the other attempt, if any
+                        if pending:
+                            continue
+                        if sent > self.max_retries or not self._retry_allowed():
+                            raise
+                        started = threading.Event()
+                        started_at = None
+                        send(self.get_connection())
+                    else:
+                        if future is hedge:
+                            hedger.hedge_won()
+                        return self._process_response(
+                            connection, method, status, headers_response, data
+                        )
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _perform_hedged_attempt(
+        self, connection: Connection, started: threading.Event, *args: Any
+    ) -> Any:
+        with self._hedge_lock:
+            self._hedge_running += 1
+        started.set()
+        start = time.perf_counter()
+        try:
+            response = self._perform_attempt(connection, *args)
+            self.hedger.record(time.perf_counter() - start)  # type: ignore
+            return response
+        finally:
+            with self._hedge_lock:
+                self._hedge_running -= 1
+
+    def _get_hedge_connection(self, exclude: Collection[Connection]) -> Any:
+        """
+        Return a live connection that isn't in ``exclude``, ``None`` if the
+        pool has none.
+        """
+        for _ in range(len(self.connection_pool.connections)):
+            connection = self.get_connection()
+            if connection not in exclude:
+                return connection
+        return None
 
-                if method == "HEAD":
-                    return 200 <= status < 300
+    def _perform_attempt(
+        self,
+        connection: Connection,
+        method: str,
+        url: str,
+        params: Any,
+        body: Any,
+        timeout: Any,
+        ignore: Collection[int],
+        headers: Any,
+        stream: bool = False,
+    ) -> Any:
+        """
+        Send the request over ``connection`` once, keeping the connection
+        pool informed of the request.
+        """
+        kwargs = {"stream": True} if stream else {}
+        self.connection_pool.request_started(connection)
+        start = time.perf_counter()
+        try:
+            status, headers_response, data = connection.perform_request(
+                method,
+                url,
+                params,
+                body,
+                headers=headers,
+                ignore=ignore,
+                timeout=timeout,
+                **kwargs,
+            )
+        finally:
+            self.connection_pool.request_finished(
+                connection, time.perf_counter() - start
+            )
+
+        # Lowercase all the header names for consistency in accessing them.
+        headers_response = {
+            header.lower(): value for header, value in headers_response.items()
+        }
+        return status, headers_response, data
+
+    def _should_retry(self, error: TransportError) -> bool:
+        """
+        Whether the request that failed with ``error`` should be retried on
+        another node.
+        """
+        if isinstance(error, ConnectionTimeout):
+            return self.retry_on_timeout
+        if isinstance(error, ConnectionError):
+            return True
+        return error.status_code in self.retry_on_status
+
+    def _retry_allowed(self) -> bool:
+        return self.retry_budget is None or self.retry_budget.withdraw()
 
-                if data:
-                    data = self.deserializer.loads(
-                        data, headers_response.get("content-type")
-                    )
-                return data
+    def _process_response(
+        self,
+        connection: Connection,
+        method: str,
+        status: int,
+        headers_response: Any,
+        data: Any,
+        stream: bool = False,
+    ) -> Any:
+        # connection didn't fail, confirm its live status
+        self.connection_pool.mark_live(connection)
+        if self.retry_budget is not None:
+            self.retry_budget.deposit()
+
+        if method == "HEAD":
+            return 200 <= status < 300
+
+        if data and not stream:
+            data = self.deserializer.loads(data, headers_response.get("content-type"))
+        return data
+
+    @property
+    def hedge_stats(self) -> Dict[str, Any]:
+        """
+        Number of duplicate reads sent (``fired``), how many of them answered
+        before the original request (``won``) and the current hedging
+        ``delay`` in seconds, ``None`` while it is being learned. Empty if
+        hedging is disabled.
+        """
+        if self.hedger is None:
+            return {}
+        return self.hedger.stats
 
     def close(self) -> Any:
         """
         Explicitly closes connections
         """
+        if self._sniffer is not None:
+            self._sniffer_stopped = True
+            self._sniff_requested.set()
+            self._sniffer = None
+        if self._hedge_executor is not None:
+            self._hedge_executor.shutdown(wait=False)
+            self._hedge_executor = None
         return self.connection_pool.close()
 
     def _resolve_request_args(
@@ -484,7 +1135,10 @@ class Transport:
         timeout: Optional[Union[int, float]],
     ) -> Any:
         """Resolves parameters for .perform_request()"""
-        if body is not None:
+        if is_stream(body):
+            # streamed as is by the connection
+            pass
+        elif body is not None:
             body = self.serializer.dumps(body)
 
             # some clients or environments don't support sending GET with body
@@ -500,7 +1154,7 @@ class Transport:
                     params["source"] = body
                     body = None
 
-        if body is not None:
+        if body is not None and not is_stream(body):
             try:
                 body = body.encode("utf-8", "surrogatepass")
             except (UnicodeDecodeError, AttributeError):
@@ -118,6 +118,9 @@ setup(
         "develop": tests_require + docs_require + generate_require,
         "docs": docs_require + async_require,
         "async": async_require,
+        "http2": ["httpx[http2]>=0.23.0,<1"],
+        "zstd": ["zstandard"],
+        "arrow": ["pyarrow>=14"],
         "grpc": ["opensearch-protobufs==1.4.0"],
         "kerberos": ["requests_kerberos"],
     },
@@ -52,6 +52,7 @@ class DummyTransport(AsyncTransport):
         timeout: Optional[Union[int, float]] = None,
         ignore: Collection[int] = (),
         headers: Optional[Mapping[str, str]] = None,
+        stream: bool = False,
     ) -> Any:
         resp: Any = (200, {})
         if self.responses:
@@ -72,6 +72,9 @@ class TestAIOHttpConnection:
                 async def text(self) -> Any:
                     return response_body.decode("utf-8", "surrogatepass")
 
+                async def read(self) -> Any:
+                    return response_body
+
             dummy_response: Any = DummyResponse()
             dummy_response.headers = CIMultiDict(**response_headers)
             dummy_response.status = response_code
@@ -152,6 +155,21 @@ class TestAIOHttpConnection:
         assert kwargs["headers"]["accept-encoding"] == "gzip,deflate"
         assert "content-encoding" not in kwargs["headers"]
 
+    async def test_stream_body(self) -> None:
+        con = await self._get_mock_connection({"http_compress": True})
+
+        async def body() -> Any:
+            yield b'{"index":{}}\n'
+            yield "{}\n"
+
+        for stream in (body(), iter([b'{"index":{}}\n', "{}\n"])):
+            await con.perform_request("POST", "/_bulk", body=stream)
+
+            _, kwargs = con.session.request.call_args
+            data = b"".join([chunk async for chunk in kwargs["data"]])
+            assert gzip.decompress(data) == b'{"index":{}}\n{}\n'
+            assert kwargs["headers"]["content-encoding"] == "gzip"
+
     async def test_url_prefix(self) -> None:
         con = await self._get_mock_connection(
             connection_params={"url_prefix": "/_search/"}
@@ -362,6 +380,14 @@ class TestAIOHttpConnection:
         _, _, data = await con.perform_request("GET", "/")
         assert "你好\uda6a" == data  # fmt: skip
 
+    async def test_response_as_bytes_returns_raw_body(self) -> None:
+        buf = b"\xe4\xbd\xa0\xe5\xa5\xbd\xed\xa9\xaa"
+        con = await self._get_mock_connection(
+            connection_params={"response_as_bytes": True}, response_body=buf
+        )
+        _, _, data = await con.perform_request("GET", "/")
+        assert buf == data
+
     @pytest.mark.parametrize("exception_cls", reraise_exceptions)  # type: ignore
     async def test_recursion_error_reraised(self, exception_cls: Any) -> None:
         conn = AIOHttpConnection()
@@ -476,6 +502,14 @@ class TestConnectionHttpServer:
             "User-Agent": user_agent,
         }
 
+    async def test_aiohttp_stream_response(self) -> None:
+        conn = AIOHttpConnection("localhost", port=8081, use_ssl=False)
+        status, _, chunks = await conn.perform_request("GET", "/", stream=True)
+        data = json.loads(b"".join([chunk async for chunk in chunks]))
+        assert status == 200
+        assert data["method"] == "GET"
+        await conn.close()
+
     async def test_aiohttp_connection_error(self) -> None:
         conn = AIOHttpConnection("not.a.host.name")
         with pytest.raises(ConnectionError):
@@ -0,0 +1,417 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+from _pytest.mark.structures import MarkDecorator
+
+from opensearchpy import AsyncOpenSearch, helpers
+from opensearchpy._async.helpers.search import AsyncSearch
+from opensearchpy.connection.async_connections import add_connection, async_connections
+from opensearchpy.exceptions import TransportError
+
+pytestmark: MarkDecorator = pytest.mark.asyncio
+
+
+class BulkClient(AsyncOpenSearch):
+    """
+    Answers bulk requests after a delay without a server, rejects the
+    documents in ``reject`` once and records the number of concurrent
+    requests.
+    """
+
+    def __init__(self, reject: Any = (), **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.reject = set(reject)
+        self.inflight = 0
+        self.max_inflight = 0
+        self.bodies: Any = []
+
+    async def bulk(self, body: Any, *args: Any, **kwargs: Any) -> Any:
+        self.bodies.append(body)
+        self.inflight += 1
+        self.max_inflight = max(self.max_inflight, self.inflight)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.inflight -= 1
+        items = []
+        for line in body.splitlines()[1::2]:
+            doc = self.transport.serializer.loads(line)
+            status = 201
+            if doc["x"] in self.reject:
+                self.reject.discard(doc["x"])
+                status = 429
+            items.append({"index": {"status": status, "x": doc["x"]}})
+        return {"took": 1, "items": items}
+
+
+class TestAsyncParallelBulk:
+    async def test_all_chunks_sent(self) -> None:
+        client = BulkClient()
+        results = [
+            item
+            async for item in helpers.async_parallel_bulk(
+                client, ({"x": i} for i in range(100)), max_inflight=3, chunk_size=10
+            )
+        ]
+
+        assert 100 == len(results)
+        assert all(ok for ok, _ in results)
+        assert set(range(100)) == {item["index"]["x"] for _, item in results}
+        assert 10 == len(client.bodies)
+        assert 3 == client.max_inflight
+
+    async def test_single_request_in_flight(self) -> None:
+        client = BulkClient()
+        async for _ in helpers.async_parallel_bulk(
+            client, ({"x": i} for i in range(50)), max_inflight=1, chunk_size=10
+        ):
+            pass
+
+        assert 1 == client.max_inflight
+
+    async def test_rejected_documents_are_retried(self) -> None:
+        client = BulkClient(reject={3, 42})
+        results = [
+            item
+            async for item in helpers.async_parallel_bulk(
+                client,
+                ({"x": i} for i in range(50)),
+                chunk_size=10,
+                raise_on_error=False,
+                max_retries=1,
+                initial_backoff=0,
+            )
+        ]
+
+        assert 50 == len(results)
+        assert all(ok for ok, _ in results)
+        assert 7 == len(client.bodies)
+        assert b'{"index":{}}\n{"x":3}\n' in client.bodies
+        assert b'{"index":{}}\n{"x":42}\n' in client.bodies
+
+    async def test_completed_chunks_are_yielded_right_away(self) -> None:
+        client = BulkClient()
+        produced = 0
+
+        async def actions() -> Any:
+            nonlocal produced
+            for i in range(30):
+                if i and i % 10 == 0:
+                    # the previous chunks complete meanwhile
+                    await asyncio.sleep(0.05)
+                produced += 1
+                yield {"x": i}
+
+        first = None
+        async for _ in helpers.async_parallel_bulk(
+            client, actions(), max_inflight=10, chunk_size=10
+        ):
+            if first is None:
+                first = produced
+
+        assert first is not None and first < 30
+
+    async def test_errors_cancel_pending_requests(self) -> None:
+        client = BulkClient()
+        calls = 0
+
+        async def bulk(body: Any, *args: Any, **kwargs: Any) -> Any:
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise TransportError(500, "boom")
+            await asyncio.sleep(10)
+
+        client.bulk = bulk  # type: ignore
+        with pytest.raises(TransportError):
+            async for _ in helpers.async_parallel_bulk(
+                client, ({"x": i} for i in range(50)), max_inflight=4, chunk_size=10
+            ):
+                pass
+
+    async def test_invalid_max_inflight(self) -> None:
+        with pytest.raises(ValueError):
+            async for _ in helpers.async_parallel_bulk(
+                BulkClient(), [{"x": 1}], max_inflight=0
+            ):
+                pass
+
+
+class SlicedScrollClient(AsyncOpenSearch):
+    """
+    Serves sliced scrolls without a server, every slice holds ``per_slice``
+    documents.
+    """
+
+    def __init__(self, per_slice: int = 25, fail_slice: Any = None) -> None:
+        super().__init__()
+        self.per_slice = per_slice
+        self.fail_slice = fail_slice
+        self.searches: Any = []
+        self.scrolls = 0
+        self.cleared: Any = []
+
+    async def page(self, slice_id: int, offset: int, size: int) -> Any:
+        await asyncio.sleep(0)
+        if slice_id == self.fail_slice and offset:
+            raise TransportError(500, "boom")
+        hits = [
+            {"_id": f"{slice_id}-{i}"}
+            for i in range(offset, min(offset + size, self.per_slice))
+        ]
+        return {
+            "_scroll_id": f"{slice_id}:{offset + size}:{size}",
+            "_shards": {"successful": 1, "total": 1},
+            "hits": {"total": {"value": self.per_slice}, "hits": hits},
+        }
+
+    async def search(self, body: Any = None, size: Any = None, **kwargs: Any) -> Any:
+        self.searches.append(body)
+        return await self.page(body.get("slice", {}).get("id", 0), 0, size)
+
+    async def scroll(self, body: Any = None, **kwargs: Any) -> Any:
+        self.scrolls += 1
+        slice_id, offset, size = map(int, body["scroll_id"].split(":"))
+        return await self.page(slice_id, offset, size)
+
+    async def clear_scroll(self, body: Any = None, **kwargs: Any) -> Any:
+        self.cleared.extend(body["scroll_id"])
+
+
+class TestAsyncScanPrefetch:
+    async def test_all_pages_are_yielded(self) -> None:
+        client = SlicedScrollClient()
+        hits = [hit async for hit in helpers.async_scan(client, size=10, prefetch=2)]
+
+        assert [f"0-{i}" for i in range(25)] == [h["_id"] for h in hits]
+        assert 1 == len(client.cleared)
+
+    async def test_pages_are_fetched_ahead_of_the_consumer(self) -> None:
+        client = SlicedScrollClient(per_slice=1000)
+        hits = helpers.async_scan(client, size=10, prefetch=3)
+        await hits.__anext__()
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        # the initial search and 3 buffered pages, plus the one waiting for room
+        assert 5 == len(client.searches) + client.scrolls
+
+        await hits.aclose()
+        assert 1 == len(client.cleared)
+
+    async def test_errors_are_raised(self) -> None:
+        client = SlicedScrollClient(per_slice=1000, fail_slice=0)
+        with pytest.raises(TransportError):
+            async for _ in helpers.async_scan(client, size=10, prefetch=2):
+                pass
+
+        assert 1 == len(client.cleared)
+
+
+class StreamingScrollClient(SlicedScrollClient):
+    """Serves the pages of ``SlicedScrollClient`` as streamed responses."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.transport.perform_request = self.perform_request  # type: ignore
+
+    async def perform_request(
+        self, method: str, url: str, body: Any = None, **kwargs: Any
+    ) -> Any:
+        assert kwargs["stream"]
+        if url == "/_search/scroll":
+            resp = await self.scroll(body=body)
+        else:
+            resp = await self.search(body=body, size=int(kwargs["params"]["size"]))
+        data = json.dumps(resp).encode()
+
+        async def chunks() -> Any:
+            for i in range(0, len(data), 10):
+                yield data[i : i + 10]
+
+        return chunks()
+
+
+class TestAsyncScanStream:
+    async def test_all_pages_are_streamed(self) -> None:
+        client = StreamingScrollClient()
+        hits = [hit async for hit in helpers.async_scan(client, size=10, stream=True)]
+
+        assert [f"0-{i}" for i in range(25)] == [h["_id"] for h in hits]
+        assert ["0:40:10"] == client.cleared
+
+    async def test_scroll_is_cleared_when_closed_early(self) -> None:
+        client = StreamingScrollClient()
+        hits = helpers.async_scan(client, size=10, stream=True)
+        await hits.__anext__()
+        await hits.aclose()
+
+        assert ["0:10:10"] == client.cleared
+
+
+class TestAsyncParallelScan:
+    async def test_all_slices_are_scanned(self) -> None:
+        client = SlicedScrollClient()
+        progress: Any = []
+        hits = [
+            hit
+            async for hit in helpers.async_parallel_scan(
+                client,
+                {"query": {"match_all": {}}},
+                slices=4,
+                size=10,
+                progress=lambda *args: progress.append(args),
+            )
+        ]
+
+        assert {f"{s}-{i}" for s in range(4) for i in range(25)} == {
+            hit["_id"] for hit in hits
+        }
+        assert 100 == len(hits)
+        assert [{"id": s, "max": 4} for s in range(4)] == [
+            body["slice"] for body in client.searches
+        ]
+        assert 4 == len(client.cleared)
+        assert [(0, 10, 25), (0, 20, 25), (0, 25, 25)] == [
+            p for p in progress if p[0] == 0
+        ]
+
+    async def test_errors_are_raised_and_scrolls_cleared(self) -> None:
+        client = SlicedScrollClient(per_slice=1000, fail_slice=1)
+        with pytest.raises(TransportError):
+            async for _ in helpers.async_parallel_scan(client, slices=3, size=10):
+                pass
+
+        assert 3 == len(client.cleared)
+
+    async def test_scrolls_are_cleared_when_closed_early(self) -> None:
+        client = SlicedScrollClient(per_slice=1000)
+        hits = helpers.async_parallel_scan(client, slices=3, size=10, queue_size=1)
+        await hits.__anext__()
+        await hits.aclose()
+
+        assert 3 == len(client.cleared)
+
+
+class PitClient(AsyncOpenSearch):
+    """
+    Serves point in time searches without a server, documents are sorted by
+    their number.
+    """
+
+    def __init__(self, docs: int = 25) -> None:
+        super().__init__()
+        self.docs = docs
+        self.pits: Any = []
+        self.searches: Any = []
+        self.deleted: Any = []
+
+    async def create_pit(self, index: Any = None, **kwargs: Any) -> Any:
+        self.pits.append((index, kwargs))
+        return {"pit_id": f"pit-{len(self.pits)}"}
+
+    async def search(self, body: Any = None, size: Any = None, **kwargs: Any) -> Any:
+        await asyncio.sleep(0)
+        self.searches.append(body)
+        start = body.get("search_after", [-1])[0] + 1
+        slice_ = body.get("slice", {"id": 0, "max": 1})
+        numbers = [
+            i for i in range(start, self.docs) if i % slice_["max"] == slice_["id"]
+        ][:size]
+        return {
+            "pit_id": body["pit"]["id"],
+            "_shards": {"successful": 1, "total": 1},
+            "hits": {
+                "total": {"value": self.docs},
+                "hits": [{"_id": str(i), "sort": [i]} for i in numbers],
+            },
+        }
+
+    async def delete_pit(self, body: Any = None, **kwargs: Any) -> Any:
+        self.deleted.extend(body["pit_id"])
+
+
+class TestAsyncPitScan:
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    async def test_all_pages_are_fetched_with_search_after(self, prefetch: int) -> None:
+        client = PitClient()
+        hits = [
+            hit
+            async for hit in helpers.async_pit_scan(
+                client,
+                {"query": {"match_all": {}}},
+                index="movies",
+                keep_alive="1m",
+                size=10,
+                prefetch=prefetch,
+            )
+        ]
+
+        assert [str(i) for i in range(25)] == [h["_id"] for h in hits]
+        assert [("movies", {"keep_alive": "1m"})] == client.pits
+        assert [None, [9], [19]] == [b.get("search_after") for b in client.searches]
+        assert ["_shard_doc"] == client.searches[0]["sort"]
+        assert ["pit-1"] == client.deleted
+
+    async def test_pit_is_deleted_when_closed_early(self) -> None:
+        client = PitClient(docs=1000)
+        hits = helpers.async_pit_scan(client, index="movies", size=10, prefetch=2)
+        await hits.__anext__()
+        await hits.aclose()
+
+        assert ["pit-1"] == client.deleted
+
+    async def test_parallel_scan_with_pit(self) -> None:
+        client = PitClient()
+        hits = [
+            hit
+            async for hit in helpers.async_parallel_scan(
+                client, index="movies", slices=3, size=5, pit=True
+            )
+        ]
+
+        assert {str(i) for i in range(25)} == {h["_id"] for h in hits}
+        assert [("movies", {"keep_alive": "5m"})] == client.pits
+        assert ["pit-1"] == client.deleted
+
+    async def test_search_scan_with_pit(self) -> None:
+        client = PitClient()
+        await add_connection("pit", client)
+        try:
+            s = AsyncSearch(using="pit", index="movies").query("match_all")
+            hits = [hit async for hit in s.scan(pit=True)]
+        finally:
+            async_connections._conns = {}
+            async_connections._kwargs = {}
+
+        assert 25 == len(hits)
+        assert [(["movies"], {"keep_alive": "5m"})] == client.pits
+        assert ["pit-1"] == client.deleted
+
+
+class TestAsyncBulkFromArrow:
+    async def test_rows_are_indexed(self) -> None:
+        pa = pytest.importorskip("pyarrow")
+        client = BulkClient()
+        table = pa.table({"x": list(range(10)), "_id": [str(i) for i in range(10)]})
+
+        success, errors = await helpers.async_bulk_from_arrow(
+            client, table, batch_size=3, chunk_size=4
+        )
+
+        assert (10, []) == (success, errors)
+        assert 3 == len(client.bodies)
+        assert [b'{"index":{"_id":"0"}}', b'{"x":0}'] == client.bodies[0].splitlines()[
+            :2
+        ]
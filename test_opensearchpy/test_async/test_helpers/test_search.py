@@ -9,6 +9,7 @@
 
 from copy import deepcopy
 from typing import Any
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from _pytest.mark.structures import MarkDecorator
@@ -19,6 +20,7 @@ from opensearchpy._async.helpers.document import AsyncDocument
 from opensearchpy.exceptions import IllegalOperation
 from opensearchpy.helpers import query
 from opensearchpy.helpers.query import Q
+from opensearchpy.helpers.search import Param
 
 pytestmark: MarkDecorator = pytest.mark.asyncio
 
@@ -596,3 +598,44 @@ def test_collapse_chaining() -> None:
         },
         "collapse": {"field": "category"},
     } == s.to_dict()
+
+
+async def test_compiled_search_execute(mock_client: Any) -> None:
+    mock_client.search = AsyncMock(return_value={"hits": {"hits": []}})
+    s = search.AsyncSearch(using="mock", index="i").filter(
+        "term", user_id=Param("user_id")
+    )
+    r = await s.compile().execute(user_id="u1")
+
+    assert 0 == len(r.hits)
+    mock_client.search.assert_awaited_once_with(
+        index=["i"], body=b'{"query":{"bool":{"filter":[{"term":{"user_id":"u1"}}]}}}'
+    )
+
+
+async def test_execute_raw_returns_the_response_body(mock_client: Any) -> None:
+    body = {"hits": {"hits": [{"_id": "1", "_source": {}}]}}
+    mock_client.search = AsyncMock(return_value=body)
+    s = search.AsyncSearch(using="mock")
+
+    assert body is await s.execute(raw=True)
+    assert "1" == (await s.execute())[0].meta.id
+    mock_client.search.assert_awaited_once_with(index=None, body={})
+
+
+async def test_to_arrow(mock_client: Any) -> None:
+    pytest.importorskip("pyarrow")
+    hits = [{"_id": str(i), "_source": {"n": i}} for i in range(5)]
+    mock_client.search = AsyncMock(return_value={"hits": {"hits": hits[:2]}})
+
+    async def scan_hits(*args: Any, **kwargs: Any) -> Any:
+        for hit in hits:
+            yield hit
+
+    s = search.AsyncSearch(using="mock")
+    table = await s.to_arrow(meta=["_id"])
+    assert {"_id": ["0", "1"], "n": [0, 1]} == table.to_pydict()
+
+    with patch("opensearchpy._async.helpers.search.async_scan", scan_hits):
+        table = await s.to_arrow(fields=["n"], scan=True, batch_size=2)
+    assert [0, 1, 2, 3, 4] == table.column("n").to_pylist()
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import asyncio
+from typing import Any
+
+import pytest
+from _pytest.mark.structures import MarkDecorator
+
+from opensearchpy import AsyncHttpxHttpConnection, AsyncOpenSearch
+from opensearchpy.exceptions import ConflictError, ConnectionTimeout
+
+httpx = pytest.importorskip("httpx")
+
+pytestmark: MarkDecorator = pytest.mark.asyncio
+
+
+def mock_connection(requests: Any, status: int = 200, exception: Any = None) -> Any:
+    con = AsyncHttpxHttpConnection()
+
+    async def handler(request: Any) -> Any:
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        if exception is not None:
+            raise exception
+        return httpx.Response(status, content=b'{"took":1}')
+
+    con.client._transport = httpx.MockTransport(handler)
+    return con
+
+
+class TestAsyncHttpxHttpConnection:
+    async def test_request(self) -> None:
+        requests: Any = []
+        con = mock_connection(requests)
+
+        status, _, data = await con.perform_request(
+            "PUT", "/movies/_doc/1", params={"refresh": "true"}, body=b"{}"
+        )
+        assert (200, '{"took":1}') == (status, data)
+        assert "http://localhost:9200/movies/_doc/1?refresh=true" == str(
+            requests[0].url
+        )
+        assert b"{}" == requests[0].content
+        await con.close()
+        assert con.client.is_closed
+
+    async def test_stream_response(self) -> None:
+        con = mock_connection([])
+
+        status, _, chunks = await con.perform_request("POST", "/_search", stream=True)
+        assert 200 == status
+        assert b'{"took":1}' == b"".join([chunk async for chunk in chunks])
+        await con.close()
+
+    async def test_errors_are_mapped(self) -> None:
+        con = mock_connection([], status=409)
+        with pytest.raises(ConflictError):
+            await con.perform_request("PUT", "/movies/_create/1", body=b"{}")
+
+        con = mock_connection([], exception=httpx.PoolTimeout("pool"))
+        with pytest.raises(ConnectionTimeout):
+            await con.perform_request("GET", "/")
+
+    async def test_concurrent_requests_through_the_client(self) -> None:
+        requests: Any = []
+        client = AsyncOpenSearch(connection_class=AsyncHttpxHttpConnection)
+        transport: Any = client.transport
+        await transport._async_call()
+        connection = transport.get_connection()
+        connection.client._transport = mock_connection(requests).client._transport
+
+        results = await asyncio.gather(*(client.info() for _ in range(20)))
+        assert [{"took": 1}] * 20 == results
+        assert 20 == len(requests)
+        await client.close()
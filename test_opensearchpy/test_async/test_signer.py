@@ -42,6 +42,16 @@ class TestAsyncSigner:
         assert "X-Amz-Date" in headers
         assert "X-Amz-Security-Token" in headers
 
+    async def test_aws_signer_async_refuses_streamed_body(self) -> None:
+        from opensearchpy.helpers.asyncsigner import AWSV4SignerAsyncAuth
+
+        async def body() -> Any:
+            yield b"{}\n"
+
+        auth = AWSV4SignerAsyncAuth(self.mock_session(), "us-west-2")
+        with pytest.raises(ValueError):
+            auth("POST", "http://localhost/_bulk", body())
+
     async def test_aws_signer_async_when_region_is_null(self) -> None:
         session = self.mock_session()
 
@@ -180,6 +190,7 @@ class TestAsyncSignerWithSpecialCharacters:
                 timeout: Optional[Union[int, float]] = None,
                 ignore: Collection[int] = (),
                 headers: Optional[Mapping[str, str]] = None,
+                stream: bool = False,
             ) -> Tuple[int, Mapping[str, str], str]:
                 nonlocal sent_url
                 sent_url = f"{self.host}{url}"
@@ -35,8 +35,13 @@ from _pytest.mark.structures import MarkDecorator
 
 from opensearchpy import AIOHttpConnection, AsyncTransport
 from opensearchpy.connection import Connection
-from opensearchpy.connection_pool import DummyConnectionPool
+from opensearchpy.connection_pool import DummyConnectionPool, LeastOutstandingSelector
 from opensearchpy.exceptions import ConnectionError, TransportError
+from opensearchpy.routing import shard_id
+from opensearchpy.transport import RetryBudget
+
+from ..test_routing import CLUSTER_STATE
+from ..test_transport import ROUTING_NODES
 
 pytestmark: MarkDecorator = pytest.mark.asyncio
 
@@ -281,6 +286,22 @@ class TestTransport:
         assert 2 == len(t.connection_pool.connections)
         assert "http://google.com:1234" == t.connection_pool.connections[1].host
 
+    async def test_selector_is_told_about_requests_in_flight(self) -> None:
+        t: Any = AsyncTransport(
+            [{"delay": 0.05}, {"delay": 0.05}],
+            connection_class=DummyConnection,
+            selector_class=LeastOutstandingSelector,
+        )
+        await t._async_call()
+        pool = t.connection_pool
+
+        requests = asyncio.gather(*(t.perform_request("GET", "/") for _ in range(4)))
+        await asyncio.sleep(0.01)
+        assert [2, 2] == list(pool.inflight.values())
+
+        await requests
+        assert {} == pool.inflight
+
     async def test_request_will_fail_after_x_retries(self) -> None:
         t: Any = AsyncTransport(
             [{"exception": ConnectionError(None, "abandon ship", Exception())}],
@@ -296,6 +317,39 @@ class TestTransport:
         assert connection_error
         assert 4 == len(t.get_connection().calls)
 
+    async def test_retries_stop_once_the_budget_is_spent(self) -> None:
+        t: Any = AsyncTransport(
+            [{"exception": ConnectionError(None, "abandon ship", Exception())}],
+            connection_class=DummyConnection,
+            retry_budget=RetryBudget(ratio=0, min_per_second=0, max_tokens=1),
+        )
+
+        with pytest.raises(ConnectionError):
+            await t.perform_request("GET", "/")
+        assert 2 == len(t.get_connection().calls)
+        assert 1 == t.retry_budget.stats["rejected"]
+
+    async def test_consumed_stream_body_is_not_retried(self) -> None:
+        t: Any = AsyncTransport(
+            [{"exception": ConnectionError(None, "abandon ship", Exception())}],
+            connection_class=DummyConnection,
+        )
+
+        async def body() -> Any:
+            yield b"{}\n"
+
+        stream = body()
+        with pytest.raises(ConnectionError):
+            await t.perform_request("POST", "/_bulk", body=stream)
+        assert [stream] == [args[3] for args, _ in t.get_connection().calls]
+
+    async def test_stream_response_is_not_deserialized(self) -> None:
+        chunks = object()
+        t: Any = AsyncTransport([{"data": chunks}], connection_class=DummyConnection)
+
+        assert chunks is await t.perform_request("POST", "/_search", stream=True)
+        assert t.get_connection().calls[0][1]["stream"]
+
     async def test_failed_connection_will_be_marked_as_dead(self) -> None:
         t: Any = AsyncTransport(
             [{"exception": ConnectionError(None, "abandon ship", Exception())}] * 2,
@@ -618,3 +672,91 @@ class TestTransport:
             t.connection_pool.connections[0],
             AIOHttpConnection,
         )
+
+
+class TestHedgedRequests:
+    async def test_slow_read_is_hedged_and_loser_cancelled(self) -> None:
+        t: Any = AsyncTransport(
+            [{"delay": 0.5, "data": '{"node":1}'}, {"data": '{"node":2}'}],
+            connection_class=DummyConnection,
+            randomize_hosts=False,
+            hedge_after=0.01,
+        )
+        await t._async_call()
+        slow, fast = t.connection_pool.connections
+
+        assert {"node": 2} == await t.perform_request("POST", "/movies/_search")
+        assert {"fired": 1, "won": 1, "delay": 0.01} == t.hedge_stats
+        await asyncio.sleep(0.6)
+        assert [] == slow.calls
+        assert 1 == len(fast.calls)
+
+    async def test_fast_read_is_not_hedged(self) -> None:
+        t: Any = AsyncTransport(
+            [{"delay": 0.02}, {}],
+            connection_class=DummyConnection,
+            randomize_hosts=False,
+            hedge_after=1,
+        )
+
+        assert {} == await t.perform_request("GET", "/_search")
+        assert 0 == t.hedge_stats["fired"]
+
+    async def test_writes_are_not_hedged(self) -> None:
+        t: Any = AsyncTransport(
+            [{"delay": 0.05}, {}],
+            connection_class=DummyConnection,
+            randomize_hosts=False,
+            hedge_after=0.01,
+        )
+
+        await t.perform_request("POST", "/_bulk")
+        assert 0 == t.hedge_stats["fired"]
+
+
+class ClusterConnection(DummyConnection):
+    """
+    Answers the cluster state and node info requests of shard aware routing
+    with the fake cluster of the synchronous tests.
+    """
+
+    async def perform_request(
+        self, method: str, url: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        response = await super().perform_request(method, url, *args, **kwargs)
+        if url.startswith("/_cluster/state/"):
+            return 200, {}, json.dumps(CLUSTER_STATE)
+        if url == "/_nodes/_all/http":
+            return 200, {}, json.dumps(ROUTING_NODES)
+        return response
+
+
+class TestShardAwareRouting:
+    async def test_document_requests_go_to_the_shard(self) -> None:
+        t: Any = AsyncTransport(
+            [{"host": f"node{i}", "port": 9200} for i in (1, 2, 3)],
+            connection_class=ClusterConnection,
+            randomize_hosts=False,
+            routing_aware=True,
+        )
+        await t._async_call()
+        await t.routing_task
+        node1, _, node3 = t.connection_pool.connections
+        doc = next(str(i) for i in range(100) if shard_id(2, str(i)) == 0)
+
+        for _ in range(5):
+            await t.perform_request("PUT", f"/movies/_doc/{doc}", body={})
+        assert 5 == len([c for c in node1.calls if "/movies/" in c[0][1]])
+        assert [] == [c for c in node3.calls if "/movies/" in c[0][1]]
+        await t.close()
+
+    async def test_refresh_runs_in_the_background(self) -> None:
+        t: Any = AsyncTransport(
+            [{"data": "{}"}], connection_class=DummyConnection, routing_aware=True
+        )
+
+        assert {} == await t.perform_request("GET", "/movies/_doc/1")
+        await t.routing_task
+        assert not t.router.stale
+        await t.close()
+        assert t.routing_task is None
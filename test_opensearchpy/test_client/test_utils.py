@@ -25,9 +25,19 @@
 #  under the License.
 
 
+import asyncio
+import io
 from typing import Any
 
-from opensearchpy.client.utils import _bulk_body, _escape, _make_path, query_params
+from opensearchpy.client import utils
+from opensearchpy.client.utils import (
+    BulkStream,
+    _bulk_body,
+    _escape,
+    _make_path,
+    query_params,
+)
+from opensearchpy.serializer import FastJSONSerializer, JSONSerializer
 
 from ..test_cases import TestCase
 
@@ -235,3 +245,60 @@ class TestBulkBody(TestCase):
             b'"{"index":{ "_index" : "test"}}\n{"field1": "value1"}"\n',
             _bulk_body(None, bytestring_body),
         )
+
+    def test_bulk_body_stays_bytes_with_bytes_serializer(self) -> None:
+        self.assertEqual(
+            b'{"index":{}}\n{"field1":"v\xc3\xa9"}\n',
+            _bulk_body(FastJSONSerializer(), ['{"index":{}}', {"field1": "v\u00e9"}]),
+        )
+
+    def test_bulk_body_from_file_is_streamed_as_is(self) -> None:
+        body = io.BytesIO(b'{"index":{}}\n{"field1":"value1"}\n')
+        self.assertIs(body, _bulk_body(JSONSerializer(), body))
+
+    def test_bulk_body_from_generator_is_joined(self) -> None:
+        lines = iter([{"index": {}}, '{"field1":"value1"}'])
+        self.assertEqual(
+            '{"index":{}}\n{"field1":"value1"}\n', _bulk_body(JSONSerializer(), lines)
+        )
+
+    def test_bulk_stream_is_serialized_lazily(self) -> None:
+        consumed = []
+
+        def lines() -> Any:
+            for i in range(3):
+                consumed.append(i)
+                yield {"index": {}}
+                yield '{"field1":%d}' % i
+
+        body = _bulk_body(JSONSerializer(), BulkStream(lines()))
+        self.assertEqual([], consumed)
+        self.assertEqual(
+            b'{"index":{}}\n{"field1":0}\n{"index":{}}\n{"field1":1}\n'
+            b'{"index":{}}\n{"field1":2}\n',
+            b"".join(body),
+        )
+
+    def test_bulk_stream_of_async_generator_is_serialized_lazily(self) -> None:
+        async def lines() -> Any:
+            yield {"index": {}}
+            yield '{"field1":"value1"}'
+
+        async def consume() -> Any:
+            body = _bulk_body(JSONSerializer(), BulkStream(lines()))
+            return [chunk async for chunk in body]
+
+        self.assertEqual(
+            [b'{"index":{}}\n{"field1":"value1"}\n'], asyncio.run(consume())
+        )
+
+    def test_bulk_stream_is_sent_in_chunks(self) -> None:
+        line = {"field1": "x" * 1000}
+        body = BulkStream(line for _ in range(200))
+        chunks = list(_bulk_body(JSONSerializer(), body))
+
+        self.assertEqual(4, len(chunks))
+        self.assertTrue(
+            all(len(chunk) >= utils.BULK_STREAM_CHUNK_SIZE for chunk in chunks[:-1])
+        )
+        self.assertEqual(200, b"".join(chunks).count(b"\n"))
@@ -25,11 +25,17 @@
 #  under the License.
 
 
+import gzip
+import logging
 import os
 import sys
 import warnings
+import zlib
+from typing import Any
+from unittest.mock import patch
 
 from opensearchpy.connection import Connection
+from opensearchpy.exceptions import ImproperlyConfigured
 
 from ..test_cases import TestCase
 
@@ -38,7 +44,7 @@ try:
 except ImportError:  # Old version of pytest for 2.7 and 3.5
     from _pytest.monkeypatch import MonkeyPatch
 
-from pytest import raises
+from pytest import importorskip, raises
 
 from opensearchpy import OpenSearch, serializer
 from opensearchpy.connection import connections
@@ -87,6 +93,32 @@ class TestBaseConnection(TestCase):
 
         self.assertEqual([str(w.message) for w in warn], ["warning", "folded"])
 
+    def test_request_success_not_logged_when_disabled(self) -> None:
+        con = Connection()
+        with patch.object(con, "_log_request_response") as log_request_response:
+            with patch.object(con, "_log_trace") as log_trace:
+                con.log_request_success("GET", "/", "/", None, 200, b"{}", 0.1)
+
+        log_request_response.assert_not_called()
+        log_trace.assert_not_called()
+
+    @patch("opensearchpy.connection.base.logger")
+    def test_request_success_logged_when_info_enabled(self, logger: Any) -> None:
+        logger.isEnabledFor.side_effect = lambda level: level >= logging.INFO
+
+        Connection().log_request_success(
+            "GET", "http://localhost:9200/", "/", None, 200, b"{}", 0.1
+        )
+
+        logger.info.assert_called_once_with(
+            "%s %s [status:%s request:%.3fs]",
+            "GET",
+            "http://localhost:9200/",
+            200,
+            0.1,
+        )
+        logger.debug.assert_not_called()
+
     def test_ipv6_host_and_port(self) -> None:
         for kwargs, expected_host in [
             ({"host": "::1"}, "http://[::1]:9200"),
@@ -118,6 +150,53 @@ class TestBaseConnection(TestCase):
         finally:
             os.environ.pop("ELASTIC_CLIENT_APIVERSIONING")
 
+    def test_compress(self) -> None:
+        body = b'{"title":"The Dark Knight"}\n' * 100
+        for http_compress, decompress in (
+            (True, gzip.decompress),
+            ("gzip", gzip.decompress),
+            ("deflate", zlib.decompress),
+        ):
+            for level in (None, 1, 9):
+                con = Connection(http_compress=http_compress, compression_level=level)
+                headers: Any = {}
+                self.assertEqual(body, decompress(con._compress(body, headers)))
+                self.assertEqual(con.compression, headers["content-encoding"])
+
+    def test_compression_threshold(self) -> None:
+        con = Connection(http_compress=True, compression_threshold=100)
+        headers: Any = {}
+        self.assertEqual(b"{}", con._compress(b"{}", headers))
+        self.assertEqual({}, headers)
+
+        body = b"{}" * 50
+        self.assertEqual(body, gzip.decompress(con._compress(body, headers)))
+        self.assertEqual("gzip", headers["content-encoding"])
+
+    def test_compressed_stream_body(self) -> None:
+        con = Connection(http_compress="deflate", compression_threshold=100)
+        headers: Any = {}
+        chunks = con._stream_body(iter([b"{}\n"] * 3), headers)
+        self.assertEqual(b"{}\n" * 3, zlib.decompress(b"".join(chunks)))
+        self.assertEqual("deflate", headers["content-encoding"])
+
+    def test_unsupported_compression_raises(self) -> None:
+        self.assertRaises(ImproperlyConfigured, Connection, http_compress="br")
+
+    def test_zstd_compression_requires_zstandard(self) -> None:
+        with patch("opensearchpy.connection.base.zstandard", None):
+            self.assertRaises(ImproperlyConfigured, Connection, http_compress="zstd")
+
+    def test_zstd_compression(self) -> None:
+        zstandard = importorskip("zstandard")
+        con = Connection(http_compress="zstd", compression_level=1)
+        headers: Any = {}
+        body = con._compress(b"{}" * 100, headers)
+        self.assertEqual("zstd", headers["content-encoding"])
+        self.assertEqual(
+            b"{}" * 100, zstandard.ZstdDecompressor().decompressobj().decompress(body)
+        )
+
     def test_ca_certs_ssl_cert_file(self) -> None:
         cert = "/path/to/clientcert.pem"
         with MonkeyPatch().context() as monkeypatch:
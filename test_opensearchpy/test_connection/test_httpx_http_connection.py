@@ -0,0 +1,198 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import gzip
+import io
+import ssl
+import sys
+import warnings
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from opensearchpy.connection import HttpxHttpConnection
+from opensearchpy.exceptions import (
+    ConnectionError,
+    ConnectionTimeout,
+    ImproperlyConfigured,
+    NotFoundError,
+    SSLError,
+    TransportError,
+)
+
+from ..test_cases import SkipTest, TestCase
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore
+
+
+class TestHttpxHttpConnection(TestCase):
+    def setUp(self) -> None:
+        if httpx is None:
+            raise SkipTest("Test requires httpx to be available")
+        self.requests: Any = []
+
+    def _get_mock_connection(
+        self,
+        connection_params: Any = {},
+        status: int = 200,
+        body: bytes = b"{}",
+        headers: Any = None,
+        exception: Any = None,
+    ) -> Any:
+        con = HttpxHttpConnection(**connection_params)
+
+        def handler(request: Any) -> Any:
+            self.requests.append(request)
+            if exception is not None:
+                raise exception
+            return httpx.Response(status, content=body, headers=headers or {})
+
+        con.client._transport = httpx.MockTransport(handler)
+        return con
+
+    def test_http2_is_enabled_by_default(self) -> None:
+        transport: Any = HttpxHttpConnection().client._transport
+        self.assertTrue(transport._pool._http2)
+        transport = HttpxHttpConnection(http2=False).client._transport
+        self.assertFalse(transport._pool._http2)
+
+    def test_request(self) -> None:
+        con = self._get_mock_connection({"url_prefix": "/prefix", "timeout": 42})
+
+        status, _, data = con.perform_request(
+            "POST",
+            "/movies/_search",
+            params={"size": 5},
+            body=b'{"query":{}}',
+            headers={"x-test": "1"},
+        )
+        self.assertEqual((200, "{}"), (status, data))
+        request = self.requests[0]
+        self.assertEqual("POST", request.method)
+        self.assertEqual(
+            "http://localhost:9200/prefix/movies/_search?size=5", str(request.url)
+        )
+        self.assertEqual(b'{"query":{}}', request.content)
+        self.assertEqual("1", request.headers["x-test"])
+        self.assertEqual("application/json", request.headers["content-type"])
+        self.assertEqual(42, request.extensions["timeout"]["read"])
+
+    def test_response_as_bytes(self) -> None:
+        con = self._get_mock_connection({"response_as_bytes": True})
+        self.assertEqual(b"{}", con.perform_request("GET", "/")[2])
+
+    def test_basic_auth(self) -> None:
+        con = self._get_mock_connection({"http_auth": "username:secret"})
+        con.perform_request("GET", "/")
+        self.assertEqual(
+            "Basic dXNlcm5hbWU6c2VjcmV0", self.requests[0].headers["authorization"]
+        )
+
+    def test_no_http_compression(self) -> None:
+        con = self._get_mock_connection()
+        con.perform_request("POST", "/", body=b"{}")
+
+        self.assertNotIn("accept-encoding", self.requests[0].headers)
+        self.assertNotIn("content-encoding", self.requests[0].headers)
+
+    def test_http_compression(self) -> None:
+        con = self._get_mock_connection({"http_compress": True})
+        con.perform_request("POST", "/", body=b"{}")
+
+        request = self.requests[0]
+        self.assertEqual("gzip,deflate", request.headers["accept-encoding"])
+        self.assertEqual("gzip", request.headers["content-encoding"])
+        self.assertEqual(b"{}", gzip.decompress(request.content))
+
+    def test_stream_body(self) -> None:
+        con = self._get_mock_connection()
+        con.perform_request("POST", "/_bulk", body=io.BytesIO(b"{}\n"))
+
+        request = self.requests[0]
+        self.assertEqual("chunked", request.headers["transfer-encoding"])
+        self.assertEqual(b"{}\n", request.read())
+
+    def test_stream_response(self) -> None:
+        con = self._get_mock_connection(body=b'{"hits":{"hits":[]}}')
+
+        status, _, chunks = con.perform_request("POST", "/_search", stream=True)
+        self.assertEqual(200, status)
+        self.assertEqual(b'{"hits":{"hits":[]}}', b"".join(chunks))
+
+    def test_error_status_raises(self) -> None:
+        con = self._get_mock_connection(
+            status=404,
+            body=b'{"error":{"type":"index_not_found_exception"}}',
+            headers={"content-type": "application/json"},
+        )
+        with pytest.raises(NotFoundError) as e:
+            con.perform_request("GET", "/movies")
+        self.assertEqual("index_not_found_exception", e.value.error)
+
+        con = self._get_mock_connection(status=500, body=b"boom")
+        self.assertRaises(TransportError, con.perform_request, "GET", "/")
+
+    def test_ignored_status(self) -> None:
+        con = self._get_mock_connection(status=404)
+        self.assertEqual(404, con.perform_request("GET", "/", ignore=(404,))[0])
+
+    def test_warning_header(self) -> None:
+        con = self._get_mock_connection(headers={"warning": '299 - "deprecated"'})
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            con.perform_request("GET", "/")
+        self.assertEqual(["deprecated"], [str(x.message) for x in w])
+
+    def test_exceptions_are_mapped(self) -> None:
+        ssl_error = httpx.ConnectError("certificate verify failed")
+        ssl_error.__cause__ = ssl.SSLError("CERTIFICATE_VERIFY_FAILED")
+        for exception, expected in (
+            (httpx.ReadTimeout("timed out"), ConnectionTimeout),
+            (httpx.ConnectError("refused"), ConnectionError),
+            (httpx.RemoteProtocolError("reset"), ConnectionError),
+            (ssl_error, SSLError),
+        ):
+            con = self._get_mock_connection(exception=exception)
+            with pytest.raises(expected):
+                con.perform_request("GET", "/")
+
+    def test_uses_https_if_verify_certs_is_off(self) -> None:
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter("always")
+            con = HttpxHttpConnection(use_ssl=True, verify_certs=False)
+
+        self.assertEqual(1, len(w))
+        self.assertEqual(
+            "Connecting to https://localhost:9200 using SSL with verify_certs=False is insecure.",
+            str(w[0].message),
+        )
+        self.assertEqual("https://localhost:9200", con.host)
+
+    def test_ca_certs_with_verify_certs_off_raises(self) -> None:
+        self.assertRaises(
+            ImproperlyConfigured,
+            HttpxHttpConnection,
+            use_ssl=True,
+            verify_certs=False,
+            ca_certs="/ca.pem",
+        )
+
+    def test_http2_requires_h2(self) -> None:
+        with patch.dict(sys.modules, {"h2": None}):
+            self.assertRaises(ImproperlyConfigured, HttpxHttpConnection)
+            HttpxHttpConnection(http2=False)
+
+    def test_close(self) -> None:
+        con = HttpxHttpConnection()
+        con.close()
+        self.assertTrue(con.client.is_closed)
@@ -25,6 +25,7 @@
 #  under the License.
 
 
+import gzip
 import json
 import re
 import uuid
@@ -132,6 +133,27 @@ class TestRequestsHttpConnection(TestCase):
         self.assertNotIn("content-encoding", req.headers)
         self.assertEqual(req.headers["accept-encoding"], "gzip,deflate")
 
+    def test_stream_body_is_sent_chunked(self) -> None:
+        con = self._get_mock_connection({"http_compress": True})
+        con.perform_request("POST", "/_bulk", body=iter([b"{}\n"] * 3))
+
+        req = con.session.send.call_args[0][0]
+        self.assertEqual("chunked", req.headers["transfer-encoding"])
+        self.assertEqual("gzip", req.headers["content-encoding"])
+        self.assertEqual(b"{}\n" * 3, gzip.decompress(b"".join(req.body)))
+
+    def test_stream_response(self) -> None:
+        con = self._get_mock_connection()
+        con.session.send = Mock(wraps=con.session.send)
+        response = con.session.send.return_value = Mock(status_code=200, headers={})
+        response.iter_content.return_value = iter([b'{"hits":', b"{}}"])
+
+        status, _, chunks = con.perform_request("POST", "/_search", stream=True)
+        self.assertTrue(con.session.send.call_args[1]["stream"])
+        self.assertEqual(200, status)
+        self.assertEqual(b'{"hits":{}}', b"".join(chunks))
+        response.close.assert_called_once_with()
+
     def test_uses_https_if_verify_certs_is_off(self) -> None:
         with warnings.catch_warnings(record=True) as w:
             con = self._get_mock_connection(
@@ -437,6 +459,14 @@ class TestRequestsHttpConnection(TestCase):
         _, _, data = con.perform_request("GET", "/")
         self.assertEqual("你好\uda6a", data)  # fmt: skip
 
+    def test_response_as_bytes_returns_raw_body(self) -> None:
+        buf = b"\xe4\xbd\xa0\xe5\xa5\xbd\xed\xa9\xaa"
+        con = self._get_mock_connection(
+            connection_params={"response_as_bytes": True}, response_body=buf
+        )
+        _, _, data = con.perform_request("GET", "/")
+        self.assertIs(buf, data)
+
     def test_recursion_error_reraised(self) -> None:
         conn = RequestsHttpConnection()
 
@@ -25,11 +25,14 @@
 #  under the License.
 
 
+import io
+import logging
 import ssl
 import uuid
 import warnings
+import zlib
 from gzip import GzipFile
-from io import BytesIO
+from io import BytesIO, StringIO
 from platform import python_version
 from typing import Any
 from unittest.mock import MagicMock, Mock, patch
@@ -126,6 +129,91 @@ class TestUrllib3HttpConnection(TestCase):
         self.assertEqual(kwargs["headers"]["accept-encoding"], "gzip,deflate")
         self.assertNotIn("content-encoding", kwargs["headers"])
 
+    def test_http_compression_threshold(self) -> None:
+        con = self._get_mock_connection(
+            {"http_compress": "deflate", "compression_threshold": 10}
+        )
+        con.perform_request("POST", "/", body=b"{}")
+
+        (_, _, req_body), kwargs = con.pool.urlopen.call_args
+        self.assertEqual(b"{}", req_body)
+        self.assertNotIn("content-encoding", kwargs["headers"])
+
+        con.perform_request("POST", "/", body=b'{"query":{}}')
+
+        (_, _, req_body), kwargs = con.pool.urlopen.call_args
+        self.assertEqual(b'{"query":{}}', zlib.decompress(req_body))
+        self.assertEqual("deflate", kwargs["headers"]["content-encoding"])
+
+    def test_stream_body_is_sent_chunked(self) -> None:
+        con = self._get_mock_connection()
+        con.perform_request("POST", "/_bulk", body=iter([b'{"index":{}}\n', "{}\n"]))
+
+        (_, _, req_body), kwargs = con.pool.urlopen.call_args
+        self.assertTrue(kwargs["chunked"])
+        self.assertEqual(b'{"index":{}}\n{}\n', b"".join(req_body))
+
+        con.perform_request("POST", "/_bulk", body=BytesIO(b"{}\n"))
+
+        (_, _, req_body), kwargs = con.pool.urlopen.call_args
+        self.assertTrue(kwargs["chunked"])
+        self.assertEqual(b"{}\n", b"".join(req_body))
+
+    def test_stream_body_is_compressed(self) -> None:
+        con = self._get_mock_connection({"http_compress": True})
+        con.perform_request("POST", "/_bulk", body=iter([b"{}\n"] * 3))
+
+        (_, _, req_body), kwargs = con.pool.urlopen.call_args
+        buf = GzipFile(fileobj=BytesIO(b"".join(req_body)), mode="rb")
+        self.assertEqual(b"{}\n" * 3, buf.read())
+        self.assertEqual(kwargs["headers"]["content-encoding"], "gzip")
+
+    def test_stream_response(self) -> None:
+        con = Urllib3HttpConnection()
+        body = BytesIO(b'{"hits":{"hits":[]}}')
+        response = urllib3.HTTPResponse(body=body, status=200, preload_content=False)
+        con.pool.urlopen = Mock(return_value=response)
+
+        status, _, chunks = con.perform_request("POST", "/_search", stream=True)
+        self.assertFalse(con.pool.urlopen.call_args[1]["preload_content"])
+        self.assertEqual(200, status)
+        self.assertEqual(b'{"hits":{"hits":[]}}', b"".join(chunks))
+
+    def test_stream_response_closed_early(self) -> None:
+        con = Urllib3HttpConnection()
+        body = BytesIO(b"{}" * 100000)
+        response = urllib3.HTTPResponse(body=body, status=200, preload_content=False)
+        con.pool.urlopen = Mock(return_value=response)
+
+        _, _, chunks = con.perform_request("POST", "/_search", stream=True)
+        next(chunks)
+        chunks.close()
+        self.assertTrue(response.closed)
+
+    def test_streams_are_not_traced(self) -> None:
+        con: Any = Urllib3HttpConnection()
+        body = BytesIO(b'{"hits":{"hits":[]}}')
+        response = urllib3.HTTPResponse(body=body, status=200, preload_content=False)
+        con.pool.urlopen = Mock(return_value=response)
+
+        tracer = logging.getLogger("opensearchpy.trace")
+        stream = StringIO()
+        handler = logging.StreamHandler(stream)
+        tracer.addHandler(handler)
+        tracer.setLevel(logging.DEBUG)
+        try:
+            _, _, chunks = con.perform_request(
+                "POST", "/_bulk", body=iter([b"{}\n"]), stream=True
+            )
+        finally:
+            tracer.removeHandler(handler)
+            tracer.setLevel(logging.NOTSET)
+
+        self.assertEqual(b'{"hits":{"hits":[]}}', b"".join(chunks))
+        self.assertIn(
+            "curl -XPOST 'http://localhost:9200/_bulk?pretty'", stream.getvalue()
+        )
+
     def test_default_user_agent(self) -> None:
         con = Urllib3HttpConnection()
         self.assertEqual(
@@ -205,6 +293,24 @@ class TestUrllib3HttpConnection(TestCase):
         self.assertIn("X-Amz-Security-Token", headers)
         self.assertIn("X-Amz-Content-SHA256", headers)
 
+    @patch("urllib3.HTTPConnectionPool.urlopen")
+    def test_aws_signer_refuses_streamed_body(self, mock_open: Any) -> None:
+        from opensearchpy.helpers.signer import Urllib3AWSV4SignerAuth
+
+        auth = Urllib3AWSV4SignerAuth(self.mock_session(), "us-west-2")
+        with pytest.raises(ValueError) as e:
+            auth("POST", "http://localhost/_bulk", (c for c in [b"{}\n"]))
+        self.assertEqual(
+            "Streamed request bodies can't be signed, pass the body as bytes or str",
+            str(e.value),
+        )
+
+        con = Urllib3HttpConnection(http_auth=auth)
+        body: Any = io.BytesIO(b"{}\n")
+        with pytest.raises(ValueError):
+            con.perform_request("POST", "/_bulk", body=body)
+        self.assertEqual(mock_open.call_count, 0)
+
     def test_aws_signer_as_http_auth(self) -> None:
         region = "us-west-2"
 
@@ -387,6 +493,28 @@ class TestUrllib3HttpConnection(TestCase):
         _, _, data = con.perform_request("GET", "/")
         self.assertEqual("你好\uda6a", data)  # fmt: skip
 
+    def test_response_as_bytes_returns_raw_body(self) -> None:
+        buf = b"\xe4\xbd\xa0\xe5\xa5\xbd\xed\xa9\xaa"
+        con = self._get_mock_connection(
+            connection_params={"response_as_bytes": True}, response_body=buf
+        )
+        _, _, data = con.perform_request("GET", "/")
+        self.assertIs(buf, data)
+
+    @patch("opensearchpy.connection.base.logger")
+    def test_response_as_bytes_logged_as_text(self, logger: Any) -> None:
+        con = self._get_mock_connection(
+            connection_params={"response_as_bytes": True},
+            response_body=b'{"error":"missing"}',
+            response_code=404,
+        )
+        with pytest.raises(NotFoundError) as e:
+            con.perform_request("GET", "/invalid")
+        self.assertEqual(e.value.error, '{"error":"missing"}')
+
+        _, resp = logger.debug.call_args_list
+        self.assertEqual('< {"error":"missing"}', resp[0][0] % resp[0][1:])
+
     def test_recursion_error_reraised(self) -> None:
         conn = Urllib3HttpConnection()
 
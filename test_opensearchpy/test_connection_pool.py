@@ -26,12 +26,16 @@
 
 
 import time
+from functools import partial
 from typing import Any
 
 from opensearchpy.connection import Connection
 from opensearchpy.connection_pool import (
+    CircuitBreakerConnectionPool,
     ConnectionPool,
     DummyConnectionPool,
+    LeastLatencySelector,
+    LeastOutstandingSelector,
     RoundRobinSelector,
 )
 from opensearchpy.exceptions import ImproperlyConfigured
@@ -166,3 +170,208 @@ class TestConnectionPool(TestCase):
         self.assertEqual(3, pool.dead_count[42])
         pool.mark_live(42)
         self.assertNotIn(42, pool.dead_count)
+
+
+class TestConnectionPoolUpdate(TestCase):
+    def test_state_of_remaining_connections_is_kept(self) -> None:
+        pool = ConnectionPool([(x, {}) for x in range(4)], randomize_hosts=False)
+        selector = pool.selector
+        pool.mark_dead(1)
+        pool.mark_dead(2)
+
+        pool.update([(x, {"x": x}) for x in (1, 3, 4)])
+
+        self.assertIs(selector, pool.selector)
+        self.assertEqual(
+            {1: {"x": 1}, 3: {"x": 3}, 4: {"x": 4}}, selector.connection_opts
+        )
+        self.assertEqual([3, 4], pool.connections)
+        self.assertEqual((1, 3, 4), pool.orig_connections)
+        self.assertEqual({1: 1}, pool.dead_count)
+        self.assertEqual(1, pool.dead.qsize())
+        self.assertEqual(1, pool.dead.get()[1])
+
+    def test_removed_connections_are_drained(self) -> None:
+        pool: Any = ConnectionPool([(x, {}) for x in range(3)])
+        pool.request_started(0)
+
+        pool.update([(2, {}), (3, {})])
+
+        self.assertEqual([1], pool.drained())
+        self.assertEqual([], pool.drained())
+        pool.request_finished(0, 0.1)
+        self.assertEqual([0], pool.drained())
+
+    def test_pool_can_grow(self) -> None:
+        pool = ConnectionPool([(x, {}) for x in range(2)])
+        pool.update([(x, {}) for x in range(4)])
+        for x in range(4):
+            pool.mark_dead(x)
+
+        self.assertEqual(4, pool.dead.qsize())
+
+    def test_circuit_breaker_forgets_removed_connections(self) -> None:
+        pool = CircuitBreakerConnectionPool([(x, {}) for x in range(3)])
+        pool.mark_dead(0)
+        pool.mark_dead(1)
+
+        pool.update([(1, {}), (2, {})])
+        self.assertEqual({1: 1}, pool.failures)
+
+
+class TestLeastOutstandingSelector(TestCase):
+    def test_connection_with_fewer_requests_in_flight_is_selected(self) -> None:
+        pool: Any = ConnectionPool(
+            [(x, {}) for x in range(2)], selector_class=LeastOutstandingSelector
+        )
+        for _ in range(3):
+            pool.request_started(0)
+
+        self.assertEqual({1}, {pool.get_connection() for _ in range(20)})
+
+        for _ in range(3):
+            pool.request_finished(0, 0.1)
+        self.assertEqual({}, pool.inflight)
+
+    def test_load_is_spread_across_connections(self) -> None:
+        pool = ConnectionPool(
+            [(x, {}) for x in range(10)], selector_class=LeastOutstandingSelector
+        )
+        for _ in range(100):
+            pool.request_started(pool.get_connection())
+
+        self.assertLessEqual(max(pool.inflight.values()), 12)
+
+
+class TestLeastLatencySelector(TestCase):
+    def test_slow_connection_is_avoided(self) -> None:
+        pool: Any = ConnectionPool(
+            [(x, {}) for x in range(2)], selector_class=LeastLatencySelector
+        )
+        for connection, latency in ((0, 2.0), (1, 0.01)):
+            pool.request_started(connection)
+            pool.request_finished(connection, latency)
+
+        self.assertEqual({1}, {pool.get_connection() for _ in range(20)})
+
+    def test_unused_connections_are_tried_first(self) -> None:
+        pool: Any = ConnectionPool(
+            [(x, {}) for x in range(2)], selector_class=LeastLatencySelector
+        )
+        pool.request_started(0)
+        pool.request_finished(0, 0.01)
+
+        self.assertEqual(1, pool.get_connection())
+
+    def test_latency_is_a_moving_average(self) -> None:
+        selector_class: Any = partial(LeastLatencySelector, alpha=0.5)
+        pool: Any = ConnectionPool([(0, {})], selector_class=selector_class)
+        selector = pool.selector
+        for latency in (1.0, 3.0):
+            pool.request_started(0)
+            pool.request_finished(0, latency)
+
+        self.assertEqual(2.0, selector.latency[0][0])
+        self.assertAlmostEqual(2.0, selector.cost(0), places=3)
+
+        pool.request_started(0)
+        self.assertAlmostEqual(4.0, selector.cost(0), places=3)
+
+    def test_latency_of_idle_connections_decays(self) -> None:
+        selector_class: Any = partial(LeastLatencySelector, half_life=10)
+        pool: Any = ConnectionPool([(0, {})], selector_class=selector_class)
+        selector = pool.selector
+        selector.latency[0] = (4.0, time.monotonic() - 20)
+
+        self.assertAlmostEqual(1.0, selector.cost(0), places=2)
+
+    def test_removed_connections_are_forgotten(self) -> None:
+        pool: Any = ConnectionPool(
+            [(x, {}) for x in range(3)], selector_class=LeastLatencySelector
+        )
+        for connection in range(3):
+            pool.request_started(connection)
+            pool.request_finished(connection, 0.1)
+        pool.request_started(0)
+
+        pool.update([(2, {}), (3, {})])
+        self.assertEqual({0, 2}, set(pool.selector.latency))
+
+        pool.request_finished(0, 0.1)
+        self.assertEqual({2}, set(pool.selector.latency))
+        self.assertEqual({}, pool.inflight)
+
+    def test_invalid_options(self) -> None:
+        self.assertRaises(ImproperlyConfigured, LeastLatencySelector, {}, alpha=0)
+        self.assertRaises(ImproperlyConfigured, LeastLatencySelector, {}, half_life=0)
+
+
+class TestCircuitBreakerConnectionPool(TestCase):
+    def test_circuit_opens_after_consecutive_failures(self) -> None:
+        pool = CircuitBreakerConnectionPool(
+            [(x, {}) for x in range(3)], failure_threshold=3
+        )
+
+        pool.mark_dead(0)
+        pool.mark_dead(0)
+        self.assertEqual(3, len(pool.connections))
+
+        pool.mark_dead(0)
+        self.assertEqual(2, len(pool.connections))
+        self.assertEqual(1, pool.dead.qsize())
+
+    def test_success_resets_the_failures(self) -> None:
+        pool = CircuitBreakerConnectionPool(
+            [(x, {}) for x in range(3)], failure_threshold=2
+        )
+
+        pool.mark_dead(0)
+        pool.mark_live(0)
+        pool.mark_dead(0)
+        self.assertEqual(3, len(pool.connections))
+
+    def test_half_open_connection_takes_one_probe_at_a_time(self) -> None:
+        pool: Any = CircuitBreakerConnectionPool(
+            [(x, {}) for x in range(2)], failure_threshold=1, randomize_hosts=False
+        )
+        pool.mark_dead(0, now=time.time() - 61)
+        pool.resurrect()
+        self.assertEqual({0: 0}, pool.half_open)
+
+        pool.request_started(0)
+        self.assertEqual({1}, {pool.get_connection() for _ in range(10)})
+
+        pool.request_finished(0, 0.1)
+        self.assertEqual({0, 1}, {pool.get_connection() for _ in range(10)})
+
+    def test_successful_probe_closes_the_circuit(self) -> None:
+        pool = CircuitBreakerConnectionPool(
+            [(x, {}) for x in range(2)], failure_threshold=1
+        )
+        pool.mark_dead(0, now=time.time() - 61)
+        pool.resurrect()
+
+        pool.mark_live(0)
+        self.assertEqual({}, pool.half_open)
+        self.assertNotIn(0, pool.dead_count)
+        self.assertIn(0, pool.connections)
+
+    def test_failed_probe_opens_the_circuit_again(self) -> None:
+        pool = CircuitBreakerConnectionPool(
+            [(x, {}) for x in range(2)], failure_threshold=1
+        )
+        pool.mark_dead(0, now=time.time() - 61)
+        pool.resurrect()
+
+        pool.mark_dead(0)
+        self.assertEqual({}, pool.half_open)
+        self.assertEqual(2, pool.dead_count[0])
+        self.assertNotIn(0, pool.connections)
+
+    def test_invalid_failure_threshold(self) -> None:
+        self.assertRaises(
+            ImproperlyConfigured,
+            CircuitBreakerConnectionPool,
+            [(0, {})],
+            failure_threshold=0,
+        )
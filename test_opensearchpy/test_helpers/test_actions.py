@@ -25,16 +25,18 @@
 #  under the License.
 
 
+import json
 import threading
 import time
+from functools import partial
 from typing import Any
 from unittest import mock
 from unittest.mock import Mock
 
 import pytest
 
-from opensearchpy import OpenSearch, helpers
-from opensearchpy.serializer import JSONSerializer
+from opensearchpy import Connection, OpenSearch, TransportError, helpers
+from opensearchpy.serializer import FastJSONSerializer, JSONSerializer
 
 from ..test_cases import TestCase
 
@@ -85,7 +87,8 @@ class TestParallelBulk(TestCase):
 
         self.assertEqual(50, _bulk.call_count)
         _bulk.assert_called_with(
-            body='{"index":{}}\n{"x":98}\n{"index":{}}\n{"x":99}\n', request_timeout=160
+            body=b'{"index":{}}\n{"x":98}\n{"index":{}}\n{"x":99}\n',
+            request_timeout=160,
         )
 
     @mock.patch("opensearchpy.helpers.actions._process_bulk_chunk")
@@ -110,11 +113,12 @@ class TestParallelBulk(TestCase):
         self.assertEqual(50, _process_bulk_chunk.call_count)
         _process_bulk_chunk.assert_called_with(
             client,
-            ['{"index":{}}', '{"x":98}', '{"index":{}}', '{"x":99}'],
+            b'{"index":{}}\n{"x":98}\n{"index":{}}\n{"x":99}\n',
             [({"index": {}}, {"x": 98}), ({"index": {}}, {"x": 99})],
             True,
             True,
             123,
+            adaptive_chunk_size=None,
             request_timeout=160,
         )
 
@@ -134,6 +138,202 @@ class TestParallelBulk(TestCase):
         self.assertTrue(len({r[1] for r in results}) > 1)
 
 
+class BulkConnection(Connection):
+    """
+    Answers bulk requests without a server, documents with a ``fail`` field
+    are rejected.
+    """
+
+    def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+        lines = args[3].splitlines()
+        items = [
+            {
+                "index": {
+                    "_id": str(json.loads(action)["index"]["_id"]),
+                    "status": 400 if "fail" in json.loads(source) else 201,
+                }
+            }
+            for action, source in zip(lines[::2], lines[1::2])
+        ]
+        return 200, {}, json.dumps({"errors": False, "items": items})
+
+
+class TestProcessParallelBulk(TestCase):
+    client_factory = partial(OpenSearch, connection_class=BulkConnection)
+
+    def test_all_chunks_sent(self) -> None:
+        actions = ({"_id": i, "x": i} for i in range(100))
+        results = list(
+            helpers.process_parallel_bulk(
+                self.client_factory, actions, process_count=2, chunk_size=7
+            )
+        )
+
+        self.assertEqual(100, len(results))
+        self.assertTrue(all(ok for ok, _ in results))
+        self.assertEqual(
+            {str(i) for i in range(100)}, {item["index"]["_id"] for _, item in results}
+        )
+
+    def test_chunks_are_chopped_by_byte_size(self) -> None:
+        actions = ({"_id": i, "x": i} for i in range(10))
+        results = list(
+            helpers.process_parallel_bulk(
+                self.client_factory,
+                actions,
+                process_count=1,
+                chunk_size=5,
+                max_chunk_bytes=1,
+            )
+        )
+
+        self.assertEqual(10, len(results))
+
+    def test_errors_are_reported(self) -> None:
+        actions = [{"_id": 1, "x": 1}, {"_id": 2, "fail": True}]
+        results = list(
+            helpers.process_parallel_bulk(
+                self.client_factory, actions, process_count=1, raise_on_error=False
+            )
+        )
+
+        self.assertEqual([True, False], [ok for ok, _ in results])
+        self.assertEqual(400, results[1][1]["index"]["status"])
+
+    def test_errors_are_raised(self) -> None:
+        actions = [{"_id": 1, "x": 1}, {"_id": 2, "fail": True}]
+        with pytest.raises(helpers.BulkIndexError) as e:
+            list(
+                helpers.process_parallel_bulk(
+                    self.client_factory, actions, process_count=1
+                )
+            )
+
+        self.assertEqual("2", e.value.errors[0]["index"]["_id"])
+
+
+class TestStreamingBulk(TestCase):
+    @mock.patch("opensearchpy.OpenSearch.bulk")
+    def test_rejected_documents_are_retried_as_bytes(self, _bulk: Any) -> None:
+        _bulk.side_effect = [
+            {
+                "items": [
+                    {"index": {"_id": "1", "status": 201}},
+                    {"index": {"_id": "2", "status": 429}},
+                ]
+            },
+            {"items": [{"index": {"_id": "2", "status": 201}}]},
+        ]
+        results = list(
+            helpers.streaming_bulk(
+                OpenSearch(),
+                [{"_id": 1, "x": 1}, {"_id": 2, "x": 2}],
+                raise_on_error=False,
+                max_retries=1,
+                initial_backoff=0,
+            )
+        )
+
+        self.assertEqual([True, True], [ok for ok, _ in results])
+        self.assertEqual(2, _bulk.call_count)
+        _bulk.assert_called_with(body=b'{"index":{"_id":2}}\n{"x":2}\n')
+
+
+class TestAdaptiveChunkSize(TestCase):
+    def test_fast_full_chunks_grow_additively(self) -> None:
+        chunk_size = helpers.AdaptiveChunkSize(initial_size=100, increase_by=10)
+        chunk_size.record(100, 0.1, took=50)
+        chunk_size.record(110, 0.1, took=50)
+
+        self.assertEqual(120, chunk_size.chunk_size)
+        self.assertEqual(2, chunk_size.stats["increases"])
+
+    def test_partial_chunks_dont_grow(self) -> None:
+        chunk_size = helpers.AdaptiveChunkSize(initial_size=100)
+        chunk_size.record(30, 0.1, took=50)
+
+        self.assertEqual(100, chunk_size.chunk_size)
+
+    def test_slow_chunks_shrink_multiplicatively(self) -> None:
+        chunk_size = helpers.AdaptiveChunkSize(initial_size=100, min_size=30)
+        chunk_size.record(100, 0.5, took=2000)
+        self.assertEqual(50, chunk_size.chunk_size)
+        chunk_size.record(50, 0.5, took=2000)
+        self.assertEqual(30, chunk_size.chunk_size)
+
+    def test_took_is_preferred_over_round_trip(self) -> None:
+        chunk_size = helpers.AdaptiveChunkSize(initial_size=100, target_latency=1.0)
+        chunk_size.record(100, 5.0, took=100)
+        self.assertEqual(110, chunk_size.chunk_size)
+        chunk_size.record(110, 5.0)
+        self.assertEqual(55, chunk_size.chunk_size)
+
+    def test_rejections_shrink(self) -> None:
+        chunk_size = helpers.AdaptiveChunkSize(initial_size=100, max_size=100)
+        chunk_size.record(100, 0.1, took=10, rejected=1)
+
+        self.assertEqual(50, chunk_size.chunk_size)
+        self.assertEqual(
+            {
+                "chunk_size": 50,
+                "chunks": 1,
+                "actions": 100,
+                "rejected": 1,
+                "increases": 0,
+                "decreases": 1,
+                "avg_latency": 0.1,
+                "avg_took": 10.0,
+            },
+            chunk_size.stats,
+        )
+
+    def test_invalid_bounds(self) -> None:
+        with pytest.raises(ValueError):
+            helpers.AdaptiveChunkSize(initial_size=10, min_size=50)
+        with pytest.raises(ValueError):
+            helpers.AdaptiveChunkSize(decrease_factor=1)
+
+    def test_invalid_chunk_size(self) -> None:
+        with pytest.raises(ValueError):
+            list(helpers.streaming_bulk(OpenSearch(), [{"x": 1}], chunk_size="big"))
+
+    @mock.patch("opensearchpy.OpenSearch.bulk")
+    def test_streaming_bulk_adapts_chunk_size(self, _bulk: Any) -> None:
+        def bulk(body: bytes, **kwargs: Any) -> Any:
+            count = body.count(b"\n") // 2
+            # the cluster slows down once chunks get larger than 30 documents
+            took = 100 if count <= 30 else 3000
+            items = [{"index": {"status": 201}} for _ in range(count)]
+            return {"took": took, "items": items}
+
+        _bulk.side_effect = bulk
+        chunk_size = helpers.AdaptiveChunkSize(
+            initial_size=20, min_size=10, increase_by=10
+        )
+        actions = ({"x": i} for i in range(200))
+        results = list(helpers.streaming_bulk(OpenSearch(), actions, chunk_size))
+
+        self.assertEqual(200, len(results))
+        sizes = [c[1]["body"].count(b"\n") // 2 for c in _bulk.call_args_list]
+        self.assertEqual([20, 30, 40, 20, 30, 40, 20], sizes)
+        self.assertEqual(7, chunk_size.stats["chunks"])
+        self.assertEqual(2, chunk_size.stats["decreases"])
+
+    @mock.patch("opensearchpy.OpenSearch.bulk")
+    def test_auto_chunk_size(self, _bulk: Any) -> None:
+        _bulk.side_effect = lambda body, **kwargs: {
+            "took": 1,
+            "items": [
+                {"index": {"status": 201}} for _ in range(body.count(b"\n") // 2)
+            ],
+        }
+        actions = ({"x": i} for i in range(1200))
+        list(helpers.streaming_bulk(OpenSearch(), actions, chunk_size="auto"))
+
+        sizes = [c[1]["body"].count(b"\n") // 2 for c in _bulk.call_args_list]
+        self.assertEqual([500, 550, 150], sizes)
+
+
 class TestChunkActions(TestCase):
     def setup_method(self, _: Any) -> None:
         """
@@ -266,9 +466,42 @@ class TestChunkActions(TestCase):
         )
         self.assertEqual(25, len(chunks))
         for _, chunk_actions in chunks:
-            chunk = "".join(chunk_actions)  # fmt: skip
-            chunk = chunk if isinstance(chunk, str) else chunk.encode("utf-8")
-            self.assertLessEqual(len(chunk), max_byte_size)
+            self.assertIsInstance(chunk_actions, bytes)
+            self.assertLessEqual(len(chunk_actions), max_byte_size)
+
+    def test_chunks_are_chopped_by_byte_size_with_bytes_serializer(self) -> None:
+        max_byte_size = 170
+        chunks = list(
+            helpers._chunk_actions(
+                self.actions, 100000, max_byte_size, FastJSONSerializer()
+            )
+        )
+        self.assertEqual(25, len(chunks))
+        for _, chunk_actions in chunks:
+            self.assertLessEqual(len(chunk_actions), max_byte_size)
+
+    def test_chunk_body_is_newline_delimited_bytes(self) -> None:
+        chunks = list(
+            helpers._chunk_actions(
+                map(
+                    helpers.expand_action,
+                    [{"_id": 1, "x": "é"}, {"_op_type": "delete", "_id": 2}],
+                ),
+                100,
+                99999999,
+                JSONSerializer(),
+            )
+        )
+        self.assertEqual(1, len(chunks))
+        bulk_data, body = chunks[0]
+        self.assertEqual(
+            [({"index": {"_id": 1}}, {"x": "é"}), ({"delete": {"_id": 2}},)],
+            bulk_data,
+        )
+        self.assertEqual(
+            '{"index":{"_id":1}}\n{"x":"é"}\n{"delete":{"_id":2}}\n'.encode("utf-8"),
+            body,
+        )
 
 
 class TestExpandActions(TestCase):
@@ -299,3 +532,305 @@ class TestScanFunction(TestCase):
         # The test should pass without raising a KeyError
         scan_result = list(helpers.scan(client, query={"query": {"match_all": {}}}))
         assert scan_result == [], "Expected empty results when 'hits' key is missing"
+
+
+class SlicedScrollClient(OpenSearch):
+    """
+    Serves sliced scrolls without a server, every slice holds ``per_slice``
+    documents.
+    """
+
+    def __init__(self, per_slice: int = 25, fail_slice: Any = None) -> None:
+        super().__init__()
+        self.per_slice = per_slice
+        self.fail_slice = fail_slice
+        self.lock = threading.Lock()
+        self.searches: Any = []
+        self.cleared: Any = []
+
+    def page(self, slice_id: int, offset: int, size: int) -> Any:
+        if slice_id == self.fail_slice and offset:
+            raise TransportError(500, "boom")
+        hits = [
+            {"_id": f"{slice_id}-{i}"}
+            for i in range(offset, min(offset + size, self.per_slice))
+        ]
+        return {
+            "_scroll_id": f"{slice_id}:{offset + size}:{size}",
+            "_shards": {"successful": 1, "total": 1},
+            "hits": {"total": {"value": self.per_slice}, "hits": hits},
+        }
+
+    def search(self, body: Any = None, size: Any = None, **kwargs: Any) -> Any:
+        with self.lock:
+            self.searches.append(body)
+        return self.page(body.get("slice", {}).get("id", 0), 0, size)
+
+    def scroll(self, body: Any = None, **kwargs: Any) -> Any:
+        slice_id, offset, size = map(int, body["scroll_id"].split(":"))
+        return self.page(slice_id, offset, size)
+
+    def clear_scroll(self, body: Any = None, **kwargs: Any) -> Any:
+        with self.lock:
+            self.cleared.extend(body["scroll_id"])
+
+
+class TestScanPrefetch(TestCase):
+    def test_all_pages_are_yielded(self) -> None:
+        client = SlicedScrollClient()
+        hits = list(helpers.scan(client, size=10, prefetch=2))
+
+        self.assertEqual([f"0-{i}" for i in range(25)], [h["_id"] for h in hits])
+        self.assertEqual(1, len(client.cleared))
+
+    def test_pages_are_fetched_ahead_of_the_consumer(self) -> None:
+        client = SlicedScrollClient(per_slice=1000)
+        client.scroll = mock.Mock(wraps=client.scroll)  # type: ignore
+        hits = helpers.scan(client, size=10, prefetch=3)
+        next(hits)
+
+        # the initial search and 3 buffered pages, plus the one waiting for room
+        deadline = time.time() + 5
+        while client.scroll.call_count < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.05)
+        self.assertEqual(4, client.scroll.call_count)
+
+        hits.close()
+        self.assertEqual(1, len(client.cleared))
+
+    def test_errors_are_raised(self) -> None:
+        client = SlicedScrollClient(per_slice=1000, fail_slice=0)
+        with pytest.raises(TransportError):
+            list(helpers.scan(client, size=10, prefetch=2))
+
+        self.assertEqual(1, len(client.cleared))
+
+
+class StreamingScrollClient(SlicedScrollClient):
+    """Serves the pages of ``SlicedScrollClient`` as streamed responses."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.transport.perform_request = self.perform_request  # type: ignore
+
+    def perform_request(
+        self, method: str, url: str, body: Any = None, **kwargs: Any
+    ) -> Any:
+        assert kwargs["stream"]
+        if url == "/_search/scroll":
+            resp = self.scroll(body=body)
+        else:
+            resp = self.search(body=body, size=int(kwargs["params"]["size"]))
+        data = json.dumps(resp).encode()
+        return (data[i : i + 10] for i in range(0, len(data), 10))
+
+
+class TestScanStream(TestCase):
+    def test_all_pages_are_streamed(self) -> None:
+        client = StreamingScrollClient()
+        hits = list(helpers.scan(client, size=10, stream=True))
+
+        self.assertEqual([f"0-{i}" for i in range(25)], [h["_id"] for h in hits])
+        self.assertEqual(["0:40:10"], client.cleared)
+
+    def test_scroll_is_cleared_when_closed_early(self) -> None:
+        client = StreamingScrollClient()
+        hits = helpers.scan(client, size=10, stream=True)
+        next(hits)
+        hits.close()
+
+        self.assertEqual(["0:10:10"], client.cleared)
+
+    def test_stream_and_prefetch_are_exclusive(self) -> None:
+        with pytest.raises(ValueError):
+            next(helpers.scan(StreamingScrollClient(), stream=True, prefetch=2))
+
+
+class TestParallelScan(TestCase):
+    def test_all_slices_are_scanned(self) -> None:
+        client = SlicedScrollClient()
+        hits = list(
+            helpers.parallel_scan(
+                client, {"query": {"match_all": {}}}, slices=4, size=10
+            )
+        )
+
+        self.assertEqual(
+            {f"{s}-{i}" for s in range(4) for i in range(25)},
+            {hit["_id"] for hit in hits},
+        )
+        self.assertEqual(100, len(hits))
+        self.assertEqual(
+            [{"id": s, "max": 4} for s in range(4)],
+            sorted((body["slice"] for body in client.searches), key=str),
+        )
+        self.assertTrue(all(body["sort"] == "_doc" for body in client.searches))
+        self.assertEqual(4, len(client.cleared))
+
+    def test_single_slice_is_not_sliced(self) -> None:
+        client = SlicedScrollClient()
+        hits = list(helpers.parallel_scan(client, slices=1, size=10))
+
+        self.assertEqual(25, len(hits))
+        self.assertNotIn("slice", client.searches[0])
+
+    def test_progress_is_reported_per_slice(self) -> None:
+        progress = []
+        list(
+            helpers.parallel_scan(
+                SlicedScrollClient(),
+                slices=2,
+                size=10,
+                progress=lambda *args: progress.append(args),
+            )
+        )
+
+        for slice_id in range(2):
+            self.assertEqual(
+                [(slice_id, 10, 25), (slice_id, 20, 25), (slice_id, 25, 25)],
+                [p for p in progress if p[0] == slice_id],
+            )
+
+    def test_errors_are_raised_and_scrolls_cleared(self) -> None:
+        client = SlicedScrollClient(per_slice=1000, fail_slice=1)
+        with pytest.raises(TransportError):
+            list(helpers.parallel_scan(client, slices=3, size=10))
+
+        self.assertEqual(3, len(client.cleared))
+
+    def test_scrolls_are_cleared_when_closed_early(self) -> None:
+        client = SlicedScrollClient(per_slice=1000)
+        hits = helpers.parallel_scan(client, slices=3, size=10, queue_size=1)
+        next(hits)
+        hits.close()
+
+        self.assertEqual(3, len(client.cleared))
+
+
+class PitClient(OpenSearch):
+    """
+    Serves point in time searches without a server, documents are sorted by
+    their number.
+    """
+
+    def __init__(self, docs: int = 25) -> None:
+        super().__init__()
+        self.docs = docs
+        self.lock = threading.Lock()
+        self.pits: Any = []
+        self.searches: Any = []
+        self.deleted: Any = []
+
+    def create_pit(self, index: Any = None, **kwargs: Any) -> Any:
+        self.pits.append((index, kwargs))
+        return {"pit_id": f"pit-{len(self.pits)}"}
+
+    def search(self, body: Any = None, size: Any = None, **kwargs: Any) -> Any:
+        with self.lock:
+            self.searches.append(body)
+        start = body.get("search_after", [-1])[0] + 1
+        slice_ = body.get("slice", {"id": 0, "max": 1})
+        numbers = [
+            i for i in range(start, self.docs) if i % slice_["max"] == slice_["id"]
+        ][:size]
+        return {
+            "pit_id": body["pit"]["id"],
+            "_shards": {"successful": 1, "total": 1},
+            "hits": {
+                "total": {"value": self.docs},
+                "hits": [{"_id": str(i), "sort": [i]} for i in numbers],
+            },
+        }
+
+    def delete_pit(self, body: Any = None, **kwargs: Any) -> Any:
+        with self.lock:
+            self.deleted.extend(body["pit_id"])
+
+
+class TestPitScan(TestCase):
+    def test_all_pages_are_fetched_with_search_after(self) -> None:
+        for prefetch in (0, 1, 3):
+            client = PitClient()
+            hits = list(
+                helpers.pit_scan(
+                    client,
+                    {"query": {"match_all": {}}},
+                    index="movies",
+                    keep_alive="1m",
+                    size=10,
+                    prefetch=prefetch,
+                )
+            )
+
+            self.assertEqual([str(i) for i in range(25)], [h["_id"] for h in hits])
+            self.assertEqual([("movies", {"keep_alive": "1m"})], client.pits)
+            self.assertEqual(
+                [None, [9], [19]],
+                [body.get("search_after") for body in client.searches],
+            )
+            self.assertEqual(
+                {
+                    "query": {"match_all": {}},
+                    "sort": ["_shard_doc"],
+                    "pit": {"id": "pit-1", "keep_alive": "1m"},
+                },
+                client.searches[0],
+            )
+            self.assertEqual(["pit-1"], client.deleted)
+
+    def test_shard_doc_is_added_as_tiebreaker(self) -> None:
+        client = PitClient()
+        list(helpers.pit_scan(client, {"sort": {"year": "desc"}}, index="movies"))
+        list(
+            helpers.pit_scan(client, {"sort": [{"_shard_doc": "desc"}]}, index="movies")
+        )
+
+        self.assertEqual([{"year": "desc"}, "_shard_doc"], client.searches[0]["sort"])
+        self.assertEqual([{"_shard_doc": "desc"}], client.searches[1]["sort"])
+
+    def test_existing_pit_is_not_created_or_deleted(self) -> None:
+        client = PitClient()
+        hits = list(helpers.pit_scan(client, pit_id="mine", size=10))
+
+        self.assertEqual(25, len(hits))
+        self.assertEqual([], client.pits)
+        self.assertEqual([], client.deleted)
+
+    def test_pit_is_deleted_when_closed_early(self) -> None:
+        client = PitClient(docs=1000)
+        hits = helpers.pit_scan(client, index="movies", size=10, prefetch=2)
+        next(hits)
+        hits.close()
+
+        self.assertEqual(["pit-1"], client.deleted)
+
+    def test_shard_failures_raise(self) -> None:
+        client = PitClient()
+        client.search = mock.Mock(  # type: ignore
+            return_value={
+                "_shards": {"successful": 1, "total": 2},
+                "hits": {"hits": [{"_id": "1", "sort": [1]}]},
+            }
+        )
+        with pytest.raises(helpers.ScanError):
+            list(helpers.pit_scan(client, index="movies", size=1))
+
+        self.assertEqual(["pit-1"], client.deleted)
+
+    def test_parallel_scan_with_pit(self) -> None:
+        client = PitClient()
+        hits = list(
+            helpers.parallel_scan(client, index="movies", slices=3, size=5, pit=True)
+        )
+
+        self.assertEqual({str(i) for i in range(25)}, {h["_id"] for h in hits})
+        self.assertEqual([("movies", {"keep_alive": "5m"})], client.pits)
+        self.assertEqual(
+            [{"id": s, "max": 3} for s in range(3)],
+            sorted(
+                (b["slice"] for b in client.searches if "search_after" not in b),
+                key=str,
+            ),
+        )
+        self.assertEqual(["pit-1"], client.deleted)
@@ -0,0 +1,290 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import json
+import sys
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from typing import Any
+from unittest.mock import Mock, patch
+
+import pytest
+
+from opensearchpy import Date, Document, Integer, Keyword, Search
+from opensearchpy.exceptions import ImproperlyConfigured
+from opensearchpy.helpers import (
+    ColumnarBatches,
+    bulk_from_arrow,
+    bulk_from_dataframe,
+    scan_to_arrow,
+)
+from opensearchpy.serializer import JSONSerializer
+
+pa = pytest.importorskip("pyarrow")
+
+
+class Order(Document):
+    user = Keyword()
+    quantity = Integer()
+    created = Date()
+    tags = Keyword(multi=True)
+
+
+HITS: Any = [
+    {
+        "_id": "1",
+        "_score": 1.0,
+        "_source": {
+            "user": "ann",
+            "quantity": 3,
+            "created": "2024-05-01T10:00:00Z",
+            "tags": ["new"],
+        },
+    },
+    {
+        "_id": "2",
+        "_score": 0.5,
+        "_source": {"user": "bob", "created": 1714557600000},
+        "fields": {"tags": ["a", "b"]},
+    },
+    {"_id": "3", "_score": None, "_source": {"quantity": "7"}},
+]
+
+
+def test_columns_are_typed_after_the_mapping() -> None:
+    columnar = ColumnarBatches(meta=["_id", "_score"], mapping=Order)
+    (batch,) = columnar.batches(HITS)
+
+    assert (
+        pa.schema(
+            [
+                ("_id", pa.string()),
+                ("_score", pa.float64()),
+                ("user", pa.string()),
+                ("quantity", pa.int32()),
+                ("created", pa.timestamp("ms", tz="UTC")),
+                ("tags", pa.list_(pa.string())),
+            ]
+        )
+        == batch.schema
+    )
+    assert {
+        "_id": ["1", "2", "3"],
+        "_score": [1.0, 0.5, None],
+        "user": ["ann", "bob", None],
+        "quantity": [3, None, 7],
+        "created": [
+            datetime(2024, 5, 1, 10, tzinfo=timezone.utc),
+            datetime(2024, 5, 1, 10, tzinfo=timezone.utc),
+            None,
+        ],
+        "tags": [["new"], ["a", "b"], None],
+    } == batch.to_pydict()
+
+
+def test_batches_are_bounded() -> None:
+    columnar = ColumnarBatches(fields=["user"], batch_size=2)
+    batches = list(columnar.batches(HITS))
+
+    assert [2, 1] == [batch.num_rows for batch in batches]
+    assert ["ann", "bob", None] == columnar.table(batches).column("user").to_pylist()
+
+
+def test_columns_are_inferred_without_mapping() -> None:
+    columnar = ColumnarBatches(batch_size=1)
+    batches = list(columnar.batches(HITS))
+
+    # the columns of the first batch are kept
+    assert ["user", "quantity", "created", "tags"] == batches[2].schema.names
+    assert pa.int64() == batches[0].schema.field("quantity").type
+    assert {
+        "user": ["bob"],
+        "quantity": [None],
+        "created": [1714557600000],
+        "tags": [["a", "b"]],
+    } == batches[1].to_pydict()
+
+
+def test_types_inferred_by_different_batches_are_unified() -> None:
+    hits: Any = [{"_source": {"a": 1}}, {"_source": {"a": 2}}, {"_source": {"a": 2.5}}]
+    columnar = ColumnarBatches(batch_size=2)
+    batches = list(columnar.batches(hits))
+
+    assert [pa.int64(), pa.float64()] == [batch.schema.types[0] for batch in batches]
+    table = columnar.table(batches)
+    assert pa.float64() == table.schema.field("a").type
+    assert [1.0, 2.0, 2.5] == table.column("a").to_pylist()
+
+    hits = [{"_source": {"a": None}}, {"_source": {"a": "x"}}, {"_source": {}}]
+    columnar = ColumnarBatches(fields=["a"], batch_size=1)
+    batches = list(columnar.batches(hits))
+
+    # a batch without values keeps the type of the previous ones
+    assert [pa.null(), pa.string(), pa.string()] == [
+        batch.schema.types[0] for batch in batches
+    ]
+    assert [None, "x", None] == columnar.table(batches).column("a").to_pylist()
+    assert batches[1].schema == pa.Table.from_batches(batches[1:]).schema
+
+
+def test_dotted_fields_and_schema() -> None:
+    hits: Any = [{"_source": {"name": {"first": "Ann"}}}, {"_source": {"name": None}}]
+    schema = pa.schema([("name.first", pa.large_string())])
+    (batch,) = ColumnarBatches(schema=schema).batches(hits)
+
+    assert schema == batch.schema
+    assert ["Ann", None] == batch.column(0).to_pylist()
+
+
+def test_empty_table_has_the_columns() -> None:
+    columnar = ColumnarBatches(fields=["quantity"], mapping=Order)
+    table = columnar.table(columnar.batches([]))
+
+    assert 0 == table.num_rows
+    assert pa.int32() == table.schema.field("quantity").type
+
+
+def test_pyarrow_is_required() -> None:
+    with patch.dict(sys.modules, {"pyarrow": None}):
+        with pytest.raises(ImproperlyConfigured):
+            ColumnarBatches()
+
+
+def test_scan_to_arrow() -> None:
+    client = Mock()
+    with patch("opensearchpy.helpers.columnar.scan", return_value=iter(HITS)) as scan:
+        batches = list(
+            scan_to_arrow(client, index="orders", mapping=Order, batch_size=2, size=500)
+        )
+
+    scan.assert_called_once_with(client, query=None, index="orders", size=500)
+    assert [2, 1] == [batch.num_rows for batch in batches]
+
+
+def test_search_to_arrow(mock_client: Any) -> None:
+    s = Search(using="mock", index="test-index").source(["name"])
+    table = s.to_arrow(fields=["name.first", "lang"], meta=["_id"])
+
+    assert ["_id", "name.first", "lang"] == table.schema.names
+    assert ["opensearch", "42", "47", "53"] == table.column("_id").to_pylist()
+    assert [None, "Shay", "Honza", None] == table.column("name.first").to_pylist()
+    mock_client.search.assert_called_once_with(
+        index=["test-index"], body={"_source": ["name"]}
+    )
+
+
+def test_search_to_pandas_scans_the_documents_of_the_search(mock_client: Any) -> None:
+    pytest.importorskip("pandas")
+    s = Search(using="mock").doc_type(Order).params(size=2)
+    with patch("opensearchpy.helpers.search.scan", return_value=iter(HITS)) as scan:
+        df = s.to_pandas(scan=True)
+
+    scan.assert_called_once_with(mock_client, query={}, index=None, size=2)
+    assert ["user", "quantity", "created", "tags"] == list(df.columns)
+    assert [False, False, True] == df["user"].isna().tolist()
+    assert ["ann", "bob"] == df["user"].dropna().tolist()
+    assert [3, 7] == df["quantity"].dropna().astype(int).tolist()
+
+
+def bulk_client(bodies: Any) -> Any:
+    def bulk(body: Any, **kwargs: Any) -> Any:
+        bodies.append(body)
+        actions = body.splitlines()[::2]
+        return {"items": [{"index": {"status": 201}} for _ in actions]}
+
+    client = Mock()
+    client.transport.serializer = JSONSerializer()
+    client.bulk.side_effect = bulk
+    return client
+
+
+def test_bulk_from_arrow_converts_columns() -> None:
+    bodies: Any = []
+    table = pa.table(
+        {
+            "n": pa.array([1, None], pa.int8()),
+            "f": [1.5, float("nan")],
+            "inf": [float("inf"), 2.0],
+            "price": pa.array([Decimal("1.25"), None], pa.decimal128(5, 2)),
+            "at": pa.array([datetime(2024, 5, 1, 10, 0, 0, 500000), None]),
+            "utc": pa.array(
+                [datetime(2024, 5, 1, 12), datetime(2024, 5, 2)], pa.timestamp("s")
+            ).cast(pa.timestamp("s", tz="Europe/Paris")),
+            "day": [date(2024, 5, 1), None],
+            "tag": pa.array(["a", "b"]).dictionary_encode(),
+            "tags": [["x"], []],
+        }
+    )
+
+    assert (2, []) == bulk_from_arrow(bulk_client(bodies), table)
+    assert [
+        b'{"index":{}}',
+        b'{"n":1,"f":1.5,"inf":null,"price":1.25,"at":"2024-05-01T10:00:00.500000",'
+        b'"utc":"2024-05-01T12:00:00Z","day":"2024-05-01","tag":"a","tags":["x"]}',
+        b'{"index":{}}',
+        b'{"n":null,"f":null,"inf":2.0,"price":null,"at":null,'
+        b'"utc":"2024-05-02T00:00:00Z","day":null,"tag":"b","tags":[]}',
+    ] == bodies[0].splitlines()
+
+
+def test_bulk_from_arrow_metadata_columns() -> None:
+    bodies: Any = []
+    batch = pa.record_batch(
+        {
+            "_id": ["1", None, "3", "4"],
+            "_routing": ["r", None, None, None],
+            "_op_type": [None, "create", "update", "delete"],
+            "name": ["a", "b", "c", None],
+        }
+    )
+
+    bulk_from_arrow(bulk_client(bodies), batch, index="people", chunk_size=2)
+
+    client_lines = b"".join(bodies).splitlines()
+    assert [
+        b'{"index":{"_id":"1","routing":"r"}}',
+        b'{"name":"a"}',
+        b'{"create":{}}',
+        b'{"name":"b"}',
+        b'{"update":{"_id":"3"}}',
+        b'{"doc":{"name":"c"}}',
+        b'{"delete":{"_id":"4"}}',
+    ] == client_lines
+    assert 2 == len(bodies)
+
+
+def test_bulk_from_dataframe_in_batches() -> None:
+    pd = pytest.importorskip("pandas")
+    bodies: Any = []
+    df = pd.DataFrame(
+        {
+            "user": ["ann", None, "bob"],
+            "quantity": [1.0, float("nan"), 3.0],
+            "created": pd.to_datetime(["2024-05-01", None, "2024-05-03"]),
+        },
+        index=["x", "y", "z"],
+    )
+
+    success, _ = bulk_from_dataframe(
+        bulk_client(bodies), df.reset_index(names="_id"), batch_size=2
+    )
+
+    assert 3 == success
+    lines = [json.loads(line) for line in bodies[0].splitlines()]
+    # the precision of the timestamps depends on the version of pandas
+    for line in lines[1::2]:
+        line["created"] = line["created"] and line["created"][:19]
+    assert [
+        {"index": {"_id": "x"}},
+        {"user": "ann", "quantity": 1.0, "created": "2024-05-01T00:00:00"},
+        {"index": {"_id": "y"}},
+        {"user": None, "quantity": None, "created": None},
+        {"index": {"_id": "z"}},
+        {"user": "bob", "quantity": 3.0, "created": "2024-05-03T00:00:00"},
+    ] == lines
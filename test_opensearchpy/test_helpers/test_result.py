@@ -132,6 +132,39 @@ def test_iterating_over_response_gives_you_hits(dummy_response: Any) -> None:
     assert hits[1].meta.routing == "opensearch"
 
 
+def test_hits_are_only_built_once_accessed(dummy_response: Any) -> None:
+    built = []
+
+    class CountingSearch(Search):
+        def _get_result(self, hit: Any, parent_class: Any = None) -> Any:
+            built.append(hit["_id"])
+            return super()._get_result(hit, parent_class)
+
+    res = response.Response(CountingSearch(), dummy_response)
+    assert 4 == len(res.hits)
+    assert 123 == res.hits.total
+    assert [] == built
+
+    assert res.hits[1] is res.hits[1]
+    assert res.hits[-1] is res.hits[3]
+    assert ["42", "53"] == built
+
+    assert 4 == len(list(res))
+    assert ["42", "53", "opensearch", "47"] == built
+
+
+def test_hit_meta_is_built_once_accessed(dummy_response: Any) -> None:
+    h = response.Response(Search(), dummy_response).hits[0]
+
+    assert not hasattr(h, "__dict__")
+    assert h._meta is None
+    assert h.meta is h.meta
+    assert "opensearch" == h.meta.id
+
+    h.meta = response.HitMeta({"_id": "42"})
+    assert "42" == h.meta.id
+
+
 def test_hits_get_wrapped_to_contain_additional_attrs(dummy_response: Any) -> None:
     res = response.Response(Search(), dummy_response)
     hits = res.hits
@@ -24,6 +24,7 @@
 #  specific language governing permissions and limitations
 #  under the License.
 
+import json
 from copy import deepcopy
 from typing import Any
 
@@ -57,6 +58,16 @@ def test_cache_can_be_ignored(mock_client: Any) -> None:
     mock_client.search.assert_called_once_with(index=None, body={})
 
 
+def test_execute_raw_returns_the_response_body(
+    mock_client: Any, dummy_response: Any
+) -> None:
+    s: Any = search.Search(using="mock")
+
+    assert dummy_response is s.execute(raw=True)
+    assert dummy_response is s.execute().to_dict()
+    mock_client.search.assert_called_once_with(index=None, body={})
+
+
 def test_iter_iterates_over_hits() -> None:
     s: Any = search.Search()
     s._response = [1, 2, 3]
@@ -159,6 +170,46 @@ def test_copy_clones() -> None:
     assert s1 is not s2
 
 
+def test_clone_shares_state_until_changed() -> None:
+    s1: Any = search.Search().sort("title").extra(size=5)
+    s1.aggs.bucket("tags", "terms", field="tags")
+    s2: Any = s1._clone()
+
+    assert s1.__dict__["_sort"] is s2.__dict__["_sort"]
+    assert s1.__dict__["_extra"] is s2.__dict__["_extra"]
+
+    s2._extra["from"] = 10
+    s2._sort.append("-date")
+    s2.aggs.bucket("authors", "terms", field="author")
+    s1.aggs.bucket("years", "terms", field="year")
+
+    assert {"size": 5} == s1._extra
+    assert ["title"] == s1._sort
+    assert ["tags", "years"] == list(s1.aggs)
+    assert ["tags", "authors"] == list(s2.aggs)
+    assert s1.__dict__["_highlight"] is s2.__dict__["_highlight"]
+    assert s2.query._search is s2
+    assert s2.aggs._search is s2
+
+
+def test_clone_copies_attributes_of_subclasses() -> None:
+    class TaggedSearch(search.Search):
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            self.tags: Any = []
+
+        def tag(self, name: str) -> Any:
+            s = self._clone()
+            s.tags.append(name)
+            return s
+
+    s1 = TaggedSearch().tag("a")
+    s2 = s1.tag("b")
+
+    assert ["a"] == s1.tags
+    assert ["a", "b"] == s2.tags
+
+
 def test_aggs_allow_two_metric() -> None:
     s: Any = search.Search()
 
@@ -638,3 +689,78 @@ def test_collapse_chaining() -> None:
         },
         "collapse": {"field": "category"},
     } == s.to_dict()
+
+
+def test_scan_with_pit(mock_client: Any) -> None:
+    mock_client.create_pit.return_value = {"pit_id": "pit-1"}
+    s = search.Search(using="mock", index="i").query("match", title="python")
+    hits = list(s.scan(pit=True))
+
+    assert 4 == len(hits)
+    mock_client.create_pit.assert_called_once_with(index=["i"], keep_alive="5m")
+    assert {
+        "query": {"match": {"title": "python"}},
+        "sort": ["_shard_doc"],
+        "pit": {"id": "pit-1", "keep_alive": "5m"},
+    } == mock_client.search.call_args[1]["body"]
+    mock_client.delete_pit.assert_called_once_with(
+        body={"pit_id": ["pit-1"]}, ignore=(404,)
+    )
+
+
+def test_compiled_search_renders_placeholders() -> None:
+    s = (
+        search.Search(index="orders")
+        .filter("term", user_id=search.Param("user_id"))
+        .filter("terms", tags=[search.Param("tag"), "sale"])
+        .query("match", title="café")
+        .extra(size=search.Param("size"))
+    )
+    compiled = s.compile()
+
+    assert {"user_id", "tag", "size"} == compiled.params
+    for values in (
+        {"user_id": 'a "quoted" id', "tag": "new", "size": 10},
+        {"user_id": 42, "tag": None, "size": 0},
+        {"user_id": ["a", "b"], "tag": {"nested": True}, "size": 1.5},
+    ):
+        expected = s.to_dict()
+        expected["query"]["bool"]["filter"][0]["term"]["user_id"] = values["user_id"]
+        expected["query"]["bool"]["filter"][1]["terms"]["tags"][0] = values["tag"]
+        expected["size"] = values["size"]
+        assert expected == json.loads(compiled.render(**values))
+
+
+def test_compiled_search_is_not_changed_by_the_search() -> None:
+    s = search.Search().filter("term", user_id=search.Param("user_id"))
+    compiled = s.compile()
+    s.query = Q("match_all")
+
+    assert b'{"query":{"bool":{"filter":[{"term":{"user_id":1}}]}}}' == (
+        compiled.render(user_id=1)
+    )
+
+
+def test_compiled_search_requires_all_placeholders() -> None:
+    compiled = search.Search().filter("term", user_id=search.Param("user_id")).compile()
+
+    with raises(ValueError):
+        compiled.render()
+    with raises(ValueError):
+        compiled.render(user_id=1, user=1)
+
+
+def test_compiled_search_execute(mock_client: Any) -> None:
+    s = (
+        search.Search(using="mock", index="i")
+        .params(routing="42")
+        .filter("term", user_id=search.Param("user_id"))
+    )
+    r = s.compile().execute(user_id="u1")
+
+    assert 4 == len(r.hits)
+    mock_client.search.assert_called_once_with(
+        index=["i"],
+        body=b'{"query":{"bool":{"filter":[{"term":{"user_id":"u1"}}]}}}',
+        routing="42",
+    )
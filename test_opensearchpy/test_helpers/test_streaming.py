@@ -0,0 +1,145 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+import json
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from opensearchpy import OpenSearch, SerializationError
+from opensearchpy.helpers import HitsParser, HitsStream, stream_scroll, stream_search
+
+RESPONSE = {
+    "_scroll_id": "abc",
+    "took": 3,
+    "timed_out": False,
+    "_shards": {"total": 1, "successful": 1, "skipped": 0, "failed": 0},
+    "hits": {
+        "total": {"value": 3, "relation": "eq"},
+        "max_score": 1.0,
+        "hits": [
+            {"_id": "1", "_source": {"title": 'say "hi" \\ {[', "n": [1, 2.5, None]}},
+            {"_id": "2", "_source": {"title": "café ☃ \U0001f600"}},
+            {"_id": "3", "_source": {}},
+        ],
+    },
+    "aggregations": {"hits": {"hits": [{"_id": "agg"}]}},
+}
+
+
+def feed(body: bytes, chunk_size: int) -> Any:
+    parser = HitsParser()
+    hits = []
+    for i in range(0, len(body), chunk_size):
+        hits.extend(parser.feed(body[i : i + chunk_size]))
+    parser.close()
+    return hits, parser.response
+
+
+class TestHitsParser:
+    @pytest.mark.parametrize("indent", [None, 2])
+    def test_hits_are_parsed_at_any_chunk_size(self, indent: Any) -> None:
+        body = json.dumps(RESPONSE, indent=indent, ensure_ascii=False).encode()
+        expected = dict(RESPONSE, hits=dict(RESPONSE["hits"], hits=[]))  # type: ignore
+        for chunk_size in range(1, 40):
+            hits, response = feed(body, chunk_size)
+            assert RESPONSE["hits"]["hits"] == hits  # type: ignore
+            assert expected == response
+
+    def test_response_without_hits(self) -> None:
+        hits, response = feed(b'{"count": 1, "hits": null}', 1)
+        assert [] == hits
+        assert {"count": 1, "hits": None} == response
+
+    def test_incomplete_response_raises(self) -> None:
+        parser = HitsParser()
+        assert [{"_id": "1"}] == parser.feed(b'{"hits": {"hits": [{"_id": "1"}, {')
+        with pytest.raises(SerializationError):
+            parser.close()
+
+    def test_invalid_response_raises(self) -> None:
+        with pytest.raises(SerializationError):
+            HitsParser().feed(b'["hits"]')
+
+
+class TestHitsStream:
+    def test_hits_are_read_as_they_are_consumed(self) -> None:
+        body = json.dumps(RESPONSE).encode()
+        end = body.index(b'{"_id": "2"')
+        chunks = iter([body[:end], body[end:]])
+        hits = HitsStream(chunks)
+
+        assert "1" == next(hits)["_id"]
+        assert [body[end:]] == list(chunks)
+        assert 1 == hits.count
+
+    def test_close_closes_the_chunks(self) -> None:
+        chunks = Mock()
+        with HitsStream(chunks):
+            pass
+        chunks.close.assert_called_once_with()
+
+
+class TestStreamSearch:
+    def test_request_is_sent_with_stream(self) -> None:
+        client = OpenSearch()
+        client.transport.perform_request = Mock(  # type: ignore
+            return_value=iter([json.dumps(RESPONSE).encode()])
+        )
+
+        hits = stream_search(
+            client, body={"query": {}}, index="movies", from_=10, size=5
+        )
+        assert ["1", "2", "3"] == [hit["_id"] for hit in hits]
+        assert "abc" == hits.response["_scroll_id"]
+        client.transport.perform_request.assert_called_once_with(
+            "POST",
+            "/movies/_search",
+            params={"size": "5", "from": "10"},
+            headers={},
+            body={"query": {}},
+            stream=True,
+        )
+
+    def test_scroll_id_is_sent_in_the_body(self) -> None:
+        client = OpenSearch()
+        client.transport.perform_request = Mock(  # type: ignore
+            return_value=b'{"hits": {"hits": []}}'
+        )
+
+        assert [] == list(stream_scroll(client, "abc", scroll="1m"))
+        client.transport.perform_request.assert_called_once_with(
+            "POST",
+            "/_search/scroll",
+            params={"scroll": b"1m"},
+            headers={},
+            body={"scroll_id": "abc"},
+            stream=True,
+        )
+        with pytest.raises(ValueError):
+            stream_scroll(client)
+
+    def test_search_parameters_match_the_client(self) -> None:
+        client = OpenSearch()
+        client.transport.perform_request = Mock(  # type: ignore
+            return_value=b'{"hits": {"hits": []}}'
+        )
+
+        list(stream_search(client, verbose_pipeline=True, filter_path="hits"))
+        client.transport.perform_request.assert_called_once_with(
+            "POST",
+            "/_search",
+            params={"verbose_pipeline": b"true", "filter_path": b"hits"},
+            headers={},
+            body=None,
+            stream=True,
+        )
+        with pytest.raises(TypeError):
+            stream_search(client, no_such_parameter=1)
@@ -119,3 +119,29 @@ def test_attrdict_get() -> None:
     assert a.get("d", {}) == {}
     with raises(AttributeError):
         assert a.get("d")
+
+
+def test_copy_on_write_attributes_are_copied_once_used() -> None:
+    class Holder:
+        items = utils.CopyOnWrite()
+
+        def __init__(self) -> None:
+            self.items = []
+            self.tags = ["a"]
+            self.name = "holder"
+
+    h1 = Holder()
+    h2 = utils.shallow_clone(h1)
+    assert "holder" == h2.name
+    assert h1.__dict__["items"] is h2.__dict__["items"]
+    assert ["a"] == h2.tags
+    assert h1.tags is not h2.tags
+
+    h2.items.append(1)
+    h1.items.append(2)
+    assert [2] == h1.items
+    assert [1] == h2.items
+
+    items = h2.items
+    h2.items.append(3)
+    assert items is h2.items
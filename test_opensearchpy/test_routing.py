@@ -0,0 +1,203 @@
+# SPDX-License-Identifier: Apache-2.0
+#
+# The OpenSearch Contributors require contributions made to
+# this file be licensed under the Apache-2.0 license or a
+# compatible open source license.
+#
+# Modifications Copyright OpenSearch Contributors. See
+# GitHub history for details.
+
+from typing import Any
+
+import pytest
+
+from opensearchpy.routing import (
+    ShardRouter,
+    default_routing_num_shards,
+    murmur3_hash,
+    shard_id,
+)
+
+from .test_cases import TestCase
+
+NODES = {
+    "n1": {"host": "node1", "port": 9200},
+    "n2": {"host": "node2", "port": 9200},
+    "n3": {"host": "node3", "port": 9200},
+}
+
+
+def copy(node: Any, primary: bool, state: str = "STARTED") -> Any:
+    return {"node": node, "primary": primary, "state": state}
+
+
+CLUSTER_STATE = {
+    "metadata": {
+        "indices": {
+            "movies": {
+                "settings": {"index": {"number_of_shards": "2"}},
+                "routing_num_shards": 1024,
+            },
+            "partitioned": {
+                "settings": {
+                    "index": {"number_of_shards": "4", "routing_partition_size": "2"}
+                },
+                "routing_num_shards": 4,
+            },
+        }
+    },
+    "routing_table": {
+        "indices": {
+            "movies": {
+                "shards": {
+                    "0": [copy("n1", True), copy("n2", False)],
+                    "1": [copy("n2", True), copy("n3", False, "INITIALIZING")],
+                }
+            },
+            "partitioned": {"shards": {str(s): [copy("n3", True)] for s in range(4)}},
+        }
+    },
+}
+
+
+class TestMurmur3(TestCase):
+    def test_hash_of_utf16_code_units(self) -> None:
+        assert 0 == murmur3_hash("")
+        assert 0x5A0CB7C3 == murmur3_hash("hell")
+        assert 0xD7C31989 - (1 << 32) == murmur3_hash("hello")
+        assert 0xE07DB09C - (1 << 32) == murmur3_hash(
+            "The quick brown fox jumps over the lazy dog"
+        )
+
+    def test_hash_is_a_signed_int32(self) -> None:
+        for i in range(1000):
+            assert -(1 << 31) <= murmur3_hash(str(i)) < 1 << 31
+
+
+class TestShardId(TestCase):
+    def test_default_routing_num_shards(self) -> None:
+        assert 1024 == default_routing_num_shards(1)
+        assert 1024 == default_routing_num_shards(2)
+        assert 768 == default_routing_num_shards(3)
+        assert 640 == default_routing_num_shards(5)
+        assert 2048 == default_routing_num_shards(1024)
+        assert 4 == default_routing_num_shards(4, 2)
+
+    def test_single_shard(self) -> None:
+        assert {0} == {shard_id(1, str(i)) for i in range(100)}
+
+    def test_documents_are_spread_over_all_shards(self) -> None:
+        assert {0, 1, 2, 3, 4} == {shard_id(5, str(i)) for i in range(100)}
+
+    def test_routing_overrides_the_id(self) -> None:
+        assert [shard_id(5, None, "user1")] * 20 == [
+            shard_id(5, str(i), "user1") for i in range(20)
+        ]
+
+    def test_partitioned_routing_spreads_over_partition_size_shards(self) -> None:
+        shards = {shard_id(8, str(i), "user1", None, 3) for i in range(100)}
+        assert 3 == len(shards)
+
+    def test_partitioned_routing_requires_the_id(self) -> None:
+        with pytest.raises(ValueError):
+            shard_id(4, None, "user1", None, 2)
+
+    def test_id_or_routing_is_required(self) -> None:
+        with pytest.raises(ValueError):
+            shard_id(4)
+
+
+class TestShardRouter(TestCase):
+    def setup_method(self, _: Any) -> None:
+        self.router = ShardRouter()
+        self.router.update(CLUSTER_STATE, NODES)
+
+    def doc(self, shard: int) -> str:
+        return next(str(i) for i in range(100) if shard_id(2, str(i)) == shard)
+
+    def test_new_router_is_stale(self) -> None:
+        router = ShardRouter()
+        assert router.stale
+        assert [] == router.hosts("GET", "/movies/_doc/1", None, None)
+        assert not self.router.stale
+
+    def test_writes_go_to_the_primary(self) -> None:
+        assert [NODES["n1"]] == self.router.hosts(
+            "PUT", f"/movies/_doc/{self.doc(0)}", None, None
+        )
+        assert [NODES["n2"]] == self.router.hosts(
+            "POST", f"/movies/_update/{self.doc(1)}", None, None
+        )
+
+    def test_reads_go_to_any_started_copy(self) -> None:
+        hosts = self.router.hosts("GET", f"/movies/_doc/{self.doc(0)}", None, None)
+        assert sorted([NODES["n1"], NODES["n2"]], key=str) == sorted(hosts, key=str)
+        # the replica of shard 1 is still initializing
+        assert [NODES["n2"]] == self.router.hosts(
+            "HEAD", f"/movies/_source/{self.doc(1)}", None, None
+        )
+
+    def test_routing_parameter(self) -> None:
+        routing = next(r for r in "abcdef" if shard_id(2, None, r) == 0)
+        assert [NODES["n1"]] == self.router.hosts(
+            "DELETE", f"/movies/_doc/{self.doc(1)}", {"routing": routing}, None
+        )
+        assert [NODES["n1"]] == self.router.hosts(
+            "POST", "/movies/_bulk", {"routing": routing}, "..."
+        )
+
+    def test_mget_on_one_node(self) -> None:
+        body = {
+            "docs": [{"_id": self.doc(0)}, {"_index": "movies", "_id": self.doc(0)}]
+        }
+        hosts = self.router.hosts("POST", "/movies/_mget", None, body)
+        assert sorted([NODES["n1"], NODES["n2"]], key=str) == sorted(hosts, key=str)
+        assert [NODES["n2"]] == self.router.hosts(
+            "POST", "/_mget", None, {"docs": [{"_index": "movies", "_id": self.doc(1)}]}
+        )
+
+    def test_mget_over_several_nodes_is_not_routed(self) -> None:
+        # shard 0 is on n1 and n2, shard 1 only on n2
+        body: Any = {"ids": [self.doc(0), self.doc(1)]}
+        assert [NODES["n2"]] == self.router.hosts("POST", "/movies/_mget", None, body)
+        body = {"docs": [{"_index": "movies", "_id": "1"}, {"_index": "other"}]}
+        assert [] == self.router.hosts("POST", "/_mget", None, body)
+
+    def test_partitioned_index(self) -> None:
+        assert [NODES["n3"]] == self.router.hosts(
+            "GET", "/partitioned/_doc/1", {"routing": "user1"}, None
+        )
+        assert [] == self.router.hosts(
+            "POST", "/partitioned/_bulk", {"routing": "user1"}, "..."
+        )
+
+    def test_requests_that_cant_be_routed(self) -> None:
+        for method, url, params in (
+            ("POST", "/movies/_search", None),
+            ("POST", "/movies/_doc", None),
+            ("POST", "/movies/_bulk", None),
+            ("GET", "/unknown/_doc/1", None),
+            ("GET", "/_cluster/health", None),
+        ):
+            assert [] == self.router.hosts(method, url, params, None)
+
+    def test_ids_are_unquoted(self) -> None:
+        router = ShardRouter()
+        router.update(
+            {
+                "metadata": {
+                    "indices": {"a b": {"settings": {"index": {"number_of_shards": 2}}}}
+                },
+                "routing_table": {
+                    "indices": {
+                        "a b": {
+                            "shards": {
+                                str(shard_id(2, "x/y")): [copy("n1", True)],
+                            }
+                        }
+                    }
+                },
+            },
+            NODES,
+        )
+        assert [NODES["n1"]] == router.hosts("PUT", "/a%20b/_doc/x%2Fy", None, None)
@@ -25,11 +25,13 @@
 #  under the License.
 
 
+import pickle
 import sys
 import uuid
 from datetime import datetime
 from decimal import Decimal
 from typing import Any
+from unittest.mock import patch
 
 try:
     import numpy as np
@@ -40,7 +42,9 @@ except ImportError:
 from opensearchpy.exceptions import ImproperlyConfigured, SerializationError
 from opensearchpy.serializer import (
     DEFAULT_SERIALIZERS,
+    JSON_BACKENDS,
     Deserializer,
+    FastJSONSerializer,
     JSONSerializer,
     TextSerializer,
 )
@@ -191,6 +195,14 @@ class TestJSONSerializer(TestCase):
     def test_raises_serialization_error_on_dump_error(self) -> None:
         self.assertRaises(SerializationError, JSONSerializer().dumps, object())
 
+    def test_numpy_and_pandas_are_not_imported_by_default(self) -> None:
+        with patch.dict(sys.modules):
+            sys.modules.pop("numpy", None)
+            sys.modules.pop("pandas", None)
+            self.assertRaises(SerializationError, JSONSerializer().dumps, object())
+            self.assertNotIn("numpy", sys.modules)
+            self.assertNotIn("pandas", sys.modules)
+
     def test_raises_serialization_error_on_load_error(self) -> None:
         self.assertRaises(SerializationError, JSONSerializer().loads, object())
         self.assertRaises(SerializationError, JSONSerializer().loads, "")
@@ -200,6 +212,77 @@ class TestJSONSerializer(TestCase):
         self.assertEqual("你好", JSONSerializer().dumps("你好"))
 
 
+def installed_json_backends() -> Any:
+    for backend in JSON_BACKENDS:
+        try:
+            yield FastJSONSerializer(backend=backend)
+        except ImproperlyConfigured:
+            pass
+
+
+class TestFastJSONSerializer(TestCase):
+    def test_auto_picks_an_installed_backend(self) -> None:
+        self.assertIn(FastJSONSerializer().backend, JSON_BACKENDS)
+
+    def test_unknown_backend_raises_improperly_configured(self) -> None:
+        self.assertRaises(ImproperlyConfigured, FastJSONSerializer, backend="yaml")
+
+    def test_dumps_returns_bytes_matching_json_serializer(self) -> None:
+        data = {
+            "d": datetime(2010, 10, 1, 2, 30),
+            "u": uuid.UUID("00000000-0000-0000-0000-000000000003"),
+            "dec": Decimal("3.8"),
+            "text": "你好/",
+            "list": [1, 2.5, None, True],
+        }
+        expected = JSONSerializer().dumps(data).encode("utf-8")
+        for ser in installed_json_backends():
+            self.assertEqual(expected, ser.dumps(data), ser.backend)
+
+    def test_numpy_and_pandas_values_use_default(self) -> None:
+        requires_numpy_and_pandas()
+
+        data = {
+            "i": np.int64(-1),
+            "b": np.bool_(True),
+            "a": np.zeros((3,), dtype=np.uint8),
+            "t": pd.Timestamp("2010-10-01T02:30:00"),
+            "s": pd.Series(["a", "b"]),
+        }
+        for ser in installed_json_backends():
+            self.assertEqual(
+                b'{"i":-1,"b":true,"a":[0,0,0],"t":"2010-10-01T02:30:00","s":["a","b"]}',
+                ser.dumps(data),
+                ser.backend,
+            )
+
+    def test_big_integers_fall_back_to_stdlib(self) -> None:
+        for ser in installed_json_backends():
+            self.assertEqual(b'{"d":%d}' % 2**70, ser.dumps({"d": 2**70}))
+
+    def test_loads_accepts_str_and_bytes(self) -> None:
+        for ser in installed_json_backends():
+            self.assertEqual({"some": "datá"}, ser.loads('{"some":"datá"}'))
+            self.assertEqual(
+                {"some": "datá"}, ser.loads('{"some":"datá"}'.encode("utf-8"))
+            )
+
+    def test_strings_are_left_untouched(self) -> None:
+        self.assertEqual("你好", FastJSONSerializer().dumps("你好"))
+        self.assertEqual(b"{}", FastJSONSerializer().dumps(b"{}"))
+
+    def test_raises_serialization_error(self) -> None:
+        for ser in installed_json_backends():
+            self.assertRaises(SerializationError, ser.dumps, object())
+            self.assertRaises(SerializationError, ser.loads, "{{")
+
+    def test_can_be_pickled(self) -> None:
+        ser = FastJSONSerializer(backend="json")
+        clone = pickle.loads(pickle.dumps(ser))
+        self.assertEqual("json", clone.backend)
+        self.assertEqual(b'{"a":1}', clone.dumps({"a": 1}))
+
+
 class TestTextSerializer(TestCase):
     def test_strings_are_left_untouched(self) -> None:
         self.assertEqual("你好", TextSerializer().dumps("你好"))
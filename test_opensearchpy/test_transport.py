@@ -25,17 +25,38 @@
 #  under the License.
 
 
+import gc
+import io
 import json
+import threading
 import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from unittest.mock import patch
 
 from opensearchpy.connection import Connection
-from opensearchpy.connection_pool import DummyConnectionPool
-from opensearchpy.exceptions import ConnectionError, TransportError
-from opensearchpy.transport import Transport, get_host_info
+from opensearchpy.connection_pool import (
+    DummyConnectionPool,
+    LeastLatencySelector,
+    LeastOutstandingSelector,
+)
+from opensearchpy.exceptions import (
+    ConnectionError,
+    ImproperlyConfigured,
+    TransportError,
+)
+from opensearchpy.routing import shard_id
+from opensearchpy.serializer import FastJSONSerializer, JSONSerializer
+from opensearchpy.transport import (
+    RetryBudget,
+    Transport,
+    _is_hedgeable,
+    get_host_info,
+)
 
 from .test_cases import TestCase
+from .test_routing import CLUSTER_STATE
 
 
 class DummyConnection(Connection):
@@ -43,15 +64,33 @@ class DummyConnection(Connection):
         self.exception = kwargs.pop("exception", None)
         self.status, self.data = kwargs.pop("status", 200), kwargs.pop("data", "{}")
         self.headers = kwargs.pop("headers", {})
+        self.delay = kwargs.pop("delay", 0)
         self.calls: Any = []
+        self.closed = False
         super().__init__(**kwargs)
 
     def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+        if self.delay:
+            time.sleep(self.delay)
         self.calls.append((args, kwargs))
         if self.exception:
             raise self.exception
         return self.status, self.headers, self.data
 
+    def close(self) -> None:
+        self.closed = True
+
+
+class StreamingConnection(DummyConnection):
+    """Reads the streamed body of every request, like a real connection."""
+
+    def perform_request(self, *args: Any, **kwargs: Any) -> Any:
+        body = args[3]
+        self.sent = getattr(self, "sent", []) + [
+            body.read() if hasattr(body, "read") else b"".join(body)
+        ]
+        return super().perform_request(*args, **kwargs)
+
 
 CLUSTER_NODES = """{
   "_nodes" : {
@@ -232,6 +271,32 @@ class TestTransport(TestCase):
             t.get_connection().calls[0][0],
         )
 
+    def test_json_backend_uses_fast_json_serializer(self) -> None:
+        t: Any = Transport([{}], json_backend="json", connection_class=DummyConnection)
+
+        self.assertIsInstance(t.serializer, FastJSONSerializer)
+        self.assertIs(t.serializer, t.deserializer.default)
+        t.perform_request("POST", "/", body={"a": "é"})
+        self.assertEqual('{"a":"é"}'.encode("utf-8"), t.get_connection().calls[0][0][3])
+
+    def test_json_backend_and_serializer_are_exclusive(self) -> None:
+        self.assertRaises(
+            ImproperlyConfigured,
+            Transport,
+            [{}],
+            json_backend="auto",
+            serializer=JSONSerializer(),
+        )
+
+    def test_bytes_response_is_deserialized(self) -> None:
+        t: Any = Transport(
+            [{"data": b'{"answer":42}'}], connection_class=DummyConnection
+        )
+        self.assertEqual({"answer": 42}, t.perform_request("GET", "/"))
+
+        t.get_connection().headers = {"content-type": "text/plain"}
+        self.assertEqual('{"answer":42}', t.perform_request("GET", "/"))
+
     def test_kwargs_passed_on_to_connections(self) -> None:
         t: Any = Transport([{"host": "google.com"}], port=123)
         self.assertEqual(1, len(t.connection_pool.connections))
@@ -277,6 +342,29 @@ class TestTransport(TestCase):
             ],
         )
 
+    def test_selector_is_told_about_requests(self) -> None:
+        t: Any = Transport(
+            [{}, {}],
+            connection_class=DummyConnection,
+            selector_class=LeastLatencySelector,
+        )
+        for _ in range(4):
+            t.perform_request("GET", "/")
+
+        selector = t.connection_pool.selector
+        self.assertEqual(set(t.connection_pool.connections), set(selector.latency))
+        self.assertEqual({}, t.connection_pool.inflight)
+
+    def test_selector_is_told_about_failed_requests(self) -> None:
+        t: Any = Transport(
+            [{"exception": ConnectionError(None, "abandon ship", Exception())}] * 2,
+            connection_class=DummyConnection,
+            selector_class=LeastOutstandingSelector,
+        )
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        self.assertEqual({}, t.connection_pool.inflight)
+
     def test_request_will_fail_after_x_retries(self) -> None:
         t: Any = Transport(
             [{"exception": ConnectionError(None, "abandon ship", Exception())}],
@@ -286,6 +374,87 @@ class TestTransport(TestCase):
         self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
         self.assertEqual(4, len(t.get_connection().calls))
 
+    def test_retries_stop_once_the_budget_is_spent(self) -> None:
+        budget = RetryBudget(ratio=0, min_per_second=0, max_tokens=2)
+        t: Any = Transport(
+            [{"exception": ConnectionError(None, "abandon ship", Exception())}],
+            connection_class=DummyConnection,
+            retry_budget=budget,
+        )
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        self.assertEqual(3, len(t.get_connection().calls))
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        self.assertEqual(4, len(t.get_connection().calls))
+        self.assertEqual({"tokens": 0, "retries": 2, "rejected": 2}, budget.stats)
+
+    def test_successful_requests_fill_the_retry_budget(self) -> None:
+        budget = RetryBudget(ratio=0.5, min_per_second=0, max_tokens=2)
+        budget.tokens = 0
+        t: Any = Transport([{}], connection_class=DummyConnection, retry_budget=budget)
+
+        for _ in range(3):
+            t.perform_request("GET", "/")
+        self.assertEqual(1.5, budget.stats["tokens"])
+        for _ in range(3):
+            t.perform_request("GET", "/")
+        self.assertEqual(2, budget.stats["tokens"])
+
+    def test_retry_budget_refills_over_time(self) -> None:
+        budget = RetryBudget(ratio=0, min_per_second=10, max_tokens=1)
+        self.assertTrue(budget.withdraw())
+        self.assertFalse(budget.withdraw())
+
+        budget.updated -= 0.1
+        self.assertTrue(budget.withdraw())
+
+    def test_invalid_retry_budget(self) -> None:
+        self.assertRaises(ImproperlyConfigured, RetryBudget, ratio=-1)
+        self.assertRaises(ImproperlyConfigured, RetryBudget, max_tokens=0)
+
+    def test_stream_body_is_not_serialized(self) -> None:
+        t: Any = Transport([{}], connection_class=DummyConnection)
+        body = iter([b'{"index":{}}\n', b"{}\n"])
+
+        t.perform_request("POST", "/_bulk", body=body)
+        self.assertIs(body, t.get_connection().calls[0][0][3])
+
+    def test_seekable_stream_body_is_rewound_on_retry(self) -> None:
+        t: Any = Transport(
+            [{"exception": ConnectionError(None, "abandon ship", Exception())}],
+            connection_class=StreamingConnection,
+            max_retries=2,
+        )
+        body = io.BytesIO(b'{"index":{}}\n{}\n')
+        body.read(13)
+
+        self.assertRaises(
+            ConnectionError, t.perform_request, "POST", "/_bulk", body=body
+        )
+        self.assertEqual([b"{}\n"] * 3, t.get_connection().sent)
+
+    def test_consumed_stream_body_is_not_retried(self) -> None:
+        t: Any = Transport(
+            [{"exception": ConnectionError(None, "abandon ship", Exception())}] * 2,
+            connection_class=StreamingConnection,
+        )
+        body = (line for line in [b"{}\n"] * 2)
+
+        self.assertRaises(
+            ConnectionError, t.perform_request, "POST", "/_bulk", body=body
+        )
+        self.assertEqual(1, t.connection_pool.dead.qsize())
+        self.assertEqual(
+            1, sum(len(c.calls) for c in t.connection_pool.orig_connections)
+        )
+
+    def test_stream_response_is_not_deserialized(self) -> None:
+        chunks = iter([b'{"hits":', b"{}}"])
+        t: Any = Transport([{"data": chunks}], connection_class=DummyConnection)
+
+        self.assertIs(chunks, t.perform_request("POST", "/_search", stream=True))
+        self.assertTrue(t.get_connection().calls[0][1]["stream"])
+
     def test_failed_connection_will_be_marked_as_dead(self) -> None:
         t: Any = Transport(
             [{"exception": ConnectionError(None, "abandon ship", Exception())}] * 2,
@@ -360,6 +529,36 @@ class TestTransport(TestCase):
         self.assertEqual(1, len(t.connection_pool.connections))
         self.assertIs(connection, t.get_connection())
 
+    def test_set_connections_updates_the_pool_in_place(self) -> None:
+        t: Any = Transport(
+            [{"host": "a"}, {"host": "b"}, {"host": "c"}],
+            connection_class=DummyConnection,
+            randomize_hosts=False,
+        )
+        pool = t.connection_pool
+        a, b, c = pool.connections
+        pool.mark_dead(b)
+
+        t.set_connections([{"host": "b"}, {"host": "c"}, {"host": "d"}])
+        self.assertIs(pool, t.connection_pool)
+        self.assertIs(c, pool.connections[0])
+        self.assertEqual("http://d:9200", pool.connections[1].host)
+        self.assertEqual({b: 1}, pool.dead_count)
+        self.assertEqual([a], pool.drained())
+
+    def test_sniff_closes_removed_connections(self) -> None:
+        t: Any = Transport([{"data": CLUSTER_NODES}], connection_class=DummyConnection)
+        t.add_connection({"host": "2.2.2.2", "data": CLUSTER_NODES})
+        # the pool is shuffled, tell the connections apart by host
+        seed, added = sorted(
+            t.connection_pool.connections, key=lambda c: c.host, reverse=True
+        )
+
+        t.sniff_hosts()
+        self.assertEqual("http://1.1.1.1:123", t.get_connection().host)
+        self.assertTrue(added.closed)
+        self.assertFalse(seed.closed)
+
     def test_sniff_on_fail_triggers_sniffing_on_fail(self) -> None:
         t: Any = Transport(
             [
@@ -417,6 +616,77 @@ class TestTransport(TestCase):
         self.assertEqual("http://1.1.1.1:123", t.get_connection().host)
         self.assertTrue(time.time() - 1 < t.last_sniff < time.time() + 0.01)
 
+    def test_sniff_in_background(self) -> None:
+        t: Any = Transport(
+            [{"data": CLUSTER_NODES}],
+            connection_class=DummyConnection,
+            sniffer_timeout=0.05,
+            sniff_in_background=True,
+        )
+        seed = t.seed_connections[0]
+        t.last_sniff = time.time() - 1
+
+        # the request thread doesn't sniff
+        t.perform_request("GET", "/")
+        self.assertEqual(("GET", "/"), seed.calls[0][0][:2])
+
+        for _ in range(100):
+            if t.get_connection() is not seed:
+                break
+            time.sleep(0.01)
+        t.close()
+        self.assertEqual("http://1.1.1.1:123", t.get_connection().host)
+        self.assertEqual(("GET", "/_nodes/_all/http"), seed.calls[1][0])
+
+    def test_background_sniffer_stops_with_the_transport(self) -> None:
+        t: Any = Transport(
+            [{"data": CLUSTER_NODES}],
+            connection_class=DummyConnection,
+            sniffer_timeout=10,
+            sniff_in_background=True,
+        )
+        sniffer = t._sniffer
+        ref = weakref.ref(t)
+        del t
+        gc.collect()
+
+        self.assertIsNone(ref())
+        sniffer.join(1)
+        self.assertFalse(sniffer.is_alive())
+
+    def test_sniff_on_fail_in_background(self) -> None:
+        t: Any = Transport(
+            [
+                {"exception": ConnectionError(None, "abandon ship", Exception())},
+                {"data": CLUSTER_NODES},
+            ],
+            connection_class=DummyConnection,
+            sniff_on_connection_fail=True,
+            sniff_in_background=True,
+            max_retries=0,
+            randomize_hosts=False,
+        )
+
+        self.assertRaises(ConnectionError, t.perform_request, "GET", "/")
+        for _ in range(100):
+            if t.get_connection().host == "http://1.1.1.1:123":
+                break
+            time.sleep(0.01)
+        t.close()
+        self.assertEqual("http://1.1.1.1:123", t.get_connection().host)
+
+    def test_sniff_asks_nodes_in_parallel(self) -> None:
+        t: Any = Transport(
+            [{"delay": 1, "data": CLUSTER_NODES}, {"data": CLUSTER_NODES}],
+            connection_class=DummyConnection,
+            randomize_hosts=False,
+        )
+
+        start = time.time()
+        t.sniff_hosts()
+        self.assertLess(time.time() - start, 0.5)
+        self.assertEqual("http://1.1.1.1:123", t.get_connection().host)
+
     def test_sniff_7x_publish_host(self) -> None:
         # Test the response shaped when a 7.x node has publish_host set
         # and the returend data is shaped in the fqdn/ip:port format.
@@ -431,3 +701,234 @@ class TestTransport(TestCase):
             t.connection_pool.connection_opts[0][1],
             {"host": "somehost.tld", "port": 123},
         )
+
+
+class TestHedgedRequests(TestCase):
+    def hedging_transport(self, **kwargs: Any) -> Any:
+        return Transport(
+            [{"delay": 0.5, "data": '{"node":1}'}, {"data": '{"node":2}'}],
+            connection_class=DummyConnection,
+            randomize_hosts=False,
+            **kwargs,
+        )
+
+    def test_slow_read_is_hedged_to_another_node(self) -> None:
+        t: Any = self.hedging_transport(hedge_after=0.01)
+
+        self.assertEqual({"node": 2}, t.perform_request("GET", "/_search"))
+        self.assertEqual({"fired": 1, "won": 1, "delay": 0.01}, t.hedge_stats)
+
+    def test_fast_read_is_not_hedged(self) -> None:
+        t: Any = self.hedging_transport(hedge_after=1)
+        t.connection_pool.connections.reverse()
+
+        self.assertEqual({"node": 2}, t.perform_request("POST", "/movies/_search"))
+        self.assertEqual(0, t.hedge_stats["fired"])
+
+    def test_writes_are_not_hedged(self) -> None:
+        t: Any = self.hedging_transport(hedge_after=0.01)
+
+        self.assertEqual({"node": 1}, t.perform_request("POST", "/_bulk"))
+        self.assertEqual(0, t.hedge_stats["fired"])
+
+    def test_hedges_count_against_max_retries(self) -> None:
+        t: Any = self.hedging_transport(hedge_after=0.01, max_retries=0)
+
+        self.assertEqual({"node": 1}, t.perform_request("GET", "/_search"))
+        self.assertEqual(0, t.hedge_stats["fired"])
+
+    def test_no_hedge_while_all_workers_are_busy(self) -> None:
+        t: Any = self.hedging_transport(hedge_after=0.01)
+        t.HEDGE_WORKERS = 1
+
+        self.assertEqual({"node": 1}, t.perform_request("GET", "/_search"))
+        self.assertEqual(0, t.hedge_stats["fired"])
+
+    def test_delay_counts_from_when_the_attempt_is_sent(self) -> None:
+        t: Any = Transport(
+            [{"delay": 0.05, "data": '{"node":1}'}, {"data": '{"node":2}'}],
+            connection_class=DummyConnection,
+            randomize_hosts=False,
+            hedge_after=0.1,
+        )
+        t.HEDGE_WORKERS = 1
+        t._hedge_executor = ThreadPoolExecutor(max_workers=1)
+        # the only worker is busy for longer than the delay
+        t._hedge_executor.submit(time.sleep, 0.2)
+
+        self.assertEqual({"node": 1}, t.perform_request("GET", "/_search"))
+        self.assertEqual(0, t.hedge_stats["fired"])
+
+    def test_failed_attempt_is_retried_while_hedging(self) -> None:
+        t: Any = Transport(
+            [
+                {"exception": ConnectionError(None, "abandon ship", Exception())},
+                {"data": '{"node":2}'},
+            ],
+            connection_class=DummyConnection,
+            randomize_hosts=False,
+            hedge_after=1,
+        )
+
+        self.assertEqual({"node": 2}, t.perform_request("GET", "/_search"))
+        self.assertEqual(1, len(t.connection_pool.connections))
+        self.assertEqual(0, t.hedge_stats["fired"])
+
+    def test_delay_is_learned(self) -> None:
+        t: Any = Transport([{}], connection_class=DummyConnection, hedge_after="p95")
+        self.assertIsNone(t.hedge_stats["delay"])
+        for latency in range(200):
+            t.hedger.record(latency / 1000)
+
+        self.assertEqual(0.19, t.hedge_stats["delay"])
+
+    def test_hedging_is_disabled_by_default(self) -> None:
+        t: Any = Transport([{}], connection_class=DummyConnection)
+
+        self.assertEqual({}, t.hedge_stats)
+
+    def test_invalid_hedge_after(self) -> None:
+        for hedge_after in ("p99", -1):
+            self.assertRaises(
+                ImproperlyConfigured,
+                Transport,
+                [{}],
+                connection_class=DummyConnection,
+                hedge_after=hedge_after,
+            )
+
+    def test_only_idempotent_reads_are_hedgeable(self) -> None:
+        self.assertTrue(_is_hedgeable("GET", "/movies/_doc/1", None))
+        self.assertTrue(_is_hedgeable("HEAD", "/movies", None))
+        self.assertTrue(_is_hedgeable("POST", "/movies/_search", {}))
+        self.assertTrue(_is_hedgeable("POST", "/_msearch", {}))
+        self.assertFalse(_is_hedgeable("POST", "/_search", {"scroll": "1m"}))
+        self.assertFalse(_is_hedgeable("POST", "/_search/scroll", None))
+        self.assertFalse(_is_hedgeable("POST", "/movies/_doc", None))
+        self.assertFalse(_is_hedgeable("DELETE", "/movies", None))
+
+
+class ClusterConnection(DummyConnection):
+    """
+    Answers the cluster state and node info requests of shard aware routing
+    with a fake cluster, where ``movies`` has shard 0 on node1 and node2
+    and shard 1 on node2.
+    """
+
+    def perform_request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Any:
+        response = super().perform_request(method, url, *args, **kwargs)
+        if url.startswith("/_cluster/state/"):
+            return 200, {}, json.dumps(CLUSTER_STATE)
+        if url == "/_nodes/_all/http":
+            return 200, {}, json.dumps(ROUTING_NODES)
+        return response
+
+
+ROUTING_NODES = {
+    "nodes": {
+        f"n{i}": {"http": {"publish_address": f"node{i}:9200"}} for i in (1, 2, 3)
+    }
+}
+
+
+class TestShardAwareRouting(TestCase):
+    def routing_transport(self, **kwargs: Any) -> Any:
+        return Transport(
+            [{"host": f"node{i}", "port": 9200} for i in (1, 2, 3)],
+            connection_class=ClusterConnection,
+            randomize_hosts=False,
+            routing_aware=True,
+            **kwargs,
+        )
+
+    def doc(self, shard: int) -> str:
+        return next(str(i) for i in range(100) if shard_id(2, str(i)) == shard)
+
+    def document_calls(self, connection: Any) -> Any:
+        return [args[1] for args, _ in connection.calls if "/movies/" in args[1]]
+
+    def test_document_requests_go_to_the_shard(self) -> None:
+        t: Any = self.routing_transport()
+        node1, node2, node3 = t.connection_pool.connections
+        # the first request starts fetching the shard allocation
+        t.perform_request("GET", "/")
+        t._routing_thread.join()
+
+        for _ in range(5):
+            t.perform_request("PUT", f"/movies/_doc/{self.doc(0)}", body={})
+            t.perform_request("GET", f"/movies/_source/{self.doc(1)}")
+        self.assertEqual(5, len(self.document_calls(node1)))
+        self.assertEqual(5, len(self.document_calls(node2)))
+        self.assertEqual([], self.document_calls(node3))
+
+    def test_other_requests_use_the_selector(self) -> None:
+        t: Any = self.routing_transport()
+        t.refresh_routing()
+
+        for _ in range(3):
+            t.perform_request("POST", "/movies/_search", body={})
+        self.assertEqual(
+            [1, 1, 1],
+            [len(self.document_calls(c)) for c in t.connection_pool.connections],
+        )
+
+    def test_retries_use_the_selector(self) -> None:
+        t: Any = self.routing_transport()
+        t.refresh_routing()
+        node1 = t.connection_pool.connections[0]
+        node1.exception = ConnectionError("N/A", "", None)
+
+        t.perform_request("PUT", f"/movies/_doc/{self.doc(0)}", body={})
+        self.assertEqual(1, len(self.document_calls(node1)))
+        self.assertNotIn(node1, t.connection_pool.connections)
+        self.assertEqual(
+            1, sum(len(self.document_calls(c)) for c in t.connection_pool.connections)
+        )
+
+    def test_sniff_refreshes_the_shard_allocation(self) -> None:
+        t: Any = self.routing_transport()
+        t.sniff_hosts()
+        t._routing_thread.join()
+
+        self.assertFalse(t.router.stale)
+        self.assertEqual({"n1", "n2", "n3"}, set(t.router.nodes))
+
+    def test_failed_refresh_falls_back_to_the_selector(self) -> None:
+        t: Any = Transport(
+            [{"data": "{}"}, {"data": "{}"}],
+            connection_class=DummyConnection,
+            routing_aware=True,
+        )
+
+        self.assertEqual({}, t.perform_request("GET", "/movies/_doc/1"))
+        t._routing_thread.join()
+        self.assertFalse(t.router.stale)
+        self.assertEqual({}, t.router.indices)
+
+    def test_requests_dont_wait_for_the_refresh(self) -> None:
+        t: Any = self.routing_transport()
+        refreshing = threading.Event()
+        refresh = t.refresh_routing
+
+        def slow_refresh() -> None:
+            refreshing.wait(5)
+            refresh()
+
+        t.refresh_routing = slow_refresh
+        for _ in range(3):
+            t.perform_request("GET", f"/movies/_source/{self.doc(1)}")
+        # routed with the regular selection until the refresh is done
+        self.assertTrue(t.router.stale)
+        self.assertEqual(
+            [1, 1, 1],
+            [len(self.document_calls(c)) for c in t.connection_pool.connections],
+        )
+
+        refreshing.set()
+        t._routing_thread.join()
+        self.assertFalse(t.router.stale)
+
+    def test_refresh_requires_routing_aware(self) -> None:
+        t: Any = Transport([{}], connection_class=DummyConnection)
+        self.assertIsNone(t.router)
+        self.assertRaises(ImproperlyConfigured, t.refresh_routing)